@@ -289,22 +289,53 @@ def render_sidebar():
     return page
 
 
+def get_dashboard_data(symbols: Optional[List[str]] = None, trending_limit: int = 5) -> Dict:
+    """Get all dashboard sections in one round trip.
+    
+    Sections missing from the composite payload are fetched concurrently
+    from their own endpoints.
+    """
+    if not API_AVAILABLE:
+        return {}
+    
+    api_client = get_api_client()
+    response = api_client.get_dashboard(symbols=symbols, trending_limit=trending_limit)
+    dashboard = dict(response.get("data") or {}) if response.get("success") else {}
+    
+    wanted = ["indices", "market_sentiment", "trending"] + (["stocks"] if symbols else [])
+    missing = [name for name in wanted if not dashboard.get(name)]
+    if missing:
+        sections = api_client.get_dashboard_sections(symbols=symbols, trending_limit=trending_limit, sections=missing)
+        for name, section_response in sections.items():
+            if section_response.get("success"):
+                dashboard[name] = section_response.get("data")
+    
+    return dashboard
+
+
 def render_dashboard():
     """Render the main dashboard."""
     st.markdown("# 📊 Financial Dashboard")
     
+    current_ticker = st.session_state.current_ticker
+    dashboard = get_dashboard_data([current_ticker] if current_ticker else None)
+    current_stock = None
+    if current_ticker:
+        # Yahoo Finance directly when the API could not provide the symbol
+        current_stock = (dashboard.get('stocks') or {}).get(current_ticker.upper()) or legacy_get_stock_data(current_ticker)
+    
     # Market Overview
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         # Market Sentiment
-        market_sentiment = get_market_sentiment()
+        market_sentiment = dashboard.get('market_sentiment') or {'overall_sentiment': 0, 'sentiment_distribution': {}}
         overall_sentiment = market_sentiment.get('overall_sentiment', 0)
         create_sentiment_indicator(overall_sentiment, show_gauge=True)
     
     with col2:
         # Trending Stocks
-        trending = get_trending_stocks(5)
+        trending = dashboard.get('trending') or []
         if trending:
             st.markdown("### 🔥 Trending")
             for stock in trending[:3]:
@@ -328,10 +359,8 @@ def render_dashboard():
         # Market Indices (placeholder)
         st.markdown("### 📈 Market Indices")
         if API_AVAILABLE:
-            api_client = get_api_client()
-            success, data = format_api_response(api_client.get_market_indices())
-            
-            if success and data:
+            data = dashboard.get('indices')
+            if data:
                 for index in data[:3]:
                     symbol = index.get('symbol', 'N/A')
                     price = index.get('current_price', 0)
@@ -349,8 +378,8 @@ def render_dashboard():
     with col4:
         # Quick Stats
         st.markdown("### 📊 Quick Stats")
-        if st.session_state.current_ticker:
-            stock_data = get_stock_data(st.session_state.current_ticker)
+        if current_ticker:
+            stock_data = current_stock
             if stock_data:
                 current_price = stock_data.get('current_price')
                 volume = stock_data.get('volume')
@@ -365,7 +394,7 @@ def render_dashboard():
     st.markdown("## 📈 Current Stock Analysis")
     
     if st.session_state.current_ticker:
-        stock_data = get_stock_data(st.session_state.current_ticker, include_sentiment=True)
+        stock_data = current_stock
         
         if stock_data:
             # Display stock summary
@@ -8,7 +8,7 @@ and resource management functionality.
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Query, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query, Depends, BackgroundTasks, Request
 from pydantic import BaseModel, Field
 
 from ..services.auto_scaling_service import (
@@ -57,8 +57,12 @@ class ScalingPolicyRequest(BaseModel):
     enabled: bool = Field(True, description="Whether policy is enabled")
 
 # Dependency injection
-async def get_auto_scaling_service() -> AutoScalingService:
-    """Get auto scaling service instance."""
+async def get_auto_scaling_service(request: Request) -> AutoScalingService:
+    """Get the auto scaling service created in the application lifespan."""
+    # The lifespan instance is the one with live request/queue/socket signals
+    auto_scaling_service = getattr(request.app.state, "auto_scaling_service", None)
+    if auto_scaling_service is not None:
+        return auto_scaling_service
     cache_manager = UnifiedCacheManager()
     return AutoScalingService(cache_manager)
 
@@ -594,6 +598,7 @@ def _get_trigger_description(trigger: ScalingTrigger) -> str:
         ScalingTrigger.RESPONSE_TIME: "Scale based on application response time",
         ScalingTrigger.REQUEST_RATE: "Scale based on incoming request rate",
         ScalingTrigger.QUEUE_DEPTH: "Scale based on message queue depth",
+        ScalingTrigger.PREDICTED_LOAD: "Scale out ahead of forecast request load (Holt-Winters)",
         ScalingTrigger.CUSTOM_METRIC: "Scale based on custom application metrics"
     }
     return descriptions.get(trigger, "Unknown scaling trigger")
\ No newline at end of file
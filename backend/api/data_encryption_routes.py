@@ -40,11 +40,21 @@ class DataEncryptionRequest(BaseModel):
 class DataDecryptionRequest(BaseModel):
     """Model for data decryption request."""
     encrypted_data: Union[str, bytes] = Field(..., description="Encrypted data")
-    key_id: str = Field(..., description="Key ID used for encryption")
-    encryption_type: EncryptionType = Field(..., description="Encryption type used")
+    key_id: Optional[str] = Field(None, description="Key ID used for encryption (not needed for envelope ciphertexts)")
+    encryption_type: Optional[EncryptionType] = Field(None, description="Encryption type used (not needed for envelope ciphertexts)")
     iv: Optional[Union[str, bytes]] = Field(None, description="Initialization vector")
     tag: Optional[Union[str, bytes]] = Field(None, description="Authentication tag")
 
+class BatchEncryptionRequest(BaseModel):
+    """Model for batch data encryption request."""
+    items: List[Union[str, Dict[str, Any]]] = Field(..., min_items=1, max_items=10000, description="Data to encrypt")
+    data_type: str = Field(..., description="Type of data being encrypted")
+    encryption_type: Optional[EncryptionType] = Field(None, description="AEAD encryption type to use")
+
+class BatchDecryptionRequest(BaseModel):
+    """Model for batch data decryption request."""
+    encrypted_items: List[str] = Field(..., min_items=1, max_items=10000, description="Envelope ciphertexts")
+
 class EncryptionPolicyCreate(BaseModel):
     """Model for creating encryption policy."""
     policy_id: str = Field(..., description="Unique policy identifier")
@@ -61,12 +71,18 @@ class KeyRotationRequest(BaseModel):
     key_id: str = Field(..., description="Key ID to rotate")
     reason: str = Field(..., description="Reason for rotation")
 
+# Shared service so data keys and their unwrapped cache outlive a request
+_data_encryption_service: Optional[DataEncryptionService] = None
+
 # Dependency to get data encryption service
 async def get_data_encryption_service() -> DataEncryptionService:
     """Get data encryption service instance."""
+    global _data_encryption_service
     try:
-        cache_manager = UnifiedCacheManager()
-        return DataEncryptionService(cache_manager)
+        if _data_encryption_service is None:
+            cache_manager = UnifiedCacheManager()
+            _data_encryption_service = DataEncryptionService(cache_manager)
+        return _data_encryption_service
     except Exception as e:
         logger.error(f"Error creating data encryption service: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to initialize data encryption service")
@@ -151,6 +167,74 @@ async def decrypt_data(
         logger.error(f"Error decrypting data: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/encrypt/batch")
+async def encrypt_data_batch(
+    request: BatchEncryptionRequest,
+    encryption_service: DataEncryptionService = Depends(get_data_encryption_service),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Encrypt many values of one data type.
+    
+    This endpoint envelope-encrypts every item with the data type's
+    current data key and records a single audit entry.
+    """
+    try:
+        result = await encryption_service.encrypt_many(
+            items=request.items,
+            data_type=request.data_type,
+            encryption_type=request.encryption_type,
+            user_id=current_user.id
+        )
+        
+        if not result.get("success"):
+            raise HTTPException(status_code=400, detail=result.get("error", "Unknown error"))
+        
+        return result
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error encrypting data batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.post("/decrypt/batch")
+async def decrypt_data_batch(
+    request: BatchDecryptionRequest,
+    encryption_service: DataEncryptionService = Depends(get_data_encryption_service),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Decrypt many envelope ciphertexts.
+    
+    Items that fail to decrypt are returned as null with an error by index.
+    """
+    try:
+        result = await encryption_service.decrypt_many(
+            encrypted_items=request.encrypted_items,
+            user_id=current_user.id
+        )
+        
+        if not result.get("success"):
+            raise HTTPException(status_code=400, detail=result.get("error", "Unknown error"))
+        
+        return {
+            "success": True,
+            "decrypted_data": [
+                item.decode("utf-8", errors="replace") if item is not None else None
+                for item in result["decrypted_data"]
+            ],
+            "errors": result["errors"],
+            "count": result["count"],
+            "processing_time_ms": result["processing_time_ms"]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error decrypting data batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @router.get("/keys")
 async def get_encryption_keys(
     key_type: Optional[KeyType] = Query(None, description="Filter by key type"),
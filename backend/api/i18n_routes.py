@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, Depends, Query, Header
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
+from datetime import datetime
 import logging
 
 from ..services.i18n_service import (
@@ -44,6 +45,13 @@ class TranslationImportRequest(BaseModel):
     translations: Dict[str, Any] = Field(..., description="Translations to import")
     overwrite: bool = Field(False, description="Whether to overwrite existing translations")
 
+class TranslateManyRequest(BaseModel):
+    """Model for resolving many translations at once."""
+    namespace: TranslationNamespace = Field(TranslationNamespace.COMMON, description="Translation namespace")
+    locale: Optional[Locale] = Field(None, description="Target locale")
+    keys: Optional[List[str]] = Field(None, description="Keys to resolve (whole namespace if omitted)")
+    variables: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="Interpolation variables per key")
+
 class TranslationResponse(BaseModel):
     """Model for translation response."""
     key: str
@@ -63,12 +71,18 @@ class TranslationsResponse(BaseModel):
     namespace: Optional[str]
     translations: Dict[str, str]
 
+# Shared i18n service; its compiled catalog is reused across requests
+_i18n_service: Optional[I18nService] = None
+
 # Dependency to get i18n service
 async def get_i18n_service() -> I18nService:
     """Get i18n service instance."""
+    global _i18n_service
     try:
-        cache_manager = UnifiedCacheManager()
-        return I18nService(cache_manager)
+        if _i18n_service is None:
+            cache_manager = UnifiedCacheManager()
+            _i18n_service = I18nService(cache_manager)
+        return _i18n_service
     except Exception as e:
         logger.error(f"Error creating i18n service: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to initialize i18n service")
@@ -164,6 +178,48 @@ async def get_translations(
         logger.error(f"Error getting translations: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/translations/resolve")
+async def translate_many(
+    request: TranslateManyRequest,
+    accept_language: Optional[str] = Header(None, description="Accept-Language header"),
+    i18n_service: I18nService = Depends(get_i18n_service),
+    current_user: Optional[User] = Depends(get_current_user)
+):
+    """
+    Resolve many translations in one call.
+    
+    This endpoint formats every requested key (or the whole namespace)
+    for the target locale, with per-key interpolation variables.
+    """
+    try:
+        locale = request.locale
+        if not locale:
+            if current_user:
+                locale = await i18n_service.get_user_locale(str(current_user.id))
+            if not locale:
+                locale = await i18n_service.detect_locale(accept_language or "")
+        
+        translations = await i18n_service.translate_many(
+            namespace=request.namespace,
+            locale=locale,
+            keys=request.keys,
+            variables=request.variables
+        )
+        
+        return {
+            "success": True,
+            "locale": locale.value,
+            "namespace": request.namespace.value,
+            "catalog_version": i18n_service.catalog.version,
+            "translations": translations
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error resolving translations: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @router.get("/locales")
 async def get_supported_locales(
     i18n_service: I18nService = Depends(get_i18n_service)
@@ -443,6 +499,8 @@ async def get_i18n_health(
             "status": "healthy",
             "supported_locales": len(supported_locales),
             "total_translations": total_translations,
+            "catalog_version": i18n_service.catalog.version,
+            "catalog_stats": i18n_service.stats,
             "cache_status": "connected",
             "timestamp": datetime.utcnow().isoformat()
         }
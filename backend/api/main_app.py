@@ -103,6 +103,17 @@ async def lifespan(app: FastAPI):
     app.state.distributed_data_collector = DistributedDataCollector(app.state.cache_manager)
     app.state.timescale_service = TimescaleService(app.state.cache_manager)
     
+    # Feed live request, queue and socket signals into auto-scaling decisions
+    from ..monitoring.performance_monitor import performance_monitor
+    from . import websocket_routes
+    app.state.auto_scaling_service.attach_signal_sources(
+        performance_monitor=performance_monitor,
+        data_collector=app.state.distributed_data_collector,
+        # Created on the first WebSocket connection, so resolve it on every read
+        notification_service=lambda: websocket_routes.notification_service,
+        websocket_managers=websocket_routes.connection_managers
+    )
+    
     # Initialize automated test service
     from ..services.automated_test_service import AutomatedTestService
     app.state.automated_test_service = AutomatedTestService(app.state.cache_manager)
@@ -125,6 +136,12 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state.sentiment_service, 'close'):
         await app.state.sentiment_service.close()
     
+    # Write out buffered encryption audit records
+    await app.state.data_encryption_service.close()
+    
+    # Stop time-series background tasks and close its storage
+    await app.state.timescale_service.close()
+    
     # Disconnect cache
     if hasattr(cache_backend, 'disconnect'):
         await cache_backend.disconnect()
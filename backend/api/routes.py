@@ -42,6 +42,11 @@ class StockComparisonRequest(BaseModel):
     symbols: List[str] = Field(..., min_length=2, max_length=10, description="Stock symbols to compare")
     period: str = Field("1mo", description="Time period for comparison")
     include_sentiment: bool = Field(True, description="Include sentiment analysis")
+    max_points: Optional[int] = Field(1000, ge=3, le=20000, description="Maximum points per historical series")
+
+class StocksBatchRequest(BaseModel):
+    symbols: List[str] = Field(..., min_length=1, max_length=50, description="Stock symbols")
+    include_sentiment: bool = Field(True, description="Include sentiment analysis")
 
 class WatchlistRequest(BaseModel):
     user_id: str = Field(..., description="User identifier")
@@ -93,6 +98,25 @@ def get_global_services():
         _advanced_sentiment_service = AdvancedSentimentService(_cache_manager)
 
 
+async def initialize_global_services(session_factory=None):
+    """Create global service instances and load the stock search index.
+    
+    The application lifespan shares the returned StockService so that /search
+    uses the index it loads and close_global_services stops its refresh task.
+    """
+    get_global_services()
+    await _stock_service.load_symbol_index(session_factory)
+    return _stock_service
+
+
+async def close_global_services():
+    """Release threads held by global service instances."""
+    if _advanced_sentiment_service is not None:
+        await _advanced_sentiment_service.close()
+    if _stock_service is not None:
+        await _stock_service.close()
+
+
 # Dependency injection
 async def get_unified_service() -> UnifiedService:
     """Dependency to get unified service instance."""
@@ -256,6 +280,62 @@ async def get_market_statistics(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/stocks/batch", response_model=Dict[str, Any])
+async def get_stocks_batch(
+    request: StocksBatchRequest,
+    service: UnifiedService = Depends(get_unified_service),
+    user_data: Dict[str, Any] = Depends(optional_auth)
+):
+    """Get comprehensive stock data for several symbols in one request."""
+    try:
+        stocks = await service.get_stocks(request.symbols, request.include_sentiment)
+        
+        return {
+            "success": True,
+            "data": {symbol: stock.to_dict() for symbol, stock in stocks.items() if stock},
+            "not_found": [symbol for symbol, stock in stocks.items() if not stock],
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error getting stock batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/dashboard", response_model=Dict[str, Any])
+async def get_dashboard(
+    symbols: Optional[str] = Query(None, description="Comma-separated stock symbols for quick stats"),
+    trending_limit: int = Query(10, ge=1, le=50, description="Number of trending stocks"),
+    timeframe: str = Query("24h", description="Timeframe for trending analysis"),
+    include_sentiment: bool = Query(True, description="Include sentiment analysis"),
+    service: UnifiedService = Depends(get_unified_service),
+    user_data: Dict[str, Any] = Depends(optional_auth)
+):
+    """Get market indices, market sentiment, trending stocks, statistics and
+    per-symbol data in one payload; sections are loaded concurrently and
+    failures are reported per section."""
+    try:
+        symbol_list = [symbol.strip() for symbol in symbols.split(",") if symbol.strip()] if symbols else []
+        dashboard = await service.get_dashboard(
+            symbols=symbol_list[:50],
+            trending_limit=trending_limit,
+            timeframe=timeframe,
+            include_sentiment=include_sentiment
+        )
+        
+        return {
+            "success": True,
+            "data": dashboard["sections"],
+            "errors": dashboard["errors"],
+            "timings_ms": dashboard["timings_ms"],
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error getting dashboard: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.post("/compare", response_model=Dict[str, Any])
 async def compare_stocks(
     request: StockComparisonRequest,
@@ -266,7 +346,8 @@ async def compare_stocks(
         comparison_data = await service.compare_stocks(
             request.symbols,
             request.period,
-            request.include_sentiment
+            request.include_sentiment,
+            max_points=request.max_points
         )
         
         return {
@@ -5,7 +5,7 @@ This module provides REST API endpoints for TimescaleDB operations
 including hypertable management, partitioning, and performance optimization.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, Request
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -18,7 +18,6 @@ from ..services.timescale_service import (
     CompressionType,
     RetentionPolicy
 )
-from ..cache.unified_cache import UnifiedCacheManager
 from .auth_routes import get_current_user
 from ..models.unified_models import User
 
@@ -60,14 +59,13 @@ class TableOptimization(BaseModel):
     table_name: str = Field(..., description="Table name to optimize")
 
 # Dependency to get TimescaleDB service
-async def get_timescale_service() -> TimescaleService:
-    """Get TimescaleDB service instance."""
-    try:
-        cache_manager = UnifiedCacheManager()
-        return TimescaleService(cache_manager)
-    except Exception as e:
-        logger.error(f"Error creating TimescaleDB service: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to initialize TimescaleDB service")
+async def get_timescale_service(request: Request) -> TimescaleService:
+    """Get the TimescaleDB service created in the application lifespan."""
+    timescale_service = getattr(request.app.state, "timescale_service", None)
+    if timescale_service is None:
+        logger.error("TimescaleDB service is not initialized")
+        raise HTTPException(status_code=503, detail="TimescaleDB service is not available")
+    return timescale_service
 
 @router.post("/hypertables")
 async def create_hypertable(
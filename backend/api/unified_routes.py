@@ -33,6 +33,8 @@ async def get_stock(
     include_sentiment: bool = Query(True, description="Include sentiment data"),
     include_historical: bool = Query(False, description="Include historical data"),
     period: str = Query("1y", description="Historical data period"),
+    max_points: Optional[int] = Query(1000, ge=3, le=20000, description="Maximum historical points"),
+    chart_type: str = Query("candlestick", regex="^(candlestick|line)$", description="Historical chart type"),
     unified_service: UnifiedService = Depends(get_unified_service),
     user_data: Dict[str, Any] = Depends(optional_auth)
 ):
@@ -56,7 +58,9 @@ async def get_stock(
         
         # Include historical data if requested
         if include_historical:
-            historical_data = await unified_service.get_historical_data(symbol, period)
+            historical_data = await unified_service.get_historical_data(
+                symbol, period, max_points=max_points, chart_type=chart_type
+            )
             if historical_data:
                 stock_data.historical_data = historical_data
         
@@ -196,6 +200,7 @@ async def compare_stocks(
     symbols: List[str] = Query(..., description="Stock symbols to compare"),
     period: str = Query("1y", regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|max)$", description="Comparison period"),
     include_sentiment: bool = Query(True, description="Include sentiment comparison"),
+    max_points: Optional[int] = Query(1000, ge=3, le=20000, description="Maximum points per historical series"),
     unified_service: UnifiedService = Depends(get_unified_service)
 ):
     """
@@ -214,7 +219,8 @@ async def compare_stocks(
         comparison_data = await unified_service.compare_stocks(
             symbols, 
             period=period,
-            include_sentiment=include_sentiment
+            include_sentiment=include_sentiment,
+            max_points=max_points
         )
         
         return comparison_data
@@ -5,5 +5,6 @@ This package contains all caching functionality.
 """
 
 from .unified_cache import UnifiedCacheManager
+from .sentiment_result_cache import SentimentResultCache, sentiment_result_cache
 
-__all__ = ["UnifiedCacheManager"]
\ No newline at end of file
+__all__ = ["UnifiedCacheManager", "SentimentResultCache", "sentiment_result_cache"]
\ No newline at end of file
@@ -130,7 +130,7 @@ class MemoryCacheBackend:
         lru_key = min(self.cache.keys(), key=lambda k: self.cache[k]['last_accessed'])
         del self.cache[lru_key]
         self.stats['evictions'] += 1
-        self.logger.debug(f"Evicted LRU key: {lru_key}")
+        self.logger.debug("Evicted LRU key: %s", lru_key)
     
     async def cleanup_expired(self):
         """Clean up expired entries."""
@@ -147,7 +147,7 @@ class MemoryCacheBackend:
             
             if expired_keys:
                 self.stats['size'] = len(self.cache)
-                self.logger.debug(f"Cleaned up {len(expired_keys)} expired keys")
+                self.logger.debug("Cleaned up %s expired keys", len(expired_keys))
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -245,7 +245,7 @@ class ResilientCacheManager:
         """L1 캐시에서만 값 조회 (회로 차단기 개방 시)"""
         value = await self._get_l1(key)
         if value is not None:
-            self.logger.debug(f"L1 cache hit (circuit breaker open): {key}")
+            self.logger.debug("L1 cache hit (circuit breaker open): %s", key)
         return value
     
     async def _set_l1(self, key: str, value: Any, ttl: int):
@@ -0,0 +1,283 @@
+"""
+Shared sentiment result cache for InsiteChart platform.
+
+This module caches per-text model outputs keyed by (model id, normalized text
+hash) so the same post is scored once, no matter how many symbols, platforms
+or services it shows up under. A bounded in-process LRU sits in front of an
+optional Redis tier, and bulk lookups let batch scoring skip texts that were
+already scored.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from ..config import get_redis_url
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class SentimentResultCache:
+    """Two-tier (LRU + Redis) cache of per-text sentiment model outputs."""
+
+    def __init__(
+        self,
+        max_local_entries: int = 50000,
+        local_ttl: int = 3600,
+        redis_ttl: int = 86400,
+        key_prefix: str = "sentiment_result"
+    ):
+        self.max_local_entries = max_local_entries
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.key_prefix = key_prefix
+        self.logger = logging.getLogger(__name__)
+
+        # key -> (expires_at, value); move_to_end on access keeps LRU order
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Sync callers (e.g. VADER scoring) share the LRU with async ones
+        self._lock = threading.Lock()
+
+        self.redis_client = None
+
+        # Per-model statistics
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+        self.redis_errors = 0
+
+    async def initialize(self, redis_client=None) -> bool:
+        """Attach the Redis tier; the cache stays local-only on failure."""
+        try:
+            self.redis_client = redis_client or redis.from_url(
+                get_redis_url(),
+                encoding="utf-8",
+                decode_responses=True
+            )
+            await self.redis_client.ping()
+            self.logger.info("Sentiment result cache connected to Redis")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Sentiment result cache running in local-only mode: {str(e)}")
+            self.redis_client = None
+            return False
+
+    async def close(self):
+        """Close the Redis tier and clear local entries."""
+        if self.redis_client:
+            try:
+                await self.redis_client.close()
+            except Exception as e:
+                self.logger.error(f"Error closing sentiment result cache: {str(e)}")
+            self.redis_client = None
+        self.clear_local()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text so trivially different copies share a cache entry.
+
+        Applies Unicode NFKC and collapses whitespace. Case is preserved
+        because cased models and VADER both react to capitalization.
+        """
+        return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+    @classmethod
+    def text_digest(cls, text: str) -> str:
+        """Process-stable digest of normalized text."""
+        return hashlib.blake2b(cls.normalize_text(text).encode("utf-8"), digest_size=16).hexdigest()
+
+    def make_key(self, model_id: str, text: str) -> str:
+        """Build the cache key for a (model, text) pair."""
+        return f"{self.key_prefix}:{model_id}:{self.text_digest(text)}"
+
+    def _model_stats(self, model_id: str) -> Dict[str, int]:
+        if model_id not in self.stats:
+            self.stats[model_id] = {
+                "local_hits": 0,
+                "redis_hits": 0,
+                "misses": 0,
+                "sets": 0
+            }
+        return self.stats[model_id]
+
+    def _get_local_entry(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.time() >= expires_at:
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return value
+
+    def _set_local_entry(self, key: str, value: Any):
+        with self._lock:
+            self._local[key] = (time.time() + self.local_ttl, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_local_entries:
+                self._local.popitem(last=False)
+                self.evictions += 1
+
+    def get_local(self, model_id: str, text: str) -> Optional[Any]:
+        """Synchronous lookup against the in-process tier only."""
+        value = self._get_local_entry(self.make_key(model_id, text))
+        stats = self._model_stats(model_id)
+        if value is not None:
+            stats["local_hits"] += 1
+        else:
+            stats["misses"] += 1
+        return value
+
+    def set_local(self, model_id: str, text: str, value: Any):
+        """Synchronous store into the in-process tier only."""
+        self._set_local_entry(self.make_key(model_id, text), value)
+        self._model_stats(model_id)["sets"] += 1
+
+    async def get(self, model_id: str, text: str) -> Optional[Any]:
+        """Look up one text, falling through to Redis on a local miss."""
+        results = await self.get_many(model_id, [text])
+        return results.get(text)
+
+    async def get_many(self, model_id: str, texts: Iterable[str]) -> Dict[str, Any]:
+        """Bulk lookup; returns {text: cached value} for every hit.
+
+        Local misses are fetched from Redis with a single MGET and promoted
+        into the local tier.
+        """
+        stats = self._model_stats(model_id)
+        hits: Dict[str, Any] = {}
+        pending: Dict[str, List[str]] = {}
+
+        for text in texts:
+            if text in hits:
+                continue
+            key = self.make_key(model_id, text)
+            value = self._get_local_entry(key)
+            if value is not None:
+                stats["local_hits"] += 1
+                hits[text] = value
+            else:
+                pending.setdefault(key, []).append(text)
+
+        if pending and self.redis_client:
+            keys = list(pending.keys())
+            try:
+                raw_values = await self.redis_client.mget(keys)
+            except Exception as e:
+                self.redis_errors += 1
+                self.logger.error(f"Sentiment result cache MGET failed: {str(e)}")
+                raw_values = [None] * len(keys)
+
+            for key, raw in zip(keys, raw_values):
+                if raw is None:
+                    continue
+                value = json.loads(raw)
+                self._set_local_entry(key, value)
+                for text in pending.pop(key):
+                    stats["redis_hits"] += 1
+                    hits[text] = value
+
+        stats["misses"] += sum(len(texts_for_key) for texts_for_key in pending.values())
+        return hits
+
+    async def prefetch(self, model_id: str, texts: Iterable[str]) -> int:
+        """Promote Redis entries for texts into the local tier.
+
+        Used ahead of batch scoring so the per-text lookups that follow are
+        served locally. Does not count towards hit-rate metrics.
+
+        Returns:
+            Number of entries loaded from Redis
+        """
+        if not self.redis_client:
+            return 0
+
+        keys = list(dict.fromkeys(
+            key for key in (self.make_key(model_id, text) for text in texts)
+            if self._get_local_entry(key) is None
+        ))
+        if not keys:
+            return 0
+
+        try:
+            raw_values = await self.redis_client.mget(keys)
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.error(f"Sentiment result cache prefetch failed: {str(e)}")
+            return 0
+
+        loaded = 0
+        for key, raw in zip(keys, raw_values):
+            if raw is not None:
+                self._set_local_entry(key, json.loads(raw))
+                loaded += 1
+        return loaded
+
+    async def set(self, model_id: str, text: str, value: Any) -> bool:
+        """Store one model output in both tiers."""
+        return await self.set_many(model_id, {text: value})
+
+    async def set_many(self, model_id: str, values: Dict[str, Any]) -> bool:
+        """Store several model outputs; Redis writes share one pipeline."""
+        if not values:
+            return True
+
+        stats = self._model_stats(model_id)
+        entries = {self.make_key(model_id, text): value for text, value in values.items()}
+        for key, value in entries.items():
+            self._set_local_entry(key, value)
+        stats["sets"] += len(entries)
+
+        if not self.redis_client:
+            return True
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in entries.items():
+                pipe.setex(key, self.redis_ttl, json.dumps(value))
+            await pipe.execute()
+            return True
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.error(f"Sentiment result cache write failed: {str(e)}")
+            return False
+
+    def clear_local(self):
+        """Drop all in-process entries."""
+        with self._lock:
+            self._local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit-rate metrics broken down by model."""
+        models = {}
+        for model_id, stats in self.stats.items():
+            hits = stats["local_hits"] + stats["redis_hits"]
+            lookups = hits + stats["misses"]
+            models[model_id] = {
+                **stats,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "local_hit_rate": stats["local_hits"] / lookups if lookups else 0.0
+            }
+
+        return {
+            "local_size": len(self._local),
+            "max_local_entries": self.max_local_entries,
+            "evictions": self.evictions,
+            "redis_connected": self.redis_client is not None,
+            "redis_errors": self.redis_errors,
+            "models": models
+        }
+
+
+# Global sentiment result cache instance
+sentiment_result_cache = SentimentResultCache()
@@ -64,6 +64,17 @@ class UnifiedCacheManager:
         self._local_cache = {}
         self._local_cache_ttl = {}
         self._local_cache_max_size = 100
+        
+        # Load shedding: serve recently expired local entries instead of hitting the backend
+        self.serve_stale = False
+        self.stale_grace_seconds = 300
+        self.stale_hits = 0
+    
+    def set_serve_stale(self, enabled: bool):
+        """Enable or disable serving expired local entries (used while the process is overloaded)."""
+        if enabled != self.serve_stale:
+            self.logger.info(f"Serving stale local cache entries {'enabled' if enabled else 'disabled'}")
+        self.serve_stale = enabled
     
     async def initialize(self):
         """Initialize cache manager and backend."""
@@ -139,7 +150,13 @@ class UnifiedCacheManager:
                 if key in self._local_cache_ttl:
                     if current_time < self._local_cache_ttl[key]:
                         self.stats['hits'] += 1
-                        self.logger.debug(f"Local cache hit: {key}")
+                        self.logger.debug("Local cache hit: %s", key)
+                        return self._local_cache[key]
+                    elif self.serve_stale and current_time < self._local_cache_ttl[key] + self.stale_grace_seconds:
+                        # Expired but within the grace window while shedding load
+                        self.stats['hits'] += 1
+                        self.stale_hits += 1
+                        self.logger.debug("Stale local cache hit: %s", key)
                         return self._local_cache[key]
                     else:
                         # Expired, remove from local cache
@@ -152,20 +169,20 @@ class UnifiedCacheManager:
             # Check backend cache
             if not self.backend:
                 self.stats['misses'] += 1
-                self.logger.debug(f"Cache miss (no backend): {key}")
+                self.logger.debug("Cache miss (no backend): %s", key)
                 return None
             
             value = await self.backend.get(key)
             if value is not None:
                 self.stats['hits'] += 1
-                self.logger.debug(f"Backend cache hit: {key}")
+                self.logger.debug("Backend cache hit: %s", key)
                 
                 # Store in local cache for faster access
                 self._store_in_local_cache(key, value, ttl=60)  # 1 minute local cache
                 return value
             else:
                 self.stats['misses'] += 1
-                self.logger.debug(f"Cache miss: {key}")
+                self.logger.debug("Cache miss: %s", key)
                 return None
                 
         except Exception as e:
@@ -189,7 +206,7 @@ class UnifiedCacheManager:
             success = await self.backend.set(key, value, ttl)
             if success:
                 self.stats['sets'] += 1
-                self.logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+                self.logger.debug("Cache set: %s (TTL: %ss)", key, ttl)
             
             return success
             
@@ -213,7 +230,7 @@ class UnifiedCacheManager:
             success = await self.backend.delete(key)
             if success:
                 self.stats['deletes'] += 1
-                self.logger.debug(f"Cache delete: {key}")
+                self.logger.debug("Cache delete: %s", key)
             
             return success
             
@@ -230,7 +247,7 @@ class UnifiedCacheManager:
             
             deleted_count = await self.backend.delete_pattern(pattern)
             self.stats['deletes'] += deleted_count
-            self.logger.debug(f"Cache delete pattern: {pattern} (deleted: {deleted_count})")
+            self.logger.debug("Cache delete pattern: %s (deleted: %s)", pattern, deleted_count)
             
             return deleted_count
             
@@ -425,6 +442,8 @@ class UnifiedCacheManager:
             stats['hit_rate'] = (stats['hits'] / total_requests) * 100
         else:
             stats['hit_rate'] = 0.0
+        stats['stale_hits'] = self.stale_hits
+        stats['serve_stale'] = self.serve_stale
         
         # Get backend-specific stats if available
         if self.backend and hasattr(self.backend, 'get_stats'):
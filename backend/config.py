@@ -32,6 +32,8 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = Field(default=10, env="DATABASE_POOL_SIZE")
     database_max_overflow: int = Field(default=20, env="DATABASE_MAX_OVERFLOW")
+    database_pool_timeout: int = Field(default=30, env="DATABASE_POOL_TIMEOUT")
+    database_pool_recycle: int = Field(default=1800, env="DATABASE_POOL_RECYCLE")  # seconds
     
     # Redis settings
     redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
@@ -99,6 +101,10 @@ class Settings(BaseSettings):
     sentiment_analysis_enabled: bool = Field(default=True, env="SENTIMENT_ANALYSIS_ENABLED")
     sentiment_batch_size: int = Field(default=100, env="SENTIMENT_BATCH_SIZE")
     sentiment_update_interval: int = Field(default=300, env="SENTIMENT_UPDATE_INTERVAL")  # seconds
+    sentiment_inference_backend: str = Field(default="torch", env="SENTIMENT_INFERENCE_BACKEND")  # torch, onnx
+    sentiment_onnx_model_dir: Optional[str] = Field(default=None, env="SENTIMENT_ONNX_MODEL_DIR")
+    sentiment_onnx_quantize: bool = Field(default=True, env="SENTIMENT_ONNX_QUANTIZE")
+    sentiment_onnx_intra_op_threads: Optional[int] = Field(default=None, env="SENTIMENT_ONNX_INTRA_OP_THREADS")
     
     # Data collection settings
     data_collection_enabled: bool = Field(default=True, env="DATA_COLLECTION_ENABLED")
@@ -5,6 +5,7 @@ Database configuration and session management for InsiteChart platform.
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from .config import get_settings
 import sys
 import os
@@ -41,6 +42,43 @@ else:
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def get_async_database_url(url: str) -> str:
+    """Map a database URL to its async driver (aiosqlite / asyncpg)."""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgresql+psycopg2://"):
+        return url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def create_async_database_engine(url: str):
+    """Create an AsyncEngine with pool settings for the target database."""
+    async_url = get_async_database_url(url)
+    if async_url.startswith("sqlite"):
+        return create_async_engine(async_url, echo=settings.debug)
+    return create_async_engine(
+        async_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=True,
+        echo=settings.debug
+    )
+
+
+# Async engine for use from async handlers (optional drivers: aiosqlite, asyncpg)
+try:
+    async_engine = create_async_database_engine(database_url)
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+except ImportError as e:
+    print(f"Async database driver not available: {str(e)}")
+    async_engine = None
+    AsyncSessionLocal = None
+
 # Create base class for models
 Base = declarative_base()
 
@@ -57,6 +95,14 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Get async database session."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database engine is not available")
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
 def create_tables():
     """Create all database tables."""
     Base.metadata.create_all(bind=engine)
@@ -3,19 +3,48 @@
 JSON 형식의 구조화된 로그, 레벨별 필터링, 중앙 집중식 로그 수집 기능 제공
 """
 
+import copy
 import json
 import logging
+import logging.handlers
+import random
+import threading
+import time
 import traceback
 import sys
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, List
+from collections import deque
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 import asyncio
 import redis.asyncio as redis
 
+# orjson 사용 가능 여부 (없으면 표준 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# LogRecord 기본 속성 (extra 필드 추출 시 제외)
+_RESERVED_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'getMessage', 'exc_info',
+    'exc_text', 'stack_info'
+})
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """로그 데이터 JSON 직렬화 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, default=str)
+
 @dataclass
 class LogContext:
     """로그 컨텍스트 모델"""
@@ -29,6 +58,9 @@ class LogContext:
     line_number: Optional[int] = None
     additional_context: Optional[Dict[str, Any]] = None
 
+# 빈 컨텍스트 템플릿 (레코드마다 LogContext/asdict 생성 비용 회피)
+_EMPTY_CONTEXT = {field.name: None for field in fields(LogContext)}
+
 @dataclass
 class LogEntry:
     """로그 엔트리 모델"""
@@ -69,24 +101,20 @@ class StructuredFormatter(logging.Formatter):
                 "line_number": record.lineno
             }
             
-            # 컨텍스트 정보 추가
-            context = LogContext()
+            # 컨텍스트 정보 추가 (LogContext 스키마와 동일)
+            context = dict(_EMPTY_CONTEXT)
+            record_dict = record.__dict__
             
             # request_id, user_id 등 추가 필드 확인
-            if hasattr(record, 'request_id'):
-                context.request_id = record.request_id
-            if hasattr(record, 'user_id'):
-                context.user_id = record.user_id
-            if hasattr(record, 'session_id'):
-                context.session_id = record.session_id
-            if hasattr(record, 'correlation_id'):
-                context.correlation_id = record.correlation_id
+            for key in ('request_id', 'user_id', 'session_id', 'correlation_id'):
+                if key in record_dict:
+                    context[key] = record_dict[key]
             
             # 추가 컨텍스트
-            if hasattr(record, 'context'):
-                context.additional_context = record.context
+            if 'context' in record_dict:
+                context['additional_context'] = record_dict['context']
             
-            log_data["context"] = asdict(context)
+            log_data["context"] = context
             
             # 예외 정보 처리
             if record.exc_info:
@@ -108,21 +136,16 @@ class StructuredFormatter(logging.Formatter):
             
             # 추가 필드 포함
             if self.include_extra_fields:
-                extra_fields = {}
-                for key, value in record.__dict__.items():
-                    if key not in {
-                        'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                        'filename', 'module', 'lineno', 'funcName', 'created',
-                        'msecs', 'relativeCreated', 'thread', 'threadName',
-                        'processName', 'process', 'getMessage', 'exc_info',
-                        'exc_text', 'stack_info'
-                    } and not key.startswith('_'):
-                        extra_fields[key] = value
+                extra_fields = {
+                    key: value
+                    for key, value in record_dict.items()
+                    if key not in _RESERVED_RECORD_ATTRS and not key.startswith('_')
+                }
                 
                 if extra_fields:
                     log_data["extra"] = extra_fields
             
-            return json.dumps(log_data, ensure_ascii=False, default=str)
+            return _dumps(log_data)
             
         except Exception as e:
             # 포맷 오류 시 기본 포맷 사용
@@ -153,6 +176,171 @@ class StructuredFormatter(logging.Formatter):
         
         return tb_str
 
+class LevelSamplingFilter(logging.Filter):
+    """레벨별 샘플링 필터 클래스
+    
+    대량으로 발생하는 DEBUG/INFO 로그를 레벨별 비율로 샘플링합니다.
+    WARNING 이상은 비율을 지정하지 않으면 항상 기록됩니다.
+    핸들러에 연결되므로 하위 로거(logging.getLogger)에서 전파된 레코드도
+    샘플링됩니다. StructuredLogger가 이미 샘플링한 레코드는 다시 거르지 않습니다.
+    """
+    
+    def __init__(self, sample_rates: Optional[Dict[str, float]] = None):
+        super().__init__()
+        self.sample_rates: Dict[int, float] = {}
+        for level_name, rate in (sample_rates or {}).items():
+            level = logging.getLevelName(level_name.upper()) if isinstance(level_name, str) else level_name
+            self.sample_rates[level] = max(0.0, min(1.0, float(rate)))
+        self.sampled_out = 0
+    
+    def should_sample(self, level: int) -> bool:
+        """해당 레벨의 로그를 기록할지 결정"""
+        rate = self.sample_rates.get(level)
+        if rate is None or rate >= 1.0:
+            return True
+        if rate > 0.0 and random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """표준 logging 필터 인터페이스"""
+        if getattr(record, "_sampled", False):
+            return True
+        return self.should_sample(record.levelno)
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """비차단 큐 핸들러 클래스
+    
+    호출 스레드(이벤트 루프)에서는 레코드를 deque에 추가만 하고,
+    포맷과 I/O는 BatchingLogWriter 스레드에서 처리합니다.
+    deque.append는 락/조건변수 없이 스레드 안전하므로 호출 비용이 가장 낮습니다.
+    """
+    
+    def __init__(
+        self,
+        log_queue: deque,
+        writer: Optional["BatchingLogWriter"] = None,
+        max_queue_size: int = 10000
+    ):
+        super().__init__(log_queue)
+        self.writer = writer
+        self.max_queue_size = max_queue_size
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """같은 프로세스 내 큐이므로 포맷 없이 메시지 인자만 확정"""
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        """큐가 가득 차면 대기하지 않고 레코드 폐기"""
+        if len(self.queue) >= self.max_queue_size:
+            self.dropped += 1
+            return
+        self.queue.append(record)
+    
+    def close(self):
+        """핸들러 종료 시 기록 스레드도 종료"""
+        if self.writer:
+            self.writer.stop()
+        super().close()
+
+class BatchingLogWriter:
+    """배치 로그 기록 스레드 클래스
+    
+    flush_interval초마다 깨어나 큐의 레코드를 최대 batch_size개씩 모아
+    대상 스트림에 한 번의 write/flush로 기록합니다. 레코드마다 스레드를
+    깨우지 않으므로 호출 스레드와의 GIL 경합이 적습니다.
+    """
+    
+    def __init__(
+        self,
+        log_queue: deque,
+        handlers: List[logging.Handler],
+        batch_size: int = 256,
+        flush_interval: float = 0.05
+    ):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._drain_lock = threading.Lock()
+        
+        # 통계
+        self.stats = {
+            "records_written": 0,
+            "batches_written": 0,
+            "write_errors": 0
+        }
+    
+    def start(self):
+        """기록 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="structured-log-writer",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        """남은 레코드를 기록한 후 스레드 종료"""
+        if self._thread:
+            self._stop_event.set()
+            self._thread.join(timeout)
+            self._thread = None
+        self.drain()
+    
+    def flush(self):
+        """큐에 쌓인 레코드를 호출 스레드에서 즉시 기록"""
+        self.drain()
+    
+    def drain(self):
+        """큐가 빌 때까지 배치 단위로 기록"""
+        with self._drain_lock:
+            while self.queue:
+                batch = []
+                while self.queue and len(batch) < self.batch_size:
+                    batch.append(self.queue.popleft())
+                self._write_batch(batch)
+    
+    def _run(self):
+        """주기적 배치 기록 루프"""
+        while not self._stop_event.wait(self.flush_interval):
+            self.drain()
+    
+    def _write_batch(self, batch: List[logging.LogRecord]):
+        """배치 기록 (스트림 핸들러는 한 번의 write로 처리)"""
+        for handler in self.handlers:
+            try:
+                records = [record for record in batch if record.levelno >= handler.level and handler.filter(record)]
+                if not records:
+                    continue
+                
+                if isinstance(handler, logging.StreamHandler):
+                    if isinstance(handler, logging.FileHandler) and handler.stream is None:
+                        handler.stream = handler._open()
+                    payload = handler.terminator.join(handler.format(record) for record in records)
+                    with handler.lock:
+                        handler.stream.write(payload + handler.terminator)
+                        handler.stream.flush()
+                else:
+                    for record in records:
+                        handler.handle(record)
+            except Exception as e:
+                self.stats["write_errors"] += 1
+                sys.stderr.write(f"Structured log writer error: {str(e)}\n")
+        
+        self.stats["records_written"] += len(batch)
+        self.stats["batches_written"] += 1
+
 class StructuredLogger:
     """구조화된 로거 클래스"""
     
@@ -166,7 +354,12 @@ class StructuredLogger:
         enable_file: bool = True,
         log_file_path: Optional[str] = None,
         enable_remote: bool = False,
-        remote_config: Optional[Dict[str, Any]] = None
+        remote_config: Optional[Dict[str, Any]] = None,
+        async_mode: bool = False,
+        sample_rates: Optional[Dict[str, float]] = None,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        max_queue_size: int = 10000
     ):
         self.name = name
         self.service_name = service_name
@@ -178,6 +371,21 @@ class StructuredLogger:
         self.log_file_path = log_file_path
         self.remote_config = remote_config or {}
         
+        # 비동기 배치 기록 설정
+        self.async_mode = async_mode
+        self.sample_rates = sample_rates or {}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.queue_handler: Optional[AsyncQueueHandler] = None
+        self.writer: Optional[BatchingLogWriter] = None
+        
+        # 레벨별 샘플링 (직접 호출은 레코드 생성 전에, 전파된 레코드는 핸들러에서 적용)
+        self.sampling_filter = LevelSamplingFilter(self.sample_rates) if self.sample_rates else None
+        
+        # bind()로 만든 로거는 부모의 핸들러를 공유만 함
+        self._owns_handlers = True
+        
         # 로거 설정
         self.logger = logging.getLogger(name)
         self.logger.setLevel(self.log_level)
@@ -295,22 +503,15 @@ class StructuredLogger:
         )
     
     def bind(self, **kwargs):
-        """컨텍스트 바인딩"""
-        # 바인딩된 컨텍스트를 가진 새 로거 인스턴스 반환
-        bound_logger = StructuredLogger(
-            name=self.name,
-            service_name=self.service_name,
-            redis_url=self.redis_url,
-            log_level=logging.getLevelName(self.log_level),
-            enable_console=self.enable_console,
-            enable_file=self.enable_file,
-            log_file_path=self.log_file_path,
-            enable_remote=self.enable_remote,
-            remote_config=self.remote_config
-        )
+        """컨텍스트 바인딩
         
-        # 바인딩된 컨텍스트 저장
-        bound_logger._bound_context = kwargs
+        부모의 로거, 핸들러, 기록 스레드를 그대로 공유하고 컨텍스트만 추가합니다
+        (LoggerAdapter 방식). 바인딩된 로거는 핸들러를 소유하지 않으므로
+        close()를 호출해도 공유 핸들러를 닫지 않습니다.
+        """
+        bound_logger = copy.copy(self)
+        bound_logger._bound_context = {**getattr(self, '_bound_context', {}), **kwargs}
+        bound_logger._owns_handlers = False
         
         return bound_logger
     
@@ -324,6 +525,12 @@ class StructuredLogger:
     
     def _log(self, level: int, message: str, **kwargs):
         """내부 로깅 메서드"""
+        # 레벨 비활성화 또는 샘플링 제외 시 레코드 생성 없이 반환
+        if not self.logger.isEnabledFor(level):
+            return
+        if self.sampling_filter and not self.sampling_filter.should_sample(level):
+            return
+        
         # 로그 레코드 생성
         record = self.logger.makeRecord(
             name=self.logger.name,
@@ -334,6 +541,8 @@ class StructuredLogger:
             args=(),
             exc_info=kwargs.get('exc_info')
         )
+        # 핸들러 샘플링 필터에서 중복 샘플링 방지
+        record._sampled = True
         
         # 바인딩된 컨텍스트가 있는 경우 추가
         if hasattr(self, '_bound_context'):
@@ -350,22 +559,77 @@ class StructuredLogger:
     
     def _setup_handlers(self):
         """로그 핸들러 설정"""
-        # 기존 핸들러 제거
+        # 기존 핸들러 제거 (비동기 핸들러는 기록 스레드까지 종료)
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, AsyncQueueHandler):
+                handler.close()
         self.logger.handlers.clear()
         
+        handlers = []
+        
         # 콘솔 핸들러
         if self.enable_console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(self.formatter)
             console_handler.setLevel(self.log_level)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # 파일 핸들러 (비동기 설정)
         if self.enable_file and self.log_file_path:
             file_handler = logging.FileHandler(self.log_file_path)
             file_handler.setFormatter(self.formatter)
             file_handler.setLevel(self.log_level)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        if not self.async_mode:
+            for handler in handlers:
+                if self.sampling_filter:
+                    handler.addFilter(self.sampling_filter)
+                self.logger.addHandler(handler)
+            return
+        
+        # 비동기 모드: 큐 핸들러만 로거에 연결하고 포맷/I/O는 기록 스레드에서 처리
+        # (상위 로거의 동기 핸들러로 전파되지 않도록 차단)
+        self.logger.propagate = False
+        log_queue = deque()
+        self.writer = BatchingLogWriter(
+            log_queue,
+            handlers,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval
+        )
+        self.queue_handler = AsyncQueueHandler(log_queue, self.writer, self.max_queue_size)
+        if self.sampling_filter:
+            # 샘플링 제외 레코드는 큐에 들어가지 않음
+            self.queue_handler.addFilter(self.sampling_filter)
+        self.logger.addHandler(self.queue_handler)
+        self.writer.start()
+    
+    def flush(self):
+        """비동기 모드에서 대기 중인 로그 즉시 기록"""
+        if self.writer:
+            self.writer.flush()
+    
+    def close(self):
+        """비동기 기록 스레드 종료 (남은 로그 기록 후)"""
+        if not self._owns_handlers:
+            return
+        if self.queue_handler:
+            self.logger.removeHandler(self.queue_handler)
+            self.queue_handler.close()
+            self.queue_handler = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """로깅 파이프라인 통계"""
+        stats = {
+            "async_mode": self.async_mode,
+            "sampled_out": self.sampling_filter.sampled_out if self.sampling_filter else 0
+        }
+        if self.writer and self.queue_handler:
+            stats.update(self.writer.stats)
+            stats["queue_size"] = len(self.queue_handler.queue)
+            stats["dropped"] = self.queue_handler.dropped
+        return stats
     
     async def _setup_file_handler(self):
         """파일 핸들러 비동기 설정"""
@@ -431,7 +695,8 @@ class LoggerManager:
             "log_level": "INFO",
             "enable_console": True,
             "enable_file": True,
-            "enable_remote": False
+            "enable_remote": False,
+            "async_mode": False
         }
     
     async def get_logger(
@@ -484,6 +749,7 @@ class LoggerManager:
     async def shutdown(self):
         """모든 로거 종료"""
         for logger in self.loggers.values():
+            logger.close()
             if logger.redis_client:
                 await logger.redis_client.close()
         
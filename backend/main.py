@@ -7,6 +7,7 @@ routes, and configuration for the InsiteChart backend API.
 
 import logging
 import time
+import uuid
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
@@ -17,7 +18,11 @@ from fastapi.responses import JSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 
-from .api.routes import router as api_router
+from .api.routes import (
+    router as api_router,
+    initialize_global_services as initialize_api_services,
+    close_global_services as close_api_services
+)
 from .api.websocket_routes import router as websocket_router
 from .api.security_routes import router as security_router
 from .api.test_routes import router as test_router
@@ -25,11 +30,15 @@ from .api.auth_routes import router as auth_router
 from .api.feedback_routes import router as feedback_router
 from .cache.unified_cache import UnifiedCacheManager
 from .cache.resilient_cache_manager import resilient_cache_manager
+from .cache.sentiment_result_cache import sentiment_result_cache
 from .monitoring.operational_monitor import operational_monitor
+from .monitoring.system_metrics_sampler import system_metrics_sampler
+from .monitoring.load_watchdog import load_watchdog
+from .monitoring.performance_monitor import performance_monitor
 from .services.unified_service import UnifiedService
-from .services.stock_service import StockService
 from .services.sentiment_service import SentimentService
-from .database import get_db, create_tables
+from .services.bulk_writer import bulk_writer
+from .database import get_db, create_tables, SessionLocal
 
 
 # Configure logging
@@ -59,6 +68,10 @@ async def lifespan(app: FastAPI):
         create_tables()
         logger.info("Database tables created")
         
+        # Start batched writes for high-volume price/sentiment rows
+        await bulk_writer.start()
+        logger.info("Bulk writer started")
+        
         # Initialize cache manager
         cache_manager = UnifiedCacheManager()
         await cache_manager.initialize()
@@ -68,8 +81,12 @@ async def lifespan(app: FastAPI):
         await resilient_cache_manager.initialize()
         logger.info("Resilient cache manager initialized")
         
-        # Initialize stock service
-        stock_service = StockService()
+        # Initialize shared sentiment result cache (local-only without Redis)
+        await sentiment_result_cache.initialize()
+        logger.info("Sentiment result cache initialized")
+        
+        # Initialize stock service (shared with the API routes, which serve /search)
+        stock_service = await initialize_api_services(SessionLocal)
         logger.info("Stock service initialized")
         
         # Initialize sentiment service
@@ -92,6 +109,21 @@ async def lifespan(app: FastAPI):
         await security_service.start()
         logger.info("Security service initialized")
         
+        # Start the shared system metrics sampler before any monitor reads it
+        system_metrics_sampler.start()
+        logger.info("System metrics sampler started")
+
+        # Start the load watchdog and connect services that can degrade under load
+        from .services.intelligent_cache_manager import intelligent_cache_manager
+        load_watchdog.register_executor("stock_service", stock_service.executor)
+        load_watchdog.attach_degradable_services(
+            cache_manager=cache_manager,
+            intelligent_cache_manager=intelligent_cache_manager,
+            notification_service=notification_service
+        )
+        await load_watchdog.start()
+        logger.info("Load watchdog started")
+
         # Initialize operational monitor
         await operational_monitor.start()
         logger.info("Operational monitor initialized")
@@ -164,6 +196,12 @@ async def lifespan(app: FastAPI):
         # Stop operational monitor
         await operational_monitor.stop()
         logger.info("Operational monitor stopped")
+
+        # Stop load watchdog (restores normal service behaviour)
+        await load_watchdog.stop()
+
+        # Stop system metrics sampler
+        system_metrics_sampler.stop()
         
         if cache_manager:
             await cache_manager.close()
@@ -173,6 +211,17 @@ async def lifespan(app: FastAPI):
             await resilient_cache_manager.close()
             logger.info("Resilient cache manager closed")
         
+        await sentiment_result_cache.close()
+        logger.info("Sentiment result cache closed")
+        
+        # Release inference and request worker threads
+        await close_api_services()
+        logger.info("API services closed")
+        
+        # Flush buffered price/sentiment rows
+        await bulk_writer.close()
+        logger.info("Bulk writer closed")
+        
         logger.info("InsiteChart API server shut down successfully")
         
     except Exception as e:
@@ -221,10 +270,24 @@ async def log_requests(request: Request, call_next):
 # 2. Request timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    """Add processing time header to responses."""
+    """Add processing time header to responses and record request metrics."""
     start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
+    status_code = 500
+    try:
+        with load_watchdog.track_request():
+            response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        process_time = time.time() - start_time
+        # Request rate and latency signals for auto-scaling
+        await performance_monitor.record_request(
+            request_id=request.headers.get("X-Request-ID") or uuid.uuid4().hex,
+            method=request.method,
+            endpoint=request.url.path,
+            status_code=status_code,
+            response_time=process_time,
+            ip_address=request.client.host if request.client else None
+        )
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
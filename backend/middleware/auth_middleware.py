@@ -5,8 +5,12 @@ JWT 인증 미들웨어 모듈
 
 import os
 import jwt
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet, Tuple
 from fastapi import HTTPException, Request, status, Depends
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -16,6 +20,58 @@ logger = logging.getLogger(__name__)
 
 security = HTTPBearer(auto_error=False)
 
+
+class VerifiedTokenCache:
+    """검증된 토큰 캐시 (토큰 다이제스트 -> 클레임), 항목은 토큰의 exp 시각에 만료"""
+    
+    def __init__(self, max_size: int = 10000, default_ttl: float = 300.0):
+        self.max_size = max_size
+        self.default_ttl = default_ttl  # exp 클레임이 없는 토큰의 캐시 시간 (초)
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any], FrozenSet[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+    
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=20).digest()
+    
+    def get(self, token: str) -> Optional[Tuple[Dict[str, Any], FrozenSet[str]]]:
+        """만료되지 않은 캐시 항목 조회"""
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1], entry[2]
+    
+    def put(self, token: str, claims: Dict[str, Any], permissions: FrozenSet[str]):
+        """검증된 클레임 저장"""
+        exp = claims.get("exp")
+        expires_at = float(exp) if isinstance(exp, (int, float)) else time.time() + self.default_ttl
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, claims, permissions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "size": len(self._entries), "max_size": self.max_size}
+
+
 class JWTAuthMiddleware:
     """JWT 인증 미들웨어 클래스"""
     
@@ -25,6 +81,63 @@ class JWTAuthMiddleware:
         self.algorithm = algorithm
         self.token_expiry = timedelta(hours=24)
         self.refresh_token_expiry = timedelta(days=7)
+        
+        # 반복 제시되는 토큰의 서명 검증을 생략하기 위한 캐시
+        self.token_cache = VerifiedTokenCache(
+            max_size=int(os.getenv("JWT_VERIFY_CACHE_SIZE", "10000"))
+        )
+    
+    def decode_token(self, token: str) -> Dict[str, Any]:
+        """
+        JWT 토큰 디코딩 (검증 캐시 사용)
+        
+        캐시에 없는 토큰만 서명, exp, iat를 검증하고 결과를 exp까지 캐시합니다.
+        반환된 클레임은 캐시와 공유되므로 수정하지 않아야 합니다.
+        
+        Args:
+            token: JWT 토큰
+            
+        Returns:
+            토큰 페이로드
+            
+        Raises:
+            jwt.InvalidTokenError: 토큰이 유효하지 않은 경우 (ExpiredSignatureError 포함)
+        """
+        return self._decode_with_permissions(token)[0]
+    
+    def _decode_with_permissions(self, token: str) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+        
+        payload = jwt.decode(
+            token,
+            self.secret_key,
+            algorithms=[self.algorithm],
+            options={"verify_exp": True}
+        )
+        
+        # 토큰 발행 시각 확인
+        iat_timestamp = payload.get("iat")
+        if isinstance(iat_timestamp, (int, float)) and iat_timestamp > time.time():
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+        
+        permissions = frozenset(payload.get("permissions") or ())
+        self.token_cache.put(token, payload, permissions)
+        return payload, permissions
+    
+    def _apply_user_state(self, request: Request, token: str, user_id_claim: str = "user_id") -> Dict[str, Any]:
+        """토큰을 검증하고 사용자 정보를 request.state에 저장"""
+        payload, permissions = self._decode_with_permissions(token)
+        
+        request.state.user = payload
+        request.state.user_id = payload.get(user_id_claim)
+        request.state.user_role = payload.get("role", "user")
+        request.state.permissions = payload.get("permissions", [])
+        request.state.permission_set = permissions
+        
+        logger.debug("User authenticated: %s with role %s", payload.get(user_id_claim), payload.get("role"))
+        return payload
     
     async def verify_token(self, request: Request) -> Optional[Dict[str, Any]]:
         """
@@ -50,39 +163,8 @@ class JWTAuthMiddleware:
             
             token = credentials.credentials
             
-            # JWT 토큰 디코딩
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm],
-                options={"verify_exp": True}
-            )
-            
-            # 토큰 만료 확인
-            exp_timestamp = payload.get("exp")
-            if exp_timestamp and datetime.fromtimestamp(exp_timestamp) < datetime.utcnow():
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="토큰이 만료되었습니다",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # 토큰 발행 확인
-            iat_timestamp = payload.get("iat")
-            if iat_timestamp and datetime.fromtimestamp(iat_timestamp) > datetime.utcnow():
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="유효하지 않은 토큰입니다",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # 사용자 정보를 request.state에 저장
-            request.state.user = payload
-            request.state.user_id = payload.get("user_id")
-            request.state.user_role = payload.get("role", "user")
-            request.state.permissions = payload.get("permissions", [])
-            
-            logger.info(f"User authenticated: {payload.get('user_id')} with role {payload.get('role')}")
+            # JWT 토큰 검증 (캐시된 토큰은 서명 검증 생략) 및 사용자 정보 저장
+            payload = self._apply_user_state(request, token)
             
             return payload
             
@@ -209,16 +291,18 @@ class JWTAuthMiddleware:
         Returns:
             권한이 있는 경우 True, 없는 경우 False
         """
-        if not hasattr(request.state, 'user') or not request.state.user:
+        if not getattr(request.state, 'user', None):
             return False
         
-        user_permissions = request.state.permissions
-        
         # 관리자는 모든 권한 가짐
         if request.state.user_role == "admin":
             return True
         
-        # 특정 권한 확인
+        # 특정 권한 확인 (토큰 검증 시 미리 계산된 집합 사용)
+        user_permissions = getattr(request.state, 'permission_set', None)
+        if user_permissions is None:
+            user_permissions = frozenset(request.state.permissions or ())
+            request.state.permission_set = user_permissions
         return required_permission in user_permissions
     
     def __call__(self, scope, receive, send):
@@ -271,12 +355,7 @@ class JWTAuthMiddleware:
                     token = auth_header[7:]  # "Bearer " 제거
                     try:
                         # 토큰 검증
-                        payload = jwt.decode(
-                            token,
-                            self.secret_key,
-                            algorithms=[self.algorithm],
-                            options={"verify_exp": True}
-                        )
+                        payload = self.decode_token(token)
                         
                         # 사용자 정보를 scope에 저장
                         scope["user"] = payload
@@ -383,30 +462,8 @@ async def require_auth(
     try:
         token = credentials.credentials
         
-        # JWT 토큰 디코딩
-        payload = jwt.decode(
-            token,
-            auth_middleware.secret_key,
-            algorithms=[auth_middleware.algorithm],
-            options={"verify_exp": True}
-        )
-        
-        # 토큰 만료 확인
-        exp_timestamp = payload.get("exp")
-        if exp_timestamp and datetime.fromtimestamp(exp_timestamp) < datetime.utcnow():
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="토큰이 만료되었습니다",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # 사용자 정보를 request.state에 저장
-        request.state.user = payload
-        request.state.user_id = payload.get("sub")  # auth_routes.py에서 sub 필드 사용
-        request.state.user_role = payload.get("role", "user")
-        request.state.permissions = payload.get("permissions", [])
-        
-        logger.info(f"User authenticated: {payload.get('sub')} with role {payload.get('role')}")
+        # JWT 토큰 검증 및 사용자 정보 저장 (auth_routes.py에서 sub 필드 사용)
+        payload = auth_middleware._apply_user_state(request, token, user_id_claim="sub")
         
         return payload
         
@@ -451,26 +508,8 @@ async def optional_auth(
     try:
         token = credentials.credentials
         
-        # JWT 토큰 디코딩
-        payload = jwt.decode(
-            token,
-            auth_middleware.secret_key,
-            algorithms=[auth_middleware.algorithm],
-            options={"verify_exp": True}
-        )
-        
-        # 토큰 만료 확인
-        exp_timestamp = payload.get("exp")
-        if exp_timestamp and datetime.fromtimestamp(exp_timestamp) < datetime.utcnow():
-            return None
-        
-        # 사용자 정보를 request.state에 저장
-        request.state.user = payload
-        request.state.user_id = payload.get("sub")
-        request.state.user_role = payload.get("role", "user")
-        request.state.permissions = payload.get("permissions", [])
-        
-        logger.info(f"User authenticated: {payload.get('sub')} with role {payload.get('role')}")
+        # JWT 토큰 검증 및 사용자 정보 저장
+        payload = auth_middleware._apply_user_state(request, token, user_id_claim="sub")
         
         return payload
         
@@ -523,13 +562,7 @@ def verify_jwt_token(token: str) -> Dict[str, Any]:
         HTTPException: 토큰이 유효하지 않은 경우
     """
     try:
-        payload = jwt.decode(
-            token,
-            auth_middleware.secret_key,
-            algorithms=[auth_middleware.algorithm],
-            options={"verify_exp": True}
-        )
-        return payload
+        return auth_middleware.decode_token(token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -4,6 +4,7 @@
 """
 
 import time
+import math
 import asyncio
 import hashlib
 from typing import Dict, Any, Optional, Tuple, List
@@ -38,6 +39,90 @@ class RateLimitInfo:
     identifier: str = ""
     window_used: int = 0
 
+# GCRA(Generic Cell Rate Algorithm) 다중 정책 속도 제한 스크립트
+#
+# 키마다 이론적 도착 시각(TAT) 하나만 저장하므로 키당 O(1) 메모리이며,
+# 모든 정책을 한 번의 원자적 호출로 평가합니다. 하나라도 거부하면 어떤 TAT도 갱신하지 않습니다.
+#
+# KEYS[1]                   동적 조정 계수 키
+# KEYS[2i], KEYS[2i+1]      i번째 정책의 TAT 키, 패널티 키
+# ARGV[1]                   현재 시각 (ms)
+# ARGV[2+4(i-1) ...]        i번째 정책의 요청 수, 윈도우(ms), 조정 후 최소 요청 수, 패널티(ms)
+#                           (패널티가 0이면 위반해도 패널티 키를 설정하지 않지만, 활성 패널티는 모든 정책이 존중)
+#
+# 반환: {허용 여부, 정책별 [조정된 요청 수, 남은 요청 수, 재시도 대기(ms), 리셋 시각(ms)] ...}
+GCRA_LUA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local adjustment = tonumber(redis.call('GET', KEYS[1]) or '1') or 1
+local count = (#KEYS - 1) / 2
+local allowed = 1
+local tats = {}
+local results = {}
+
+for i = 1, count do
+    local tat_key = KEYS[2 * i]
+    local penalty_key = KEYS[2 * i + 1]
+    local base = 2 + (i - 1) * 4
+    local requests = tonumber(ARGV[base])
+    local window = tonumber(ARGV[base + 1])
+    local min_requests = tonumber(ARGV[base + 2])
+    local penalty = tonumber(ARGV[base + 3])
+
+    if adjustment ~= 1 then
+        requests = math.max(math.floor(requests * adjustment), min_requests)
+    end
+
+    local interval = window / requests
+    local tat = tats[tat_key]
+    if tat == nil then
+        tat = tonumber(redis.call('GET', tat_key) or now)
+    end
+    if tat < now then
+        tat = now
+    end
+
+    local new_tat = tat + interval
+    local allow_at = new_tat - window
+    local remaining = 0
+    local retry_after = 0
+    local penalty_ttl = redis.call('PTTL', penalty_key)
+
+    if penalty_ttl > 0 then
+        allowed = 0
+        retry_after = penalty_ttl
+    elseif allow_at > now then
+        allowed = 0
+        retry_after = allow_at - now
+        if penalty > 0 then
+            redis.call('SET', penalty_key, '1', 'PX', penalty)
+            retry_after = math.max(retry_after, penalty)
+        end
+    else
+        remaining = math.floor((window - (new_tat - now)) / interval)
+    end
+
+    tats[tat_key] = new_tat
+    results[i] = {requests, remaining, string.format('%.3f', retry_after), string.format('%.3f', tat)}
+end
+
+if allowed == 1 then
+    for tat_key, new_tat in pairs(tats) do
+        redis.call('SET', tat_key, string.format('%.3f', new_tat), 'PX', math.max(math.ceil(new_tat - now), 1))
+    end
+    for i = 1, count do
+        results[i][4] = string.format('%.3f', tats[KEYS[2 * i]])
+    end
+end
+
+local reply = {allowed}
+for i = 1, count do
+    for _, value in ipairs(results[i]) do
+        table.insert(reply, value)
+    end
+end
+return reply
+"""
+
 class AdvancedRateLimiter:
     """고급 속도 제한 시스템 클래스"""
     
@@ -45,6 +130,8 @@ class AdvancedRateLimiter:
         self.redis_url = redis_url
         self.redis_client = None
         self.key_prefix = "insitechart:rate_limit:"
+        self._gcra_script = None
+        self._gcra_script_client = None
         
         # 테스트 환경 확인
         import os
@@ -71,6 +158,8 @@ class AdvancedRateLimiter:
                     burst=policy.burst * 1000,
                     penalty=policy.penalty
                 )
+        else:
+            self.default_policies = base_policies
         
         # 엔드포인트별 정책 매핑
         self.endpoint_policies = {
@@ -124,14 +213,12 @@ class AdvancedRateLimiter:
             # 정책 선택
             policy = self._select_policy(operation, user_tier, endpoint)
             
-            # 동적 조정 확인
-            adjusted_policy = await self._apply_dynamic_adjustment(policy, identifier)
-            
-            # 슬라이딩 윈도우 알고리즘 적용
-            if burst_mode and adjusted_policy.burst > 0:
-                return await self._sliding_window_with_burst(identifier, operation, adjusted_policy)
-            else:
-                return await self._sliding_window(identifier, operation, adjusted_policy)
+            # 동적 조정과 GCRA 판정을 한 번의 스크립트 호출로 처리
+            results = await self._evaluate_limits(
+                identifier,
+                [(f"{operation}:{user_tier}", policy, burst_mode)]
+            )
+            return self._most_restrictive(results)
                 
         except Exception as e:
             logger.error(f"Error checking rate limit: {str(e)}")
@@ -159,16 +246,24 @@ class AdvancedRateLimiter:
         Returns:
             가장 제한적인 속도 제한 정보
         """
-        results = []
-        
-        for operation, user_tier in limits:
-            result = await self.is_allowed(identifier, operation, user_tier)
-            results.append(result)
+        checks = [
+            (f"{operation}:{user_tier}", self._select_policy(operation, user_tier, ""), False)
+            for operation, user_tier in limits
+        ]
         
-        # 가장 제한적인 결과 선택
-        most_restrictive = min(results, key=lambda x: x.remaining)
-        
-        return most_restrictive
+        try:
+            # 모든 정책을 한 번의 원자적 호출로 평가 (하나라도 거부되면 어떤 카운터도 소비하지 않음)
+            results = await self._evaluate_limits(identifier, checks)
+            return self._most_restrictive(results)
+        except Exception as e:
+            logger.error(f"Error checking multiple rate limits: {str(e)}")
+            return RateLimitInfo(
+                allowed=True,
+                remaining=self.default_policies["default"].requests,
+                reset_time=datetime.utcnow() + timedelta(hours=1),
+                policy=self.default_policies["default"],
+                identifier=identifier
+            )
     
     async def update_dynamic_adjustment(self, load_factor: float):
         """
@@ -201,41 +296,37 @@ class AdvancedRateLimiter:
         except Exception as e:
             logger.error(f"Error updating dynamic adjustment: {str(e)}")
     
-    async def get_rate_limit_stats(self, identifier: str) -> Dict[str, Any]:
+    async def get_rate_limit_stats(self, identifier: str, user_tier: str = "default") -> Dict[str, Any]:
         """
         식별자별 속도 제한 통계 조회
         
         Args:
             identifier: 고유 식별자
+            user_tier: 사용자 티어
             
         Returns:
             속도 제한 통계
         """
         try:
             stats = {}
+            operations = list(self.default_policies.keys())
+            keys = [self._gcra_key(identifier, f"{operation}:{user_tier}") for operation in operations]
             
-            # 모든 작업 유형에 대한 통계 조회
-            for operation in self.default_policies.keys():
-                key = f"{self.key_prefix}{identifier}:{operation}"
-                
-                # 현재 윈도우 정보
-                current_window = int(time.time()) // self.default_policies[operation].window
-                window_key = f"{key}:{current_window}"
-                
-                current_count = await self.redis_client.get(window_key)
-                current_count = int(current_count) if current_count else 0
-                
-                # 이전 윈도우 정보
-                prev_window = current_window - 1
-                prev_window_key = f"{key}:{prev_window}"
-                prev_count = await self.redis_client.get(prev_window_key)
-                prev_count = int(prev_count) if prev_count else 0
+            # 모든 작업 유형의 TAT를 한 번에 조회
+            tats = await self.redis_client.mget(keys)
+            now_ms = time.time() * 1000
+            
+            for operation, tat in zip(operations, tats):
+                policy = self.default_policies[operation]
+                window_ms = policy.window * 1000
+                interval_ms = window_ms / policy.requests
+                backlog_ms = max(float(tat) - now_ms, 0.0) if tat else 0.0
                 
                 stats[operation] = {
-                    "current_window": current_count,
-                    "previous_window": prev_count,
-                    "limit": self.default_policies[operation].requests,
-                    "window_seconds": self.default_policies[operation].window
+                    "current_window": min(math.ceil(backlog_ms / interval_ms), policy.requests),
+                    "limit": policy.requests,
+                    "window_seconds": policy.window,
+                    "reset_in_seconds": round(backlog_ms / 1000, 3)
                 }
             
             return stats
@@ -262,153 +353,89 @@ class AdvancedRateLimiter:
         # 기본 정책
         return self.default_policies["default"]
     
-    async def _apply_dynamic_adjustment(self, policy: RateLimitPolicy, identifier: str) -> RateLimitPolicy:
-        """동적 조정 적용"""
-        try:
-            # 현재 조정 계수 조회
-            adjustment_str = await self.redis_client.get(f"{self.key_prefix}dynamic_adjustment")
-            if not adjustment_str:
-                return policy
-            
-            adjustment = float(adjustment_str)
-            if adjustment == 1.0:
-                return policy
-            
-            # 조정된 정책 생성
-            adjusted_requests = max(
-                int(policy.requests * adjustment),
-                self.dynamic_adjustment["min_requests"]
-            )
-            
-            return RateLimitPolicy(
-                requests=adjusted_requests,
-                window=policy.window,
-                burst=max(int(policy.burst * adjustment), 1),
-                penalty=policy.penalty
-            )
-            
-        except Exception as e:
-            logger.error(f"Error applying dynamic adjustment: {str(e)}")
-            return policy
+    def _gcra_key(self, identifier: str, scope: str) -> str:
+        return f"{self.key_prefix}gcra:{identifier}:{scope}"
     
-    async def _sliding_window(self, identifier: str, operation: str, policy: RateLimitPolicy) -> RateLimitInfo:
-        """슬라이딩 윈도우 알고리즘"""
-        now = time.time()
-        window_start = now - policy.window
-        
-        # 키 생성
-        key = f"{self.key_prefix}{identifier}:{operation}"
-        
-        # 현재 윈도우의 모든 요청 타임스탬프 조회
-        timestamps = await self.redis_client.zrangebyscore(key, window_start, now)
-        
-        # 현재 요청 수
-        current_count = len(timestamps)
-        
-        # 요청 수 확인
-        if current_count >= policy.requests:
-            # 가장 오래된 요청 제거 시간 계산
-            oldest_timestamp = await self.redis_client.zrange(key, 0, 0, withscores=True)
-            if oldest_timestamp:
-                retry_after = int(oldest_timestamp[0][1] + policy.window - now)
-            else:
-                retry_after = policy.window
-            
-            return RateLimitInfo(
-                allowed=False,
-                remaining=0,
-                reset_time=datetime.fromtimestamp(now + policy.window),
-                retry_after=max(retry_after, 1),
-                policy=policy,
-                identifier=identifier,
-                window_used=current_count
-            )
-        
-        # 현재 요청 추가
-        await self.redis_client.zadd(key, {str(now): now})
-        
-        # 만료된 요청 정리
-        await self.redis_client.zremrangebyscore(key, 0, window_start)
-        
-        # 키 만료 설정
-        await self.redis_client.expire(key, policy.window)
-        
-        return RateLimitInfo(
-            allowed=True,
-            remaining=policy.requests - current_count - 1,
-            reset_time=datetime.fromtimestamp(now + policy.window),
-            policy=policy,
-            identifier=identifier,
-            window_used=current_count + 1
-        )
+    def _get_gcra_script(self):
+        """현재 Redis 클라이언트에 등록된 GCRA 스크립트 (EVALSHA, NOSCRIPT 시 자동 재적재)"""
+        if self._gcra_script is None or self._gcra_script_client is not self.redis_client:
+            self._gcra_script = self.redis_client.register_script(GCRA_LUA_SCRIPT)
+            self._gcra_script_client = self.redis_client
+        return self._gcra_script
     
-    async def _sliding_window_with_burst(self, identifier: str, operation: str, policy: RateLimitPolicy) -> RateLimitInfo:
-        """버스트를 지원하는 슬라이딩 윈도우 알고리즘"""
-        now = time.time()
-        window_start = now - policy.window
-        
-        # 키 생성
-        key = f"{self.key_prefix}{identifier}:{operation}"
-        burst_key = f"{key}:burst"
-        
-        # 일반 윈도우 확인
-        normal_result = await self._sliding_window(identifier, operation, policy)
+    async def _evaluate_limits(
+        self,
+        identifier: str,
+        checks: List[Tuple[str, RateLimitPolicy, bool]]
+    ) -> List[RateLimitInfo]:
+        """
+        GCRA 정책 평가 (Redis 왕복 1회)
         
-        # 버스트 윈도우 확인 (더 짧은 시간 윈도우)
-        burst_window = policy.window // 4  # 1/4 시간 윈도우
-        burst_start = now - burst_window
+        Args:
+            identifier: 고유 식별자
+            checks: [(범위, 정책, 버스트 적용 여부), ...]
+            
+        Returns:
+            정책별 속도 제한 정보 (버스트 정책 포함)
+        """
+        now_ms = time.time() * 1000
+        keys = [f"{self.key_prefix}dynamic_adjustment"]
+        args: List[Any] = [f"{now_ms:.3f}"]
+        entries: List[Tuple[RateLimitPolicy, int]] = []
+        min_requests = self.dynamic_adjustment["min_requests"]
+        
+        for scope, policy, burst_mode in checks:
+            key = self._gcra_key(identifier, scope)
+            # 패널티는 버스트 규칙 위반 시에만 부과 (기본 윈도우 초과는 패널티 없음)
+            keys.extend([key, f"{key}:penalty"])
+            args.extend([policy.requests, policy.window * 1000, min_requests, 0])
+            entries.append((policy, policy.requests))
+            
+            if burst_mode and policy.burst > 0:
+                # 버스트: 1/4 윈도우 동안 burst 요청까지 허용
+                burst_window = max(policy.window // 4, 1)
+                keys.extend([f"{key}:burst", f"{key}:penalty"])
+                args.extend([policy.burst, burst_window * 1000, 1, policy.penalty * 1000])
+                entries.append((policy, policy.burst))
         
-        burst_timestamps = await self.redis_client.zrangebyscore(burst_key, burst_start, now)
-        burst_count = len(burst_timestamps)
+        reply = await self._get_gcra_script()(keys=keys, args=args)
+        allowed = int(reply[0]) == 1
         
-        # 버스트 제한 확인
-        if burst_count >= policy.burst:
-            # 버스트 초과 시 패널티 적용
-            if policy.penalty > 0:
-                # 패널티 시간 동안 추가 요청 차단
-                penalty_key = f"{key}:penalty"
-                penalty_active = await self.redis_client.exists(penalty_key)
-                
-                if not penalty_active:
-                    await self.redis_client.setex(penalty_key, policy.penalty, "1")
-                
-                retry_after = policy.penalty
-            else:
-                retry_after = burst_window - int(now - burst_start)
+        results = []
+        for index, (policy, base_requests) in enumerate(entries):
+            requests, remaining, retry_after_ms, reset_ms = reply[1 + index * 4:5 + index * 4]
+            requests = int(requests)
+            remaining = int(remaining) if allowed else 0
+            retry_after_ms = float(retry_after_ms)
             
-            return RateLimitInfo(
-                allowed=False,
-                remaining=0,
-                reset_time=datetime.fromtimestamp(now + retry_after),
-                retry_after=retry_after,
+            if requests != base_requests:
+                # 동적 조정이 적용된 정책
+                adjustment = requests / base_requests
+                policy = RateLimitPolicy(
+                    requests=max(int(policy.requests * adjustment), min_requests),
+                    window=policy.window,
+                    burst=max(int(policy.burst * adjustment), 1),
+                    penalty=policy.penalty
+                )
+            
+            results.append(RateLimitInfo(
+                allowed=allowed,
+                remaining=remaining,
+                reset_time=datetime.fromtimestamp(float(reset_ms) / 1000),
+                retry_after=max(math.ceil(retry_after_ms / 1000), 1) if retry_after_ms > 0 else None,
                 policy=policy,
                 identifier=identifier,
-                window_used=burst_count
-            )
-        
-        # 버스트 윈도우에 현재 요청 추가
-        await self.redis_client.zadd(burst_key, {str(now): now})
-        await self.redis_client.zremrangebyscore(burst_key, 0, burst_start)
-        await self.redis_client.expire(burst_key, burst_window)
+                window_used=requests - remaining if allowed else requests
+            ))
         
-        # 일반 윈도우 결과와 버스트 윈도우 결과 중 더 제한적인 것 선택
-        if not normal_result.allowed:
-            return normal_result
-        
-        # 버스트 고려하여 남은 요청 수 조정
-        burst_remaining = min(
-            policy.requests - normal_result.window_used,
-            policy.burst - burst_count - 1
-        )
-        
-        return RateLimitInfo(
-            allowed=True,
-            remaining=burst_remaining,
-            reset_time=normal_result.reset_time,
-            policy=policy,
-            identifier=identifier,
-            window_used=normal_result.window_used
-        )
+        return results
+    
+    def _most_restrictive(self, results: List[RateLimitInfo]) -> RateLimitInfo:
+        """가장 제한적인 결과 선택 (거부 시 가장 오래 기다려야 하는 정책)"""
+        denied = [result for result in results if result.retry_after]
+        if denied:
+            return max(denied, key=lambda x: x.retry_after)
+        return min(results, key=lambda x: x.remaining)
 
 # 전속 속도 제한기 인스턴스
 rate_limiter = AdvancedRateLimiter()
@@ -230,7 +230,11 @@ class UserFeedback(Base):
     
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
-    responder = relationship("User", foreign_keys=[responded_by])
+    responder = relationship(
+        "User",
+        primaryjoin="foreign(UserFeedback.responded_by) == User.id",
+        viewonly=True
+    )
     
     # Indexes
     __table_args__ = (
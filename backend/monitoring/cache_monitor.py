@@ -5,7 +5,6 @@
 
 import asyncio
 import time
-import psutil
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
@@ -16,6 +15,7 @@ import json
 
 from .intelligent_cache_manager import intelligent_cache_manager
 from .distributed_cache import distributed_cache_manager
+from .system_metrics_sampler import system_metrics_sampler
 
 logger = logging.getLogger(__name__)
 
@@ -467,29 +467,20 @@ class CachePerformanceMonitor:
     async def _collect_system_metrics(self) -> Dict[str, Any]:
         """시스템 메트릭 수집"""
         try:
-            # CPU 사용량
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # 메모리 사용량
-            memory = psutil.virtual_memory()
-            
-            # 디스크 사용량
-            disk = psutil.disk_usage('/')
-            
-            # 네트워크 I/O
-            network = psutil.net_io_counters()
+            # 공유 샘플러의 최신 스냅샷 (이벤트 루프 차단 없음)
+            snapshot = system_metrics_sampler.latest()
             
             return {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_available": memory.available,
-                "memory_used": memory.used,
-                "disk_percent": (disk.used / disk.total) * 100,
-                "disk_free": disk.free,
-                "disk_used": disk.used,
-                "network_bytes_sent": network.bytes_sent,
-                "network_bytes_recv": network.bytes_recv,
-                "timestamp": datetime.utcnow().isoformat()
+                "cpu_percent": snapshot.cpu_percent,
+                "memory_percent": snapshot.memory_percent,
+                "memory_available": snapshot.memory_available,
+                "memory_used": snapshot.memory_used,
+                "disk_percent": snapshot.disk_percent,
+                "disk_free": snapshot.disk_free,
+                "disk_used": snapshot.disk_used,
+                "network_bytes_sent": snapshot.network_bytes_sent,
+                "network_bytes_recv": snapshot.network_bytes_recv,
+                "timestamp": snapshot.timestamp.isoformat()
             }
             
         except Exception as e:
@@ -0,0 +1,285 @@
+"""
+이벤트 루프 부하 감시 및 부하 차단(load shedding) 모듈
+
+이벤트 루프 지연(loop lag), 대기 중인 asyncio 태스크 수, 스레드 풀 실행기 큐 깊이,
+처리 중인 요청 수를 주기적으로 측정하고, 임계값을 넘으면 등록된 서비스의
+비핵심 작업을 줄이도록 부하 단계를 알립니다.
+"""
+
+import asyncio
+import inspect
+import logging
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoadLevel(str, Enum):
+    NORMAL = "normal"
+    ELEVATED = "elevated"
+    OVERLOADED = "overloaded"
+
+
+_LEVEL_ORDER = {LoadLevel.NORMAL: 0, LoadLevel.ELEVATED: 1, LoadLevel.OVERLOADED: 2}
+
+
+@dataclass(frozen=True)
+class LoadSignals:
+    """부하 신호 스냅샷"""
+    timestamp: datetime
+    level: LoadLevel
+    loop_lag_ms: float
+    loop_lag_p99_ms: float
+    pending_tasks: int
+    executor_queue_depth: int
+    in_flight_requests: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        data["level"] = self.level.value
+        return data
+
+
+class LoadWatchdog:
+    """이벤트 루프 지연/태스크 포화 감시 및 부하 차단 조정자"""
+
+    def __init__(
+        self,
+        check_interval: float = 0.5,
+        lag_window: int = 120,
+        recovery_checks: int = 6,
+        thresholds: Optional[Dict[str, Dict[str, float]]] = None
+    ):
+        self.check_interval = check_interval
+        self.recovery_checks = recovery_checks
+
+        # 신호별 (elevated, overloaded) 임계값
+        self.thresholds = thresholds or {
+            "loop_lag_ms": {"elevated": 100.0, "overloaded": 500.0},
+            "pending_tasks": {"elevated": 2000, "overloaded": 10000},
+            "executor_queue_depth": {"elevated": 8, "overloaded": 32},
+            "in_flight_requests": {"elevated": 200, "overloaded": 1000}
+        }
+
+        self.level = LoadLevel.NORMAL
+        self._lag_samples: deque = deque(maxlen=lag_window)
+        self._calm_checks = 0
+        self._in_flight = 0
+        self._latest: Optional[LoadSignals] = None
+
+        self.executors: Dict[str, Any] = {}
+        self.shedding_handlers: Dict[str, Callable[[LoadLevel], Any]] = {}
+
+        self._task: Optional[asyncio.Task] = None
+        self.running = False
+
+        # 통계
+        self.stats = {
+            "checks": 0,
+            "level_changes": 0,
+            "max_loop_lag_ms": 0.0,
+            "handler_errors": 0
+        }
+
+    async def start(self):
+        """감시 루프 시작 (실행 중인 이벤트 루프 필요)"""
+        if self.running:
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info("Load watchdog started")
+
+    async def stop(self):
+        """감시 루프 중지 후 모든 서비스를 정상 단계로 복원"""
+        self.running = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self.level != LoadLevel.NORMAL:
+            await self._set_level(LoadLevel.NORMAL)
+        logger.info("Load watchdog stopped")
+
+    def register_executor(self, name: str, executor: Any):
+        """큐 깊이를 측정할 ThreadPoolExecutor 등록"""
+        self.executors[name] = executor
+
+    def register_shedding_handler(self, name: str, handler: Callable[[LoadLevel], Any]):
+        """부하 단계 변경 시 호출될 핸들러 등록 (동기/코루틴 함수)"""
+        self.shedding_handlers[name] = handler
+
+    def attach_degradable_services(
+        self,
+        cache_manager=None,
+        intelligent_cache_manager=None,
+        notification_service=None
+    ):
+        """부하 시 품질을 낮출 수 있는 서비스 연결
+
+        Args:
+            cache_manager: UnifiedCacheManager (만료된 로컬 항목 제공)
+            intelligent_cache_manager: IntelligentCacheManager (워밍 일시 중지)
+            notification_service: RealtimeNotificationService (모니터 주기 연장)
+        """
+        if cache_manager is not None:
+            self.register_shedding_handler(
+                "stale_cache",
+                lambda level: cache_manager.set_serve_stale(level != LoadLevel.NORMAL)
+            )
+
+        if intelligent_cache_manager is not None:
+            def toggle_warmups(level: LoadLevel):
+                if level == LoadLevel.NORMAL:
+                    intelligent_cache_manager.resume_warmups()
+                else:
+                    intelligent_cache_manager.pause_warmups()
+
+            self.register_shedding_handler("cache_warmup", toggle_warmups)
+
+        if notification_service is not None:
+            multipliers = {LoadLevel.NORMAL: 1.0, LoadLevel.ELEVATED: 2.0, LoadLevel.OVERLOADED: 4.0}
+            self.register_shedding_handler(
+                "notification_intervals",
+                lambda level: notification_service.set_monitor_interval_multiplier(multipliers[level])
+            )
+
+    @property
+    def is_shedding(self) -> bool:
+        return self.level != LoadLevel.NORMAL
+
+    @contextmanager
+    def track_request(self):
+        """처리 중인 요청 수 추적"""
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+
+    def get_signals(self) -> LoadSignals:
+        """최신 부하 신호 조회"""
+        if self._latest is None:
+            return self._snapshot(0.0)
+        return self._latest
+
+    def _executor_queue_depth(self) -> int:
+        depth = 0
+        for name, executor in list(self.executors.items()):
+            work_queue = getattr(executor, "_work_queue", None)
+            if work_queue is not None:
+                depth += work_queue.qsize()
+        return depth
+
+    def _pending_tasks(self) -> int:
+        try:
+            return len(asyncio.all_tasks())
+        except RuntimeError:
+            return 0
+
+    def _snapshot(self, lag_ms: float) -> LoadSignals:
+        ordered = sorted(self._lag_samples)
+        lag_p99 = ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)] if ordered else 0.0
+        return LoadSignals(
+            timestamp=datetime.utcnow(),
+            level=self.level,
+            loop_lag_ms=lag_ms,
+            loop_lag_p99_ms=lag_p99,
+            pending_tasks=self._pending_tasks(),
+            executor_queue_depth=self._executor_queue_depth(),
+            in_flight_requests=self._in_flight
+        )
+
+    def _classify(self, signals: LoadSignals) -> LoadLevel:
+        values = {
+            "loop_lag_ms": signals.loop_lag_ms,
+            "pending_tasks": signals.pending_tasks,
+            "executor_queue_depth": signals.executor_queue_depth,
+            "in_flight_requests": signals.in_flight_requests
+        }
+        level = LoadLevel.NORMAL
+        for name, value in values.items():
+            limits = self.thresholds.get(name)
+            if not limits:
+                continue
+            if value >= limits["overloaded"]:
+                return LoadLevel.OVERLOADED
+            if value >= limits["elevated"]:
+                level = LoadLevel.ELEVATED
+        return level
+
+    async def check(self, lag_ms: float) -> LoadSignals:
+        """측정된 지연으로 신호를 갱신하고 필요하면 부하 단계를 변경"""
+        self._lag_samples.append(lag_ms)
+        self.stats["checks"] += 1
+        self.stats["max_loop_lag_ms"] = max(self.stats["max_loop_lag_ms"], lag_ms)
+
+        signals = self._snapshot(lag_ms)
+        target = self._classify(signals)
+
+        if _LEVEL_ORDER[target] > _LEVEL_ORDER[self.level]:
+            # 악화는 즉시 반영
+            self._calm_checks = 0
+            await self._set_level(target)
+        elif _LEVEL_ORDER[target] < _LEVEL_ORDER[self.level]:
+            # 회복은 연속으로 안정된 측정이 쌓인 뒤 반영 (진동 방지)
+            self._calm_checks += 1
+            if self._calm_checks >= self.recovery_checks:
+                self._calm_checks = 0
+                await self._set_level(target)
+        else:
+            self._calm_checks = 0
+
+        self._latest = LoadSignals(**{**asdict(signals), "level": self.level})
+        return self._latest
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self.running:
+            try:
+                expected = loop.time() + self.check_interval
+                await asyncio.sleep(self.check_interval)
+                lag_ms = max(0.0, loop.time() - expected) * 1000
+                await self.check(lag_ms)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in load watchdog: {str(e)}")
+
+    async def _set_level(self, level: LoadLevel):
+        previous = self.level
+        self.level = level
+        self.stats["level_changes"] += 1
+        logger.warning(f"Load level changed from {previous.value} to {level.value}")
+
+        for name, handler in list(self.shedding_handlers.items()):
+            try:
+                result = handler(level)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self.stats["handler_errors"] += 1
+                logger.error(f"Error in load shedding handler {name}: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """감시자 통계 조회"""
+        return {
+            **self.stats,
+            "level": self.level.value,
+            "running": self.running,
+            "executors": list(self.executors.keys()),
+            "shedding_handlers": list(self.shedding_handlers.keys()),
+            "signals": self.get_signals().to_dict()
+        }
+
+
+# 전역 부하 감시자 인스턴스
+load_watchdog = LoadWatchdog()
@@ -8,13 +8,15 @@
 import asyncio
 import time
 import json
-import psutil
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+from .system_metrics_sampler import system_metrics_sampler
+from .load_watchdog import load_watchdog
+
 logger = logging.getLogger(__name__)
 
 class AlertSeverity(Enum):
@@ -56,6 +58,10 @@ class SystemHealthMetrics:
     error_rate: float
     active_connections: int
     queue_size: int
+    loop_lag_ms: float = 0.0
+    pending_tasks: int = 0
+    executor_queue_depth: int = 0
+    in_flight_requests: int = 0
 
 class OperationalMonitor:
     """운영 모니터링 시스템"""
@@ -114,7 +120,13 @@ class OperationalMonitor:
             "network_latency_warning": 50.0,
             "network_latency_critical": 100.0,
             "cache_hit_rate_warning": 70.0,
-            "cache_hit_rate_critical": 50.0
+            "cache_hit_rate_critical": 50.0,
+            "loop_lag_warning": 100.0,
+            "loop_lag_critical": 500.0,
+            "executor_queue_warning": 8,
+            "executor_queue_critical": 32,
+            "in_flight_requests_warning": 200,
+            "in_flight_requests_critical": 1000
         }
         
         # 메트릭 수집기
@@ -217,9 +229,7 @@ class OperationalMonitor:
         """메트릭 수집"""
         try:
             # 시스템 메트릭 수집
-            cpu_usage = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            snapshot = system_metrics_sampler.latest()
             
             # 네트워크 지연 측정
             network_latency = await self._measure_network_latency()
@@ -239,19 +249,26 @@ class OperationalMonitor:
             # 큐 크기
             queue_size = await self._get_queue_size()
             
+            # 이벤트 루프 부하 신호
+            load_signals = load_watchdog.get_signals()
+            
             # 상태 메트릭 생성
             metrics = SystemHealthMetrics(
                 timestamp=datetime.utcnow(),
                 status=self.current_status,
-                cpu_usage=cpu_usage,
-                memory_usage=memory.percent,
-                disk_usage=(disk.used / disk.total) * 100,
+                cpu_usage=snapshot.cpu_percent,
+                memory_usage=snapshot.memory_percent,
+                disk_usage=snapshot.disk_percent,
                 network_latency=network_latency,
                 cache_hit_rate=cache_hit_rate,
                 api_response_time=api_response_time,
                 error_rate=error_rate,
                 active_connections=active_connections,
-                queue_size=queue_size
+                queue_size=queue_size,
+                loop_lag_ms=load_signals.loop_lag_ms,
+                pending_tasks=load_signals.pending_tasks,
+                executor_queue_depth=load_signals.executor_queue_depth,
+                in_flight_requests=load_signals.in_flight_requests
             )
             
             # 메트릭 저장
@@ -439,6 +456,18 @@ class OperationalMonitor:
         if metrics.cache_hit_rate < 50:
             warning_issues += 1
         
+        # 이벤트 루프 지연 및 작업 포화
+        load_checks = [
+            (metrics.loop_lag_ms, "loop_lag"),
+            (metrics.executor_queue_depth, "executor_queue"),
+            (metrics.in_flight_requests, "in_flight_requests")
+        ]
+        for value, name in load_checks:
+            if value > self.alert_thresholds[f"{name}_critical"]:
+                critical_issues += 1
+            elif value > self.alert_thresholds[f"{name}_warning"]:
+                warning_issues += 1
+        
         # 상태 결정
         if critical_issues > 0:
             return OperationalStatus.UNHEALTHY
@@ -671,7 +700,18 @@ class OperationalMonitor:
             "auto_recoveries": self.stats["auto_recoveries"],
             "status_changes": self.stats["status_changes"],
             "monitored_services": list(self.monitored_services.keys()),
-            "latest_metrics": asdict(self.health_metrics[-1]) if self.health_metrics else None
+            "latest_metrics": asdict(self.health_metrics[-1]) if self.health_metrics else None,
+            "processes": self._get_process_breakdown(),
+            "load": load_watchdog.get_stats()
+        }
+    
+    def _get_process_breakdown(self) -> Dict[str, Any]:
+        """프로세스/워커별 리소스 사용량 (공유 샘플러 스냅샷 기준)"""
+        snapshot = system_metrics_sampler.latest()
+        return {
+            "sampled_at": snapshot.timestamp.isoformat(),
+            "process": asdict(snapshot.process) if snapshot.process else None,
+            "workers": [asdict(worker) for worker in snapshot.workers]
         }
     
     async def get_active_alerts(self, severity: Optional[AlertSeverity] = None) -> List[Dict[str, Any]]:
@@ -4,8 +4,8 @@ API 응답 시간 추적, 시스템 리소스 모니터링, 성능 메트릭 수
 """
 
 import asyncio
+import math
 import time
-import psutil
 import json
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta
@@ -14,6 +14,8 @@ from collections import defaultdict, deque
 import logging
 import redis.asyncio as redis
 
+from .system_metrics_sampler import system_metrics_sampler
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -65,6 +67,100 @@ class AlertThreshold:
     cooldown_minutes: int = 5
     enabled: bool = True
 
+class RequestWindowCounters:
+    """초 단위 버킷 기반 요청 윈도우 카운터
+    
+    초마다 요청 수, 에러 수, 로그 간격 응답 시간 히스토그램을 링 버퍼에 누적합니다.
+    요청량과 무관하게 메모리가 고정되며, 분위수는 히스토그램 구간 상한으로
+    계산되므로 상대 오차는 latency_growth - 1 이내입니다.
+    """
+    
+    def __init__(
+        self,
+        max_window_seconds: int = 3600,
+        latency_base: float = 0.0001,
+        latency_growth: float = 1.05
+    ):
+        self.size = max_window_seconds
+        self.latency_base = latency_base
+        self.latency_growth = latency_growth
+        self._log_growth = math.log(latency_growth)
+        self.epochs = [-1] * self.size
+        self.counts = [0] * self.size
+        self.errors = [0] * self.size
+        self.histograms: List[Optional[Dict[int, int]]] = [None] * self.size
+    
+    def _bin(self, response_time: float) -> int:
+        if response_time <= self.latency_base:
+            return 0
+        return math.ceil(math.log(response_time / self.latency_base) / self._log_growth)
+    
+    def _upper_bound(self, index: int) -> float:
+        return self.latency_base * self.latency_growth ** index
+    
+    def add(self, response_time: float, is_error: bool, now: Optional[float] = None):
+        """요청 1건 누적"""
+        second = int(now if now is not None else time.time())
+        slot = second % self.size
+        if self.epochs[slot] != second:
+            self.epochs[slot] = second
+            self.counts[slot] = 0
+            self.errors[slot] = 0
+            self.histograms[slot] = {}
+        
+        self.counts[slot] += 1
+        if is_error:
+            self.errors[slot] += 1
+        histogram = self.histograms[slot]
+        index = self._bin(response_time)
+        histogram[index] = histogram.get(index, 0) + 1
+    
+    def count(self, window_seconds: int, now: Optional[float] = None) -> int:
+        """윈도우 내 요청 수"""
+        second = int(now if now is not None else time.time())
+        total = 0
+        for epoch in range(second - min(window_seconds, self.size) + 1, second + 1):
+            slot = epoch % self.size
+            if self.epochs[slot] == epoch:
+                total += self.counts[slot]
+        return total
+    
+    def window_stats(self, window_seconds: int, now: Optional[float] = None) -> Dict[str, float]:
+        """윈도우 내 요청 수, 에러 수 및 응답 시간 분위수 집계"""
+        second = int(now if now is not None else time.time())
+        count = 0
+        errors = 0
+        merged: Dict[int, int] = defaultdict(int)
+        for epoch in range(second - min(window_seconds, self.size) + 1, second + 1):
+            slot = epoch % self.size
+            if self.epochs[slot] != epoch:
+                continue
+            count += self.counts[slot]
+            errors += self.errors[slot]
+            for index, hits in self.histograms[slot].items():
+                merged[index] += hits
+        
+        quantiles = {0.50: 0.0, 0.95: 0.0, 0.99: 0.0}
+        if count:
+            ordered = sorted(merged.items())
+            for q in quantiles:
+                # 정렬된 표본의 int(count * q)번째 값이 속한 구간
+                rank = min(int(count * q), count - 1) + 1
+                seen = 0
+                for index, hits in ordered:
+                    seen += hits
+                    if seen >= rank:
+                        quantiles[q] = self._upper_bound(index)
+                        break
+        
+        return {
+            "request_count": count,
+            "error_count": errors,
+            "p50_response_time": quantiles[0.50],
+            "p95_response_time": quantiles[0.95],
+            "p99_response_time": quantiles[0.99]
+        }
+
 class PerformanceMonitor:
     """성능 모니터링 클래스"""
     
@@ -86,6 +182,8 @@ class PerformanceMonitor:
         # 메트릭 저장
         self.metrics_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_metrics_per_type))
         self.request_metrics: deque = deque(maxlen=10000)
+        # 윈도우 통계는 요청량에 따라 잘리지 않도록 초 단위 버킷으로 집계
+        self.request_window = RequestWindowCounters()
         
         # 알림 설정
         self.alert_thresholds = self._default_alert_thresholds()
@@ -204,6 +302,7 @@ class PerformanceMonitor:
             
             # 메트릭 저장
             self.request_metrics.append(metric)
+            self.request_window.add(response_time, status_code >= 400)
             
             # 통계 업데이트
             self._update_request_stats(metric)
@@ -333,6 +432,28 @@ class PerformanceMonitor:
             logger.error(f"Error getting performance summary: {str(e)}")
             return {"error": str(e)}
     
+    def get_request_window_stats(self, window_seconds: int = 60) -> Dict[str, float]:
+        """
+        최근 윈도우의 요청률, 응답 시간 분위수 및 에러율 조회
+        
+        Args:
+            window_seconds: 집계 윈도우 (초)
+            
+        Returns:
+            요청 수, 초당 요청 수, p50/p95/p99 응답 시간(초), 에러율(%)
+        """
+        stats = self.request_window.window_stats(window_seconds)
+        count = stats["request_count"]
+        
+        return {
+            "request_count": count,
+            "requests_per_second": count / window_seconds,
+            "p50_response_time": stats["p50_response_time"],
+            "p95_response_time": stats["p95_response_time"],
+            "p99_response_time": stats["p99_response_time"],
+            "error_rate": stats["error_count"] / count * 100 if count else 0.0
+        }
+    
     async def get_system_metrics(
         self,
         start_time: Optional[datetime] = None,
@@ -484,11 +605,7 @@ class PerformanceMonitor:
         )
         
         # RPS 계산 (최근 1분)
-        recent_requests = [
-            req for req in self.request_metrics
-            if req.timestamp > datetime.utcnow() - timedelta(minutes=1)
-        ]
-        self.stats["requests_per_second"] = len(recent_requests) / 60.0
+        self.stats["requests_per_second"] = self.request_window.count(60) / 60.0
     
     async def _system_metrics_collector(self):
         """시스템 메트릭 수집기"""
@@ -570,37 +687,21 @@ class PerformanceMonitor:
     async def _collect_system_metrics(self) -> SystemMetric:
         """시스템 메트릭 수집"""
         try:
-            # CPU 사용량
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # 메모리 정보
-            memory = psutil.virtual_memory()
-            
-            # 디스크 정보
-            disk = psutil.disk_usage('/')
-            
-            # 네트워크 I/O
-            network = psutil.net_io_counters()
-            
-            # 시스템 로드 평균 (Linux/Unix)
-            load_average = None
-            try:
-                load_average = list(psutil.getloadavg())
-            except (AttributeError, OSError):
-                pass
+            # 공유 샘플러의 최신 스냅샷 (이벤트 루프 차단 없음)
+            snapshot = system_metrics_sampler.latest()
             
             return SystemMetric(
-                timestamp=datetime.utcnow(),
-                cpu_percent=cpu_percent,
-                memory_percent=memory.percent,
-                memory_available=memory.available,
-                memory_used=memory.used,
-                disk_percent=(disk.used / disk.total) * 100,
-                disk_free=disk.free,
-                disk_used=disk.used,
-                network_bytes_sent=network.bytes_sent,
-                network_bytes_recv=network.bytes_recv,
-                load_average=load_average
+                timestamp=snapshot.timestamp,
+                cpu_percent=snapshot.cpu_percent,
+                memory_percent=snapshot.memory_percent,
+                memory_available=snapshot.memory_available,
+                memory_used=snapshot.memory_used,
+                disk_percent=snapshot.disk_percent,
+                disk_free=snapshot.disk_free,
+                disk_used=snapshot.disk_used,
+                network_bytes_sent=snapshot.network_bytes_sent,
+                network_bytes_recv=snapshot.network_bytes_recv,
+                load_average=list(snapshot.load_average) if snapshot.load_average else None
             )
             
         except Exception as e:
@@ -737,6 +838,10 @@ class PerformanceMonitor:
     
     async def _create_alert(self, alert_id: str, message: str, data: Dict[str, Any]):
         """알림 생성"""
+        # 요청마다 확인되는 알림도 쿨다운 동안 한 번만 생성
+        if alert_id in self.active_alerts:
+            return
+        
         try:
             # 알림 데이터 생성
             alert_data = {
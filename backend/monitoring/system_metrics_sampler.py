@@ -0,0 +1,341 @@
+"""
+공유 시스템 메트릭 샘플러 모듈
+
+프로세스당 하나의 전용 스레드가 psutil 카운터를 주기적으로 읽고, 이전 샘플과의
+차이(delta)로 CPU 사용률과 네트워크 처리량을 계산합니다. 결과는 불변 스냅샷으로
+게시되므로 각 모니터는 `psutil.cpu_percent(interval=1)`처럼 이벤트 루프를 막는
+호출 없이 최신 값을 읽을 수 있습니다.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProcessMetrics:
+    """단일 프로세스 메트릭 스냅샷"""
+    pid: int
+    name: str
+    role: str  # main, worker
+    cpu_percent: float
+    memory_rss: int
+    memory_percent: float
+    num_threads: int
+    num_fds: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SystemMetricsSnapshot:
+    """시스템 메트릭 불변 스냅샷"""
+    sequence: int
+    timestamp: datetime
+    interval: float  # 이전 샘플과의 간격 (초)
+    cpu_percent: float
+    per_cpu_percent: Tuple[float, ...]
+    memory_percent: float
+    memory_available: int
+    memory_used: int
+    memory_total: int
+    disk_percent: float
+    disk_free: int
+    disk_used: int
+    disk_total: int
+    network_bytes_sent: int
+    network_bytes_recv: int
+    network_packets_sent: int
+    network_packets_recv: int
+    network_bytes_sent_per_sec: float
+    network_bytes_recv_per_sec: float
+    load_average: Optional[Tuple[float, ...]] = None
+    process: Optional[ProcessMetrics] = None
+    workers: Tuple[ProcessMetrics, ...] = field(default_factory=tuple)
+
+    @property
+    def is_warm(self) -> bool:
+        """CPU 사용률이 실제 delta로 계산되었는지 여부"""
+        return self.sequence > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 가능한 딕셔너리로 변환"""
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+class SystemMetricsSampler:
+    """전용 스레드에서 비차단 delta 방식으로 시스템 메트릭을 수집하는 샘플러"""
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        disk_path: str = "/",
+        include_workers: bool = True
+    ):
+        self.interval = interval
+        self.disk_path = disk_path
+        self.include_workers = include_workers
+
+        self._latest: Optional[SystemMetricsSnapshot] = None
+        self._sequence = 0
+        self._last_sample_time: Optional[float] = None
+        self._last_network = None
+
+        # pid -> psutil.Process; cpu_percent(None)은 인스턴스별 이전 값을 기준으로 계산
+        self._processes: Dict[int, psutil.Process] = {}
+
+        self._subscribers: List[Tuple[Callable, Optional[asyncio.AbstractEventLoop]]] = []
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # stop() 이후에는 latest()가 샘플러를 다시 시작하지 않음
+        self._stopped = False
+
+        # 통계
+        self.stats = {
+            "samples_taken": 0,
+            "sample_errors": 0,
+            "subscriber_errors": 0,
+            "last_sample_duration_ms": 0.0
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """샘플링 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.running:
+                return
+            self._stopped = False
+            self._stop_event.clear()
+            # 카운터 기준점을 잡아 두고 즉시 사용할 수 있는 스냅샷을 게시
+            self._prime()
+            self._thread = threading.Thread(
+                target=self._run, name="system-metrics-sampler", daemon=True
+            )
+            self._thread.start()
+        logger.info("System metrics sampler started")
+
+    def stop(self, timeout: float = 2.0):
+        """샘플링 스레드 중지 (start()를 명시적으로 호출할 때까지 유지)"""
+        self._stopped = True
+        self._stop_event.set()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        logger.info("System metrics sampler stopped")
+
+    def latest(self) -> SystemMetricsSnapshot:
+        """최신 스냅샷 반환 (필요하면 샘플러를 시작)
+
+        샘플러가 아직 시작되지 않았다면 시작하고 기준 스냅샷을 반환합니다.
+        stop()으로 중지된 샘플러는 다시 시작하지 않고 마지막 스냅샷을 반환합니다.
+        이 호출은 블로킹 대기를 하지 않습니다.
+        """
+        if self._stopped:
+            return self._latest if self._latest is not None else self.sample()
+        if self._latest is None or not self.running:
+            self.start()
+        return self._latest
+
+    def subscribe(self, callback: Callable[[SystemMetricsSnapshot], Any]) -> Callable:
+        """스냅샷 구독
+
+        코루틴 함수는 구독 시점의 이벤트 루프에서 실행되고, 일반 함수는
+        샘플러 스레드에서 바로 호출되므로 빠르게 반환해야 합니다.
+        """
+        loop = None
+        if inspect.iscoroutinefunction(callback):
+            loop = asyncio.get_running_loop()
+        with self._lock:
+            self._subscribers.append((callback, loop))
+        return callback
+
+    def unsubscribe(self, callback: Callable):
+        """스냅샷 구독 해제"""
+        with self._lock:
+            self._subscribers = [(cb, loop) for cb, loop in self._subscribers if cb != callback]
+
+    def sample(self) -> SystemMetricsSnapshot:
+        """샘플 한 번 수집 후 게시 (샘플러 스레드 및 테스트에서 사용)"""
+        start = time.perf_counter()
+        try:
+            snapshot = self._collect()
+        except Exception as e:
+            self.stats["sample_errors"] += 1
+            logger.error(f"Error sampling system metrics: {str(e)}")
+            return self._latest
+
+        self._latest = snapshot
+        self.stats["samples_taken"] += 1
+        self.stats["last_sample_duration_ms"] = (time.perf_counter() - start) * 1000
+        self._publish(snapshot)
+        return snapshot
+
+    def _prime(self):
+        """delta 계산 기준점 설정"""
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        for process in self._tracked_processes():
+            self._prime_process(process)
+        self._sequence = -1
+        self.sample()
+
+    @staticmethod
+    def _prime_process(process: psutil.Process):
+        try:
+            process.cpu_percent(interval=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def _tracked_processes(self) -> List[psutil.Process]:
+        """현재 프로세스와 워커(자식) 프로세스 목록, Process 인스턴스는 재사용"""
+        pid = os.getpid()
+        if pid not in self._processes:
+            self._processes[pid] = psutil.Process(pid)
+        main = self._processes[pid]
+
+        tracked = [main]
+        if self.include_workers:
+            try:
+                children = main.children(recursive=True)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                children = []
+            for child in children:
+                if child.pid not in self._processes:
+                    self._processes[child.pid] = child
+                    self._prime_process(child)
+                tracked.append(self._processes[child.pid])
+
+        live_pids = {process.pid for process in tracked}
+        for stale_pid in [p for p in self._processes if p not in live_pids]:
+            del self._processes[stale_pid]
+        return tracked
+
+    @staticmethod
+    def _process_metrics(process: psutil.Process, role: str) -> Optional[ProcessMetrics]:
+        try:
+            with process.oneshot():
+                memory_info = process.memory_info()
+                try:
+                    num_fds = process.num_fds()
+                except (AttributeError, psutil.AccessDenied):
+                    num_fds = None
+                return ProcessMetrics(
+                    pid=process.pid,
+                    name=process.name(),
+                    role=role,
+                    cpu_percent=process.cpu_percent(interval=None),
+                    memory_rss=memory_info.rss,
+                    memory_percent=process.memory_percent(),
+                    num_threads=process.num_threads(),
+                    num_fds=num_fds
+                )
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    def _collect(self) -> SystemMetricsSnapshot:
+        now = time.monotonic()
+        elapsed = now - self._last_sample_time if self._last_sample_time else 0.0
+        self._last_sample_time = now
+
+        cpu_percent = psutil.cpu_percent(interval=None)
+        per_cpu_percent = tuple(psutil.cpu_percent(interval=None, percpu=True))
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+
+        network = psutil.net_io_counters()
+        sent_per_sec = recv_per_sec = 0.0
+        if self._last_network is not None and elapsed > 0:
+            sent_per_sec = max(0, network.bytes_sent - self._last_network.bytes_sent) / elapsed
+            recv_per_sec = max(0, network.bytes_recv - self._last_network.bytes_recv) / elapsed
+        self._last_network = network
+
+        load_average = None
+        try:
+            load_average = tuple(psutil.getloadavg())
+        except (AttributeError, OSError):
+            pass
+
+        tracked = self._tracked_processes()
+        process = self._process_metrics(tracked[0], "main")
+        workers = tuple(
+            metrics for metrics in (self._process_metrics(p, "worker") for p in tracked[1:])
+            if metrics is not None
+        )
+
+        self._sequence += 1
+        return SystemMetricsSnapshot(
+            sequence=self._sequence,
+            timestamp=datetime.utcnow(),
+            interval=elapsed,
+            cpu_percent=cpu_percent,
+            per_cpu_percent=per_cpu_percent,
+            memory_percent=memory.percent,
+            memory_available=memory.available,
+            memory_used=memory.used,
+            memory_total=memory.total,
+            disk_percent=(disk.used / disk.total) * 100 if disk.total else 0.0,
+            disk_free=disk.free,
+            disk_used=disk.used,
+            disk_total=disk.total,
+            network_bytes_sent=network.bytes_sent,
+            network_bytes_recv=network.bytes_recv,
+            network_packets_sent=network.packets_sent,
+            network_packets_recv=network.packets_recv,
+            network_bytes_sent_per_sec=sent_per_sec,
+            network_bytes_recv_per_sec=recv_per_sec,
+            load_average=load_average,
+            process=process,
+            workers=workers
+        )
+
+    def _publish(self, snapshot: SystemMetricsSnapshot):
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback, loop in subscribers:
+            try:
+                if loop is not None:
+                    if loop.is_closed():
+                        self.unsubscribe(callback)
+                        continue
+                    asyncio.run_coroutine_threadsafe(callback(snapshot), loop)
+                else:
+                    callback(snapshot)
+            except Exception as e:
+                self.stats["subscriber_errors"] += 1
+                logger.error(f"Error in system metrics subscriber: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """샘플러 통계 조회"""
+        latest = self._latest
+        return {
+            **self.stats,
+            "running": self.running,
+            "interval": self.interval,
+            "subscribers": len(self._subscribers),
+            "tracked_processes": len(self._processes),
+            "last_sample_at": latest.timestamp.isoformat() if latest else None
+        }
+
+
+# 전역 시스템 메트릭 샘플러 인스턴스
+system_metrics_sampler = SystemMetricsSampler()
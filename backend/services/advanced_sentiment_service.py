@@ -25,7 +25,11 @@ except ImportError:
     logging.warning("Transformers library not available. Using fallback sentiment analysis.")
 
 from ..cache.unified_cache import UnifiedCacheManager
+from ..cache.sentiment_result_cache import SentimentResultCache, sentiment_result_cache
 from .bert_sentiment_service import BertSentimentService
+from ..config import get_settings
+from .inference_batcher import DynamicBatchInferenceWorker
+from .onnx_sentiment_backend import ONNX_RUNTIME_AVAILABLE, load_onnx_sentiment_model
 from ..models.unified_models import SentimentSource
 
 
@@ -64,6 +68,12 @@ class AdvancedSentimentService:
         self.models = {}
         self.tokenizers = {}
         self.pipelines = {}
+        self.batchers: Dict[SentimentModel, DynamicBatchInferenceWorker] = {}
+        self.result_cache_model_ids: Dict[SentimentModel, str] = {}
+        
+        # Dynamic batching configuration
+        self.inference_batch_size = 16
+        self.inference_max_wait_ms = 10.0
         
         # Initialize BERT sentiment service
         self.bert_service = BertSentimentService(cache_manager)
@@ -74,6 +84,9 @@ class AdvancedSentimentService:
         # Model cache
         self.model_cache_ttl = 3600  # 1 hour
         
+        # Bounded, content-addressed cache of per-text model outputs
+        self.result_cache: SentimentResultCache = sentiment_result_cache
+        
         # Initialize models
         self._initialize_models()
         
@@ -142,22 +155,41 @@ class AdvancedSentimentService:
     def _load_model(self, model_type: SentimentModel, model_name: str):
         """Load a specific sentiment model."""
         try:
-            # Load tokenizer and model
-            tokenizer = AutoTokenizer.from_pretrained(model_name)
-            model = AutoModelForSequenceClassification.from_pretrained(model_name)
-            
-            # Create pipeline
-            sentiment_pipeline = pipeline(
-                "sentiment-analysis",
-                model=model,
-                tokenizer=tokenizer,
-                return_all_scores=True
-            )
+            settings = get_settings()
+            inference_backend = "torch"
+            if settings.sentiment_inference_backend == "onnx" and ONNX_RUNTIME_AVAILABLE:
+                inference_backend = "onnx"
+                # Quantized ONNX Runtime model, served only through the batcher
+                tokenizer, model = load_onnx_sentiment_model(
+                    model_name,
+                    model_dir=settings.sentiment_onnx_model_dir,
+                    quantize=settings.sentiment_onnx_quantize,
+                    intra_op_threads=settings.sentiment_onnx_intra_op_threads
+                )
+            else:
+                # Load tokenizer and model
+                tokenizer = AutoTokenizer.from_pretrained(model_name)
+                model = AutoModelForSequenceClassification.from_pretrained(model_name)
+                
+                # Create pipeline
+                self.pipelines[model_type] = pipeline(
+                    "sentiment-analysis",
+                    model=model,
+                    tokenizer=tokenizer,
+                    return_all_scores=True
+                )
             
             # Store model components
             self.tokenizers[model_type] = tokenizer
             self.models[model_type] = model
-            self.pipelines[model_type] = sentiment_pipeline
+            self.batchers[model_type] = DynamicBatchInferenceWorker(
+                model,
+                tokenizer,
+                max_batch_size=self.inference_batch_size,
+                max_wait_ms=self.inference_max_wait_ms,
+                name=model_type.value
+            )
+            self.result_cache_model_ids[model_type] = f"{model_name}:{inference_backend}"
             
             self.logger.info(f"Loaded model: {model_type.value} ({model_name})")
             
@@ -176,7 +208,7 @@ class AdvancedSentimentService:
         
         try:
             # Check cache first
-            cache_key = f"sentiment_{hash(text)}_{model.value}"
+            cache_key = f"sentiment_{SentimentResultCache.text_digest(text)}_{model.value}"
             cached_result = await self.cache_manager.get(cache_key)
             if cached_result:
                 self.logger.debug(f"Cache hit for sentiment analysis")
@@ -298,26 +330,41 @@ class AdvancedSentimentService:
     ) -> List[SentimentResult]:
         """Analyze sentiment for multiple texts."""
         try:
-            # Process in parallel batches
-            batch_size = 8  # Adjust based on GPU memory
-            results = []
+            # Score each distinct text once and fan results back out
+            unique_texts = list(dict.fromkeys(texts))
             
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                batch_results = await asyncio.gather(
-                    *[
-                        self.analyze_sentiment(text, model, context)
-                        for text in batch
-                    ],
-                    return_exceptions=True
+            # Pull previously scored texts into the local tier with one
+            # bulk lookup so they never reach the model
+            if model in [SentimentModel.BERT_FINANCIAL, SentimentModel.BERT_BASE]:
+                await self.result_cache.prefetch(
+                    self.bert_service.result_cache_model_id,
+                    [self.bert_service._preprocess_text(text) for text in unique_texts]
                 )
-                
-                # Filter out exceptions
-                for result in batch_results:
-                    if not isinstance(result, Exception):
-                        results.append(result)
-                    else:
-                        self.logger.error(f"Error in batch sentiment analysis: {str(result)}")
+            elif model in self.batchers or model in self.pipelines:
+                await self.result_cache.prefetch(
+                    self._result_cache_model_id(model),
+                    [self._preprocess_text(text) for text in unique_texts]
+                )
+            
+            # Submit all texts concurrently; the inference workers coalesce
+            # them into padded batches of at most inference_batch_size
+            unique_results = await asyncio.gather(
+                *[
+                    self.analyze_sentiment(text, model, context)
+                    for text in unique_texts
+                ],
+                return_exceptions=True
+            )
+            results_by_text = dict(zip(unique_texts, unique_results))
+            
+            # Filter out exceptions
+            results = []
+            for text in texts:
+                result = results_by_text[text]
+                if not isinstance(result, Exception):
+                    results.append(result)
+                else:
+                    self.logger.error(f"Error in batch sentiment analysis: {str(result)}")
             
             return results
             
@@ -512,7 +559,7 @@ class AdvancedSentimentService:
             # Analyze with specified model
             if model == SentimentModel.VADER or not TRANSFORMERS_AVAILABLE:
                 result = await self._analyze_with_vader(text, context)
-            elif model in self.pipelines:
+            elif model in self.batchers or model in self.pipelines:
                 result = await self._analyze_with_transformer(text, model, context)
             else:
                 # Fallback to VADER
@@ -525,6 +572,10 @@ class AdvancedSentimentService:
             self.logger.error(f"Error in standard model analysis: {str(e)}")
             raise
     
+    def _result_cache_model_id(self, model: SentimentModel) -> str:
+        """Result cache namespace; outputs differ between inference backends."""
+        return self.result_cache_model_ids.get(model, model.value)
+    
     async def _analyze_with_transformer(
         self,
         text: str,
@@ -533,10 +584,17 @@ class AdvancedSentimentService:
     ) -> Dict[str, Any]:
         """Analyze sentiment using transformer model."""
         try:
-            pipeline = self.pipelines[model]
-            
-            # Get predictions
-            results = pipeline(text)
+            # Raw model output is context-free, so it is shared across callers;
+            # the context adjustment below is applied on every call
+            model_id = self._result_cache_model_id(model)
+            results = await self.result_cache.get(model_id, text)
+            if results is None:
+                # Get predictions, batched off the event loop when a worker exists
+                if model in self.batchers:
+                    results = [await self.batchers[model].submit(text)]
+                else:
+                    results = self.pipelines[model](text)
+                await self.result_cache.set(model_id, text, results)
             
             # Process results (format varies by model)
             if isinstance(results, list) and len(results) > 0:
@@ -756,6 +814,13 @@ class AdvancedSentimentService:
             self.logger.error(f"Error analyzing emotional profile: {str(e)}")
             return {}
     
+    async def close(self):
+        """Stop inference workers and release their threads."""
+        for batcher in self.batchers.values():
+            await batcher.close()
+        self.batchers.clear()
+        await self.bert_service.close()
+    
     async def get_model_stats(self) -> Dict[str, Any]:
         """Get statistics about available models."""
         try:
@@ -767,6 +832,11 @@ class AdvancedSentimentService:
                 "model_count": len(self.models),
                 "financial_keywords_count": len(self.financial_keywords),
                 "cache_ttl": self.model_cache_ttl,
+                "inference_batching": {
+                    model_type.value: batcher.get_stats()
+                    for model_type, batcher in self.batchers.items()
+                },
+                "result_cache": self.result_cache.get_stats(),
                 "bert_service": bert_stats
             }
             
@@ -3,10 +3,13 @@ API 키 관리 서비스 모듈
 API 키 생성, 검증, 관리 및 권한 부여 기능 제공
 """
 
+import asyncio
 import secrets
 import hashlib
 import json
-from typing import Dict, List, Optional, Any
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 import redis.asyncio as redis
@@ -43,12 +46,45 @@ class APIKeyUsage:
 class APIKeyService:
     """API 키 관리 서비스 클래스"""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        cache_ttl: float = 30.0,
+        max_cached_keys: int = 10000,
+        usage_flush_interval_ms: int = 500
+    ):
         self.redis_url = redis_url
         self.redis_client = None
         self.key_prefix = "insitechart:api_keys:"
         self.usage_prefix = "insitechart:api_usage:"
         
+        # 검증된 키 메타데이터 로컬 캐시 (키 다이제스트 -> (만료 시각, APIKeyInfo 또는 None)), LRU
+        self.cache_ttl = cache_ttl
+        self.max_cached_keys = max_cached_keys
+        self._key_cache: "OrderedDict[str, Tuple[float, Optional[APIKeyInfo]]]" = OrderedDict()
+        
+        # 폐기/수정 시 다른 인스턴스의 캐시 무효화 채널 (키 다이제스트 전송)
+        self.invalidation_channel = f"{self.key_prefix}invalidate"
+        self._invalidation_task: Optional[asyncio.Task] = None
+        
+        # 쓰기 지연(write-behind) 사용량 집계
+        self.usage_flush_interval = usage_flush_interval_ms / 1000
+        self._pending_usage: Dict[str, int] = defaultdict(int)
+        self._pending_last_used: Dict[str, str] = {}
+        self._pending_hourly: Dict[str, int] = defaultdict(int)
+        self._hourly_known: Dict[str, int] = {}  # 시간 윈도우 키 -> 마지막으로 확인한 전역 사용량
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        
+        # 통계
+        self.stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "invalidations": 0,
+            "usage_flushes": 0,
+            "usage_flush_errors": 0
+        }
+        
         # 기본 권한 정의
         self.default_permissions = {
             "basic": ["stock:read", "search:read"],
@@ -68,11 +104,32 @@ class APIKeyService:
         try:
             self.redis_client = redis.from_url(self.redis_url)
             await self.redis_client.ping()
+            await self.start()
             logger.info("API Key Service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize API Key Service: {str(e)}")
             raise
     
+    async def start(self):
+        """캐시 무효화 구독 및 사용량 플러시 작업 시작"""
+        if self._invalidation_task is None or self._invalidation_task.done():
+            self._invalidation_task = asyncio.create_task(self._invalidation_listener())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._usage_flusher())
+    
+    async def close(self):
+        """백그라운드 작업 중지 및 남은 사용량 플러시"""
+        for task in (self._invalidation_task, self._flush_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._invalidation_task = None
+        self._flush_task = None
+        await self.flush_usage()
+    
     async def generate_api_key(
         self, 
         user_id: str, 
@@ -154,8 +211,8 @@ class APIKeyService:
             API 키 정보 또는 None
         """
         try:
-            # API 키 정보 조회
-            key_info = await self._get_key_info(api_key)
+            # API 키 정보 조회 (로컬 캐시 우선)
+            key_info = await self._get_cached_key_info(api_key)
             
             if not key_info:
                 logger.warning(f"Invalid API key: {api_key[:10]}...")
@@ -172,8 +229,8 @@ class APIKeyService:
                 logger.warning(f"Expired API key: {key_info.key_id}")
                 return None
             
-            # 사용량 업데이트
-            await self._update_usage(key_info)
+            # 사용량 업데이트 (로컬 집계 후 일괄 플러시)
+            self._record_usage(key_info)
             
             return key_info
             
@@ -193,7 +250,7 @@ class APIKeyService:
             (허용 여부, 제한 정보)
         """
         try:
-            key_info = await self._get_key_info(api_key)
+            key_info = await self._get_cached_key_info(api_key)
             if not key_info:
                 return False, {"error": "Invalid API key"}
             
@@ -201,9 +258,8 @@ class APIKeyService:
             current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
             window_key = f"{self.usage_prefix}hourly:{api_key}:{current_hour.isoformat()}"
             
-            # 현재 사용량 조회
-            current_usage = await self.redis_client.get(window_key)
-            current_count = int(current_usage) if current_usage else 0
+            # 현재 사용량 조회 (마지막 전역 값 + 아직 플러시되지 않은 로컬 사용량)
+            current_count = await self._get_hourly_count(window_key)
             
             # 속도 제한 확인
             if current_count >= key_info.rate_limit:
@@ -216,9 +272,8 @@ class APIKeyService:
                     "retry_after": (reset_time - datetime.utcnow()).total_seconds()
                 }
             
-            # 사용량 증가
-            await self.redis_client.incr(window_key)
-            await self.redis_client.expire(window_key, 3600)  # 1시간 후 만료
+            # 사용량 증가 (다음 플러시에서 INCRBY)
+            self._pending_hourly[window_key] += 1
             
             return True, {
                 "allowed": True,
@@ -246,9 +301,9 @@ class APIKeyService:
             if not key_info:
                 return False
             
-            # 비활성화
+            # 비활성화 (사용량 필드는 덮어쓰지 않음)
             key_info.is_active = False
-            await self._store_key_info(key_info)
+            await self._update_key_fields(api_key, is_active=False)
             
             logger.info(f"API key revoked: {key_info.key_id}")
             return True
@@ -300,7 +355,7 @@ class APIKeyService:
                 return False
             
             key_info.permissions = permissions
-            await self._store_key_info(key_info)
+            await self._update_key_fields(api_key, permissions=permissions)
             
             logger.info(f"API key permissions updated: {key_info.key_id}")
             return True
@@ -325,6 +380,9 @@ class APIKeyService:
             if not key_info:
                 return {"error": "Invalid API key"}
             
+            # 로컬에 집계된 사용량 반영
+            await self.flush_usage()
+            
             # 기간별 사용량 조회
             end_date = datetime.utcnow()
             start_date = end_date - timedelta(days=days)
@@ -355,13 +413,31 @@ class APIKeyService:
             logger.error(f"Error getting API key usage stats: {str(e)}")
             return {"error": "Failed to get usage stats"}
     
+    @staticmethod
+    def _serialize_field(value: Any) -> Any:
+        """Redis 해시 필드 값 직렬화"""
+        if isinstance(value, list):
+            return json.dumps(value)
+        if isinstance(value, bool) or value is None:
+            return str(value) if value is not None else ""
+        return value
+    
     async def _store_key_info(self, key_info: APIKeyInfo) -> None:
         """API 키 정보 저장"""
-        key_data = asdict(key_info)
+        key_data = {k: self._serialize_field(v) for k, v in asdict(key_info).items()}
         await self.redis_client.hset(
             f"{self.key_prefix}info:{key_info.api_key}",
             mapping=key_data
         )
+        await self._invalidate_cached_key(key_info.api_key)
+    
+    async def _update_key_fields(self, api_key: str, **fields: Any) -> None:
+        """API 키 정보 일부 필드만 갱신 후 캐시 무효화"""
+        await self.redis_client.hset(
+            f"{self.key_prefix}info:{api_key}",
+            mapping={k: self._serialize_field(v) for k, v in fields.items()}
+        )
+        await self._invalidate_cached_key(api_key)
     
     async def _get_key_info(self, api_key: str) -> Optional[APIKeyInfo]:
         """API 키 정보 조회"""
@@ -370,17 +446,23 @@ class APIKeyService:
             if not key_data:
                 return None
             
-            # 문자열 값을 적절한 타입으로 변환
-            if b'usage_count' in key_data:
-                key_data[b'usage_count'] = int(key_data[b'usage_count'])
-            if b'is_active' in key_data:
-                key_data[b'is_active'] = key_data[b'is_active'] == b'True'
-            if b'rate_limit' in key_data:
-                key_data[b'rate_limit'] = int(key_data[b'rate_limit'])
-            
             # 바이트를 문자열로 변환
-            str_key_data = {k.decode(): v.decode() if isinstance(v, bytes) else v 
-                          for k, v in key_data.items()}
+            str_key_data = {
+                (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+                for k, v in key_data.items()
+            }
+            
+            # 문자열 값을 적절한 타입으로 변환
+            if 'usage_count' in str_key_data:
+                str_key_data['usage_count'] = int(str_key_data['usage_count'])
+            if 'is_active' in str_key_data:
+                str_key_data['is_active'] = str_key_data['is_active'] == 'True'
+            if 'rate_limit' in str_key_data:
+                str_key_data['rate_limit'] = int(str_key_data['rate_limit'])
+            if isinstance(str_key_data.get('permissions'), str):
+                str_key_data['permissions'] = json.loads(str_key_data['permissions'])
+            if str_key_data.get('last_used') == "":
+                str_key_data['last_used'] = None
             
             return APIKeyInfo(**str_key_data)
             
@@ -388,23 +470,163 @@ class APIKeyService:
             logger.error(f"Error getting key info: {str(e)}")
             return None
     
+    @staticmethod
+    def _key_digest(api_key: str) -> str:
+        """캐시 및 무효화 메시지에 사용할 API 키 다이제스트"""
+        return hashlib.sha256(api_key.encode()).hexdigest()
+    
+    async def _get_cached_key_info(self, api_key: str) -> Optional[APIKeyInfo]:
+        """로컬 캐시를 거쳐 API 키 정보 조회 (존재하지 않는 키도 짧게 캐시)"""
+        digest = self._key_digest(api_key)
+        cached = self._key_cache.get(digest)
+        if cached is not None and cached[0] > time.monotonic():
+            self._key_cache.move_to_end(digest)
+            self.stats["cache_hits"] += 1
+            return cached[1]
+        
+        self.stats["cache_misses"] += 1
+        key_info = await self._get_key_info(api_key)
+        
+        self._key_cache[digest] = (time.monotonic() + self.cache_ttl, key_info)
+        self._key_cache.move_to_end(digest)
+        while len(self._key_cache) > self.max_cached_keys:
+            self._key_cache.popitem(last=False)
+        
+        return key_info
+    
+    def _evict_cached_key(self, digest: str) -> None:
+        """로컬 캐시에서 키 제거"""
+        if self._key_cache.pop(digest, None) is not None:
+            self.stats["invalidations"] += 1
+    
+    async def _invalidate_cached_key(self, api_key: str) -> None:
+        """로컬 캐시 제거 후 다른 인스턴스에 무효화 발행"""
+        digest = self._key_digest(api_key)
+        self._evict_cached_key(digest)
+        try:
+            await self.redis_client.publish(self.invalidation_channel, digest)
+        except Exception as e:
+            logger.error(f"Error publishing API key invalidation: {str(e)}")
+    
+    async def _invalidation_listener(self) -> None:
+        """캐시 무효화 메시지 구독"""
+        pubsub = self.redis_client.pubsub()
+        await pubsub.subscribe(self.invalidation_channel)
+        try:
+            while True:
+                try:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        digest = message["data"]
+                        if isinstance(digest, bytes):
+                            digest = digest.decode()
+                        self._evict_cached_key(digest)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in API key invalidation listener: {str(e)}")
+                    await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.unsubscribe(self.invalidation_channel)
+                await pubsub.aclose()
+            except Exception:
+                pass
+    
+    async def _get_hourly_count(self, window_key: str) -> int:
+        """시간 윈도우 사용량 (윈도우당 최초 1회만 Redis 조회)"""
+        if window_key not in self._hourly_known:
+            current_usage = await self.redis_client.get(window_key)
+            self._hourly_known[window_key] = int(current_usage) if current_usage else 0
+        return self._hourly_known[window_key] + self._pending_hourly.get(window_key, 0)
+    
+    def _record_usage(self, key_info: APIKeyInfo) -> None:
+        """API 키 사용량 로컬 집계"""
+        now = datetime.utcnow().isoformat()
+        key_info.last_used = now
+        key_info.usage_count += 1
+        self._pending_usage[key_info.api_key] += 1
+        self._pending_last_used[key_info.api_key] = now
+    
     async def _update_usage(self, key_info: APIKeyInfo) -> None:
         """API 키 사용량 업데이트"""
-        try:
-            # 마지막 사용 시간 업데이트
-            key_info.last_used = datetime.utcnow().isoformat()
-            key_info.usage_count += 1
+        self._record_usage(key_info)
+    
+    async def flush_usage(self) -> int:
+        """로컬에 집계된 사용량을 파이프라인 한 번으로 Redis에 반영
+        
+        Returns:
+            반영한 요청 수
+        """
+        async with self._flush_lock:
+            if not self.redis_client or not (self._pending_usage or self._pending_hourly):
+                return 0
             
-            await self._store_key_info(key_info)
+            usage, self._pending_usage = self._pending_usage, defaultdict(int)
+            last_used, self._pending_last_used = self._pending_last_used, {}
+            hourly, self._pending_hourly = self._pending_hourly, defaultdict(int)
             
-            # 일일 사용량 기록
             today = datetime.utcnow().strftime('%Y-%m-%d')
-            daily_key = f"{self.usage_prefix}daily:{key_info.api_key}:{today}"
-            await self.redis_client.incr(daily_key)
-            await self.redis_client.expire(daily_key, 86400 * 7)  # 7일간 유지
-            
-        except Exception as e:
-            logger.error(f"Error updating usage: {str(e)}")
+            window_keys = list(hourly.keys())
+            
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for api_key, count in usage.items():
+                    info_key = f"{self.key_prefix}info:{api_key}"
+                    daily_key = f"{self.usage_prefix}daily:{api_key}:{today}"
+                    pipe.hincrby(info_key, "usage_count", count)
+                    pipe.hset(info_key, "last_used", last_used[api_key])
+                    pipe.incrby(daily_key, count)
+                    pipe.expire(daily_key, 86400 * 7)  # 7일간 유지
+                for window_key in window_keys:
+                    pipe.incrby(window_key, hourly[window_key])
+                    pipe.expire(window_key, 3600)  # 1시간 후 만료
+                results = await pipe.execute()
+                
+            except Exception as e:
+                # 실패한 집계는 다음 플러시에서 재시도
+                for api_key, count in usage.items():
+                    self._pending_usage[api_key] += count
+                    self._pending_last_used.setdefault(api_key, last_used[api_key])
+                for window_key, count in hourly.items():
+                    self._pending_hourly[window_key] += count
+                self.stats["usage_flush_errors"] += 1
+                logger.error(f"Error flushing API key usage: {str(e)}")
+                return 0
+            
+            # INCRBY 결과로 전역 시간 윈도우 사용량 갱신
+            hourly_results = results[len(results) - 2 * len(window_keys):]
+            for index, window_key in enumerate(window_keys):
+                self._hourly_known[window_key] = int(hourly_results[2 * index])
+            
+            # 지난 시간 윈도우 정리
+            current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0).isoformat()
+            for window_key in [k for k in self._hourly_known if not k.endswith(current_hour)]:
+                if window_key not in self._pending_hourly:
+                    del self._hourly_known[window_key]
+            
+            self.stats["usage_flushes"] += 1
+            return sum(usage.values()) + sum(hourly.values())
+    
+    async def _usage_flusher(self) -> None:
+        """주기적 사용량 플러시"""
+        while True:
+            try:
+                await asyncio.sleep(self.usage_flush_interval)
+                await self.flush_usage()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in API key usage flusher: {str(e)}")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """캐시 및 사용량 집계 통계 조회"""
+        return {
+            **self.stats,
+            "cached_keys": len(self._key_cache),
+            "pending_usage": sum(self._pending_usage.values()),
+            "pending_hourly": sum(self._pending_hourly.values())
+        }
 
 # 전역 API 키 서비스 인스턴스
 api_key_service = APIKeyService()
\ No newline at end of file
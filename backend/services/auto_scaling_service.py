@@ -8,16 +8,17 @@ horizontal scaling, vertical scaling, and performance-based resource management.
 import asyncio
 import logging
 import json
+import math
 import os
-import psutil
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 import statistics
 
 from ..cache.unified_cache import UnifiedCacheManager
+from ..monitoring.system_metrics_sampler import system_metrics_sampler
 
 
 class ScalingDirection(str, Enum):
@@ -35,6 +36,7 @@ class ScalingTrigger(str, Enum):
     RESPONSE_TIME = "response_time"
     REQUEST_RATE = "request_rate"
     QUEUE_DEPTH = "queue_depth"
+    PREDICTED_LOAD = "predicted_load"
     CUSTOM_METRIC = "custom_metric"
 
 
@@ -106,9 +108,58 @@ class ScalingConfiguration:
     cooldown_period: int = 300  # seconds
     min_instances: int = 1
     max_instances: int = 10
+    target_requests_per_instance: float = 50.0  # requests/second one instance serves at 100%
+    forecast_horizon: int = 10  # samples ahead the predictive policy looks
+    season_length: int = 120  # samples per season (1 hour at a 30s interval)
     policies: List[ScalingPolicy] = field(default_factory=list)
 
 
+class HoltWintersForecaster:
+    """Additive Holt-Winters (triple exponential smoothing) forecaster.
+
+    Falls back to Holt's linear trend method until two full seasons of
+    history are available.
+    """
+    
+    def __init__(self, alpha: float = 0.5, beta: float = 0.3, gamma: float = 0.2, season_length: int = 0):
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.season_length = season_length
+    
+    def forecast(self, series: List[float], horizon: int) -> List[float]:
+        """Forecast the next `horizon` values of `series` (never negative)."""
+        n = len(series)
+        if n == 0:
+            return [0.0] * horizon
+        if n == 1:
+            return [max(0.0, float(series[0]))] * horizon
+        
+        m = self.season_length
+        if m > 1 and n >= 2 * m:
+            level = statistics.fmean(series[:m])
+            trend = (statistics.fmean(series[m:2 * m]) - level) / m
+            seasonals = [series[i] - level for i in range(m)]
+            for t, value in enumerate(series):
+                seasonal = seasonals[t % m]
+                last_level = level
+                level = self.alpha * (value - seasonal) + (1 - self.alpha) * (level + trend)
+                trend = self.beta * (level - last_level) + (1 - self.beta) * trend
+                seasonals[t % m] = self.gamma * (value - level) + (1 - self.gamma) * seasonal
+            return [
+                max(0.0, level + h * trend + seasonals[(n + h - 1) % m])
+                for h in range(1, horizon + 1)
+            ]
+        
+        level = float(series[0])
+        trend = float(series[1] - series[0])
+        for value in series[1:]:
+            last_level = level
+            level = self.alpha * value + (1 - self.alpha) * (level + trend)
+            trend = self.beta * (level - last_level) + (1 - self.beta) * trend
+        return [max(0.0, level + h * trend) for h in range(1, horizon + 1)]
+
+
 class AutoScalingService:
     """Cloud-native auto-scaling service."""
     
@@ -129,6 +180,17 @@ class AutoScalingService:
         self.metrics_buffer = []
         self.max_metrics_buffer = 1000
         
+        # Application signal sources (see attach_signal_sources)
+        self.performance_monitor = None
+        self.request_window_seconds = 60
+        self.queue_sources: Dict[str, Callable[[], int]] = {}
+        self.connection_sources: Dict[str, Callable[[], int]] = {}
+        
+        # Predictive scaling
+        self.forecaster = HoltWintersForecaster(season_length=self.config.season_length)
+        self.min_forecast_samples = 6
+        self.last_forecast: Optional[Dict[str, Any]] = None
+        
         # Cloud provider clients
         self.cloud_client = None
         self._initialize_cloud_client()
@@ -159,7 +221,10 @@ class AutoScalingService:
                 scale_in_threshold=float(os.getenv('SCALE_IN_THRESHOLD', '30.0')),
                 cooldown_period=int(os.getenv('COOLDOWN_PERIOD', '300')),
                 min_instances=int(os.getenv('MIN_INSTANCES', '1')),
-                max_instances=int(os.getenv('MAX_INSTANCES', '10'))
+                max_instances=int(os.getenv('MAX_INSTANCES', '10')),
+                target_requests_per_instance=float(os.getenv('TARGET_REQUESTS_PER_INSTANCE', '50.0')),
+                forecast_horizon=int(os.getenv('FORECAST_HORIZON', '10')),
+                season_length=int(os.getenv('FORECAST_SEASON_LENGTH', '120'))
             )
             
             # Add default policies
@@ -199,6 +264,18 @@ class AutoScalingService:
                     max_instances=config.max_instances,
                     scale_out_step=2,
                     scale_in_step=1
+                ),
+                ScalingPolicy(
+                    name="predictive_load",
+                    trigger_type=ScalingTrigger.PREDICTED_LOAD,
+                    threshold_min=0.0,  # scale-in is left to the reactive policies
+                    threshold_max=config.scale_out_threshold,
+                    scale_out_cooldown=config.cooldown_period,
+                    scale_in_cooldown=config.cooldown_period,
+                    min_instances=config.min_instances,
+                    max_instances=config.max_instances,
+                    scale_out_step=1,
+                    scale_in_step=0
                 )
             ]
             
@@ -342,6 +419,64 @@ class AutoScalingService:
             'scale_count': 0
         }
     
+    def attach_signal_sources(
+        self,
+        performance_monitor=None,
+        data_collector=None,
+        notification_service=None,
+        websocket_managers: Optional[Dict[str, Any]] = None
+    ):
+        """Connect live application signals used by the scaling policies.
+        
+        Args:
+            performance_monitor: PerformanceMonitor providing request rate and latency quantiles
+            data_collector: DistributedDataCollector whose task queues count towards queue depth
+            notification_service: RealtimeNotificationService (notification queue and sockets),
+                or a callable returning it for services created lazily (None until created)
+            websocket_managers: Mapping of user id to WebSocketConnectionManager
+        """
+        if performance_monitor is not None:
+            self.performance_monitor = performance_monitor
+        
+        if data_collector is not None:
+            self.register_queue_source(
+                "data_collection",
+                lambda: sum(queue.qsize() for queue in data_collector.task_queues.values())
+            )
+        
+        if notification_service is not None:
+            resolve_notifications = (
+                notification_service if callable(notification_service) else lambda: notification_service
+            )
+            
+            def notification_queue_size() -> int:
+                service = resolve_notifications()
+                return service.notification_queue.qsize() if service is not None else 0
+            
+            def notification_connections() -> int:
+                service = resolve_notifications()
+                return len(service.active_connections) if service is not None else 0
+            
+            self.register_queue_source("notifications", notification_queue_size)
+            self.register_connection_source("notification_websockets", notification_connections)
+        
+        if websocket_managers is not None:
+            self.register_connection_source(
+                "websocket_managers",
+                lambda: sum(
+                    1 for manager in list(websocket_managers.values())
+                    if getattr(manager.state, "value", manager.state) == "connected"
+                )
+            )
+    
+    def register_queue_source(self, name: str, source: Callable[[], int]):
+        """Register a callable returning a queue size that counts towards queue depth."""
+        self.queue_sources[name] = source
+    
+    def register_connection_source(self, name: str, source: Callable[[], int]):
+        """Register a callable returning an open socket/connection count."""
+        self.connection_sources[name] = source
+    
     async def start_monitoring(self):
         """Start continuous monitoring and auto-scaling."""
         try:
@@ -369,18 +504,7 @@ class AutoScalingService:
         """Main monitoring loop for auto-scaling decisions."""
         while self.is_monitoring:
             try:
-                # Collect current metrics
-                metrics = await self._collect_metrics()
-                
-                # Store metrics
-                await self._store_metrics(metrics)
-                
-                # Evaluate scaling policies
-                scaling_decisions = await self._evaluate_scaling_policies(metrics)
-                
-                # Execute scaling decisions
-                for decision in scaling_decisions:
-                    await self._execute_scaling_decision(decision)
+                await self.run_scaling_iteration()
                 
                 # Wait before next iteration
                 await asyncio.sleep(30)  # Check every 30 seconds
@@ -389,33 +513,57 @@ class AutoScalingService:
                 self.logger.error(f"Error in monitoring loop: {str(e)}")
                 await asyncio.sleep(60)  # Wait longer on error
     
+    async def run_scaling_iteration(self) -> List[Dict[str, Any]]:
+        """Collect metrics, evaluate policies and execute the resulting decisions once."""
+        # Collect current metrics
+        metrics = await self._collect_metrics()
+        
+        # Store metrics
+        await self._store_metrics(metrics)
+        
+        # Evaluate scaling policies
+        scaling_decisions = await self._evaluate_scaling_policies(metrics)
+        
+        # Execute scaling decisions
+        for decision in scaling_decisions:
+            await self._execute_scaling_decision(decision)
+        
+        return scaling_decisions
+    
     async def _collect_metrics(self) -> ResourceMetrics:
         """Collect current resource metrics."""
         try:
-            # System metrics
-            cpu_usage = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            memory_usage = memory.percent
-            disk = psutil.disk_usage('/')
-            disk_usage = disk.percent
+            # System metrics from the shared non-blocking sampler
+            snapshot = system_metrics_sampler.latest()
+            cpu_usage = snapshot.cpu_percent
+            memory_usage = snapshot.memory_percent
+            disk_usage = snapshot.disk_percent
             
             # Network metrics
-            network = psutil.net_io_counters()
             network_io = {
-                'bytes_sent': network.bytes_sent,
-                'bytes_recv': network.bytes_recv,
-                'bytes_sent_per_sec': network.bytes_sent / (time.time() - psutil.boot_time()),
-                'bytes_recv_per_sec': network.bytes_recv / (time.time() - psutil.boot_time())
+                'bytes_sent': snapshot.network_bytes_sent,
+                'bytes_recv': snapshot.network_bytes_recv,
+                'bytes_sent_per_sec': snapshot.network_bytes_sent_per_sec,
+                'bytes_recv_per_sec': snapshot.network_bytes_recv_per_sec
             }
             
-            # Application metrics (mock for now)
-            request_rate = self._calculate_request_rate()
-            response_time = self._calculate_response_time()
+            # Application metrics
+            request_stats = self._get_request_stats()
+            request_rate = self._calculate_request_rate(request_stats)
+            response_time = self._calculate_response_time(request_stats)
             queue_depth = self._calculate_queue_depth()
             active_connections = self._calculate_active_connections()
             
             # Custom metrics
             custom_metrics = await self._collect_custom_metrics()
+            custom_metrics.update({
+                'response_time_p50': request_stats['p50_response_time'] * 1000,
+                'response_time_p99': request_stats['p99_response_time'] * 1000,
+                'error_rate': request_stats['error_rate'] / 100,
+                'throughput': request_rate,
+                # Instance count at sample time turns per-instance rates into fleet load
+                'instances': float(self.current_instances)
+            })
             
             return ResourceMetrics(
                 timestamp=datetime.utcnow(),
@@ -446,33 +594,47 @@ class AutoScalingService:
                 custom_metrics={}
             )
     
-    def _calculate_request_rate(self) -> float:
-        """Calculate current request rate."""
-        # This would typically integrate with your application metrics
-        # For now, return a mock value
-        import random
-        return random.uniform(10, 100)
+    def _get_request_stats(self) -> Dict[str, float]:
+        """Request rate and latency quantiles from the attached PerformanceMonitor."""
+        if self.performance_monitor is not None:
+            try:
+                return self.performance_monitor.get_request_window_stats(self.request_window_seconds)
+            except Exception as e:
+                self.logger.error(f"Error reading request stats: {str(e)}")
+        
+        return {
+            'request_count': 0,
+            'requests_per_second': 0.0,
+            'p50_response_time': 0.0,
+            'p95_response_time': 0.0,
+            'p99_response_time': 0.0,
+            'error_rate': 0.0
+        }
+    
+    def _calculate_request_rate(self, request_stats: Dict[str, float]) -> float:
+        """Calculate current request rate (requests/second on this instance)."""
+        return float(request_stats['requests_per_second'])
     
-    def _calculate_response_time(self) -> float:
-        """Calculate current average response time."""
-        # This would typically integrate with your application metrics
-        # For now, return a mock value
-        import random
-        return random.uniform(100, 1000)
+    def _calculate_response_time(self, request_stats: Dict[str, float]) -> float:
+        """Calculate current response time (p95, milliseconds)."""
+        return float(request_stats['p95_response_time']) * 1000
+    
+    def _sum_sources(self, sources: Dict[str, Callable[[], int]]) -> int:
+        total = 0
+        for name, source in list(sources.items()):
+            try:
+                total += int(source())
+            except Exception as e:
+                self.logger.error(f"Error reading signal source {name}: {str(e)}")
+        return total
     
     def _calculate_queue_depth(self) -> int:
-        """Calculate current queue depth."""
-        # This would typically integrate with your application queue system
-        # For now, return a mock value
-        import random
-        return int(random.uniform(0, 50))
+        """Calculate current queue depth across registered queues."""
+        return self._sum_sources(self.queue_sources)
     
     def _calculate_active_connections(self) -> int:
-        """Calculate current active connections."""
-        # This would typically integrate with your application connection pool
-        # For now, return a mock value
-        import random
-        return int(random.uniform(10, 200))
+        """Calculate current open connections across registered socket sources."""
+        return self._sum_sources(self.connection_sources)
     
     async def _collect_custom_metrics(self) -> Dict[str, float]:
         """Collect custom application metrics."""
@@ -534,6 +696,9 @@ class AutoScalingService:
     async def _evaluate_policy(self, policy: ScalingPolicy, metrics: ResourceMetrics) -> Optional[Dict[str, Any]]:
         """Evaluate a single scaling policy."""
         try:
+            if policy.trigger_type == ScalingTrigger.PREDICTED_LOAD:
+                return self._evaluate_predictive_policy(policy)
+            
             # Get trigger value based on policy type
             trigger_value = self._get_trigger_value(policy.trigger_type, metrics)
             
@@ -592,6 +757,63 @@ class AutoScalingService:
             self.logger.error(f"Error evaluating policy: {str(e)}")
             return None
     
+    def _fleet_load_series(self) -> List[float]:
+        """Fleet-wide request rate per buffered sample (per-instance rate x instances)."""
+        return [
+            metrics.request_rate * metrics.custom_metrics.get('instances', float(self.current_instances))
+            for metrics in self.metrics_buffer
+        ]
+    
+    def _evaluate_predictive_policy(self, policy: ScalingPolicy) -> Optional[Dict[str, Any]]:
+        """Scale out ahead of saturation using a short-horizon load forecast.
+        
+        The fleet request rate in the metrics buffer is forecast with
+        Holt-Winters; if the forecast peak would push utilization above
+        threshold_max, enough instances are added to bring it back under.
+        """
+        series = self._fleet_load_series()
+        if len(series) < self.min_forecast_samples:
+            return None
+        
+        forecast = self.forecaster.forecast(series, self.config.forecast_horizon)
+        peak = max(forecast)
+        capacity = self.current_instances * self.config.target_requests_per_instance
+        predicted_utilization = peak / capacity * 100 if capacity else 0.0
+        
+        self.last_forecast = {
+            'timestamp': datetime.utcnow().isoformat(),
+            'current_load': series[-1],
+            'forecast_peak': peak,
+            'predicted_utilization': predicted_utilization,
+            'horizon': self.config.forecast_horizon
+        }
+        
+        if predicted_utilization <= policy.threshold_max:
+            return None
+        
+        last_scale_key = f"{policy.name}_{policy.trigger_type.value}"
+        if last_scale_key in self.last_scale_time:
+            time_since_last_scale = (datetime.utcnow() - self.last_scale_time[last_scale_key]).total_seconds()
+            if time_since_last_scale < policy.scale_out_cooldown:
+                return None
+        
+        required = math.ceil(peak / (self.config.target_requests_per_instance * policy.threshold_max / 100))
+        new_instances = min(max(required, self.current_instances + policy.scale_out_step), policy.max_instances)
+        if new_instances <= self.current_instances:
+            return None
+        
+        return {
+            'direction': ScalingDirection.SCALE_OUT,
+            'policy': policy,
+            'trigger_value': predicted_utilization,
+            'current_instances': self.current_instances,
+            'new_instances': new_instances,
+            'reason': (
+                f"forecast load {peak:.1f} req/s within {self.config.forecast_horizon} samples "
+                f"({predicted_utilization:.1f}% utilization) exceeds threshold ({policy.threshold_max})"
+            )
+        }
+    
     def _get_trigger_value(self, trigger_type: ScalingTrigger, metrics: ResourceMetrics) -> float:
         """Get trigger value for policy evaluation."""
         trigger_map = {
@@ -883,6 +1105,12 @@ class AutoScalingService:
                     'total_scaling_events': len(self.scaling_history),
                     'metrics_buffer_size': len(self.metrics_buffer)
                 },
+                'signal_sources': {
+                    'performance_monitor': self.performance_monitor is not None,
+                    'queues': list(self.queue_sources.keys()),
+                    'connections': list(self.connection_sources.keys())
+                },
+                'forecast': self.last_forecast,
                 'current_metrics': {
                     'timestamp': current_metrics.timestamp.isoformat() if current_metrics else None,
                     'cpu_usage': current_metrics.cpu_usage if current_metrics else None,
@@ -6,6 +6,7 @@ for financial text analysis, improving upon the basic VADER approach.
 """
 
 import asyncio
+import hashlib
 import logging
 import torch
 import numpy as np
@@ -16,6 +17,10 @@ from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipe
 import re
 
 from ..cache.unified_cache import UnifiedCacheManager
+from ..cache.sentiment_result_cache import SentimentResultCache, sentiment_result_cache
+from ..config import get_settings
+from .inference_batcher import DynamicBatchInferenceWorker
+from .onnx_sentiment_backend import ONNX_RUNTIME_AVAILABLE, load_onnx_sentiment_model
 
 
 @dataclass
@@ -56,9 +61,15 @@ class BertSentimentService:
         self.tokenizer = None
         self.model = None
         self.sentiment_pipeline = None
+        self.inference_worker: Optional[DynamicBatchInferenceWorker] = None
+        self.inference_backend = "torch"
         
-        # Cache for model results
-        self.analysis_cache: Dict[str, SentimentAnalysisResult] = {}
+        # Dynamic batching configuration
+        self.inference_batch_size = 16
+        self.inference_max_wait_ms = 10.0
+        
+        # Bounded, content-addressed cache of per-text model outputs
+        self.result_cache: SentimentResultCache = sentiment_result_cache
         
         # Financial sentiment keywords
         self.financial_keywords = {
@@ -81,19 +92,39 @@ class BertSentimentService:
         try:
             self.logger.info("Loading BERT model for sentiment analysis...")
             
-            # Load tokenizer and model
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            settings = get_settings()
+            if settings.sentiment_inference_backend == "onnx" and ONNX_RUNTIME_AVAILABLE:
+                # Quantized ONNX Runtime model; all inference goes through the worker
+                self.tokenizer, self.model = load_onnx_sentiment_model(
+                    self.model_name,
+                    model_dir=settings.sentiment_onnx_model_dir,
+                    quantize=settings.sentiment_onnx_quantize,
+                    intra_op_threads=settings.sentiment_onnx_intra_op_threads
+                )
+                self.inference_backend = "onnx"
+            else:
+                # Load tokenizer and model
+                self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                
+                # Create sentiment analysis pipeline
+                self.sentiment_pipeline = pipeline(
+                    "sentiment-analysis",
+                    model=self.model,
+                    tokenizer=self.tokenizer,
+                    return_all_scores=True
+                )
             
-            # Create sentiment analysis pipeline
-            self.sentiment_pipeline = pipeline(
-                "sentiment-analysis",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                return_all_scores=True
+            # Coalesce concurrent requests into padded batches off the event loop
+            self.inference_worker = DynamicBatchInferenceWorker(
+                self.model,
+                self.tokenizer,
+                max_batch_size=self.inference_batch_size,
+                max_wait_ms=self.inference_max_wait_ms,
+                name="finbert"
             )
             
-            self.logger.info(f"BERT model loaded successfully: {self.model_name}")
+            self.logger.info(f"BERT model loaded successfully: {self.model_name} ({self.inference_backend})")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize BERT model: {str(e)}")
@@ -103,7 +134,7 @@ class BertSentimentService:
         """Analyze sentiment for a symbol using multiple sources."""
         try:
             # Check cache first
-            cache_key = f"bert_sentiment_{symbol}_{hash(str(sources))}"
+            cache_key = f"bert_sentiment_{symbol}_{self._sources_digest(sources)}"
             cached_result = await self.cache_manager.get(cache_key)
             if cached_result:
                 return SentimentAnalysisResult(**cached_result)
@@ -143,6 +174,19 @@ class BertSentimentService:
                 model_version=self.model_name
             )
     
+    def _sources_digest(self, sources: List[SentimentSource]) -> str:
+        """Process-stable digest of the scoring inputs of a source list."""
+        digest = hashlib.blake2b(digest_size=16)
+        for source in sources:
+            digest.update(f"{source.source_type}|{source.weight}|".encode("utf-8"))
+            digest.update(SentimentResultCache.text_digest(source.content).encode("utf-8"))
+        return digest.hexdigest()
+    
+    @property
+    def result_cache_model_id(self) -> str:
+        """Result cache namespace; outputs differ between inference backends."""
+        return f"{self.model_name}:{self.inference_backend}"
+    
     async def _analyze_source(self, source: SentimentSource) -> Optional[Dict[str, Any]]:
         """Analyze sentiment from a single source."""
         try:
@@ -152,17 +196,24 @@ class BertSentimentService:
             if not processed_text:
                 return None
             
-            # Analyze with BERT
-            result = self.sentiment_pipeline(processed_text)
-            
-            # Extract sentiment scores
-            scores = result[0] if result else None
-            if not scores:
-                return None
+            # Reuse label scores for text that was already scored
+            scores = await self.result_cache.get(self.result_cache_model_id, processed_text)
+            if scores is None:
+                # Analyze with BERT
+                if self.inference_worker:
+                    result = [await self.inference_worker.submit(processed_text)]
+                else:
+                    result = self.sentiment_pipeline(processed_text)
+                
+                # Extract sentiment scores
+                scores = result[0] if result else None
+                if not scores:
+                    return None
+                await self.result_cache.set(self.result_cache_model_id, processed_text, scores)
             
             # Map to our format
-            labels = scores['labels']
-            sentiment_scores = scores['scores']
+            labels = [score['label'].upper() for score in scores]
+            sentiment_scores = [score['score'] for score in scores]
             
             # Find dominant sentiment
             max_score_idx = np.argmax(sentiment_scores)
@@ -554,13 +605,19 @@ class BertSentimentService:
                 "tokenizer_loaded": self.tokenizer is not None,
                 "pipeline_loaded": self.sentiment_pipeline is not None,
                 "financial_keywords_count": len(self.financial_keywords["positive"]) + len(self.financial_keywords["negative"]),
-                "cache_size": len(self.analysis_cache),
+                "cache_size": self.result_cache.get_stats()["local_size"],
                 "timestamp": datetime.utcnow().isoformat()
             }
         except Exception as e:
             self.logger.error(f"Error getting model info: {str(e)}")
             return {}
     
+    async def close(self):
+        """Stop the inference worker and release its thread."""
+        if self.inference_worker:
+            await self.inference_worker.close()
+            self.inference_worker = None
+    
     async def get_model_stats(self) -> Dict[str, Any]:
         """Get statistics about the loaded BERT model."""
         try:
@@ -570,7 +627,10 @@ class BertSentimentService:
                 "tokenizer_loaded": self.tokenizer is not None,
                 "pipeline_loaded": self.sentiment_pipeline is not None,
                 "financial_keywords_count": len(self.financial_keywords["positive"]) + len(self.financial_keywords["negative"]),
-                "cache_size": len(self.analysis_cache),
+                "cache_size": self.result_cache.get_stats()["local_size"],
+                "result_cache": self.result_cache.get_stats()["models"].get(self.result_cache_model_id),
+                "inference_backend": self.inference_backend,
+                "inference_batching": self.inference_worker.get_stats() if self.inference_worker else None,
                 "timestamp": datetime.utcnow().isoformat()
             }
         except Exception as e:
@@ -0,0 +1,262 @@
+"""
+Bulk ingest writer for InsiteChart platform.
+
+Buffers StockPrice and SentimentData rows in memory and writes them through
+the async engine as batched executemany INSERTs, flushing when a table's buffer reaches
+``max_batch_size`` rows or every ``flush_interval`` seconds, whichever comes
+first. On SQLite and PostgreSQL the INSERT uses ``ON CONFLICT DO NOTHING`` so
+a batch that is retried after a partial failure does not duplicate rows that
+carry explicit ids.
+
+Only transient failures (lost connections, operational errors) put a batch
+back in the buffer. When the database rejects a batch (constraint violations,
+bad values) it is split in halves until the offending rows are isolated; the
+rest is written and the rejected rows are kept in a bounded dead-letter list.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import insert, Table
+from sqlalchemy.exc import DBAPIError, DisconnectionError, OperationalError
+
+from ..models.database_models import SentimentData, StockPrice
+
+logger = logging.getLogger(__name__)
+
+
+class BulkWriter:
+    """Size- and time-bounded batching writer for high-volume tables."""
+
+    def __init__(
+        self,
+        session_factory=None,
+        max_batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        max_buffered_rows: int = 100000,
+        max_dead_letters: int = 1000
+    ):
+        # Defaults to backend.database.AsyncSessionLocal, resolved on first flush
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered_rows = max_buffered_rows
+
+        self.tables: Dict[str, Table] = {
+            StockPrice.__tablename__: StockPrice.__table__,
+            SentimentData.__tablename__: SentimentData.__table__
+        }
+        self.buffers: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self.tables}
+        # Created on first flush so the module-global writer binds to the running loop
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Rows the database rejected, with the error that rejected them
+        self.dead_letters: Deque[Dict[str, Any]] = deque(maxlen=max_dead_letters)
+
+        # Statistics
+        self.stats = {
+            "rows_buffered": 0,
+            "rows_written": 0,
+            "rows_dropped": 0,
+            "rows_rejected": 0,
+            "batches_written": 0,
+            "flush_errors": 0,
+            "last_flush_ms": 0.0
+        }
+
+    async def start(self):
+        """Start the periodic flush task."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(f"Bulk writer started (batch size {self.max_batch_size}, interval {self.flush_interval}s)")
+
+    async def close(self):
+        """Stop the periodic flush task and write out buffered rows."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in bulk writer flush loop: {str(e)}")
+
+    async def add_stock_price(self, row: Dict[str, Any]):
+        """Buffer a stock_prices row (column name -> value)."""
+        await self.add(StockPrice.__tablename__, row)
+
+    async def add_sentiment_data(self, row: Dict[str, Any]):
+        """Buffer a sentiment_data row (column name -> value)."""
+        await self.add(SentimentData.__tablename__, row)
+
+    async def add(self, table_name: str, row: Dict[str, Any]):
+        """Buffer a row and flush the table once a full batch is buffered."""
+        buffer = self.buffers[table_name]
+        if "timestamp" not in row or row["timestamp"] is None:
+            row = {**row, "timestamp": datetime.utcnow()}
+        buffer.append(row)
+        self.stats["rows_buffered"] += 1
+
+        if len(buffer) >= self.max_batch_size:
+            await self.flush(table_name)
+
+    async def add_many(self, table_name: str, rows: List[Dict[str, Any]]):
+        """Buffer several rows at once."""
+        now = datetime.utcnow()
+        buffer = self.buffers[table_name]
+        for row in rows:
+            if "timestamp" not in row or row["timestamp"] is None:
+                row = {**row, "timestamp": now}
+            buffer.append(row)
+        self.stats["rows_buffered"] += len(rows)
+
+        if len(buffer) >= self.max_batch_size:
+            await self.flush(table_name)
+
+    def _insert_statement(self, table: Table, dialect_name: str):
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            return insert(table)
+        return dialect_insert(table).on_conflict_do_nothing()
+
+    def _get_session_factory(self):
+        if self.session_factory is None:
+            from ..database import AsyncSessionLocal
+            if AsyncSessionLocal is None:
+                # Treated like a lost connection: rows stay buffered until it is available
+                raise ConnectionError("Async database engine is not available")
+            self.session_factory = AsyncSessionLocal
+        return self.session_factory
+
+    async def flush(self, table_name: Optional[str] = None) -> int:
+        """Write buffered rows (of one table or all tables) in batches.
+
+        Returns:
+            Number of rows written
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            names = [table_name] if table_name else list(self.tables)
+            written = 0
+            start = time.perf_counter()
+
+            for name in names:
+                rows = self.buffers[name]
+                if not rows:
+                    continue
+                self.buffers[name] = []
+
+                try:
+                    written += await self._write_rows(name, rows)
+                except Exception as e:
+                    self.stats["flush_errors"] += 1
+                    logger.error(f"Error flushing {len(rows)} rows to {name}: {str(e)}")
+                    if self._is_transient(e):
+                        self._requeue(name, rows)
+                    else:
+                        retry: List[Dict[str, Any]] = []
+                        written += await self._write_isolating_rejects(name, rows, e, retry)
+                        if retry:
+                            self._requeue(name, retry)
+
+            if written:
+                self.stats["last_flush_ms"] = (time.perf_counter() - start) * 1000
+            return written
+
+    async def _write_rows(self, table_name: str, rows: List[Dict[str, Any]]) -> int:
+        table = self.tables[table_name]
+        session_factory = self._get_session_factory()
+
+        async with session_factory() as session:
+            async with session.begin():
+                statement = self._insert_statement(table, session.bind.dialect.name)
+                for offset in range(0, len(rows), self.max_batch_size):
+                    # A list of parameter sets runs as one executemany per batch
+                    await session.execute(statement, rows[offset:offset + self.max_batch_size])
+                    self.stats["batches_written"] += 1
+
+        self.stats["rows_written"] += len(rows)
+        return len(rows)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Whether a failed write is worth retrying unchanged."""
+        if isinstance(error, (OperationalError, DisconnectionError, ConnectionError, TimeoutError)):
+            return True
+        return isinstance(error, DBAPIError) and error.connection_invalidated
+
+    async def _write_isolating_rejects(self, table_name: str, rows: List[Dict[str, Any]],
+                                       error: Exception, retry: List[Dict[str, Any]]) -> int:
+        """Bisect a rejected batch, writing the good rows and dead-lettering the bad ones.
+
+        Rows whose half fails transiently are appended to ``retry``.
+        """
+        if len(rows) == 1:
+            self._dead_letter(table_name, rows[0], error)
+            return 0
+
+        written = 0
+        middle = len(rows) // 2
+        for half in (rows[:middle], rows[middle:]):
+            try:
+                written += await self._write_rows(table_name, half)
+            except Exception as e:
+                if self._is_transient(e):
+                    retry.extend(half)
+                else:
+                    written += await self._write_isolating_rejects(table_name, half, e, retry)
+        return written
+
+    def _dead_letter(self, table_name: str, row: Dict[str, Any], error: Exception):
+        self.stats["rows_rejected"] += 1
+        self.dead_letters.append({
+            "table": table_name,
+            "row": row,
+            "error": str(getattr(error, "orig", None) or error),
+            "rejected_at": datetime.utcnow().isoformat()
+        })
+        logger.warning(f"Bulk writer rejected a {table_name} row: {str(error)}")
+
+    def _requeue(self, table_name: str, rows: List[Dict[str, Any]]):
+        """Put failed rows back in front of newer ones, dropping the oldest past the buffer cap."""
+        buffer = rows + self.buffers[table_name]
+        overflow = len(buffer) - self.max_buffered_rows
+        if overflow > 0:
+            buffer = buffer[overflow:]
+            self.stats["rows_dropped"] += overflow
+            logger.warning(f"Bulk writer buffer for {table_name} full; dropped {overflow} oldest rows")
+        self.buffers[table_name] = buffer
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer statistics."""
+        return {
+            **self.stats,
+            "pending_rows": {name: len(rows) for name, rows in self.buffers.items()},
+            "dead_letters": len(self.dead_letters),
+            "max_batch_size": self.max_batch_size,
+            "flush_interval": self.flush_interval
+        }
+
+
+# Global bulk writer instance
+bulk_writer = BulkWriter()
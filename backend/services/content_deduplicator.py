@@ -0,0 +1,392 @@
+"""
+Content Deduplication Service for InsiteChart platform.
+
+This service detects reposts and cross-posts across collection batches and
+platforms. Exact repeats are caught with a Bloom filter over a normalized
+content digest, and near-duplicates with MinHash signatures over word
+unigrams and bigrams, indexed by LSH bands. The index is time-windowed
+(rotating generations) and can be persisted to Redis so it survives restarts
+and is shared between workers.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import redis.asyncio as redis
+
+from ..config import get_redis_url
+
+
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_TOKEN_RE = re.compile(r"[^\W_]+(?:'[^\W_]+)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# (content digest, MinHash signature or None for short texts)
+Fingerprint = Tuple[bytes, Optional[np.ndarray]]
+
+
+def normalize_content(text: str) -> str:
+    """Normalize content so trivial repost edits map to the same text."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    text = _URL_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def content_digest(normalized: str) -> bytes:
+    """128-bit digest of normalized content."""
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+def shingle_features(tokens: List[str]) -> List[str]:
+    """Word unigrams and bigrams; bigrams keep some word order signal."""
+    return list(set(tokens) | {f"{a} {b}" for a, b in zip(tokens, tokens[1:])})
+
+
+class MinHasher:
+    """MinHash signatures with universal hashing over 32-bit feature hashes."""
+
+    def __init__(self, num_perm: int = 32, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, features: List[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=4).digest(), "big")
+                for feature in features
+            ),
+            dtype=np.uint64,
+            count=len(features)
+        )
+        permuted = (np.outer(hashes, self.a) + self.b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 128-bit digests (double hashing)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: bytes):
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, digest: bytes):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+@dataclass
+class DedupGeneration:
+    """One time slice of the dedup index."""
+    started_at: int
+    bloom: BloomFilter
+    rows_per_band: int
+    signatures: List[np.ndarray] = field(default_factory=list)
+    bands: Dict[Tuple[int, bytes], List[int]] = field(default_factory=dict)
+    pending: List[str] = field(default_factory=list)  # entries not yet persisted
+
+    def _band_keys(self, signature: np.ndarray):
+        for band, start in enumerate(range(0, len(signature), self.rows_per_band)):
+            yield (band, signature[start:start + self.rows_per_band].tobytes())
+
+    def add(self, digest: bytes, signature: Optional[np.ndarray]):
+        self.bloom.add(digest)
+        if signature is not None:
+            index = len(self.signatures)
+            self.signatures.append(signature)
+            for key in self._band_keys(signature):
+                self.bands.setdefault(key, []).append(index)
+
+    def find_near(self, signature: np.ndarray, threshold: float) -> Optional[float]:
+        """Return the estimated Jaccard similarity of the first LSH candidate above threshold."""
+        checked = set()
+        for key in self._band_keys(signature):
+            for index in self.bands.get(key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                similarity = float(np.mean(self.signatures[index] == signature))
+                if similarity >= threshold:
+                    return similarity
+        return None
+
+
+class ContentDeduplicator:
+    """Time-windowed exact (Bloom) and near-duplicate (MinHash LSH) detector."""
+
+    def __init__(
+        self,
+        namespace: str = "default",
+        window_seconds: int = 86400,
+        generations: int = 4,
+        capacity_per_generation: int = 100000,
+        error_rate: float = 1e-4,
+        similarity_threshold: float = 0.7,
+        num_perm: int = 32,
+        lsh_bands: int = 8,
+        min_tokens_for_near_match: int = 6,
+        clock: Callable[[], float] = time.time
+    ):
+        if num_perm % lsh_bands:
+            raise ValueError("num_perm must be a multiple of lsh_bands")
+
+        self.namespace = namespace
+        self.window_seconds = window_seconds
+        self.generation_seconds = max(1, window_seconds // generations)
+        self.capacity_per_generation = capacity_per_generation
+        self.error_rate = error_rate
+        self.similarity_threshold = similarity_threshold
+        self.rows_per_band = num_perm // lsh_bands
+        self.min_tokens_for_near_match = min_tokens_for_near_match
+        self.minhasher = MinHasher(num_perm)
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+
+        self.generations: List[DedupGeneration] = []
+        self.redis_client = None
+        self.key_prefix = f"content_dedup:{namespace}"
+
+        # Statistics
+        self.stats = {
+            "items_checked": 0,
+            "exact_duplicates": 0,
+            "near_duplicates": 0,
+            "unique_items": 0,
+            "entries_loaded": 0,
+            "persist_errors": 0
+        }
+
+    async def initialize(self, redis_client=None) -> bool:
+        """Attach Redis persistence and load the live window; local-only on failure."""
+        try:
+            self.redis_client = redis_client or redis.from_url(
+                get_redis_url(),
+                encoding="utf-8",
+                decode_responses=True
+            )
+            await self.redis_client.ping()
+            await self._load()
+            self.logger.info(
+                f"Content deduplicator {self.namespace} loaded {self.stats['entries_loaded']} entries"
+            )
+            return True
+        except Exception as e:
+            self.logger.warning(f"Content deduplicator {self.namespace} running without persistence: {str(e)}")
+            self.redis_client = None
+            return False
+
+    def _generation_start(self, now: float) -> int:
+        return int(now // self.generation_seconds * self.generation_seconds)
+
+    def _new_generation(self, started_at: int) -> DedupGeneration:
+        return DedupGeneration(
+            started_at=started_at,
+            bloom=BloomFilter(self.capacity_per_generation, self.error_rate),
+            rows_per_band=self.rows_per_band
+        )
+
+    def _current_generation(self) -> DedupGeneration:
+        """Rotate generations and return the one new entries go into."""
+        now = self.clock()
+        started_at = self._generation_start(now)
+        if not self.generations or self.generations[-1].started_at < started_at:
+            self.generations.append(self._new_generation(started_at))
+        cutoff = now - self.window_seconds
+        while self.generations and self.generations[0].started_at + self.generation_seconds <= cutoff:
+            self.generations.pop(0)
+        return self.generations[-1]
+
+    def _fingerprint(self, text: str) -> Fingerprint:
+        normalized = normalize_content(text)
+        tokens = _TOKEN_RE.findall(normalized)
+        # Short texts share too many shingles by chance; match them exactly only
+        signature = (
+            self.minhasher.signature(shingle_features(tokens))
+            if len(tokens) >= self.min_tokens_for_near_match else None
+        )
+        return content_digest(" ".join(tokens) or normalized), signature
+
+    def _classify(
+        self,
+        digest: bytes,
+        signature: Optional[np.ndarray],
+        generations: List[DedupGeneration]
+    ) -> Optional[str]:
+        self.stats["items_checked"] += 1
+
+        if any(digest in generation.bloom for generation in generations):
+            self.stats["exact_duplicates"] += 1
+            return "exact"
+
+        if signature is not None:
+            for generation in generations:
+                if generation.find_near(signature, self.similarity_threshold) is not None:
+                    self.stats["near_duplicates"] += 1
+                    return "near"
+
+        return None
+
+    def _record(self, fingerprints: List[Fingerprint]):
+        current = self._current_generation()
+        for digest, signature in fingerprints:
+            current.add(digest, signature)
+            current.pending.append(f"{digest.hex()}:{'' if signature is None else signature.tobytes().hex()}")
+        self.stats["unique_items"] += len(fingerprints)
+
+    def check_and_add(self, text: str) -> Optional[str]:
+        """Check one text against the window and record it if unique.
+
+        Returns:
+            "exact" or "near" for duplicates, None for unique content
+        """
+        self._current_generation()
+        digest, signature = self._fingerprint(text)
+        kind = self._classify(digest, signature, self.generations)
+        if kind is None:
+            self._record([(digest, signature)])
+        return kind
+
+    def stage_batch(
+        self,
+        items: List[Dict[str, Any]],
+        text_getter: Callable[[Dict[str, Any]], str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int], List[Fingerprint]]:
+        """Drop items already seen in this batch or the window, without recording them.
+
+        The returned fingerprints are recorded by commit() once the unique
+        items have been stored, so a batch that fails downstream is not
+        treated as seen when it is retried.
+
+        Returns:
+            Tuple of (unique items, {"exact": n, "near": n}, fingerprints to commit)
+        """
+        self._current_generation()
+        staged = DedupGeneration(
+            started_at=0,
+            bloom=BloomFilter(max(1, len(items)), self.error_rate),
+            rows_per_band=self.rows_per_band
+        )
+        generations = self.generations + [staged]
+
+        unique_items = []
+        fingerprints: List[Fingerprint] = []
+        dropped = {"exact": 0, "near": 0}
+        for item in items:
+            digest, signature = self._fingerprint(text_getter(item))
+            kind = self._classify(digest, signature, generations)
+            if kind:
+                dropped[kind] += 1
+            else:
+                staged.add(digest, signature)
+                fingerprints.append((digest, signature))
+                unique_items.append(item)
+
+        return unique_items, dropped, fingerprints
+
+    async def commit(self, fingerprints: List[Fingerprint]):
+        """Record fingerprints returned by stage_batch() and persist them."""
+        if fingerprints:
+            self._record(fingerprints)
+            await self.persist()
+
+    async def filter_batch(
+        self,
+        items: List[Dict[str, Any]],
+        text_getter: Callable[[Dict[str, Any]], str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Drop items already seen in this or earlier batches and record the rest.
+
+        Returns:
+            Tuple of (unique items, {"exact": n, "near": n})
+        """
+        unique_items, dropped, fingerprints = self.stage_batch(items, text_getter)
+        await self.commit(fingerprints)
+        return unique_items, dropped
+
+    async def persist(self):
+        """Append newly recorded digests/signatures to Redis in one pipeline."""
+        if not self.redis_client:
+            return
+
+        pending_generations = [generation for generation in self.generations if generation.pending]
+        if not pending_generations:
+            return
+
+        try:
+            ttl = self.window_seconds + self.generation_seconds
+            pipe = self.redis_client.pipeline(transaction=False)
+            for generation in pending_generations:
+                key = f"{self.key_prefix}:{generation.started_at}"
+                pipe.rpush(key, *generation.pending)
+                pipe.expire(key, ttl)
+                pipe.zadd(f"{self.key_prefix}:generations", {str(generation.started_at): generation.started_at})
+            pipe.zremrangebyscore(
+                f"{self.key_prefix}:generations", "-inf", self.clock() - self.window_seconds - self.generation_seconds
+            )
+            await pipe.execute()
+            for generation in pending_generations:
+                generation.pending.clear()
+        except Exception as e:
+            self.stats["persist_errors"] += 1
+            self.logger.error(f"Error persisting dedup index {self.namespace}: {str(e)}")
+
+    async def _load(self):
+        """Rebuild live generations from Redis."""
+        now = self.clock()
+        min_start = now - self.window_seconds - self.generation_seconds
+        starts = await self.redis_client.zrangebyscore(f"{self.key_prefix}:generations", min_start, "+inf")
+
+        generations = []
+        for start in sorted(int(float(s)) for s in starts):
+            if start + self.generation_seconds <= now - self.window_seconds:
+                continue
+            generation = self._new_generation(start)
+            for entry in await self.redis_client.lrange(f"{self.key_prefix}:{start}", 0, -1):
+                digest_hex, _, signature_hex = entry.partition(":")
+                signature = (
+                    np.frombuffer(bytes.fromhex(signature_hex), dtype=np.uint32)
+                    if signature_hex else None
+                )
+                generation.add(bytes.fromhex(digest_hex), signature)
+                self.stats["entries_loaded"] += 1
+            generations.append(generation)
+
+        self.generations = generations
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication statistics."""
+        checked = self.stats["items_checked"]
+        duplicates = self.stats["exact_duplicates"] + self.stats["near_duplicates"]
+        return {
+            **self.stats,
+            "duplicate_rate": duplicates / checked if checked else 0.0,
+            "live_generations": len(self.generations),
+            "indexed_items": sum(generation.bloom.count for generation in self.generations),
+            "window_seconds": self.window_seconds,
+            "persistent": self.redis_client is not None
+        }
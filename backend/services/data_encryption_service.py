@@ -11,21 +11,31 @@ import json
 import os
 import base64
 import secrets
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from cryptography.hazmat.backends import default_backend
-import hashlib
 
 from ..cache.unified_cache import UnifiedCacheManager
 
+# Envelope ciphertext layout:
+#   magic (2) | version (1) | algorithm (1) | DEK key id (16, UUID bytes) | nonce (12) | ciphertext + tag
+# The first 20 bytes are authenticated as associated data.
+ENVELOPE_MAGIC = b"IC"
+ENVELOPE_VERSION = 1
+ENVELOPE_AAD_SIZE = 20
+ENVELOPE_HEADER_SIZE = 32
+
 
 class EncryptionType(str, Enum):
     """Types of encryption algorithms."""
@@ -60,6 +70,14 @@ class KeyStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# AEAD algorithms usable for envelope encryption, with their header ids
+ENVELOPE_ALGORITHMS = {
+    EncryptionType.AES_256_GCM: (1, AESGCM),
+    EncryptionType.CHACHA20_POLY1305: (2, ChaCha20Poly1305)
+}
+ENVELOPE_ALGORITHM_IDS = {algorithm_id: enc_type for enc_type, (algorithm_id, _) in ENVELOPE_ALGORITHMS.items()}
+
+
 @dataclass
 class EncryptionKey:
     """Encryption key record."""
@@ -138,6 +156,34 @@ class DataEncryptionService:
         self.default_key_size = 256
         self.rsa_key_size = 4096
         
+        # Envelope encryption: one data key (DEK) per (data_type, algorithm, time window),
+        # stored wrapped by the master key; unwrapped DEKs are kept in an LRU
+        self.dek_window_seconds = self.config.get("dek_window_hours", 24) * 3600
+        self.dek_max_uses = self.config.get("dek_max_uses", 1000000)
+        self.dek_cache_size = self.config.get("dek_cache_size", 1024)
+        self.dek_cache_ttl = self.config.get("dek_cache_ttl_seconds", 3600)
+        self._active_data_keys: Dict[Tuple[str, EncryptionType, int], str] = {}
+        # key id -> (expiry on the monotonic clock, AEAD cipher, envelope header)
+        self._dek_cache: "OrderedDict[str, Tuple[float, Any, bytes]]" = OrderedDict()
+        self._data_key_lock = asyncio.Lock()
+        
+        # Buffered audit trail
+        self.audit_batch_size = self.config.get("audit_batch_size", 500)
+        self.audit_flush_interval = self.config.get("audit_flush_interval_ms", 1000) / 1000
+        # Records kept for retry while the cache is unavailable; the oldest are dropped beyond this
+        self.max_audit_buffer = self.config.get("max_audit_buffer", 10000)
+        self._audit_buffer: List[EncryptionOperation] = []
+        self._audit_flush_task: Optional[asyncio.Task] = None
+        
+        self.envelope_stats = {
+            "data_keys_created": 0,
+            "dek_cache_hits": 0,
+            "dek_cache_misses": 0,
+            "audit_flushes": 0,
+            "audit_records_flushed": 0,
+            "audit_records_dropped": 0
+        }
+        
         # Initialize master key
         self._initialize_master_key()
         
@@ -147,6 +193,8 @@ class DataEncryptionService:
         # Start maintenance tasks
         if self.key_rotation_enabled:
             asyncio.create_task(self._maintenance_loop())
+        if self.audit_logging_enabled:
+            self._audit_flush_task = asyncio.create_task(self._audit_flush_loop())
         
         self.logger.info("DataEncryptionService initialized")
     
@@ -163,7 +211,14 @@ class DataEncryptionService:
                 "hardware_security_module": os.getenv('HSM_ENABLED', 'false').lower() == 'true',
                 "key_backup_enabled": os.getenv('KEY_BACKUP_ENABLED', 'true').lower() == 'true',
                 "key_backup_location": os.getenv('KEY_BACKUP_LOCATION', '/secure/keys/backup'),
-                "performance_monitoring": os.getenv('ENCRYPTION_PERFORMANCE_MONITORING', 'true').lower() == 'true'
+                "performance_monitoring": os.getenv('ENCRYPTION_PERFORMANCE_MONITORING', 'true').lower() == 'true',
+                "dek_window_hours": int(os.getenv('DEK_WINDOW_HOURS', '24')),
+                "dek_max_uses": int(os.getenv('DEK_MAX_USES', '1000000')),
+                "dek_cache_size": int(os.getenv('DEK_CACHE_SIZE', '1024')),
+                "dek_cache_ttl_seconds": int(os.getenv('DEK_CACHE_TTL_SECONDS', '3600')),
+                "audit_batch_size": int(os.getenv('ENCRYPTION_AUDIT_BATCH_SIZE', '500')),
+                "audit_flush_interval_ms": int(os.getenv('ENCRYPTION_AUDIT_FLUSH_INTERVAL_MS', '1000')),
+                "max_audit_buffer": int(os.getenv('ENCRYPTION_AUDIT_MAX_BUFFER', '10000'))
             }
         except Exception as e:
             self.logger.error(f"Error loading encryption configuration: {str(e)}")
@@ -294,12 +349,7 @@ class DataEncryptionService:
             start_time = datetime.utcnow()
             
             # Convert data to bytes if needed
-            if isinstance(data, dict):
-                data_bytes = json.dumps(data).encode('utf-8')
-            elif isinstance(data, str):
-                data_bytes = data.encode('utf-8')
-            else:
-                data_bytes = data
+            data_bytes = self._to_bytes(data)
             
             # Get encryption policy
             policy = await self._get_encryption_policy(data_type)
@@ -309,16 +359,19 @@ class DataEncryptionService:
             # Use specified encryption type or policy default
             enc_type = encryption_type or policy.encryption_type
             
-            # Get or create encryption key
+            # Use the given key or the active data key of this data type's window
             if key_id:
                 encryption_key = self.encryption_keys.get(key_id)
                 if not encryption_key:
                     return {"success": False, "error": f"Encryption key not found: {key_id}"}
             else:
-                encryption_key = await self._create_encryption_key(enc_type, KeyType.DATA)
+                encryption_key = await self._get_active_data_key(data_type, enc_type)
             
             # Perform encryption based on type
-            if enc_type == EncryptionType.AES_256_GCM:
+            if encryption_key.metadata.get("wrapped"):
+                sealed = self._seal_envelope(data_bytes, encryption_key)
+                result = {"success": True, "encrypted_data": base64.b64encode(sealed).decode()}
+            elif enc_type == EncryptionType.AES_256_GCM:
                 result = await self._encrypt_aes_gcm(data_bytes, encryption_key)
             elif enc_type == EncryptionType.AES_256_CBC:
                 result = await self._encrypt_aes_cbc(data_bytes, encryption_key)
@@ -355,13 +408,14 @@ class DataEncryptionService:
                 "success": True,
                 "encrypted_data": result["encrypted_data"],
                 "key_id": encryption_key.key_id,
-                "encryption_type": enc_type.value,
+                "encryption_type": encryption_key.algorithm.value,
                 "iv": result.get("iv"),
                 "tag": result.get("tag"),
                 "metadata": {
                     "data_type": data_type,
                     "encrypted_at": datetime.utcnow().isoformat(),
-                    "policy_id": policy.policy_id
+                    "policy_id": policy.policy_id,
+                    "envelope": bool(encryption_key.metadata.get("wrapped"))
                 }
             }
             
@@ -383,30 +437,38 @@ class DataEncryptionService:
     async def decrypt_data(
         self,
         encrypted_data: Union[str, bytes],
-        key_id: str,
-        encryption_type: EncryptionType,
+        key_id: Optional[str] = None,
+        encryption_type: Optional[EncryptionType] = None,
         iv: Optional[Union[str, bytes]] = None,
         tag: Optional[Union[str, bytes]] = None,
         user_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Decrypt data using specified key."""
+        """Decrypt data; envelope ciphertexts need no key id or encryption type."""
         try:
             if not self.encryption_enabled:
                 return {"success": False, "error": "Encryption is disabled"}
             
             start_time = datetime.utcnow()
             
-            # Get encryption key
-            encryption_key = self.encryption_keys.get(key_id)
-            if not encryption_key:
-                return {"success": False, "error": f"Encryption key not found: {key_id}"}
-            
             # Convert encrypted data to bytes if needed
             if isinstance(encrypted_data, str):
                 encrypted_bytes = base64.b64decode(encrypted_data.encode())
             else:
                 encrypted_bytes = encrypted_data
             
+            # Envelope ciphertexts name their data key in the header
+            if iv is None and tag is None and self._is_envelope(encrypted_bytes):
+                key_id = self._envelope_key_id(encrypted_bytes)
+                encryption_key = await self._get_data_key(key_id)
+                if not encryption_key:
+                    return {"success": False, "error": f"Encryption key not found: {key_id}"}
+                encryption_type = encryption_key.algorithm
+            else:
+                # Get encryption key
+                encryption_key = self.encryption_keys.get(key_id) if key_id else None
+                if not encryption_key:
+                    return {"success": False, "error": f"Encryption key not found: {key_id}"}
+            
             # Convert IV and tag to bytes if provided
             if isinstance(iv, str):
                 iv_bytes = base64.b64decode(iv.encode())
@@ -419,7 +481,9 @@ class DataEncryptionService:
                 tag_bytes = tag
             
             # Perform decryption based on type
-            if encryption_type == EncryptionType.AES_256_GCM:
+            if encryption_key.metadata.get("wrapped"):
+                result = {"success": True, "decrypted_data": self._open_envelope(encrypted_bytes, encryption_key)}
+            elif encryption_type == EncryptionType.AES_256_GCM:
                 result = await self._decrypt_aes_gcm(encrypted_bytes, encryption_key, iv_bytes, tag_bytes)
             elif encryption_type == EncryptionType.AES_256_CBC:
                 result = await self._decrypt_aes_cbc(encrypted_bytes, encryption_key, iv_bytes)
@@ -476,6 +540,336 @@ class DataEncryptionService:
                 )
             return {"success": False, "error": str(e)}
     
+    async def encrypt_many(
+        self,
+        items: List[Union[str, bytes, Dict[str, Any]]],
+        data_type: str,
+        encryption_type: Optional[EncryptionType] = None,
+        user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Envelope-encrypt many values of one data type with a single audit record."""
+        try:
+            if not self.encryption_enabled:
+                return {"success": False, "error": "Encryption is disabled"}
+            
+            start_time = time.perf_counter()
+            
+            policy = await self._get_encryption_policy(data_type)
+            if not policy:
+                return {"success": False, "error": f"No encryption policy found for data type: {data_type}"}
+            
+            enc_type = encryption_type or policy.encryption_type
+            if enc_type not in ENVELOPE_ALGORITHMS:
+                return {"success": False, "error": f"Batch encryption requires an AEAD encryption type: {enc_type.value}"}
+            
+            encrypted_items = []
+            key_ids = []
+            total_size = 0
+            encryption_key = None
+            for item in items:
+                # Switch data keys when the current one reaches its use limit
+                if encryption_key is None or encryption_key.usage_count >= self.dek_max_uses:
+                    encryption_key = await self._get_active_data_key(data_type, enc_type)
+                    cipher, header = self._get_envelope_cipher(encryption_key)
+                    key_ids.append(encryption_key.key_id)
+                
+                data_bytes = self._to_bytes(item)
+                nonce = os.urandom(12)
+                encrypted_items.append(base64.b64encode(header + nonce + cipher.encrypt(nonce, data_bytes, header)).decode())
+                encryption_key.usage_count += 1
+                total_size += len(data_bytes)
+            
+            if encryption_key is not None:
+                encryption_key.last_used = datetime.utcnow()
+            
+            processing_time = (time.perf_counter() - start_time) * 1000
+            
+            if self.audit_logging_enabled:
+                await self._log_encryption_operation(
+                    operation_type="encrypt_batch",
+                    key_id=key_ids[0] if key_ids else "none",
+                    data_type=data_type,
+                    data_size=total_size,
+                    processing_time_ms=int(processing_time),
+                    success=True,
+                    user_id=user_id,
+                    metadata={"count": len(encrypted_items), "key_ids": key_ids}
+                )
+            
+            return {
+                "success": True,
+                "encrypted_data": encrypted_items,
+                "key_ids": key_ids,
+                "encryption_type": enc_type.value,
+                "count": len(encrypted_items),
+                "processing_time_ms": round(processing_time, 2)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error encrypting data batch: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def decrypt_many(
+        self,
+        encrypted_items: List[Union[str, bytes]],
+        user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Decrypt many envelope ciphertexts; failed items are None with an error by index."""
+        try:
+            if not self.encryption_enabled:
+                return {"success": False, "error": "Encryption is disabled"}
+            
+            start_time = time.perf_counter()
+            
+            decrypted_items: List[Optional[bytes]] = []
+            errors: Dict[int, str] = {}
+            # Ciphers resolved once per envelope header (key id + algorithm) in this batch
+            ciphers: Dict[bytes, Optional[Any]] = {}
+            key_ids: List[str] = []
+            total_size = 0
+            for index, item in enumerate(encrypted_items):
+                try:
+                    encrypted_bytes = base64.b64decode(item) if isinstance(item, str) else item
+                    if not self._is_envelope(encrypted_bytes):
+                        raise ValueError("Not an envelope ciphertext")
+                    
+                    header = encrypted_bytes[:ENVELOPE_AAD_SIZE]
+                    if header not in ciphers:
+                        key_id = self._envelope_key_id(encrypted_bytes)
+                        encryption_key = await self._get_data_key(key_id)
+                        cipher = None
+                        if encryption_key is not None:
+                            cipher, key_header = self._get_envelope_cipher(encryption_key)
+                            cipher = cipher if key_header == header else None
+                            key_ids.append(key_id)
+                        ciphers[header] = cipher
+                    cipher = ciphers[header]
+                    if cipher is None:
+                        raise ValueError(f"Encryption key not found: {self._envelope_key_id(encrypted_bytes)}")
+                    
+                    decrypted_items.append(cipher.decrypt(
+                        encrypted_bytes[ENVELOPE_AAD_SIZE:ENVELOPE_HEADER_SIZE],
+                        encrypted_bytes[ENVELOPE_HEADER_SIZE:],
+                        header
+                    ))
+                    total_size += len(encrypted_bytes)
+                except InvalidTag:
+                    decrypted_items.append(None)
+                    errors[index] = "Ciphertext authentication failed"
+                except Exception as e:
+                    decrypted_items.append(None)
+                    errors[index] = str(e)
+            
+            processing_time = (time.perf_counter() - start_time) * 1000
+            
+            if self.audit_logging_enabled:
+                await self._log_encryption_operation(
+                    operation_type="decrypt_batch",
+                    key_id=key_ids[0] if key_ids else "none",
+                    data_type="unknown",
+                    data_size=total_size,
+                    processing_time_ms=int(processing_time),
+                    success=not errors,
+                    error_message=f"{len(errors)} items failed" if errors else None,
+                    user_id=user_id,
+                    metadata={"count": len(decrypted_items), "key_ids": key_ids}
+                )
+            
+            return {
+                "success": True,
+                "decrypted_data": decrypted_items,
+                "errors": errors,
+                "count": len(decrypted_items),
+                "processing_time_ms": round(processing_time, 2)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error decrypting data batch: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    @staticmethod
+    def _to_bytes(data: Union[str, bytes, Dict[str, Any]]) -> bytes:
+        """Convert payload data to bytes."""
+        if isinstance(data, dict):
+            return json.dumps(data).encode('utf-8')
+        if isinstance(data, str):
+            return data.encode('utf-8')
+        return data
+    
+    async def _get_active_data_key(self, data_type: str, encryption_type: EncryptionType) -> EncryptionKey:
+        """Get the data key for data_type in the current window, creating it on first use."""
+        window = int(time.time() // self.dek_window_seconds)
+        slot = (data_type, encryption_type, window)
+        encryption_key = self._usable_data_key(slot)
+        if encryption_key:
+            return encryption_key
+        
+        async with self._data_key_lock:
+            encryption_key = self._usable_data_key(slot)
+            if encryption_key:
+                return encryption_key
+            
+            if encryption_type in ENVELOPE_ALGORITHMS:
+                encryption_key = await self._create_data_key(encryption_type, data_type, window)
+            else:
+                # Non-AEAD algorithms keep raw keys, still shared for the window
+                encryption_key = await self._create_encryption_key(encryption_type, KeyType.DATA)
+            
+            # Retire the previous key of this data type (earlier window or use limit reached)
+            for old_slot in [s for s in self._active_data_keys if s[:2] == slot[:2]]:
+                old_key = self.encryption_keys.get(self._active_data_keys.pop(old_slot))
+                if old_key and old_key.status == KeyStatus.ACTIVE:
+                    old_key.status = KeyStatus.ROTATED
+            
+            self._active_data_keys[slot] = encryption_key.key_id
+            return encryption_key
+    
+    def _usable_data_key(self, slot: Tuple[str, EncryptionType, int]) -> Optional[EncryptionKey]:
+        """Active key of a slot if it is still within its use limit."""
+        encryption_key = self.encryption_keys.get(self._active_data_keys.get(slot, ""))
+        if (encryption_key and encryption_key.status == KeyStatus.ACTIVE and
+                encryption_key.usage_count < self.dek_max_uses):
+            return encryption_key
+        return None
+    
+    async def _create_data_key(
+        self,
+        encryption_type: EncryptionType,
+        data_type: str,
+        window: int
+    ) -> EncryptionKey:
+        """Create a data key and store it wrapped by the master key."""
+        try:
+            cipher_class = ENVELOPE_ALGORITHMS[encryption_type][1]
+            data_key = cipher_class.generate_key(bit_length=256) if cipher_class is AESGCM else cipher_class.generate_key()
+            key_id = str(uuid.uuid4())
+            current_time = datetime.utcnow()
+            
+            encryption_key = EncryptionKey(
+                key_id=key_id,
+                key_type=KeyType.DATA,
+                algorithm=encryption_type,
+                key_data=self.master_cipher.encrypt(data_key),
+                salt=None,
+                iv=None,
+                created_at=current_time,
+                expires_at=datetime.utcfromtimestamp((window + 1) * self.dek_window_seconds),
+                status=KeyStatus.ACTIVE,
+                metadata={"wrapped": True, "data_type": data_type, "window": window}
+            )
+            
+            self.encryption_keys[key_id] = encryption_key
+            self._cache_data_key_cipher(encryption_key, cipher_class(data_key))
+            
+            # Wrapped keys are kept as long as data encrypted with them may be read
+            await self.cache_manager.set(
+                f"encryption_key_{key_id}",
+                self._serialize_data_key(encryption_key),
+                ttl=self.config.get("max_key_age_days", 365) * 86400
+            )
+            
+            self.envelope_stats["data_keys_created"] += 1
+            self.logger.info(f"Created data key: {key_id} for {data_type} ({encryption_type.value})")
+            
+            return encryption_key
+            
+        except Exception as e:
+            self.logger.error(f"Error creating data key: {str(e)}")
+            raise
+    
+    async def _get_data_key(self, key_id: str) -> Optional[EncryptionKey]:
+        """Get a data key from memory or, when another worker created it, from the cache."""
+        encryption_key = self.encryption_keys.get(key_id)
+        if encryption_key:
+            return encryption_key
+        
+        try:
+            record = await self.cache_manager.get(f"encryption_key_{key_id}")
+            if not isinstance(record, dict) or not record.get("metadata", {}).get("wrapped"):
+                return None
+            
+            encryption_key = EncryptionKey(
+                key_id=record["key_id"],
+                key_type=KeyType(record["key_type"]),
+                algorithm=EncryptionType(record["algorithm"]),
+                key_data=base64.b64decode(record["key_data"]),
+                salt=None,
+                iv=None,
+                created_at=datetime.fromisoformat(record["created_at"]),
+                expires_at=datetime.fromisoformat(record["expires_at"]) if record.get("expires_at") else None,
+                status=KeyStatus(record["status"]),
+                metadata=record["metadata"]
+            )
+            self.encryption_keys[key_id] = encryption_key
+            return encryption_key
+            
+        except Exception as e:
+            self.logger.error(f"Error loading data key {key_id}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _serialize_data_key(key: EncryptionKey) -> Dict[str, Any]:
+        """Serializable record of a wrapped data key."""
+        return {
+            "key_id": key.key_id,
+            "key_type": key.key_type.value,
+            "algorithm": key.algorithm.value,
+            "key_data": base64.b64encode(key.key_data).decode(),
+            "created_at": key.created_at.isoformat(),
+            "expires_at": key.expires_at.isoformat() if key.expires_at else None,
+            "status": key.status.value,
+            "metadata": key.metadata
+        }
+    
+    def _get_envelope_cipher(self, key: EncryptionKey) -> Tuple[Any, bytes]:
+        """AEAD cipher and envelope header of a data key, unwrapping it on an LRU miss."""
+        entry = self._dek_cache.get(key.key_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self._dek_cache.move_to_end(key.key_id)
+            self.envelope_stats["dek_cache_hits"] += 1
+            return entry[1], entry[2]
+        
+        self.envelope_stats["dek_cache_misses"] += 1
+        data_key = self.master_cipher.decrypt(key.key_data)
+        return self._cache_data_key_cipher(key, ENVELOPE_ALGORITHMS[key.algorithm][1](data_key))
+    
+    def _cache_data_key_cipher(self, key: EncryptionKey, cipher: Any) -> Tuple[Any, bytes]:
+        """Put an unwrapped data key cipher into the LRU."""
+        header = (ENVELOPE_MAGIC + bytes((ENVELOPE_VERSION, ENVELOPE_ALGORITHMS[key.algorithm][0])) +
+                  uuid.UUID(key.key_id).bytes)
+        self._dek_cache[key.key_id] = (time.monotonic() + self.dek_cache_ttl, cipher, header)
+        self._dek_cache.move_to_end(key.key_id)
+        while len(self._dek_cache) > self.dek_cache_size:
+            self._dek_cache.popitem(last=False)
+        return cipher, header
+    
+    def _seal_envelope(self, data: bytes, key: EncryptionKey) -> bytes:
+        """Encrypt data with a data key into an envelope ciphertext."""
+        cipher, header = self._get_envelope_cipher(key)
+        nonce = os.urandom(12)
+        return header + nonce + cipher.encrypt(nonce, data, header)
+    
+    def _open_envelope(self, data: bytes, key: EncryptionKey) -> bytes:
+        """Decrypt an envelope ciphertext with its data key."""
+        cipher, header = self._get_envelope_cipher(key)
+        if data[:ENVELOPE_AAD_SIZE] != header:
+            raise ValueError("Envelope header does not match the data key")
+        try:
+            return cipher.decrypt(data[ENVELOPE_AAD_SIZE:ENVELOPE_HEADER_SIZE], data[ENVELOPE_HEADER_SIZE:], header)
+        except InvalidTag:
+            raise ValueError("Ciphertext authentication failed")
+    
+    @staticmethod
+    def _is_envelope(data: bytes) -> bool:
+        """Whether data is an envelope ciphertext."""
+        return (len(data) > ENVELOPE_HEADER_SIZE and data[:2] == ENVELOPE_MAGIC and
+                data[2] == ENVELOPE_VERSION and data[3] in ENVELOPE_ALGORITHM_IDS)
+    
+    @staticmethod
+    def _envelope_key_id(data: bytes) -> str:
+        """Data key id from an envelope header."""
+        return str(uuid.UUID(bytes=data[4:ENVELOPE_AAD_SIZE]))
+    
     async def _encrypt_aes_gcm(self, data: bytes, key: EncryptionKey) -> Dict[str, Any]:
         """Encrypt data using AES-256-GCM."""
         try:
@@ -793,6 +1187,12 @@ class DataEncryptionService:
     async def _rotate_key(self, old_key: EncryptionKey):
         """Rotate an encryption key."""
         try:
+            # Data keys are replaced on the next encryption of their data type
+            if old_key.metadata.get("wrapped"):
+                old_key.status = KeyStatus.ROTATED
+                self.logger.info(f"Retired data key {old_key.key_id}")
+                return
+            
             # Create new key
             new_key = await self._create_encryption_key(old_key.algorithm, old_key.key_type)
             
@@ -845,7 +1245,8 @@ class DataEncryptionService:
         processing_time_ms: int,
         success: bool,
         error_message: Optional[str] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
     ):
         """Log encryption operation for audit trail."""
         try:
@@ -859,19 +1260,67 @@ class DataEncryptionService:
                 success=success,
                 error_message=error_message,
                 timestamp=datetime.utcnow(),
-                user_id=user_id
+                user_id=user_id,
+                metadata=metadata or {}
             )
             
             # Store operation
             self.encryption_operations.append(operation)
             
-            # Cache operation
-            cache_key = f"encryption_operation_{operation.operation_id}"
-            await self.cache_manager.set(cache_key, operation.__dict__, ttl=self.operation_cache_ttl)
+            # Buffer for the cache; written in batches
+            self._audit_buffer.append(operation)
+            if len(self._audit_buffer) >= self.audit_batch_size:
+                await self.flush_audit_log()
             
         except Exception as e:
             self.logger.error(f"Error logging encryption operation: {str(e)}")
     
+    async def flush_audit_log(self) -> int:
+        """Write buffered audit records to the cache as one batch entry."""
+        if not self._audit_buffer:
+            return 0
+        
+        batch, self._audit_buffer = self._audit_buffer, []
+        try:
+            records = [dict(o.__dict__, timestamp=o.timestamp.isoformat()) for o in batch]
+            cache_key = f"encryption_operations_{batch[0].operation_id}"
+            await self.cache_manager.set(cache_key, records, ttl=self.operation_cache_ttl)
+            
+            self.envelope_stats["audit_flushes"] += 1
+            self.envelope_stats["audit_records_flushed"] += len(batch)
+            return len(batch)
+            
+        except Exception as e:
+            # Keep the records for the next flush, up to the buffer cap
+            self._audit_buffer[:0] = batch
+            overflow = len(self._audit_buffer) - self.max_audit_buffer
+            if overflow > 0:
+                del self._audit_buffer[:overflow]
+                self.envelope_stats["audit_records_dropped"] += overflow
+            self.logger.error(f"Error flushing encryption audit log: {str(e)}")
+            return 0
+    
+    async def _audit_flush_loop(self):
+        """Periodically flush buffered audit records."""
+        while True:
+            try:
+                await asyncio.sleep(self.audit_flush_interval)
+                await self.flush_audit_log()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error in audit flush loop: {str(e)}")
+    
+    async def close(self):
+        """Stop the audit flusher and write out pending audit records."""
+        if self._audit_flush_task and not self._audit_flush_task.done():
+            self._audit_flush_task.cancel()
+            try:
+                await self._audit_flush_task
+            except asyncio.CancelledError:
+                pass
+        await self.flush_audit_log()
+    
     async def get_encryption_keys(
         self,
         key_type: Optional[KeyType] = None,
@@ -1044,6 +1493,12 @@ class DataEncryptionService:
                     "success_rate": round(success_rate, 2),
                     "avg_processing_time_ms": round(avg_processing_time, 2)
                 },
+                "envelope": {
+                    **self.envelope_stats,
+                    "active_data_keys": len(self._active_data_keys),
+                    "cached_data_keys": len(self._dek_cache),
+                    "pending_audit_records": len(self._audit_buffer)
+                },
                 "configuration": {
                     "encryption_enabled": self.encryption_enabled,
                     "key_rotation_enabled": self.key_rotation_enabled,
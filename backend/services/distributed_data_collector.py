@@ -16,13 +16,43 @@ from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 import aiohttp
-import aioredis
 from asyncio import Queue
 import hashlib
 
+# Try to import aioredis (legacy message queue client)
+try:
+    import aioredis
+    AIOREDIS_AVAILABLE = True
+except ImportError:
+    AIOREDIS_AVAILABLE = False
+    logging.warning("aioredis not available. Distributed task message queue disabled.")
+
 from ..cache.unified_cache import UnifiedCacheManager
+from .content_deduplicator import ContentDeduplicator, Fingerprint
+
+
+class DataSourceType(str, Enum):
+    """Data source types."""
+    YAHOO_FINANCE = "yahoo_finance"
+    SOCIAL_MEDIA = "social_media"
+    NEWS_FEEDS = "news_feeds"
+
+
+class DataPriority(str, Enum):
+    """Data collection task priorities."""
+    CRITICAL = "critical"
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
 
 
+class DataStatus(str, Enum):
+    """Data collection task status."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    RETRYING = "retrying"
 
 
 @dataclass
@@ -106,7 +136,23 @@ class DistributedDataCollector:
             "tasks_failed": 0,
             "avg_processing_time_ms": 0,
             "queue_sizes": {},
-            "worker_utilization": {}
+            "worker_utilization": {},
+            "deduplication": {
+                "items_checked": 0,
+                "exact_duplicates": 0,
+                "near_duplicates": 0,
+                "downstream_items_skipped": 0,
+                "downstream_stage_runs_saved": 0
+            }
+        }
+        
+        # Cross-batch dedup index per text source (reposts/cross-posts)
+        self.deduplicators = {
+            source_type: ContentDeduplicator(
+                namespace=source_type.value,
+                window_seconds=self.config.get("deduplication_window_seconds", 86400)
+            )
+            for source_type in (DataSourceType.SOCIAL_MEDIA, DataSourceType.NEWS_FEEDS)
         }
         
         # Cache TTL settings
@@ -120,6 +166,9 @@ class DistributedDataCollector:
         # Initialize data pipelines
         self._initialize_data_pipelines()
         
+        # Load persisted dedup index
+        asyncio.create_task(self.initialize_deduplicators())
+        
         # Start message queue listener
         asyncio.create_task(self._start_message_queue_listener())
         
@@ -141,6 +190,7 @@ class DistributedDataCollector:
                 "batch_size": int(os.getenv('DATA_COLLECTION_BATCH_SIZE', '100')),
                 "quality_check_enabled": os.getenv('DATA_QUALITY_CHECK_ENABLED', 'true').lower() == 'true',
                 "deduplication_enabled": os.getenv('DATA_DEDUPLICATION_ENABLED', 'true').lower() == 'true',
+                "deduplication_window_seconds": int(os.getenv('DATA_DEDUPLICATION_WINDOW', '86400')),  # 24 hours
                 "metrics_collection_interval": int(os.getenv('METRICS_COLLECTION_INTERVAL', '60'))  # 1 minute
             }
         except Exception as e:
@@ -207,7 +257,7 @@ class DistributedDataCollector:
                     name="Social Media Data Pipeline",
                     description="Processes social media sentiment data",
                     source_type=DataSourceType.SOCIAL_MEDIA,
-                    processors=["fetch_data", "validate_data", "analyze_sentiment", "store_data"],
+                    processors=["fetch_data", "validate_data", "deduplicate", "analyze_sentiment", "store_data"],
                     enabled=True,
                     created_at=datetime.utcnow(),
                     updated_at=datetime.utcnow()
@@ -217,7 +267,7 @@ class DistributedDataCollector:
                     name="News Feed Data Pipeline",
                     description="Processes news feed data",
                     source_type=DataSourceType.NEWS_FEEDS,
-                    processors=["fetch_data", "validate_data", "extract_entities", "store_data"],
+                    processors=["fetch_data", "validate_data", "deduplicate", "extract_entities", "store_data"],
                     enabled=True,
                     created_at=datetime.utcnow(),
                     updated_at=datetime.utcnow()
@@ -232,9 +282,18 @@ class DistributedDataCollector:
         except Exception as e:
             self.logger.error(f"Error initializing data pipelines: {str(e)}")
     
+    async def initialize_deduplicators(self, redis_client=None):
+        """Attach Redis persistence to the dedup indexes."""
+        for deduplicator in self.deduplicators.values():
+            await deduplicator.initialize(redis_client)
+    
     async def _start_message_queue_listener(self):
         """Start listening to message queue for tasks."""
         try:
+            if not AIOREDIS_AVAILABLE:
+                self.logger.warning("Message queue listener not started: aioredis not installed")
+                return
+            
             # Connect to Redis
             self.redis_client = await aioredis.create_redis_pool(
                 f"redis://{self.config.get('redis_host')}:{self.config.get('redis_port')}/{self.config.get('redis_db')}"
@@ -386,20 +445,30 @@ class DistributedDataCollector:
         """Execute data processing pipeline."""
         try:
             result = {"source_config": task.source_config}
+            # Dedup fingerprints are recorded only after the batch is stored,
+            # so a failed attempt does not make its own retry look like a duplicate
+            dedup_fingerprints = []
             
-            for processor in pipeline.processors:
+            for index, processor in enumerate(pipeline.processors):
                 if processor == "fetch_data":
                     result = await self._fetch_data(task.source_type, task.source_config)
                 elif processor == "validate_data":
                     result = await self._validate_source_data(task.source_type, result)
                 elif processor == "transform_data":
                     result = await self._transform_data(task.source_type, result)
+                elif processor == "deduplicate":
+                    result, dedup_fingerprints = await self._deduplicate(
+                        task.source_type, result, pipeline.processors[index + 1:]
+                    )
                 elif processor == "analyze_sentiment":
                     result = await self._analyze_sentiment(result)
                 elif processor == "extract_entities":
                     result = await self._extract_entities(result)
                 elif processor == "store_data":
                     result = await self._store_data(task.source_type, result)
+                    if result and dedup_fingerprints:
+                        await self._commit_deduplication(task.source_type, dedup_fingerprints)
+                        dedup_fingerprints = []
                 else:
                     self.logger.warning(f"Unknown processor: {processor}")
                 
@@ -595,6 +664,58 @@ class DistributedDataCollector:
             self.logger.error(f"Error transforming {source_type} data: {str(e)}")
             raise
     
+    async def _deduplicate(
+        self,
+        source_type: DataSourceType,
+        data: Dict[str, Any],
+        downstream_processors: List[str]
+    ) -> Tuple[Dict[str, Any], List[Fingerprint]]:
+        """Drop items already collected in this or earlier batches.
+
+        Returns:
+            Tuple of (data with unique items, fingerprints to commit once stored)
+        """
+        try:
+            deduplicator = self.deduplicators.get(source_type)
+            if not deduplicator or not self.config.get("deduplication_enabled", True):
+                return data, []
+            
+            if source_type == DataSourceType.SOCIAL_MEDIA:
+                items_key = "posts"
+                text_getter = lambda post: post.get("content", "")
+            else:
+                items_key = "articles"
+                text_getter = lambda article: f"{article.get('title', '')}\n{article.get('content', '')}"
+            
+            items = data.get(items_key, [])
+            unique_items, dropped, fingerprints = deduplicator.stage_batch(items, text_getter)
+            skipped = len(items) - len(unique_items)
+            
+            # Update metrics
+            dedup_metrics = self.metrics["deduplication"]
+            dedup_metrics["items_checked"] += len(items)
+            dedup_metrics["exact_duplicates"] += dropped["exact"]
+            dedup_metrics["near_duplicates"] += dropped["near"]
+            dedup_metrics["downstream_items_skipped"] += skipped
+            dedup_metrics["downstream_stage_runs_saved"] += skipped * len(downstream_processors)
+            
+            return {
+                **data,
+                items_key: unique_items,
+                "cross_batch_duplicates_removed": skipped
+            }, fingerprints
+            
+        except Exception as e:
+            self.logger.error(f"Error deduplicating {source_type} data: {str(e)}")
+            return data, []
+    
+    async def _commit_deduplication(self, source_type: DataSourceType, fingerprints: List[Fingerprint]):
+        """Record stored items in the dedup index."""
+        try:
+            await self.deduplicators[source_type].commit(fingerprints)
+        except Exception as e:
+            self.logger.error(f"Error recording {source_type} dedup fingerprints: {str(e)}")
+    
     async def _analyze_sentiment(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze sentiment in data."""
         try:
@@ -720,21 +841,21 @@ class DistributedDataCollector:
                         seen_hashes.add(content_hash)
                         unique_posts.append(post)
                 
+                data["duplicates_removed"] = len(data["posts"]) - len(unique_posts)
                 data["posts"] = unique_posts
-                data["duplicates_removed"] = len(data.get("posts", [])) - len(unique_posts)
             
             elif source_type == DataSourceType.NEWS_FEEDS and "articles" in data:
                 seen_hashes = set()
                 unique_articles = []
                 
                 for article in data["articles"]:
-                    content_hash = hashlib.md5(article["title"] + article["content"]).encode().hexdigest()
+                    content_hash = hashlib.md5((article["title"] + article["content"]).encode()).hexdigest()
                     if content_hash not in seen_hashes:
                         seen_hashes.add(content_hash)
                         unique_articles.append(article)
                 
+                data["duplicates_removed"] = len(data["articles"]) - len(unique_articles)
                 data["articles"] = unique_articles
-                data["duplicates_removed"] = len(data.get("articles", [])) - len(unique_articles)
             
             return data
             
@@ -1037,6 +1158,13 @@ class DistributedDataCollector:
                 "avg_processing_time_ms": self.metrics["avg_processing_time_ms"],
                 "queue_sizes": self.metrics["queue_sizes"],
                 "worker_utilization": self.metrics["worker_utilization"],
+                "deduplication": {
+                    **self.metrics["deduplication"],
+                    "indexes": {
+                        source_type.value: deduplicator.get_stats()
+                        for source_type, deduplicator in self.deduplicators.items()
+                    }
+                },
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -0,0 +1,154 @@
+"""
+Server-side downsampling for chart series.
+
+- Line series use MinMaxLTTB: the series is first reduced to the min and max
+  point of ``minmax_ratio * max_points`` equal-size buckets (vectorized), and
+  Largest-Triangle-Three-Buckets then picks ``max_points`` points from those.
+  The global minimum and maximum are always kept.
+- Candles are re-bucketed into at most ``max_points`` bars of consecutive
+  rows: first open, max high, min low, last close, summed volume, so every
+  bucket keeps its extrema.
+"""
+
+import logging
+import math
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_AGGREGATIONS = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "adj close": "last",
+    "volume": "sum",
+    "dividends": "sum"
+}
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Sorted indices of the min and max of each of n_buckets equal-size buckets."""
+    n = len(y)
+    size = math.ceil(n / n_buckets)
+    padded = np.empty(size * math.ceil(n / size))
+    padded[:n] = y
+    # Padding repeats the last value so it never wins over real points of the last bucket
+    padded[n:] = y[-1]
+    buckets = padded.reshape(-1, size)
+    offsets = np.arange(buckets.shape[0]) * size
+    indices = np.concatenate([offsets + buckets.argmin(axis=1), offsets + buckets.argmax(axis=1)])
+    return np.unique(np.minimum(indices, n - 1))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Indices selected by Largest-Triangle-Three-Buckets (first and last point always kept)."""
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Bucket boundaries over the points between the first and the last
+    edges = (np.arange(max_points - 1) * ((n - 2) / (max_points - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    starts, ends = edges[:-1], edges[1:]
+
+    # Average point of each bucket; the last bucket's "next" is the final point
+    counts = ends - starts
+    avg_x = np.append(np.add.reduceat(x[:n - 1], starts) / counts, x[-1])
+    avg_y = np.append(np.add.reduceat(y[:n - 1], starts) / counts, y[-1])
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    for bucket, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        ax, ay = x[anchor], y[anchor]
+        next_x, next_y = avg_x[bucket + 1], avg_y[bucket + 1]
+        # Twice the triangle area; the constant factor does not change the argmax
+        areas = np.abs((ax - next_x) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y - ay))
+        anchor = start + int(areas.argmax())
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def downsample_line(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int,
+    minmax_ratio: int = 4
+) -> np.ndarray:
+    """Indices of at most max_points points for a line chart (MinMaxLTTB, extrema kept)."""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    candidates = np.arange(n)
+    if n > max_points * minmax_ratio:
+        candidates = minmax_indices(y, max_points * minmax_ratio // 2)
+        candidates = np.unique(np.concatenate(([0, n - 1], candidates)))
+    selected = candidates[lttb_indices(np.asarray(x)[candidates], y[candidates], max_points)]
+
+    # Pin the global extrema in place of the nearest selected interior point
+    pinned = {0, n - 1}
+    for extreme in (int(np.nanargmin(y)), int(np.nanargmax(y))):
+        position = int(np.searchsorted(selected, extreme))
+        if selected[position] == extreme:
+            pinned.add(extreme)
+            continue
+        # selected[position - 1] < extreme < selected[position]; replacing either keeps the order
+        neighbours = [p for p in (position - 1, position) if int(selected[p]) not in pinned]
+        if neighbours:
+            replaced = min(neighbours, key=lambda p: abs(int(selected[p]) - extreme))
+            selected[replaced] = extreme
+            pinned.add(extreme)
+    return selected
+
+
+def _time_axis(index: pd.Index) -> np.ndarray:
+    if isinstance(index, pd.DatetimeIndex):
+        return index.as_unit("ns").asi8.astype(np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+def downsample_frame(frame: pd.DataFrame, max_points: Optional[int], value_column: str = "Close") -> pd.DataFrame:
+    """Keep the rows LTTB selects on value_column (all columns of those rows are kept)."""
+    if frame is None or not max_points or len(frame) <= max_points or value_column not in frame.columns:
+        return frame
+    indices = downsample_line(_time_axis(frame.index), frame[value_column].to_numpy(), max_points)
+    return frame.iloc[indices]
+
+
+def resample_ohlcv(frame: pd.DataFrame, max_points: Optional[int]) -> pd.DataFrame:
+    """Merge consecutive bars into at most max_points OHLCV bars.
+
+    Each output bar is labelled with its first bar's index. Columns without a
+    known aggregation take their last value.
+    """
+    if frame is None or not max_points or len(frame) <= max_points:
+        return frame
+
+    n = len(frame)
+    size = math.ceil(n / max_points)
+    starts = np.arange(0, n, size)
+    lasts = np.append(starts[1:], n) - 1
+
+    columns = {}
+    for column in frame.columns:
+        values = frame[column].to_numpy()
+        how = OHLCV_AGGREGATIONS.get(str(column).lower(), "last")
+        if how == "first":
+            columns[column] = values[starts]
+        elif how == "last":
+            columns[column] = values[lasts]
+        elif how == "max":
+            columns[column] = np.maximum.reduceat(values, starts)
+        elif how == "min":
+            columns[column] = np.minimum.reduceat(values, starts)
+        else:
+            columns[column] = np.add.reduceat(values, starts)
+    return pd.DataFrame(columns, index=frame.index[starts])
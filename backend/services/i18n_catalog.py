@@ -0,0 +1,249 @@
+"""
+Compiled translation catalogs for the i18n service.
+
+Messages are parsed once into str.format templates. ``{name}`` placeholders
+become format fields, and ICU-style plurals such as
+``{count, plural, =0 {no alerts} one {# alert} other {# alerts}}`` become
+branch tables chosen by the locale's CLDR cardinal rule. A catalog holds one
+namespace -> key -> message dict per locale, with the fallback locale already
+merged in, so a lookup is two dict accesses.
+"""
+
+import logging
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_FIELD_RE = re.compile(r"\{\s*([A-Za-z_]\w*)\s*\}")
+_PLURAL_RE = re.compile(r"\{\s*([A-Za-z_]\w*)\s*,\s*plural\s*,")
+_SELECTOR_RE = re.compile(r"\s*(=\d+|[a-z]+)\s*\{")
+
+
+def _plural_one_other(n) -> str:
+    return "one" if n == 1 else "other"
+
+
+def _plural_zero_one_other(n) -> str:
+    # i = 0,1 is "one" (fr, pt, hi)
+    return "one" if 0 <= n < 2 else "other"
+
+
+def _plural_other(n) -> str:
+    return "other"
+
+
+def _plural_russian(n) -> str:
+    if n != int(n):
+        return "other"
+    n = abs(int(n))
+    if n % 10 == 1 and n % 100 != 11:
+        return "one"
+    if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14:
+        return "few"
+    return "many"
+
+
+def _plural_arabic(n) -> str:
+    if n != int(n):
+        return "other"
+    n = abs(int(n))
+    if n in (0, 1, 2):
+        return ("zero", "one", "two")[n]
+    if 3 <= n % 100 <= 10:
+        return "few"
+    if 11 <= n % 100 <= 99:
+        return "many"
+    return "other"
+
+
+# CLDR cardinal plural rules (integer operands) for the supported locales
+PLURAL_RULES: Dict[str, Callable[[Any], str]] = {
+    "en": _plural_one_other,
+    "de": _plural_one_other,
+    "es": _plural_one_other,
+    "it": _plural_one_other,
+    "fr": _plural_zero_one_other,
+    "pt": _plural_zero_one_other,
+    "hi": _plural_zero_one_other,
+    "ko": _plural_other,
+    "ja": _plural_other,
+    "zh-CN": _plural_other,
+    "zh-TW": _plural_other,
+    "ru": _plural_russian,
+    "ar": _plural_arabic
+}
+
+
+class _Placeholders(dict):
+    """Format values that leave unknown placeholders as written."""
+
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+class _Plural:
+    """A plural argument with its branches."""
+
+    __slots__ = ("name", "source", "branches")
+
+    def __init__(self, name: str, source: str, branches: Dict[str, List[Any]]):
+        self.name = name
+        self.source = source
+        self.branches = branches
+
+    def render(self, values: Dict[str, Any], rule: Callable[[Any], str]) -> str:
+        n = values.get(self.name)
+        if not isinstance(n, (int, float)) or isinstance(n, bool):
+            return self.source
+        branch = self.branches.get(f"={int(n)}") if n == int(n) else None
+        if branch is None:
+            branch = self.branches.get(rule(n), self.branches.get("other"))
+        return _render(branch, values, rule) if branch is not None else ""
+
+
+def _render(parts: List[Any], values: Dict[str, Any], rule: Callable[[Any], str]) -> str:
+    return "".join(
+        part.format_map(values) if part.__class__ is str else part.render(values, rule)
+        for part in parts
+    )
+
+
+def _parse(text: str, pos: int, plural_var: Optional[str], nested: bool, plurals: bool) -> Tuple[List[Any], int]:
+    """Parse text from pos into template/plural parts; stops at the closing brace when nested."""
+    parts: List[Any] = []
+    buffer: List[str] = []
+    n = len(text)
+    while pos < n:
+        ch = text[pos]
+        if ch == "{":
+            field = _FIELD_RE.match(text, pos)
+            if field:
+                buffer.append("{" + field.group(1) + "}")
+                pos = field.end()
+                continue
+            plural = _PLURAL_RE.match(text, pos) if plurals else None
+            if plural:
+                name = plural.group(1)
+                branches: Dict[str, List[Any]] = {}
+                pos = plural.end()
+                while True:
+                    selector = _SELECTOR_RE.match(text, pos)
+                    if not selector:
+                        break
+                    branches[selector.group(1)], pos = _parse(text, selector.end(), name, True, plurals)
+                while pos < n and text[pos].isspace():
+                    pos += 1
+                if pos >= n or text[pos] != "}" or not branches:
+                    raise ValueError(f"Malformed plural argument at {plural.start()}")
+                if buffer:
+                    parts.append("".join(buffer))
+                    buffer = []
+                parts.append(_Plural(name, text[plural.start():pos + 1], branches))
+                pos += 1
+                continue
+            buffer.append("{{")
+        elif ch == "}":
+            if nested:
+                if buffer:
+                    parts.append("".join(buffer))
+                return parts, pos + 1
+            buffer.append("}}")
+        elif ch == "#" and plural_var:
+            buffer.append("{" + plural_var + "}")
+        else:
+            buffer.append(ch)
+        pos += 1
+    if nested:
+        raise ValueError("Unterminated plural branch")
+    if buffer:
+        parts.append("".join(buffer))
+    return parts, pos
+
+
+class CompiledMessage:
+    """A translation message precompiled into a formatter."""
+
+    __slots__ = ("source", "_template", "_parts", "_rule")
+
+    def __init__(self, source: str, locale: str = "en"):
+        self.source = source
+        self._rule = PLURAL_RULES.get(locale, _plural_one_other)
+        try:
+            parts, _ = _parse(source, 0, None, False, True)
+        except ValueError as e:
+            logger.warning(f"Treating plural syntax as text in message {source!r}: {str(e)}")
+            parts, _ = _parse(source, 0, None, False, False)
+
+        # Plain messages format with a single str.format_map call
+        self._template: Optional[str] = None
+        self._parts: Optional[List[Any]] = None
+        if not parts:
+            self._template = ""
+        elif len(parts) == 1 and parts[0].__class__ is str:
+            self._template = parts[0]
+        else:
+            self._parts = parts
+
+    def format(self, values: Optional[Dict[str, Any]] = None) -> str:
+        """Render the message; unknown placeholders are left as written."""
+        if not values:
+            return self.source
+        if self._template is not None:
+            return self._template.format_map(_Placeholders(values))
+        return _render(self._parts, _Placeholders(values), self._rule)
+
+
+def compile_message(text: str, locale: str = "en") -> CompiledMessage:
+    """Compile a single message for the given locale."""
+    return CompiledMessage(text, locale)
+
+
+class CompiledCatalog:
+    """Immutable per-locale catalogs with the fallback chain pre-resolved."""
+
+    def __init__(
+        self,
+        translations: Dict[str, Dict[str, Dict[str, str]]],
+        fallback_locale: str,
+        version: Optional[str] = None
+    ):
+        start = time.perf_counter()
+        self.version = version or f"{time.time_ns():x}"
+        self.fallback_locale = fallback_locale
+        self.messages: Dict[str, Dict[str, Dict[str, CompiledMessage]]] = {}
+
+        fallback = translations.get(fallback_locale, {})
+        count = 0
+        for locale, namespaces in translations.items():
+            compiled: Dict[str, CompiledMessage] = {}
+            locale_messages: Dict[str, Dict[str, CompiledMessage]] = {}
+            for namespace in set(namespaces) | set(fallback):
+                merged = {**fallback.get(namespace, {}), **namespaces.get(namespace, {})}
+                table = {}
+                for key, text in merged.items():
+                    if not isinstance(text, str):
+                        continue
+                    # Fallback texts are shared, so compile each distinct text once per locale
+                    message = compiled.get(text)
+                    if message is None:
+                        message = compiled[text] = CompiledMessage(text, locale)
+                    table[key] = message
+                locale_messages[namespace] = table
+                count += len(table)
+            self.messages[locale] = locale_messages
+
+        self.message_count = count
+        self.compile_time_ms = (time.perf_counter() - start) * 1000
+
+    def lookup(self, locale: str, namespace: str, key: str) -> Optional[CompiledMessage]:
+        """Compiled message for key, or None if neither the locale nor the fallback has it."""
+        locale_messages = self.messages.get(locale) or self.messages.get(self.fallback_locale, {})
+        table = locale_messages.get(namespace)
+        return table.get(key) if table else None
+
+    def namespace(self, locale: str, namespace: str) -> Dict[str, CompiledMessage]:
+        """All compiled messages of a namespace for a locale."""
+        locale_messages = self.messages.get(locale) or self.messages.get(self.fallback_locale, {})
+        return locale_messages.get(namespace, {})
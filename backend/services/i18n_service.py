@@ -8,6 +8,7 @@ language-specific content delivery.
 
 import json
 import os
+import time
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -16,6 +17,7 @@ import asyncio
 from enum import Enum
 
 from ..cache.unified_cache import UnifiedCacheManager
+from .i18n_catalog import CompiledCatalog
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -72,9 +74,22 @@ class I18nService:
         self.cache_prefix = "i18n:"
         self.translations_cache_key = f"{self.cache_prefix}translations"
         self.locale_cache_key = f"{self.cache_prefix}locale"
+        self.catalog_version_cache_key = f"{self.cache_prefix}catalog_version"
+        
+        # Compiled catalogs are swapped as a whole; workers poll the shared
+        # version stamp at most once per interval to pick up other workers' edits
+        self.catalog: Optional[CompiledCatalog] = None
+        self.version_check_interval = float(os.getenv('I18N_VERSION_CHECK_INTERVAL', '5'))
+        self._last_version_check = 0.0
+        self.stats = {
+            "catalog_builds": 0,
+            "catalog_reloads": 0,
+            "last_compile_time_ms": 0.0
+        }
         
         # Initialize translations
         self._load_translations()
+        self._compile_catalog()
     
     async def initialize(self):
         """Initialize the i18n service."""
@@ -83,6 +98,7 @@ class I18nService:
             
             # Load translations from files
             await self._load_translation_files()
+            self._compile_catalog()
             
             # Cache translations
             await self._cache_translations()
@@ -361,27 +377,104 @@ class I18nService:
             target_locale = locale or self.default_locale
             target_namespace = namespace or TranslationNamespace.COMMON
             
-            # Try to get translation from cache first
-            cache_key = f"{self.cache_prefix}translation:{target_locale.value}:{target_namespace.value}:{key}"
-            cached_translation = await self.cache_manager.get(cache_key)
-            
-            if cached_translation:
-                return self._interpolate_variables(cached_translation, **kwargs)
+            await self._check_catalog_version()
             
-            # Get translation from memory
-            translation = self._get_translation_from_memory(key, target_locale, target_namespace)
+            # Look up the precompiled message (fallback chain already resolved)
+            message = self.catalog.lookup(target_locale.value, target_namespace.value, key)
+            if message is None:
+                return self._interpolate_variables(key, **kwargs)
             
-            # Cache the translation
-            if translation:
-                await self.cache_manager.set(cache_key, translation, ttl=1800)  # 30 minutes
-            
-            # Interpolate variables
-            return self._interpolate_variables(translation, **kwargs)
+            return message.format(kwargs)
             
         except Exception as e:
             logger.error(f"Failed to get translation for key '{key}': {str(e)}")
             return key  # Return key as fallback
     
+    async def translate_many(
+        self,
+        namespace: Optional[TranslationNamespace] = None,
+        locale: Optional[Locale] = None,
+        keys: Optional[List[str]] = None,
+        variables: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, str]:
+        """
+        Resolve many translations of a namespace in one call.
+        
+        Args:
+            namespace: Translation namespace (uses common if not provided)
+            locale: Target locale (uses default if not provided)
+            keys: Keys to resolve (resolves the whole namespace if not provided)
+            variables: Interpolation variables per key
+            
+        Returns:
+            Dictionary of key to translated string
+        """
+        try:
+            target_locale = locale or self.default_locale
+            target_namespace = namespace or TranslationNamespace.COMMON
+            variables = variables or {}
+            
+            await self._check_catalog_version()
+            
+            messages = self.catalog.namespace(target_locale.value, target_namespace.value)
+            if keys is None:
+                keys = list(messages)
+            
+            results = {}
+            for key in keys:
+                message = messages.get(key)
+                if message is None:
+                    results[key] = self._interpolate_variables(key, **variables.get(key, {}))
+                else:
+                    results[key] = message.format(variables.get(key))
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to translate namespace: {str(e)}")
+            return {key: key for key in keys or []}
+    
+    def _compile_catalog(self, version: Optional[str] = None):
+        """Compile the in-memory translations and swap in the new catalog."""
+        catalog = CompiledCatalog(self.translations, self.fallback_locale.value, version)
+        self.catalog = catalog
+        self.stats["catalog_builds"] += 1
+        self.stats["last_compile_time_ms"] = catalog.compile_time_ms
+        logger.debug(f"Compiled i18n catalog {catalog.version} ({catalog.message_count} messages "
+                     f"in {catalog.compile_time_ms:.1f}ms)")
+    
+    async def _publish_catalog(self):
+        """Recompile after a local change and announce the new version to other workers."""
+        self._compile_catalog()
+        await self._cache_translations()
+        try:
+            await self.cache_manager.set(self.catalog_version_cache_key, self.catalog.version, ttl=86400 * 30)
+        except Exception as e:
+            logger.error(f"Failed to publish catalog version: {str(e)}")
+    
+    async def _check_catalog_version(self, force: bool = False):
+        """Reload translations from the cache when another worker published a newer catalog."""
+        now = time.monotonic()
+        if not force and now - self._last_version_check < self.version_check_interval:
+            return
+        self._last_version_check = now
+        
+        try:
+            version = await self.cache_manager.get(self.catalog_version_cache_key)
+            if not isinstance(version, str) or version == self.catalog.version:
+                return
+            
+            translations = await self.cache_manager.get(self.translations_cache_key)
+            if not isinstance(translations, dict) or not translations:
+                return
+            
+            self.translations = translations
+            self._compile_catalog(version)
+            self.stats["catalog_reloads"] += 1
+            logger.info(f"Reloaded i18n catalog version {version}")
+            
+        except Exception as e:
+            logger.error(f"Failed to check catalog version: {str(e)}")
+    
     def _get_translation_from_memory(
         self,
         key: str,
@@ -632,12 +725,8 @@ class I18nService:
             
             self.translations[locale.value][namespace.value][key] = value
             
-            # Update cache
-            cache_key = f"{self.cache_prefix}translation:{locale.value}:{namespace.value}:{key}"
-            await self.cache_manager.set(cache_key, value, ttl=1800)
-            
-            # Update translations cache
-            await self._cache_translations()
+            # Recompile and publish the new catalog version
+            await self._publish_catalog()
             
             logger.info(f"Added translation: {locale.value}/{namespace.value}/{key}")
             return True
@@ -697,15 +786,14 @@ class I18nService:
                         logger.warning(f"Skipping invalid namespace: {namespace_code}")
                         continue
                     
-                    # Import translations
+                    # Import translations (a fallback-locale text does not count as existing)
+                    existing = self.translations.setdefault(locale.value, {}).setdefault(namespace.value, {})
                     for key, value in translation_dict.items():
-                        # Check if translation exists
-                        existing_translation = self._get_translation_from_memory(key, locale, namespace)
-                        if overwrite or existing_translation == key:
-                            await self.add_translation(key, value, locale, namespace)
+                        if overwrite or key not in existing:
+                            existing[key] = value
             
-            # Update cache
-            await self._cache_translations()
+            # Recompile once and publish the new catalog version
+            await self._publish_catalog()
             
             logger.info("Translations imported successfully")
             return True
@@ -0,0 +1,258 @@
+"""
+Dynamic batching inference worker for InsiteChart sentiment models.
+
+This module coalesces concurrent single-text sentiment requests into padded
+mini-batches and runs one forward pass per batch on a dedicated thread, so
+transformer inference never blocks the event loop.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+
+@dataclass
+class InferenceRequest:
+    """Single pending inference request."""
+    text: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class DynamicBatchInferenceWorker:
+    """Collect concurrent requests and run them as padded batches.
+
+    Requests are gathered for up to ``max_wait_ms`` milliseconds or until
+    ``max_batch_size`` items are queued, whichever comes first. The batch is
+    tokenized together with padding to the longest item and scored in a single
+    forward pass on a one-thread executor. Results use the same
+    ``[{"label": ..., "score": ...}, ...]`` format as a HuggingFace
+    ``pipeline(..., return_all_scores=True)`` call.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        tokenizer: Any,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+        max_length: int = 512,
+        name: str = "sentiment"
+    ):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.max_length = max_length
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+
+        # Single inference thread keeps torch intra-op threads uncontended
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"{name}-inference"
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._id2label = self._resolve_labels()
+
+        # Statistics
+        self.stats = {
+            "requests": 0,
+            "items_processed": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "max_batch_size_seen": 0,
+            "total_inference_time": 0.0,
+            "total_queue_wait_time": 0.0
+        }
+
+    def _resolve_labels(self) -> Dict[int, str]:
+        """Resolve class index to label mapping from the model config."""
+        config = getattr(self.model, "config", None)
+        id2label = getattr(config, "id2label", None) or {}
+        return {int(index): str(label) for index, label in id2label.items()}
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the batch collector is active."""
+        return self._collector_task is not None and not self._collector_task.done()
+
+    async def start(self):
+        """Start the batch collector on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self.is_running and self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._collector_task = asyncio.create_task(self._collect_loop())
+        self.logger.info(
+            f"Inference worker '{self.name}' started "
+            f"(max_batch_size={self.max_batch_size}, max_wait_ms={self.max_wait_ms})"
+        )
+
+    async def stop(self):
+        """Stop the collector and fail any requests still queued."""
+        if self._collector_task:
+            self._collector_task.cancel()
+            try:
+                await self._collector_task
+            except asyncio.CancelledError:
+                pass
+            self._collector_task = None
+
+        if self._queue:
+            while not self._queue.empty():
+                request = self._queue.get_nowait()
+                if not request.future.done():
+                    request.future.set_exception(
+                        RuntimeError(f"Inference worker '{self.name}' stopped")
+                    )
+
+        self.logger.info(f"Inference worker '{self.name}' stopped")
+
+    def shutdown(self):
+        """Release the inference thread."""
+        self._executor.shutdown(wait=False)
+
+    async def close(self):
+        """Stop the collector and release the inference thread."""
+        await self.stop()
+        self.shutdown()
+
+    async def submit(self, text: str) -> List[Dict[str, float]]:
+        """Queue a text for batched inference and wait for its scores."""
+        if not self.is_running or self._loop is not asyncio.get_running_loop():
+            await self.start()
+
+        future = self._loop.create_future()
+        self.stats["requests"] += 1
+        await self._queue.put(InferenceRequest(text=text, future=future))
+        return await future
+
+    async def submit_many(self, texts: List[str]) -> List[List[Dict[str, float]]]:
+        """Queue several texts at once; they are batched with other callers."""
+        return await asyncio.gather(*[self.submit(text) for text in texts])
+
+    async def _collect_loop(self):
+        """Gather requests into batches and dispatch them to the executor."""
+        while True:
+            first = await self._queue.get()
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[InferenceRequest]):
+        """Run one batch in the inference thread and resolve its futures."""
+        # Callers that gave up (e.g. cancelled by a timeout) are dropped
+        batch = [request for request in batch if not request.future.done()]
+        if not batch:
+            return
+
+        dispatched_at = time.perf_counter()
+        self.stats["total_queue_wait_time"] += sum(
+            dispatched_at - request.enqueued_at for request in batch
+        )
+
+        try:
+            results = await self._loop.run_in_executor(
+                self._executor,
+                self._run_batch,
+                [request.text for request in batch]
+            )
+        except Exception as e:
+            self.stats["failed_batches"] += 1
+            self.logger.error(f"Batch inference failed in '{self.name}': {str(e)}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        self.stats["batches"] += 1
+        self.stats["items_processed"] += len(batch)
+        self.stats["max_batch_size_seen"] = max(self.stats["max_batch_size_seen"], len(batch))
+        self.stats["total_inference_time"] += time.perf_counter() - dispatched_at
+
+        for request, result in zip(batch, results):
+            if not request.future.done():
+                request.future.set_result(result)
+
+    def _run_batch(self, texts: List[str]) -> List[List[Dict[str, float]]]:
+        """Tokenize texts with dynamic padding and score them in one pass."""
+        encoded = self.tokenizer(
+            texts,
+            padding="longest",
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="pt" if TORCH_AVAILABLE else "np"
+        )
+
+        if TORCH_AVAILABLE:
+            with torch.inference_mode():
+                logits = self.model(**encoded).logits
+        else:
+            logits = self.model(**encoded).logits
+
+        # PyTorch models return tensors, ONNX Runtime sessions return arrays
+        if hasattr(logits, "detach"):
+            logits = logits.float().cpu().numpy()
+
+        return self._logits_to_scores(np.asarray(logits, dtype=np.float32))
+
+    def _logits_to_scores(self, logits: np.ndarray) -> List[List[Dict[str, float]]]:
+        """Convert raw logits to per-label probability lists."""
+        shifted = logits - logits.max(axis=-1, keepdims=True)
+        probabilities = np.exp(shifted)
+        probabilities /= probabilities.sum(axis=-1, keepdims=True)
+
+        return [
+            [
+                {"label": self._id2label.get(index, f"LABEL_{index}"), "score": float(score)}
+                for index, score in enumerate(row)
+            ]
+            for row in probabilities
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics."""
+        batches = self.stats["batches"]
+        processed = self.stats["items_processed"]
+        return {
+            "name": self.name,
+            "running": self.is_running,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "queue_size": self._queue.qsize() if self._queue else 0,
+            **self.stats,
+            "avg_batch_size": processed / batches if batches else 0.0,
+            "avg_inference_time_ms": (
+                self.stats["total_inference_time"] / batches * 1000 if batches else 0.0
+            ),
+            "avg_queue_wait_ms": (
+                self.stats["total_queue_wait_time"] / processed * 1000 if processed else 0.0
+            )
+        }
@@ -4,6 +4,8 @@
 """
 
 import asyncio
+import heapq
+import random
 import time
 import statistics
 from typing import Dict, List, Optional, Any, Tuple
@@ -57,11 +59,19 @@ class IntelligentCacheManager:
         self,
         redis_url: str = "redis://localhost:6379",
         max_pattern_history: int = 100,
-        warmup_queue_size: int = 1000
+        warmup_queue_size: int = 1000,
+        max_concurrent_warmups: int = 4,
+        pattern_analysis_interval: float = 30.0,
+        pattern_sample_size: int = 200,
+        max_tracked_keys: int = 10000
     ):
         self.redis_url = redis_url
         self.max_pattern_history = max_pattern_history
         self.warmup_queue_size = warmup_queue_size
+        self.max_concurrent_warmups = max_concurrent_warmups
+        self.pattern_analysis_interval = pattern_analysis_interval
+        self.pattern_sample_size = pattern_sample_size
+        self.max_tracked_keys = max_tracked_keys
         
         # Redis 클라이언트
         self.redis_client = None
@@ -69,10 +79,28 @@ class IntelligentCacheManager:
         # 접근 패턴 분석
         self.access_patterns: Dict[str, AccessPattern] = {}
         self.access_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_pattern_history))
+        # 최근 접근 순서를 유지하며 max_tracked_keys를 넘으면 가장 오래된 키부터 제거
+        self.access_counts: Dict[str, int] = {}
         
-        # 워밍 작업 관리
-        self.warmup_queue: List[CacheWarmupTask] = []
+        # 분석 대기 키 -> (data_type, loader_name, loader_params); 백그라운드 패스에서 표본 추출
+        self._pending_analysis: Dict[str, Tuple[str, Optional[str], Optional[Dict[str, Any]]]] = {}
+        
+        # 워밍 작업 관리: 키별 중복 제거 + 실행 시각 힙 / 축출용 우선순위 힙 (지연 삭제)
+        self._warmup_entries: Dict[str, Tuple[int, CacheWarmupTask]] = {}
+        self._warmup_heap: List[Tuple[datetime, int, int, str]] = []
+        self._eviction_heap: List[Tuple[int, int, str]] = []
+        self._warmup_sequence = 0
+        # 스케줄러가 실행되는 이벤트 루프에서 생성 (모듈 전역 인스턴스가 임포트 시점 루프에 묶이지 않도록)
+        self._warmup_wakeup: Optional[asyncio.Event] = None
         self.warmup_tasks: Dict[str, asyncio.Task] = {}
+        self.warmup_stats = {
+            "scheduled": 0,
+            "deduplicated": 0,
+            "evicted": 0,
+            "dropped": 0,
+            "dispatched": 0,
+            "untracked_keys": 0
+        }
         
         # 데이터 로더 함수
         self.data_loaders: Dict[str, callable] = {}
@@ -91,6 +119,7 @@ class IntelligentCacheManager:
         
         # 상태 관리
         self.running = False
+        self.warmups_paused = False  # 부하 차단 중 워밍 일시 중지
         
         # 기본 TTL 설정 (초)
         self.default_ttls = {
@@ -140,7 +169,7 @@ class IntelligentCacheManager:
         self.running = False
         
         # 모든 워밍 작업 중지
-        for task in self.warmup_tasks.values():
+        for task in list(self.warmup_tasks.values()):
             if not task.done():
                 task.cancel()
                 try:
@@ -189,8 +218,8 @@ class IntelligentCacheManager:
             # 통계 업데이트
             self.stats.total_requests += 1
             
-            # 접근 기록
-            await self._record_access(key)
+            # 접근 기록 (O(1)); 패턴 분석과 Redis 기록은 백그라운드 패스에서 수행
+            self._note_access(key, data_type, loader_name, loader_params)
             
             # 캐시 조회
             data = await self._get_from_cache(key)
@@ -199,11 +228,6 @@ class IntelligentCacheManager:
                 # 캐시 히트
                 self.stats.cache_hits += 1
                 
-                # 접근 패턴 분석 및 예측적 워밍
-                pattern = await self._analyze_access_pattern(key)
-                if pattern:
-                    await self._schedule_predictive_warmup(key, pattern, data_type, loader_name, loader_params)
-                
                 logger.debug(f"Cache hit for key: {key}")
                 return data
             else:
@@ -302,10 +326,49 @@ class IntelligentCacheManager:
             "avg_response_time": self.stats.avg_response_time,
             "memory_usage": self.stats.memory_usage,
             "active_patterns": len(self.access_patterns),
-            "warmup_queue_size": len(self.warmup_queue),
+            "warmup_queue_size": len(self._warmup_entries),
+            "active_warmups": len(self.warmup_tasks),
+            "pending_pattern_analysis": len(self._pending_analysis),
+            "warmup_scheduler": dict(self.warmup_stats),
+            "warmups_paused": self.warmups_paused,
             "running": self.running
         }
     
+    @property
+    def warmup_queue(self) -> List[CacheWarmupTask]:
+        """대기 중인 워밍 작업 (실행 순서)"""
+        return [
+            task for _, task in sorted(
+                self._warmup_entries.values(),
+                key=lambda entry: (entry[1].scheduled_time, -entry[1].priority, entry[0])
+            )
+        ]
+    
+    def _note_access(
+        self,
+        key: str,
+        data_type: str,
+        loader_name: Optional[str],
+        loader_params: Optional[Dict[str, Any]]
+    ):
+        """요청 경로의 접근 기록 (카운터 증가와 대기 표시만 수행)"""
+        self.access_counts[key] = self.access_counts.pop(key, 0) + 1
+        self.access_history[key].append(datetime.utcnow())
+        self._pending_analysis[key] = (data_type, loader_name, loader_params)
+        
+        while len(self.access_counts) > self.max_tracked_keys:
+            oldest = next(iter(self.access_counts))
+            del self.access_counts[oldest]
+            self.access_history.pop(oldest, None)
+            self.access_patterns.pop(oldest, None)
+            self._pending_analysis.pop(oldest, None)
+            self.warmup_stats["untracked_keys"] += 1
+    
+    def _wake_warmup_scheduler(self):
+        """워밍 스케줄러 깨우기 (스케줄러가 아직 시작되지 않았으면 무시)"""
+        if self._warmup_wakeup is not None:
+            self._warmup_wakeup.set()
+    
     async def _record_access(self, key: str):
         """접근 기록"""
         try:
@@ -326,12 +389,13 @@ class IntelligentCacheManager:
     async def _analyze_access_pattern(self, key: str) -> Optional[AccessPattern]:
         """접근 패턴 분석"""
         try:
-            # 최소 샘플 수 확인
-            if len(self.access_history[key]) < self.prediction_params["min_samples"]:
+            # 최소 샘플 수 확인 (추적이 끝난 키의 이력은 다시 만들지 않음)
+            history = self.access_history.get(key)
+            if history is None or len(history) < self.prediction_params["min_samples"]:
                 return None
             
             # 접근 시간 간격 계산
-            access_times = list(self.access_history[key])
+            access_times = list(history)
             intervals = []
             
             for i in range(1, len(access_times)):
@@ -376,8 +440,9 @@ class IntelligentCacheManager:
                 prediction_confidence=max(0.0, min(1.0, pattern_confidence))
             )
             
-            # 패턴 저장
-            self.access_patterns[key] = access_pattern
+            # 패턴 저장 (분석 중 추적에서 제외된 키는 저장하지 않음)
+            if key in self.access_counts:
+                self.access_patterns[key] = access_pattern
             
             return access_pattern
             
@@ -476,51 +541,144 @@ class IntelligentCacheManager:
         return base_priority
     
     async def _add_to_warmup_queue(self, task: CacheWarmupTask):
-        """워밍 큐에 작업 추가"""
+        """워밍 큐에 작업 추가 (같은 키는 하나의 작업으로 병합)"""
         try:
-            # 큐 크기 확인
-            if len(self.warmup_queue) >= self.warmup_queue_size:
-                # 가장 낮은 우선순위 작업 제거
-                self.warmup_queue.sort(key=lambda x: x.priority)
-                self.warmup_queue.pop(0)
-            
-            # 작업 추가
-            self.warmup_queue.append(task)
-            
-            # 우선순위순으로 정렬
-            self.warmup_queue.sort(key=lambda x: (x.scheduled_time, -x.priority))
+            existing = self._warmup_entries.get(task.key)
+            if existing is not None:
+                # 최신 예측 시각을 사용하고 우선순위는 높은 쪽 유지
+                task.priority = max(task.priority, existing[1].priority)
+                self.warmup_stats["deduplicated"] += 1
+            elif len(self._warmup_entries) >= self.warmup_queue_size:
+                # 가장 낮은 우선순위 작업 제거 (새 작업이 더 낮으면 새 작업을 버림)
+                lowest = self._peek_lowest_priority()
+                if lowest is not None and lowest[1].priority > task.priority:
+                    self.warmup_stats["dropped"] += 1
+                    return
+                if lowest is not None:
+                    del self._warmup_entries[lowest[1].key]
+                    self.warmup_stats["evicted"] += 1
+            
+            self._warmup_sequence += 1
+            sequence = self._warmup_sequence
+            self._warmup_entries[task.key] = (sequence, task)
+            heapq.heappush(self._warmup_heap, (task.scheduled_time, -task.priority, sequence, task.key))
+            heapq.heappush(self._eviction_heap, (task.priority, sequence, task.key))
+            self.warmup_stats["scheduled"] += 1
+            
+            if self._warmup_heap[0][2] == sequence:
+                # 가장 이른 작업이 바뀌었으면 스케줄러 타이머 재설정
+                self._wake_warmup_scheduler()
+            
+            self._compact_warmup_heaps()
             
         except Exception as e:
             logger.error(f"Error adding to warmup queue: {str(e)}")
     
+    def _is_live_entry(self, sequence: int, key: str) -> bool:
+        entry = self._warmup_entries.get(key)
+        return entry is not None and entry[0] == sequence
+    
+    def _peek_lowest_priority(self) -> Optional[Tuple[int, CacheWarmupTask]]:
+        """우선순위가 가장 낮은 대기 작업 조회 (무효 항목은 정리)"""
+        while self._eviction_heap:
+            _, sequence, key = self._eviction_heap[0]
+            if self._is_live_entry(sequence, key):
+                return self._warmup_entries[key]
+            heapq.heappop(self._eviction_heap)
+        return None
+    
+    def _compact_warmup_heaps(self):
+        """무효 항목이 누적되면 힙 재구성"""
+        live = len(self._warmup_entries)
+        if len(self._warmup_heap) > 2 * live + 64:
+            self._warmup_heap = [e for e in self._warmup_heap if self._is_live_entry(e[2], e[3])]
+            heapq.heapify(self._warmup_heap)
+        if len(self._eviction_heap) > 2 * live + 64:
+            self._eviction_heap = [e for e in self._eviction_heap if self._is_live_entry(e[1], e[2])]
+            heapq.heapify(self._eviction_heap)
+    
+    def _pop_due_warmup(self, now: datetime) -> Optional[CacheWarmupTask]:
+        """실행 시각이 지난 가장 이른 작업 꺼내기"""
+        while self._warmup_heap:
+            scheduled_time, _, sequence, key = self._warmup_heap[0]
+            if not self._is_live_entry(sequence, key):
+                heapq.heappop(self._warmup_heap)
+                continue
+            if scheduled_time > now:
+                return None
+            heapq.heappop(self._warmup_heap)
+            return self._warmup_entries.pop(key)[1]
+        return None
+    
+    def _next_warmup_delay(self, max_delay: float = 60.0) -> float:
+        """다음 워밍 작업까지 대기 시간 (초)"""
+        if self.warmups_paused or len(self.warmup_tasks) >= self.max_concurrent_warmups:
+            return max_delay
+        while self._warmup_heap and not self._is_live_entry(self._warmup_heap[0][2], self._warmup_heap[0][3]):
+            heapq.heappop(self._warmup_heap)
+        if not self._warmup_heap:
+            return max_delay
+        delay = (self._warmup_heap[0][0] - datetime.utcnow()).total_seconds()
+        return min(max(delay, 0.0), max_delay)
+    
+    def _dispatch_due_warmups(self) -> int:
+        """동시 실행 한도 내에서 실행 시각이 된 워밍 작업 시작"""
+        dispatched = 0
+        now = datetime.utcnow()
+        while len(self.warmup_tasks) < self.max_concurrent_warmups:
+            task = self._pop_due_warmup(now)
+            if task is None:
+                break
+            if task.key in self.warmup_tasks:
+                # 같은 키의 워밍이 이미 실행 중
+                self.warmup_stats["deduplicated"] += 1
+                continue
+            self.warmup_tasks[task.key] = asyncio.create_task(self._run_warmup_worker(task))
+            self.warmup_stats["dispatched"] += 1
+            dispatched += 1
+        return dispatched
+    
+    async def _run_warmup_worker(self, task: CacheWarmupTask):
+        """워밍 작업 실행 후 슬롯 반환"""
+        try:
+            await self._execute_warmup_task(task)
+        finally:
+            self.warmup_tasks.pop(task.key, None)
+            self._wake_warmup_scheduler()
+    
+    def pause_warmups(self):
+        """예측 워밍 일시 중지 (예약된 작업은 큐에 유지)"""
+        if not self.warmups_paused:
+            self.warmups_paused = True
+            logger.info("Cache warmups paused")
+
+    def resume_warmups(self):
+        """예측 워밍 재개"""
+        if self.warmups_paused:
+            self.warmups_paused = False
+            self._wake_warmup_scheduler()
+            logger.info("Cache warmups resumed")
+
     async def _warmup_scheduler(self):
-        """워밍 스케줄러"""
+        """워밍 스케줄러 (가장 이른 작업 시각 또는 큐 변경 시 깨어남)"""
+        self._warmup_wakeup = asyncio.Event()
         while self.running:
             try:
-                now = datetime.utcnow()
-                
-                # 실행할 작업 찾기
-                tasks_to_execute = []
-                remaining_tasks = []
-                
-                for task in self.warmup_queue:
-                    if task.scheduled_time <= now:
-                        tasks_to_execute.append(task)
-                    else:
-                        remaining_tasks.append(task)
+                self._warmup_wakeup.clear()
                 
-                self.warmup_queue = remaining_tasks
+                if not self.warmups_paused:
+                    self._dispatch_due_warmups()
                 
-                # 워밍 작업 실행
-                for task in tasks_to_execute:
-                    await self._execute_warmup_task(task)
-                
-                # 1분마다 확인
-                await asyncio.sleep(60)
+                try:
+                    await asyncio.wait_for(self._warmup_wakeup.wait(), timeout=self._next_warmup_delay())
+                except asyncio.TimeoutError:
+                    pass
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in warmup scheduler: {str(e)}")
-                await asyncio.sleep(60)
+                await asyncio.sleep(1)
     
     async def _execute_warmup_task(self, task: CacheWarmupTask):
         """워밍 작업 실행"""
@@ -646,16 +804,58 @@ class IntelligentCacheManager:
         """패턴 분석기"""
         while self.running:
             try:
-                # 모든 키에 대해 패턴 분석
-                for key in list(self.access_history.keys()):
-                    await self._analyze_access_pattern(key)
+                await self._run_pattern_analysis_pass()
                 
-                # 10분마다 분석
-                await asyncio.sleep(600)
+                await asyncio.sleep(self.pattern_analysis_interval)
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in pattern analyzer: {str(e)}")
-                await asyncio.sleep(600)
+                await asyncio.sleep(self.pattern_analysis_interval)
+    
+    async def _run_pattern_analysis_pass(self) -> int:
+        """최근 접근된 키를 표본 추출해 패턴 분석, 예측 워밍 예약 및 접근 이력 저장
+        
+        Returns:
+            분석한 키 수
+        """
+        if not self._pending_analysis:
+            return 0
+        
+        keys = list(self._pending_analysis)
+        if len(keys) > self.pattern_sample_size:
+            keys = random.sample(keys, self.pattern_sample_size)
+        sampled = {key: self._pending_analysis.pop(key) for key in keys}
+        
+        await self._persist_access_history(keys)
+        
+        for key, (data_type, loader_name, loader_params) in sampled.items():
+            pattern = await self._analyze_access_pattern(key)
+            if pattern:
+                await self._schedule_predictive_warmup(key, pattern, data_type, loader_name, loader_params)
+        
+        return len(sampled)
+    
+    async def _persist_access_history(self, keys: List[str]):
+        """접근 이력을 파이프라인 한 번으로 Redis에 저장"""
+        try:
+            if not self.redis_client or not keys:
+                return
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key in keys:
+                access_key = f"cache:access:{key}"
+                history = [t.isoformat() for t in self.access_history[key]]
+                pipe.delete(access_key)
+                if history:
+                    # 최신 접근이 리스트 앞에 오도록 오래된 순서로 lpush
+                    pipe.lpush(access_key, *history)
+                    pipe.expire(access_key, 86400)  # 24시간 유지
+            await pipe.execute()
+            
+        except Exception as e:
+            logger.error(f"Error persisting access history: {str(e)}")
     
     async def _stats_collector(self):
         """통계 수집기"""
@@ -681,6 +881,7 @@ class IntelligentCacheManager:
             
             # Redis에서 패턴 데이터 로드
             pattern_keys = await self.redis_client.keys("cache:pattern:*")
+            loaded = []
             
             for key in pattern_keys:
                 pattern_data = await self.redis_client.get(key)
@@ -691,7 +892,13 @@ class IntelligentCacheManager:
                     # 마지막 접근 시간 파싱
                     pattern.last_access = datetime.fromisoformat(pattern.last_access)
                     
-                    self.access_patterns[pattern.key] = pattern
+                    loaded.append(pattern)
+            
+            # 최근 접근된 max_tracked_keys개만 추적 (접근 순서대로 등록해 같은 순서로 제거)
+            loaded.sort(key=lambda pattern: pattern.last_access)
+            for pattern in loaded[-self.max_tracked_keys:]:
+                self.access_patterns[pattern.key] = pattern
+                self.access_counts.setdefault(pattern.key, pattern.access_count)
             
             logger.info(f"Loaded {len(self.access_patterns)} access patterns")
             
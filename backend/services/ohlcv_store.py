@@ -0,0 +1,319 @@
+"""
+Columnar on-disk store for historical OHLCV frames.
+
+Each symbol/interval pair is a directory holding one raw little-endian
+array file per column (``timestamp`` as int64 UTC nanoseconds, then the
+frame's numeric columns) plus a small ``meta.json`` with the committed row
+count, column dtypes, timezone and a version that increases on every write.
+
+- Bars newer than the stored tail are appended past the committed row
+  count, which no reader maps, so the committed rows are never touched.
+  Bars that overlap the tail (e.g. a refreshed last session) produce a new
+  generation of column files holding the kept rows plus the frame. In both
+  cases the files are fsynced before ``meta.json`` (row count, generation)
+  is atomically replaced, so a crashed write leaves the previous version
+  readable; superseded generations are removed after the swap.
+- Writers take an exclusive and readers a shared ``flock`` on the series'
+  lock file, so other processes never map files while they are replaced.
+- Reads memory-map the column files and binary-search the timestamp column,
+  so a range read only touches the bytes of the requested slice.
+
+Cache entries for historical data only need to carry a pointer
+(symbol, interval, range, version) into this store.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_COLUMN = "timestamp"
+META_FILE = "meta.json"
+LOCK_FILE = ".lock"
+
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class ColumnarOHLCVStore:
+    """Memory-mapped columnar store with append-only writes per symbol/interval."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # (symbol, interval) -> (version, {column: memmap})
+        self._maps: Dict[Tuple[str, str], Tuple[int, Dict[str, np.memmap]]] = {}
+
+        # Statistics
+        self.stats = {
+            "writes": 0,
+            "appended_rows": 0,
+            "rewritten_rows": 0,
+            "generations_written": 0,
+            "reads": 0,
+            "read_rows": 0,
+            "misses": 0
+        }
+
+    # Paths and metadata
+
+    def _lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    @contextmanager
+    def _process_lock(self, directory: str, exclusive: bool):
+        """Cross-process lock on a series (no-op where flock is unavailable)."""
+        if not FCNTL_AVAILABLE or not (exclusive or os.path.isdir(directory)):
+            yield
+            return
+        with open(os.path.join(directory, LOCK_FILE), "a+b") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _directory(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, _SAFE_NAME.sub("_", symbol.upper()), _SAFE_NAME.sub("_", interval))
+
+    @staticmethod
+    def _column_file(directory: str, column: str, generation: int = 0) -> str:
+        name = _SAFE_NAME.sub('_', column)
+        return os.path.join(directory, f"{name}@{generation}.bin" if generation else f"{name}.bin")
+
+    @staticmethod
+    def _write_column(path: str, values: np.ndarray, offset_rows: int = 0):
+        with open(path, "r+b" if offset_rows else "wb") as f:
+            f.seek(offset_rows * values.dtype.itemsize)
+            f.write(np.ascontiguousarray(values).tobytes())
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_meta(self, directory: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write_meta(directory: str, meta: Dict[str, Any]):
+        path = os.path.join(directory, META_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def get_version(self, symbol: str, interval: str) -> int:
+        """Current version of a series (0 if it does not exist)."""
+        meta = self._read_meta(self._directory(symbol, interval))
+        return meta["version"] if meta else 0
+
+    def get_range(self, symbol: str, interval: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """First and last stored bar times (UTC), or None if the series is empty."""
+        key = (symbol.upper(), interval)
+        directory = self._directory(symbol, interval)
+        with self._lock(key), self._process_lock(directory, exclusive=False):
+            meta = self._read_meta(directory)
+            if not meta or not meta["rows"]:
+                return None
+            timestamps = self._maps_for(key, meta)[TIMESTAMP_COLUMN]
+            return (pd.Timestamp(int(timestamps[0]), tz="UTC"), pd.Timestamp(int(timestamps[-1]), tz="UTC"))
+
+    # Writes
+
+    @staticmethod
+    def _to_utc_nanos(index: pd.Index) -> np.ndarray:
+        index = pd.DatetimeIndex(index)
+        if index.tz is None:
+            index = index.tz_localize("UTC")
+        return index.tz_convert("UTC").as_unit("ns").asi8
+
+    def write(self, symbol: str, interval: str, frame: pd.DataFrame) -> int:
+        """Store the bars of a DatetimeIndex-ed frame and return the new version.
+
+        Numeric columns are stored; stored bars at or after the frame's first
+        timestamp are replaced by the frame.
+        """
+        if frame is None or frame.empty:
+            return self.get_version(symbol, interval)
+
+        frame = frame.select_dtypes(include=[np.number, "bool"])
+        frame = frame[~frame.index.duplicated(keep="last")]
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index()
+        timestamps = self._to_utc_nanos(frame.index)
+
+        key = (symbol.upper(), interval)
+        directory = self._directory(symbol, interval)
+        os.makedirs(directory, exist_ok=True)
+        with self._lock(key), self._process_lock(directory, exclusive=True):
+            meta = self._read_meta(directory)
+            columns = {str(name): frame[name].dtype.str for name in frame.columns}
+            version = (meta["version"] if meta else 0) + 1
+
+            cut = 0
+            stored_maps: Dict[str, np.memmap] = {}
+            if meta and meta["rows"] and meta["columns"] == columns:
+                stored_maps = self._maps_for(key, meta)
+                cut = int(np.searchsorted(stored_maps[TIMESTAMP_COLUMN], timestamps[0], side="left"))
+            rows = cut + len(timestamps)
+
+            arrays = {TIMESTAMP_COLUMN: timestamps}
+            for name in frame.columns:
+                arrays[str(name)] = frame[name].to_numpy()
+
+            previous_generation = meta.get("generation", 0) if meta else 0
+            if stored_maps and cut == meta["rows"]:
+                # Pure append: bytes past the committed rows are not mapped by any reader
+                generation = previous_generation
+                for column, values in arrays.items():
+                    self._write_column(self._column_file(directory, column, generation), values, cut)
+            else:
+                # Committed rows change: write a new generation next to the current one
+                generation = version
+                for column, values in arrays.items():
+                    kept = np.asarray(stored_maps[column][:cut]) if cut else values[:0]
+                    self._write_column(self._column_file(directory, column, generation),
+                                       np.concatenate([kept, values]))
+                self.stats["generations_written"] += 1
+
+            self._write_meta(directory, {
+                "version": version,
+                "generation": generation,
+                "rows": rows,
+                "columns": columns,
+                "timezone": str(frame.index.tz) if getattr(frame.index, "tz", None) else None,
+                "index_name": frame.index.name,
+                "index_unit": pd.DatetimeIndex(frame.index).unit
+            })
+
+            if generation != previous_generation:
+                # Existing mappings of the old files stay valid after unlink
+                self._maps.pop(key, None)
+                self._remove_files(directory, keep=generation)
+
+        previous_rows = meta["rows"] if meta else 0
+        self.stats["writes"] += 1
+        self.stats["appended_rows"] += max(rows - previous_rows, 0)
+        self.stats["rewritten_rows"] += len(timestamps) - max(rows - previous_rows, 0)
+        return version
+
+    def _remove_files(self, directory: str, keep: Optional[int] = None):
+        """Remove column files (and leftovers of crashed writes) not belonging to generation keep."""
+        for name in os.listdir(directory):
+            if name in (META_FILE, LOCK_FILE):
+                continue
+            stem, _, suffix = name[:-len(".bin")].rpartition("@") if name.endswith(".bin") else ("", "", "")
+            generation = int(suffix) if stem and suffix.isdigit() else 0
+            if keep is None or generation != keep or not name.endswith(".bin"):
+                os.remove(os.path.join(directory, name))
+
+    def delete(self, symbol: str, interval: str):
+        """Remove a series."""
+        key = (symbol.upper(), interval)
+        directory = self._directory(symbol, interval)
+        if not os.path.isdir(directory):
+            return
+        with self._lock(key), self._process_lock(directory, exclusive=True):
+            self._maps.pop(key, None)
+            # The lock file stays so processes waiting on it keep excluding each other
+            meta_path = os.path.join(directory, META_FILE)
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            self._remove_files(directory)
+
+    # Reads
+
+    def _maps_for(self, key: Tuple[str, str], meta: Dict[str, Any]) -> Dict[str, np.memmap]:
+        """Memory maps of the committed rows of a series (cached per version)."""
+        cached = self._maps.get(key)
+        if cached is not None and cached[0] == meta["version"]:
+            return cached[1]
+
+        directory = self._directory(*key)
+        rows = meta["rows"]
+        generation = meta.get("generation", 0)
+        dtypes = {TIMESTAMP_COLUMN: "<i8", **meta["columns"]}
+        maps = {
+            column: np.memmap(self._column_file(directory, column, generation), dtype=np.dtype(dtype),
+                              mode="r", shape=(rows,))
+            for column, dtype in dtypes.items()
+        }
+        self._maps[key] = (meta["version"], maps)
+        return maps
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Read bars with start <= time <= end (both optional) as a DataFrame.
+
+        Returns:
+            DataFrame indexed like the written frame, or None if the series does not exist
+        """
+        key = (symbol.upper(), interval)
+        directory = self._directory(symbol, interval)
+        with self._lock(key), self._process_lock(directory, exclusive=False):
+            meta = self._read_meta(directory)
+            if not meta or not meta["rows"]:
+                self.stats["misses"] += 1
+                return None
+
+            maps = self._maps_for(key, meta)
+            timestamps = maps[TIMESTAMP_COLUMN]
+            lo = int(np.searchsorted(timestamps, self._bound(start), side="left")) if start is not None else 0
+            hi = int(np.searchsorted(timestamps, self._bound(end), side="right")) if end is not None else len(timestamps)
+
+            # Copy only the requested slice out of the mappings
+            data = {
+                column: np.array(maps[column][lo:hi])
+                for column in (columns or list(meta["columns"]))
+            }
+            index_values = np.array(timestamps[lo:hi])
+
+        index = pd.DatetimeIndex(index_values.view("datetime64[ns]"), name=meta.get("index_name"))
+        if meta.get("timezone"):
+            index = index.tz_localize("UTC").tz_convert(meta["timezone"])
+        if meta.get("index_unit"):
+            index = index.as_unit(meta["index_unit"])
+
+        self.stats["reads"] += 1
+        self.stats["read_rows"] += hi - lo
+        return pd.DataFrame(data, index=index)
+
+    @staticmethod
+    def _bound(value: Any) -> int:
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.tz_localize("UTC")
+        return timestamp.tz_convert("UTC").as_unit("ns").value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store statistics."""
+        return {**self.stats, "root": self.root, "mapped_series": len(self._maps)}
@@ -0,0 +1,245 @@
+"""
+ONNX Runtime CPU backend for InsiteChart sentiment models.
+
+This module exports HuggingFace sequence-classification models to ONNX,
+applies dynamic int8 quantization and serves them through ONNX Runtime with a
+tuned intra-op thread count. The resulting model is a drop-in replacement for
+the PyTorch model inside DynamicBatchInferenceWorker.
+"""
+
+import logging
+import os
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Try to import ONNX Runtime
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    ONNX_RUNTIME_AVAILABLE = True
+except ImportError:
+    ONNX_RUNTIME_AVAILABLE = False
+    logging.warning("onnxruntime not available. ONNX sentiment backend disabled.")
+
+# Try to import torch (only needed for export and parity checks)
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ONNX_MODEL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "insitechart", "onnx")
+MODEL_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def default_intra_op_threads(workers: int = 1) -> int:
+    """Split the available cores evenly between inference workers."""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def _to_numpy(value: Any) -> np.ndarray:
+    """Convert tokenizer output (torch or numpy) to an int64 array."""
+    if hasattr(value, "detach"):
+        value = value.detach().cpu().numpy()
+    return np.asarray(value, dtype=np.int64)
+
+
+class OnnxSequenceClassifier:
+    """ONNX Runtime session with a HuggingFace-style call signature.
+
+    Calling the classifier with tokenizer output returns an object with a
+    ``logits`` attribute, and ``config.id2label`` is preserved, so it can be
+    used anywhere a ``AutoModelForSequenceClassification`` is used for
+    inference.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        config: Any,
+        intra_op_threads: Optional[int] = None
+    ):
+        if not ONNX_RUNTIME_AVAILABLE:
+            raise RuntimeError("onnxruntime is not installed")
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads or default_intra_op_threads()
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        self.session = ort.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.model_path = model_path
+        self.config = config
+        self.intra_op_threads = options.intra_op_num_threads
+
+    def __call__(self, **inputs) -> SimpleNamespace:
+        feed = {
+            name: _to_numpy(value)
+            for name, value in inputs.items()
+            if name in self.input_names
+        }
+        logits = self.session.run(["logits"], feed)[0]
+        return SimpleNamespace(logits=logits)
+
+
+if TORCH_AVAILABLE:
+    class _LogitsOnlyWrapper(torch.nn.Module):
+        """Expose positional inputs and a bare logits output for export."""
+
+        def __init__(self, model: Any, input_names: List[str]):
+            super().__init__()
+            self.model = model
+            self.input_names = input_names
+
+        def forward(self, *tensors):
+            return self.model(**dict(zip(self.input_names, tensors))).logits
+
+
+def export_to_onnx(model: Any, tokenizer: Any, output_path: str, opset: int = 17) -> str:
+    """Export a sequence-classification model to ONNX with dynamic axes."""
+    if not TORCH_AVAILABLE:
+        raise RuntimeError("torch is required to export models to ONNX")
+
+    sample = tokenizer(["export sample text"], return_tensors="pt")
+    input_names = [name for name in MODEL_INPUT_NAMES if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    # The wrapper must be in eval mode: export restores its training flag
+    # recursively, which would otherwise re-enable dropout on the model
+    wrapper = _LogitsOnlyWrapper(model, input_names).eval()
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with torch.no_grad():
+        torch.onnx.export(
+            wrapper,
+            tuple(sample[name] for name in input_names),
+            output_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            dynamo=False
+        )
+
+    logger.info(f"Exported ONNX model to {output_path}")
+    return output_path
+
+
+def quantize_model(model_path: str, output_path: str) -> str:
+    """Apply dynamic int8 weight quantization to an ONNX model."""
+    if not ONNX_RUNTIME_AVAILABLE:
+        raise RuntimeError("onnxruntime is not installed")
+
+    quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8)
+    logger.info(f"Quantized ONNX model written to {output_path}")
+    return output_path
+
+
+def get_model_paths(model_name: str, model_dir: Optional[str] = None) -> Dict[str, str]:
+    """Get the fp32 and int8 artifact paths for a model."""
+    base_dir = os.path.join(model_dir or DEFAULT_ONNX_MODEL_DIR, model_name.replace("/", "--"))
+    return {
+        "fp32": os.path.join(base_dir, "model.onnx"),
+        "int8": os.path.join(base_dir, "model.int8.onnx")
+    }
+
+
+def load_onnx_sentiment_model(
+    model_name: str,
+    model_dir: Optional[str] = None,
+    quantize: bool = True,
+    intra_op_threads: Optional[int] = None
+) -> Tuple[Any, OnnxSequenceClassifier]:
+    """Load (exporting on first use) an ONNX sentiment model.
+
+    Exported artifacts are cached on disk, so subsequent workers start from
+    the ONNX file without instantiating the PyTorch model.
+
+    Returns:
+        Tuple of (tokenizer, OnnxSequenceClassifier)
+    """
+    from transformers import AutoConfig, AutoModelForSequenceClassification, AutoTokenizer
+
+    paths = get_model_paths(model_name, model_dir)
+    target_path = paths["int8"] if quantize else paths["fp32"]
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    config = AutoConfig.from_pretrained(model_name)
+
+    if not os.path.exists(target_path):
+        if not os.path.exists(paths["fp32"]):
+            model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            export_to_onnx(model, tokenizer, paths["fp32"])
+            del model
+        if quantize:
+            quantize_model(paths["fp32"], paths["int8"])
+
+    classifier = OnnxSequenceClassifier(target_path, config, intra_op_threads)
+    logger.info(
+        f"Loaded ONNX sentiment model {model_name} "
+        f"({'int8' if quantize else 'fp32'}, intra_op_threads={classifier.intra_op_threads})"
+    )
+    return tokenizer, classifier
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    probabilities = np.exp(shifted)
+    return probabilities / probabilities.sum(axis=-1, keepdims=True)
+
+
+def _predict_probabilities(model: Any, tokenizer: Any, texts: List[str], batch_size: int) -> np.ndarray:
+    outputs = []
+    for start in range(0, len(texts), batch_size):
+        encoded = tokenizer(
+            texts[start:start + batch_size],
+            padding="longest",
+            truncation=True,
+            max_length=512,
+            return_tensors="pt"
+        )
+        if TORCH_AVAILABLE:
+            with torch.inference_mode():
+                logits = model(**encoded).logits
+        else:
+            logits = model(**encoded).logits
+        if hasattr(logits, "detach"):
+            logits = logits.float().cpu().numpy()
+        outputs.append(_softmax(np.asarray(logits, dtype=np.float32)))
+    return np.concatenate(outputs, axis=0)
+
+
+def check_accuracy_parity(
+    reference_model: Any,
+    candidate_model: Any,
+    tokenizer: Any,
+    texts: List[str],
+    batch_size: int = 16
+) -> Dict[str, Any]:
+    """Compare predictions of a candidate model against the reference model.
+
+    Returns:
+        Label agreement rate and absolute probability differences
+    """
+    reference = _predict_probabilities(reference_model, tokenizer, texts, batch_size)
+    candidate = _predict_probabilities(candidate_model, tokenizer, texts, batch_size)
+    differences = np.abs(reference - candidate)
+
+    return {
+        "sample_size": len(texts),
+        "label_agreement": float(np.mean(reference.argmax(axis=-1) == candidate.argmax(axis=-1))),
+        "max_abs_prob_diff": float(differences.max()),
+        "mean_abs_prob_diff": float(differences.mean())
+    }
@@ -8,11 +8,10 @@ and other resources to prevent abuse and ensure fair usage.
 import asyncio
 import time
 import logging
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-import threading
 
 from ..cache.unified_cache import UnifiedCacheManager
 
@@ -46,13 +45,48 @@ class RateLimitInfo:
     user_tier: str = "default"
 
 
+@dataclass
+class LocalTokenBucket:
+    """Per-worker lease on a global fixed-window budget.
+
+    ``tokens`` are requests this worker may admit without asking Redis; admitted
+    requests accumulate in ``pending`` until the next reconciliation.
+    """
+    global_key: str
+    window_id: int
+    window: int
+    requests: int
+    global_count: int = 0
+    pending: int = 0
+    tokens: int = 0
+
+
 class RateLimitService:
-    """Rate limit service."""
+    """Rate limit service.
+
+    Limits are fixed-window counters kept in Redis. Each worker leases a share of
+    the remaining budget as local tokens, so hot identifiers are decided in memory
+    and their usage is reconciled in batches. Once the remaining budget falls below
+    ``strict_threshold`` every request is counted globally before it is admitted.
+    """
     
-    def __init__(self, cache_manager: UnifiedCacheManager):
+    def __init__(
+        self,
+        cache_manager: UnifiedCacheManager,
+        redis_client=None,
+        local_share: float = 0.1,
+        strict_threshold: float = 0.1,
+        sync_interval: float = 0.2
+    ):
         self.cache_manager = cache_manager
+        self.redis_client = redis_client
         self.logger = logging.getLogger(__name__)
         
+        # Hybrid limiter settings. local_share should not exceed 1 / number of workers.
+        self.local_share = local_share
+        self.strict_threshold = strict_threshold
+        self.sync_interval = sync_interval
+        
         # Default policies by user tier
         self.default_policies = {
             UserTier.FREE: {
@@ -80,9 +114,16 @@ class RateLimitService:
         # Custom policies for specific users
         self.custom_policies: Dict[str, Dict[str, RateLimitPolicy]] = {}
         
-        # In-memory tracking for high-frequency operations
-        self.in_memory_counters: Dict[str, List[float]] = {}
-        self.in_memory_lock = threading.Lock()
+        # Local token buckets for high-frequency identifiers
+        self.local_buckets: Dict[str, LocalTokenBucket] = {}
+        self._sync_task: Optional[asyncio.Task] = None
+        self.limiter_stats = {
+            "local_decisions": 0,
+            "global_decisions": 0,
+            "requests_blocked": 0,
+            "syncs": 0,
+            "sync_errors": 0
+        }
         
         # Testing mode flag
         self.testing = False
@@ -118,24 +159,32 @@ class RateLimitService:
             # Get policy for user tier and operation
             policy = await self._get_policy(identifier, operation, user_tier, endpoint)
             
-            # Create cache key
-            cache_key = f"rate_limit:{identifier}:{operation}:{policy.window}"
-            
-            # Get current counter from cache
-            current_data = await self.cache_manager.get(cache_key)
-            
-            if not current_data:
-                # First request in window
-                counter = 1
-                window_start = datetime.utcnow()
+            now = time.time()
+            window_id = int(now // policy.window)
+            key = f"{identifier}:{operation}:{policy.window}"
+            bucket = self.local_buckets.get(key)
+            
+            if bucket is None or bucket.window_id != window_id or bucket.requests != policy.requests:
+                bucket = LocalTokenBucket(
+                    global_key=f"rate_limit:{key}:{window_id}",
+                    window_id=window_id,
+                    window=policy.window,
+                    requests=policy.requests
+                )
+                self.local_buckets[key] = bucket
+            
+            if bucket.tokens > 0:
+                # Fast path: spend a locally leased token
+                bucket.tokens -= 1
+                bucket.pending += 1
+                counter = bucket.global_count + bucket.pending
+                self.limiter_stats["local_decisions"] += 1
             else:
-                counter = current_data.get("count", 0) + 1
-                window_start = datetime.fromisoformat(current_data["window_start"])
-                
-                # Check if window has expired
-                if datetime.utcnow() > window_start + timedelta(seconds=policy.window):
-                    counter = 1
-                    window_start = datetime.utcnow()
+                # Slow path: count this request globally (always taken near exhaustion)
+                counter = await self._reserve_globally(bucket)
+                self.limiter_stats["global_decisions"] += 1
+            
+            self._ensure_sync_task()
             
             # Calculate remaining requests
             requests_remaining = max(0, policy.requests - counter)
@@ -143,36 +192,20 @@ class RateLimitService:
             # Handle burst mode
             if burst_mode and policy.burst > 0:
                 burst_available = policy.burst - max(0, counter - policy.requests)
-                requests_remaining += burst_available
+                requests_remaining += max(0, burst_available)
             
             # Check if allowed
             allowed = counter <= policy.requests or (burst_mode and counter <= policy.requests + policy.burst)
             
             # Calculate reset time
-            reset_time = window_start + timedelta(seconds=policy.window)
+            reset_timestamp = (window_id + 1) * policy.window
+            reset_time = datetime.utcfromtimestamp(reset_timestamp)
             
             # Calculate retry after if not allowed
             retry_after = None
             if not allowed:
-                retry_after = max(1, (reset_time - datetime.utcnow()).total_seconds())
-            
-            # Update cache
-            await self.cache_manager.set(
-                cache_key,
-                {
-                    "count": counter,
-                    "window_start": window_start.isoformat(),
-                    "policy": {
-                        "requests": policy.requests,
-                        "window": policy.window,
-                        "burst": policy.burst
-                    }
-                },
-                ttl=policy.window
-            )
-            
-            # Also update in-memory counter for very high frequency
-            await self._update_in_memory_counter(identifier, operation, policy.window)
+                retry_after = max(1, int(reset_timestamp - now))
+                self.limiter_stats["requests_blocked"] += 1
             
             return RateLimitInfo(
                 allowed=allowed,
@@ -226,31 +259,119 @@ class RateLimitService:
             self.logger.error(f"Error getting rate limit policy: {str(e)}")
             return RateLimitPolicy(requests=100, window=60)
     
-    async def _update_in_memory_counter(self, identifier: str, operation: str, window: int):
-        """Update in-memory counter for very high frequency operations."""
+    def _get_redis(self):
+        """Redis client used for global counters (falls back to the cache backend's client)."""
+        if self.redis_client is not None:
+            return self.redis_client
+        return getattr(self.cache_manager.backend, "redis_client", None)
+    
+    def _lease_tokens(self, bucket: LocalTokenBucket) -> int:
+        """Number of requests this worker may admit before reconciling again."""
+        remaining = bucket.requests - bucket.global_count
+        if remaining <= bucket.requests * self.strict_threshold:
+            return 0
+        return int(remaining * self.local_share)
+    
+    async def _reserve_globally(self, bucket: LocalTokenBucket) -> int:
+        """Count the current request (plus unreconciled local usage) in Redis and refresh the lease."""
+        redis_client = self._get_redis()
+        pending = bucket.pending + 1
+        bucket.pending = 0
+        
+        if redis_client is None:
+            # No shared store: enforce the limit per worker
+            bucket.global_count += pending
+            return bucket.global_count
+        
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.incrby(bucket.global_key, pending)
+            pipe.expire(bucket.global_key, bucket.window + 1)
+            results = await pipe.execute()
+            
+            bucket.global_count = int(results[0])
+            bucket.tokens = self._lease_tokens(bucket)
+            return bucket.global_count
+            
+        except Exception as e:
+            # Keep the usage for the next reconciliation and fail open
+            bucket.pending += pending
+            self.limiter_stats["sync_errors"] += 1
+            self.logger.error(f"Error reserving global rate limit: {str(e)}")
+            return bucket.global_count + bucket.pending
+    
+    async def sync_usage(self) -> int:
+        """Reconcile locally admitted requests with Redis in one pipeline.
+        
+        Returns:
+            Number of requests reconciled
+        """
+        redis_client = self._get_redis()
+        current_time = time.time()
+        
+        # Drop buckets whose window has ended
+        for key, bucket in list(self.local_buckets.items()):
+            if (bucket.window_id + 1) * bucket.window <= current_time:
+                del self.local_buckets[key]
+        
+        if redis_client is None:
+            return 0
+        
+        batch = [(bucket, bucket.pending) for bucket in self.local_buckets.values() if bucket.pending > 0]
+        if not batch:
+            return 0
+        for bucket, pending in batch:
+            bucket.pending -= pending
+        
         try:
-            with self.in_memory_lock:
-                key = f"{identifier}:{operation}"
-                current_time = time.time()
-                
-                if key not in self.in_memory_counters:
-                    self.in_memory_counters[key] = []
-                
-                # Add current timestamp
-                self.in_memory_counters[key].append(current_time)
-                
-                # Clean old timestamps outside window
-                cutoff_time = current_time - window
-                self.in_memory_counters[key] = [
-                    ts for ts in self.in_memory_counters[key] if ts > cutoff_time
-                ]
-                
-                # Keep only last 1000 timestamps to prevent memory issues
-                if len(self.in_memory_counters[key]) > 1000:
-                    self.in_memory_counters[key] = self.in_memory_counters[key][-1000:]
-                    
+            pipe = redis_client.pipeline(transaction=False)
+            for bucket, pending in batch:
+                pipe.incrby(bucket.global_key, pending)
+                pipe.expire(bucket.global_key, bucket.window + 1)
+            results = await pipe.execute()
+            
+            for index, (bucket, pending) in enumerate(batch):
+                bucket.global_count = int(results[index * 2])
+                bucket.tokens = self._lease_tokens(bucket)
+            
+            self.limiter_stats["syncs"] += 1
+            return sum(pending for _, pending in batch)
+            
         except Exception as e:
-            self.logger.error(f"Error updating in-memory counter: {str(e)}")
+            for bucket, pending in batch:
+                bucket.pending += pending
+            self.limiter_stats["sync_errors"] += 1
+            self.logger.error(f"Error syncing rate limit usage: {str(e)}")
+            return 0
+    
+    def _ensure_sync_task(self):
+        """Start the background reconciliation loop on first use."""
+        if self._sync_task is None or self._sync_task.done():
+            try:
+                self._sync_task = asyncio.get_running_loop().create_task(self._sync_loop())
+            except RuntimeError:
+                self._sync_task = None
+    
+    async def _sync_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.sync_interval)
+                await self.sync_usage()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error in rate limit sync loop: {str(e)}")
+    
+    async def close(self):
+        """Stop the reconciliation loop and flush pending usage."""
+        if self._sync_task and not self._sync_task.done():
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+        self._sync_task = None
+        await self.sync_usage()
     
     async def set_custom_policy(
         self,
@@ -296,36 +417,37 @@ class RateLimitService:
             # Get policy
             policy = await self._get_policy(identifier, operation, user_tier)
             
-            # Get current counter
-            cache_key = f"rate_limit:{identifier}:{operation}:{policy.window}"
-            current_data = await self.cache_manager.get(cache_key)
-            
-            if not current_data:
-                return {
-                    "identifier": identifier,
-                    "operation": operation,
-                    "user_tier": user_tier,
-                    "policy": {
-                        "requests": policy.requests,
-                        "window": policy.window,
-                        "burst": policy.burst
-                    },
-                    "current_requests": 0,
-                    "requests_remaining": policy.requests,
-                    "reset_time": (datetime.utcnow() + timedelta(seconds=policy.window)).isoformat(),
-                    "window_start": datetime.utcnow().isoformat()
-                }
-            
-            window_start = datetime.fromisoformat(current_data["window_start"])
+            # Get current counter (global count plus local usage not yet reconciled)
+            window_id = int(time.time() // policy.window)
+            key = f"{identifier}:{operation}:{policy.window}"
+            bucket = self.local_buckets.get(key)
+            if bucket is not None and bucket.window_id != window_id:
+                bucket = None
+            
+            current_requests = 0
+            redis_client = self._get_redis()
+            if redis_client is not None:
+                current_requests = int(await redis_client.get(f"rate_limit:{key}:{window_id}") or 0)
+            elif bucket is not None:
+                current_requests = bucket.global_count
+            if bucket is not None:
+                current_requests += bucket.pending
+            
+            window_start = datetime.utcfromtimestamp(window_id * policy.window)
             reset_time = window_start + timedelta(seconds=policy.window)
             
             return {
                 "identifier": identifier,
                 "operation": operation,
                 "user_tier": user_tier,
-                "policy": current_data.get("policy"),
-                "current_requests": current_data.get("count", 0),
-                "requests_remaining": max(0, policy.requests - current_data.get("count", 0)),
+                "policy": {
+                    "requests": policy.requests,
+                    "window": policy.window,
+                    "burst": policy.burst
+                },
+                "current_requests": current_requests,
+                "requests_remaining": max(0, policy.requests - current_requests),
+                "local_tokens": bucket.tokens if bucket is not None else 0,
                 "reset_time": reset_time.isoformat(),
                 "window_start": window_start.isoformat()
             }
@@ -344,15 +466,15 @@ class RateLimitService:
             # Get policy to determine window
             policy = await self._get_policy(identifier, operation, "default")
             
-            # Delete cache entry
-            cache_key = f"rate_limit:{identifier}:{operation}:{policy.window}"
-            await self.cache_manager.delete(cache_key)
+            # Delete global counter
+            key = f"{identifier}:{operation}:{policy.window}"
+            redis_client = self._get_redis()
+            if redis_client is not None:
+                window_id = int(time.time() // policy.window)
+                await redis_client.delete(f"rate_limit:{key}:{window_id}")
             
-            # Clear in-memory counter
-            with self.in_memory_lock:
-                key = f"{identifier}:{operation}"
-                if key in self.in_memory_counters:
-                    del self.in_memory_counters[key]
+            # Clear local bucket
+            self.local_buckets.pop(key, None)
             
             self.logger.info(f"Reset rate limit for {identifier}:{operation}")
             return True
@@ -365,19 +487,23 @@ class RateLimitService:
         """Get rate limiting metrics."""
         try:
             # Count active rate limit entries
-            active_keys = 0
-            total_requests = 0
+            active_keys = len(self.local_buckets)
+            total_requests = self.limiter_stats["local_decisions"] + self.limiter_stats["global_decisions"]
             
             # This would scan cache keys in a real implementation
             # For now, return mock metrics
             return {
                 "active_rate_limits": active_keys,
                 "total_requests_checked": total_requests,
-                "requests_blocked": 0,
+                "requests_blocked": self.limiter_stats["requests_blocked"],
                 "average_utilization": 0.0,
                 "top_consumers": [],
                 "custom_policies_count": len(self.custom_policies),
-                "in_memory_counters": len(self.in_memory_counters),
+                "local_buckets": len(self.local_buckets),
+                "local_decisions": self.limiter_stats["local_decisions"],
+                "global_decisions": self.limiter_stats["global_decisions"],
+                "syncs": self.limiter_stats["syncs"],
+                "sync_errors": self.limiter_stats["sync_errors"],
                 "testing_mode": self.testing,
                 "timestamp": datetime.utcnow().isoformat()
             }
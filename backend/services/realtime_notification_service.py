@@ -264,6 +264,9 @@ class RealtimeNotificationService:
         self.scheduler_running = False
         self.scheduler_task: Optional[asyncio.Task] = None
         
+        # Load shedding: stretches market monitor intervals while the process is overloaded
+        self.monitor_interval_multiplier = 1.0
+        
         self.logger.info("RealtimeNotificationService initialized")
     
     async def start(self):
@@ -517,6 +520,17 @@ class RealtimeNotificationService:
         except Exception as e:
             self.logger.error(f"Fatal error in market monitoring: {str(e)}")
     
+    def set_monitor_interval_multiplier(self, multiplier: float):
+        """Scale the sleep between market monitor passes (1.0 restores normal cadence)."""
+        multiplier = max(1.0, float(multiplier))
+        if multiplier != self.monitor_interval_multiplier:
+            self.logger.info(f"Notification monitor interval multiplier set to {multiplier}")
+        self.monitor_interval_multiplier = multiplier
+    
+    async def _monitor_sleep(self, seconds: float):
+        """Sleep between monitor passes, stretched while load shedding is active."""
+        await asyncio.sleep(seconds * self.monitor_interval_multiplier)
+    
     async def _monitor_price_changes(self):
         """Monitor price changes with improved detection logic."""
         try:
@@ -537,11 +551,11 @@ class RealtimeNotificationService:
                     
                     # Dynamic sleep based on market hours
                     sleep_duration = self._get_market_aware_sleep_duration()
-                    await asyncio.sleep(sleep_duration)
+                    await self._monitor_sleep(sleep_duration)
                     
                 except Exception as e:
                     self.logger.error(f"Error in price change monitoring: {str(e)}")
-                    await asyncio.sleep(60)
+                    await self._monitor_sleep(60)
                     
         except asyncio.CancelledError:
             self.logger.info("Price change monitoring task cancelled")
@@ -559,11 +573,11 @@ class RealtimeNotificationService:
                         for symbol in subscription.symbols:
                             await self._process_sentiment_change_alert(user_id, symbol, subscription)
                     
-                    await asyncio.sleep(60)  # Check every minute for sentiment changes
+                    await self._monitor_sleep(60)  # Check every minute for sentiment changes
                     
                 except Exception as e:
                     self.logger.error(f"Error in sentiment change monitoring: {str(e)}")
-                    await asyncio.sleep(120)
+                    await self._monitor_sleep(120)
                     
         except asyncio.CancelledError:
             self.logger.info("Sentiment change monitoring task cancelled")
@@ -583,11 +597,11 @@ class RealtimeNotificationService:
                             
                             await self._process_trending_alerts(user_id, trending_stocks, subscription)
                     
-                    await asyncio.sleep(300)  # Check every 5 minutes for trending changes
+                    await self._monitor_sleep(300)  # Check every 5 minutes for trending changes
                     
                 except Exception as e:
                     self.logger.error(f"Error in trending stocks monitoring: {str(e)}")
-                    await asyncio.sleep(300)
+                    await self._monitor_sleep(300)
                     
         except asyncio.CancelledError:
             self.logger.info("Trending stocks monitoring task cancelled")
@@ -609,11 +623,11 @@ class RealtimeNotificationService:
                             if symbol in batch_data:
                                 await self._process_volume_spike_alert(user_id, symbol, batch_data[symbol])
                     
-                    await asyncio.sleep(60)  # Check every minute for volume spikes
+                    await self._monitor_sleep(60)  # Check every minute for volume spikes
                     
                 except Exception as e:
                     self.logger.error(f"Error in volume spike monitoring: {str(e)}")
-                    await asyncio.sleep(120)
+                    await self._monitor_sleep(120)
                     
         except asyncio.CancelledError:
             self.logger.info("Volume spike monitoring task cancelled")
@@ -629,11 +643,11 @@ class RealtimeNotificationService:
                     # Check for significant news
                     await self._check_significant_news()
                     
-                    await asyncio.sleep(600)  # Check every 10 minutes for market events
+                    await self._monitor_sleep(600)  # Check every 10 minutes for market events
                     
                 except Exception as e:
                     self.logger.error(f"Error in external market events monitoring: {str(e)}")
-                    await asyncio.sleep(300)
+                    await self._monitor_sleep(300)
                     
         except asyncio.CancelledError:
             self.logger.info("External market events monitoring task cancelled")
@@ -21,6 +21,7 @@ import threading
 from concurrent.futures import ThreadPoolExecutor
 
 from ..cache.unified_cache import UnifiedCacheManager
+from ..monitoring.system_metrics_sampler import system_metrics_sampler
 
 
 class OptimizationType(str, Enum):
@@ -209,18 +210,15 @@ class ResourceOptimizationService:
     async def _collect_resource_usage(self) -> ResourceUsage:
         """Collect current resource usage metrics."""
         try:
-            # System metrics
-            cpu_usage = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            # System metrics from the shared non-blocking sampler
+            snapshot = system_metrics_sampler.latest()
             
             # Network I/O
-            network = psutil.net_io_counters()
             network_io = {
-                'bytes_sent': network.bytes_sent,
-                'bytes_recv': network.bytes_recv,
-                'packets_sent': network.packets_sent,
-                'packets_recv': network.packets_recv
+                'bytes_sent': snapshot.network_bytes_sent,
+                'bytes_recv': snapshot.network_bytes_recv,
+                'packets_sent': snapshot.network_packets_sent,
+                'packets_recv': snapshot.network_packets_recv
             }
             
             # Cache metrics
@@ -231,11 +229,11 @@ class ResourceOptimizationService:
             
             return ResourceUsage(
                 timestamp=datetime.utcnow(),
-                cpu_usage=cpu_usage,
-                memory_usage=memory.percent,
-                memory_available=memory.available / (1024**3),  # GB
-                disk_usage=(disk.used / disk.total) * 100,
-                disk_available=disk.free / (1024**3),  # GB
+                cpu_usage=snapshot.cpu_percent,
+                memory_usage=snapshot.memory_percent,
+                memory_available=snapshot.memory_available / (1024**3),  # GB
+                disk_usage=snapshot.disk_percent,
+                disk_available=snapshot.disk_free / (1024**3),  # GB
                 network_io=network_io,
                 active_connections=await self._get_active_connections(),
                 cache_size=cache_stats.get('size', 0),
@@ -16,6 +16,7 @@ import logging
 import time
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from ..cache.sentiment_result_cache import sentiment_result_cache
 from ..models.unified_models import (
     StockMention, 
     SentimentResult, 
@@ -47,6 +48,10 @@ class SentimentService:
         # Cache TTL
         self.cache_ttl = 300  # 5 minutes
         
+        # Per-text score cache (the same post is seen under many symbols)
+        self.result_cache = sentiment_result_cache
+        self.result_cache_model_id = "vader_stock_lexicon"
+        
         # Session management
         self._sessions_created = False
     
@@ -334,6 +339,22 @@ class SentimentService:
     
     def analyze_sentiment(self, text: str) -> SentimentResult:
         """Analyze sentiment of text."""
+        scores = self.result_cache.get_local(self.result_cache_model_id, text)
+        if scores is None:
+            scores = self._score_text(text)
+            self.result_cache.set_local(self.result_cache_model_id, text, scores)
+        
+        return SentimentResult(
+            compound_score=scores['compound'],
+            positive_score=scores['pos'],
+            negative_score=scores['neg'],
+            neutral_score=scores['neu'],
+            confidence=scores['confidence'],
+            source=SentimentSource.NEWS  # Default source
+        )
+    
+    def _score_text(self, text: str) -> Dict[str, float]:
+        """Compute the weighted VADER and stock lexicon scores of text."""
         # Basic VADER analysis
         vader_scores = self.analyzer.polarity_scores(text)
         
@@ -350,14 +371,13 @@ class SentimentService:
         # Calculate confidence
         confidence = self._calculate_confidence(vader_scores, stock_scores)
         
-        return SentimentResult(
-            compound_score=compound_score,
-            positive_score=vader_scores['pos'],
-            negative_score=vader_scores['neg'],
-            neutral_score=vader_scores['neu'],
-            confidence=confidence,
-            source=SentimentSource.NEWS  # Default source
-        )
+        return {
+            'compound': compound_score,
+            'pos': vader_scores['pos'],
+            'neg': vader_scores['neg'],
+            'neu': vader_scores['neu'],
+            'confidence': confidence
+        }
     
     def _analyze_stock_specific_terms(self, text: str) -> Dict[str, float]:
         """Analyze stock-specific sentiment terms."""
@@ -12,16 +12,24 @@ import pandas as pd
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import logging
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor
 
 from ..models.unified_models import UnifiedStockData, StockType, SearchQuery
+from .ohlcv_store import ColumnarOHLCVStore
+from .symbol_index import CONFIDENT_MATCH_SCORE, SymbolIndex
 
 
 class StockService:
     """Stock data service for managing stock information and search."""
     
-    def __init__(self, cache_manager=None):
+    def __init__(
+        self,
+        cache_manager=None,
+        symbol_index: Optional[SymbolIndex] = None,
+        ohlcv_store: Optional[ColumnarOHLCVStore] = None
+    ):
         self.cache_manager = cache_manager
         self.logger = logging.getLogger(__name__)
         self.yahoo_session = None
@@ -34,6 +42,45 @@ class StockService:
         
         # Thread pool for synchronous operations
         self.executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Local symbol index; searches go to Yahoo only when it has no match
+        self.symbol_index = symbol_index or SymbolIndex()
+        self.listings_path = os.getenv('SYMBOL_LISTINGS_PATH')
+        if self.listings_path and os.path.exists(self.listings_path) and not self.symbol_index.is_loaded:
+            try:
+                self.symbol_index.load_file(self.listings_path)
+            except Exception as e:
+                self.logger.error(f"Error loading symbol listings from {self.listings_path}: {str(e)}")
+        
+        # Historical bars live in the columnar store; the cache only keeps pointers into it
+        self.ohlcv_store = ohlcv_store or ColumnarOHLCVStore(os.getenv('OHLCV_STORE_PATH', 'data/ohlcv'))
+        self.historical_interval = "1d"
+    
+    async def load_symbol_index(self, session_factory=None, watch_interval: float = 30.0,
+                                refresh_interval: float = 600.0) -> int:
+        """Load the local symbol index from the stocks table and/or the listings file.
+        
+        The listings file (SYMBOL_LISTINGS_PATH) takes precedence and is watched
+        for changes; otherwise listings come from the stocks table and are
+        reloaded every refresh_interval seconds.
+        """
+        try:
+            loop = asyncio.get_event_loop()
+            if self.listings_path and os.path.exists(self.listings_path):
+                count = await loop.run_in_executor(self.executor, self.symbol_index.load_file, self.listings_path)
+                self.symbol_index.start_watching(self.listings_path, watch_interval)
+            elif session_factory is not None:
+                count = await loop.run_in_executor(self.executor, self.symbol_index.load_from_database, session_factory)
+                self.symbol_index.start_database_refresh(session_factory, refresh_interval)
+            else:
+                return 0
+            
+            self.logger.info(f"Symbol index ready with {count} listings")
+            return count
+            
+        except Exception as e:
+            self.logger.error(f"Error loading symbol index: {str(e)}")
+            return 0
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
@@ -161,7 +208,12 @@ class StockService:
             cache_key = f"hist_{symbol}_{period}"
             if self.cache_manager:
                 cached_data = await self.cache_manager.get(cache_key)
-                if cached_data:
+                if isinstance(cached_data, dict) and "ohlcv_store" in cached_data:
+                    hist_data = await self._read_historical_pointer(cached_data["ohlcv_store"])
+                    if hist_data is not None:
+                        self.logger.info(f"Cache hit for historical data: {symbol}")
+                        return hist_data
+                elif cached_data:
                     self.logger.info(f"Cache hit for historical data: {symbol}")
                     # Handle both string and DataFrame objects
                     if isinstance(cached_data, str):
@@ -183,9 +235,11 @@ class StockService:
                 self.logger.warning(f"No historical data for {symbol}")
                 return None
             
-            # Cache the result
+            # Store the bars and cache a pointer to them
             if self.cache_manager:
-                await self.cache_manager.set(cache_key, hist_data.to_json(), ttl=self.cache_ttl)
+                pointer = await self._write_historical_data(symbol, hist_data)
+                cached_value = {"ohlcv_store": pointer} if pointer else hist_data.to_json()
+                await self.cache_manager.set(cache_key, cached_value, ttl=self.cache_ttl)
             
             self.logger.info(f"Successfully fetched historical data for: {symbol}")
             return hist_data
@@ -194,9 +248,56 @@ class StockService:
             self.logger.error(f"Error getting historical data for {symbol}: {str(e)}")
             return None
     
+    async def _write_historical_data(self, symbol: str, hist_data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """Append bars to the columnar store and return a cache pointer to them."""
+        try:
+            loop = asyncio.get_event_loop()
+            version = await loop.run_in_executor(
+                self.executor, self.ohlcv_store.write, symbol, self.historical_interval, hist_data
+            )
+            return {
+                "symbol": symbol,
+                "interval": self.historical_interval,
+                "start": hist_data.index[0].isoformat(),
+                "end": hist_data.index[-1].isoformat(),
+                "version": version
+            }
+        except Exception as e:
+            self.logger.error(f"Error storing historical data for {symbol}: {str(e)}")
+            return None
+    
+    async def _read_historical_pointer(self, pointer: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Read the bars a cache pointer refers to, or None if the store is behind it."""
+        try:
+            store_version = self.ohlcv_store.get_version(pointer["symbol"], pointer["interval"])
+            if store_version < pointer["version"]:
+                return None
+            
+            loop = asyncio.get_event_loop()
+            hist_data = await loop.run_in_executor(
+                self.executor,
+                self.ohlcv_store.read,
+                pointer["symbol"],
+                pointer["interval"],
+                pointer["start"],
+                pointer["end"]
+            )
+            return hist_data if hist_data is not None and not hist_data.empty else None
+            
+        except Exception as e:
+            self.logger.error(f"Error reading historical data for {pointer.get('symbol')}: {str(e)}")
+            return None
+    
     async def search_stocks(self, query: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Search for stocks based on query and filters."""
         try:
+            # Local index first: no network round trip or rate limiting needed
+            if self.symbol_index.is_loaded:
+                local_results = self.symbol_index.search(query, filters)
+                # Weak fuzzy hits alone fall through to Yahoo, which may know the symbol
+                if local_results and local_results[0]['relevance_score'] >= CONFIDENT_MATCH_SCORE:
+                    return local_results
+            
             await self._check_rate_limit()
             
             # Check cache first
@@ -430,6 +531,8 @@ class StockService:
     
     async def close(self):
         """Close HTTP session and thread pool."""
+        await self.symbol_index.stop_watching()
+        
         if self.yahoo_session and not self.yahoo_session.closed:
             await self.yahoo_session.close()
         
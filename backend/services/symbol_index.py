@@ -0,0 +1,395 @@
+"""
+In-process symbol search index for InsiteChart platform.
+
+Listings (from the ``stocks`` table or a local CSV/JSON listings file) are
+built into an immutable snapshot holding:
+
+- an exact ticker map,
+- sorted ticker and company-name arrays for bisect prefix lookups,
+- trigram postings over company names for fuzzy matching,
+- exchange / sector / stock type bitsets (Python ints) for filters.
+
+Searches read whichever snapshot is current, and reloads build a new one and
+swap the reference in a single assignment, so queries never see a partially
+built index.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import math
+import os
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Relevance scores, aligned with StockService._calculate_relevance_score
+EXACT_SYMBOL_SCORE = 100.0
+SYMBOL_PREFIX_SCORE = 80.0
+NAME_PREFIX_SCORE = 60.0
+FUZZY_NAME_MAX_SCORE = 50.0
+# Lowest top score trusted without a remote lookup: any exact or prefix hit,
+# or a fuzzy name match with at least 90% similarity
+CONFIDENT_MATCH_SCORE = 45.0
+
+
+@dataclass(frozen=True)
+class SymbolRecord:
+    """A single listing."""
+    symbol: str
+    company_name: str
+    stock_type: str = "EQUITY"
+    exchange: str = ""
+    sector: str = ""
+    industry: str = ""
+    market_cap: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SymbolRecord":
+        market_cap = data.get("market_cap")
+        return cls(
+            symbol=str(data.get("symbol", "")).strip().upper(),
+            company_name=str(data.get("company_name") or data.get("name") or "").strip(),
+            stock_type=str(data.get("stock_type") or "EQUITY").upper(),
+            exchange=str(data.get("exchange") or "").upper(),
+            sector=str(data.get("sector") or ""),
+            industry=str(data.get("industry") or ""),
+            market_cap=float(market_cap) if market_cap not in (None, "") else None
+        )
+
+    def to_dict(self, relevance_score: float = 0.0) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "company_name": self.company_name,
+            "stock_type": self.stock_type,
+            "exchange": self.exchange,
+            "sector": self.sector,
+            "industry": self.industry,
+            "market_cap": self.market_cap,
+            "relevance_score": relevance_score,
+            "data_sources": ["symbol_index"]
+        }
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct trigrams of a lower-cased, space-padded string."""
+    padded = f"  {' '.join(text.lower().split())} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+class SymbolIndexSnapshot:
+    """Immutable index over a list of listings."""
+
+    def __init__(self, records: Iterable[SymbolRecord], version: str = ""):
+        # Later duplicates replace earlier ones; ids are positions in self.records
+        by_symbol: Dict[str, SymbolRecord] = {}
+        for record in records:
+            if record.symbol:
+                by_symbol[record.symbol] = record
+        self.records: List[SymbolRecord] = list(by_symbol.values())
+        self.version = version
+        self.built_at = time.time()
+
+        self.symbol_ids: Dict[str, int] = {record.symbol: i for i, record in enumerate(self.records)}
+
+        symbol_order = sorted(range(len(self.records)), key=lambda i: self.records[i].symbol)
+        self.sorted_symbols = [self.records[i].symbol for i in symbol_order]
+        self.sorted_symbol_ids = symbol_order
+
+        name_order = sorted(range(len(self.records)), key=lambda i: self.records[i].company_name.lower())
+        self.sorted_names = [self.records[i].company_name.lower() for i in name_order]
+        self.sorted_name_ids = name_order
+
+        postings: Dict[str, List[int]] = {}
+        trigram_counts: List[int] = []
+        for record_id, record in enumerate(self.records):
+            grams = trigrams(record.company_name)
+            trigram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(record_id)
+        self.trigram_postings: Dict[str, np.ndarray] = {
+            gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+        self.trigram_counts = np.array(trigram_counts, dtype=np.float64)
+
+        self.exchange_bits = self._bitsets(lambda record: record.exchange.upper())
+        self.stock_type_bits = self._bitsets(lambda record: record.stock_type.upper())
+        self.sector_bits = self._bitsets(lambda record: record.sector.lower())
+
+    def _bitsets(self, key) -> Dict[str, int]:
+        bitsets: Dict[str, int] = {}
+        for record_id, record in enumerate(self.records):
+            value = key(record)
+            if value:
+                bitsets[value] = bitsets.get(value, 0) | (1 << record_id)
+        return bitsets
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+class SymbolIndex:
+    """Local symbol / company search with atomic hot reload."""
+
+    def __init__(self, max_fuzzy_trigrams: int = 6, max_fuzzy_postings: int = 5000,
+                 min_fuzzy_similarity: float = 0.3):
+        # Fuzzy matching looks up at most max_fuzzy_trigrams of the query's rarest
+        # trigrams and skips trigrams with more postings than max_fuzzy_postings
+        self.max_fuzzy_trigrams = max_fuzzy_trigrams
+        self.max_fuzzy_postings = max_fuzzy_postings
+        self.min_fuzzy_similarity = min_fuzzy_similarity
+
+        self._snapshot = SymbolIndexSnapshot([])
+        self._watch_task: Optional[asyncio.Task] = None
+        self._watched_mtime: Optional[float] = None
+
+        # Statistics
+        self.stats = {
+            "searches": 0,
+            "reloads": 0,
+            "reload_errors": 0
+        }
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self._snapshot) > 0
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    def load(self, records: Iterable[Any], version: Optional[str] = None) -> int:
+        """Build a new snapshot from records (SymbolRecord or dicts) and swap it in."""
+        parsed = [
+            record if isinstance(record, SymbolRecord) else SymbolRecord.from_dict(record)
+            for record in records
+        ]
+        snapshot = SymbolIndexSnapshot(parsed, version or str(int(time.time())))
+        self._snapshot = snapshot
+        self.stats["reloads"] += 1
+        logger.info(f"Symbol index loaded: {len(snapshot)} listings (version {snapshot.version})")
+        return len(snapshot)
+
+    def load_file(self, path: str) -> int:
+        """Load listings from a CSV (with a header row) or JSON list file."""
+        with open(path, "r", encoding="utf-8") as f:
+            if path.lower().endswith(".json"):
+                rows = json.load(f)
+            else:
+                rows = list(csv.DictReader(f))
+        mtime = os.path.getmtime(path)
+        count = self.load(rows, version=f"{os.path.basename(path)}@{int(mtime)}")
+        self._watched_mtime = mtime
+        return count
+
+    def load_from_database(self, session_factory) -> int:
+        """Load listings from the stocks table."""
+        from sqlalchemy import select
+        from ..models.database_models import Stock
+
+        stocks = Stock.__table__
+        session = session_factory()
+        try:
+            rows = session.execute(select(
+                stocks.c.symbol, stocks.c.company_name, stocks.c.stock_type,
+                stocks.c.exchange, stocks.c.sector, stocks.c.industry, stocks.c.market_cap
+            )).all()
+            return self.load([dict(row._mapping) for row in rows], version=f"db@{int(time.time())}")
+        finally:
+            session.close()
+
+    def reload_file_if_changed(self, path: str) -> bool:
+        """Reload a listings file if its modification time changed."""
+        try:
+            mtime = os.path.getmtime(path)
+            if mtime == self._watched_mtime:
+                return False
+            self.load_file(path)
+            return True
+        except Exception as e:
+            # Keep serving the previous snapshot
+            self.stats["reload_errors"] += 1
+            logger.error(f"Error reloading symbol listings from {path}: {str(e)}")
+            return False
+
+    def reload_from_database(self, session_factory) -> bool:
+        """Reload listings from the stocks table, keeping the current snapshot on failure."""
+        try:
+            self.load_from_database(session_factory)
+            return True
+        except Exception as e:
+            self.stats["reload_errors"] += 1
+            logger.error(f"Error reloading symbol listings from database: {str(e)}")
+            return False
+
+    def start_database_refresh(self, session_factory, interval: float = 600.0):
+        """Periodically rebuild the index from the stocks table."""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._database_refresh_loop(session_factory, interval))
+
+    def start_watching(self, path: str, interval: float = 30.0):
+        """Poll a listings file and hot-reload it when it changes."""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch_loop(path, interval))
+
+    async def stop_watching(self):
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+    async def _watch_loop(self, path: str, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            if os.path.exists(path):
+                # Parsing and building happen off the event loop
+                await asyncio.get_event_loop().run_in_executor(None, self.reload_file_if_changed, path)
+
+    async def _database_refresh_loop(self, session_factory, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.get_event_loop().run_in_executor(None, self.reload_from_database, session_factory)
+
+    def _filter_bitmap(self, snapshot: SymbolIndexSnapshot, filters: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Bitmap (one bit per listing) of listings passing the filters, or None when unfiltered."""
+        if not filters:
+            return None
+
+        masks = []
+        if filters.get("stock_type"):
+            masks.append(snapshot.stock_type_bits.get(str(filters["stock_type"]).upper(), 0))
+        if filters.get("exchange"):
+            masks.append(snapshot.exchange_bits.get(str(filters["exchange"]).upper(), 0))
+        if filters.get("sector"):
+            # Substring match on sector, as in StockService._apply_filters
+            wanted = str(filters["sector"]).lower()
+            sector_mask = 0
+            for sector, bits in snapshot.sector_bits.items():
+                if wanted in sector:
+                    sector_mask |= bits
+            masks.append(sector_mask)
+        if not masks:
+            return None
+
+        mask = masks[0]
+        for other in masks[1:]:
+            mask &= other
+        # Per-listing tests on a bytes view avoid shifting a 50k-bit integer per candidate
+        return mask.to_bytes((len(snapshot) + 7) // 8, "little")
+
+    def search(self, query: str, filters: Optional[Dict[str, Any]] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Search listings by ticker, ticker prefix, name prefix and fuzzy name.
+
+        Returns:
+            Result dicts ordered by relevance_score (highest first)
+        """
+        snapshot = self._snapshot  # read once; reloads swap the reference
+        self.stats["searches"] += 1
+
+        query = " ".join(query.split())
+        if not query or not len(snapshot):
+            return []
+
+        bitmap = self._filter_bitmap(snapshot, filters)
+        if bitmap is not None and not any(bitmap):
+            return []
+
+        def allowed(record_id: int) -> bool:
+            return bitmap is None or (bitmap[record_id >> 3] >> (record_id & 7)) & 1 == 1
+
+        scores: Dict[int, float] = {}
+
+        def collect(record_id: int, score: float):
+            if record_id not in scores and allowed(record_id):
+                scores[record_id] = score
+
+        upper = query.upper()
+        exact = snapshot.symbol_ids.get(upper)
+        if exact is not None:
+            collect(exact, EXACT_SYMBOL_SCORE)
+
+        self._collect_prefix(snapshot.sorted_symbols, snapshot.sorted_symbol_ids, upper,
+                             SYMBOL_PREFIX_SCORE, collect, scores, limit)
+        self._collect_prefix(snapshot.sorted_names, snapshot.sorted_name_ids, query.lower(),
+                             NAME_PREFIX_SCORE, collect, scores, limit)
+
+        # Fuzzy name matching is skipped for exact tickers and queries too short for trigrams
+        if len(scores) < limit and exact is None and len(query) >= 3:
+            for record_id, similarity in self._fuzzy_candidates(snapshot, query, bitmap, limit):
+                collect(record_id, round(FUZZY_NAME_MAX_SCORE * similarity, 2))
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1], len(snapshot.records[item[0]].symbol), snapshot.records[item[0]].symbol)
+        )
+        return [snapshot.records[record_id].to_dict(score) for record_id, score in ranked[:limit]]
+
+    @staticmethod
+    def _collect_prefix(sorted_keys: List[str], ids: List[int], prefix: str, score: float,
+                        collect, scores: Dict[int, float], limit: int):
+        position = bisect_left(sorted_keys, prefix)
+        while position < len(sorted_keys) and len(scores) < limit and sorted_keys[position].startswith(prefix):
+            collect(ids[position], score)
+            position += 1
+
+    def _fuzzy_candidates(self, snapshot: SymbolIndexSnapshot, query: str,
+                          bitmap: Optional[bytes], limit: int) -> List[Tuple[int, float]]:
+        """Best fuzzy name matches for a query.
+
+        Only the query's rarest trigrams are looked up (common ones such as
+        " in" in "Inc" would touch most of the index). Similarity is the share
+        of those trigrams found in the name, weighted by the trigram count ratio
+        so long names that merely contain the query rank lower.
+        """
+        query_grams = trigrams(query)
+        postings = sorted(
+            (ids for ids in (snapshot.trigram_postings.get(gram) for gram in query_grams) if ids is not None),
+            key=len
+        )
+        selective = [ids for ids in postings[:self.max_fuzzy_trigrams] if len(ids) <= self.max_fuzzy_postings]
+        if not selective:
+            return []
+
+        used = len(selective)
+        common = np.bincount(np.concatenate(selective), minlength=len(snapshot))
+        candidate_ids = np.flatnonzero(common >= max(1, math.ceil(self.min_fuzzy_similarity * used)))
+        if bitmap is not None and len(candidate_ids):
+            allowed = np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8), bitorder="little")
+            candidate_ids = candidate_ids[allowed[candidate_ids].astype(bool)]
+        if not len(candidate_ids):
+            return []
+
+        query_count = float(len(query_grams))
+        name_counts = snapshot.trigram_counts[candidate_ids]
+        similarity = (common[candidate_ids] / used) * (
+            np.minimum(name_counts, query_count) / np.maximum(name_counts, query_count)
+        )
+        keep = similarity >= self.min_fuzzy_similarity
+        candidate_ids, similarity = candidate_ids[keep], similarity[keep]
+        if len(candidate_ids) > limit:
+            top = np.argpartition(-similarity, limit)[:limit]
+            candidate_ids, similarity = candidate_ids[top], similarity[top]
+        order = np.argsort(-similarity, kind="stable")
+        return [(int(candidate_ids[i]), float(similarity[i])) for i in order]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index statistics."""
+        snapshot = self._snapshot
+        return {
+            **self.stats,
+            "listings": len(snapshot),
+            "version": snapshot.version,
+            "built_at": snapshot.built_at,
+            "trigrams": len(snapshot.trigram_postings),
+            "exchanges": len(snapshot.exchange_bits),
+            "sectors": len(snapshot.sector_bits)
+        }
@@ -20,6 +20,8 @@ from collections import defaultdict, deque
 import uuid
 
 from ..cache.unified_cache import UnifiedCacheManager
+from .threat_pattern_scanner import PatternScanResult, ThreatPatternScanner
+from .traffic_counters import SourceTrafficTracker
 
 
 class ThreatType(str, Enum):
@@ -153,14 +155,22 @@ class ThreatDetectionService:
             "critical": 90.0
         }
         
-        # Rate limiting
-        self.request_history = defaultdict(lambda: deque(maxlen=1000))
+        # Rate limiting: fixed-memory sliding-window counters per source IP
+        self.traffic_tracker = SourceTrafficTracker(
+            max_tracked_sources=self.config.get("max_tracked_sources", 20000)
+        )
+        self.traffic_tracker.register_window("requests", self.config.get("rate_limit_window", 60))
         self.blocked_ips = {}
         
         # Anomaly detection
         self.behavioral_patterns = {}
         self.anomaly_threshold = 2.0  # Standard deviations
         
+        # Compiled scanner for pattern rules (rebuilt only when rules change)
+        self.pattern_scanner = ThreatPatternScanner(
+            max_scan_length=self.config.get("max_scan_length", 65536)
+        )
+        
         # Initialize default security rules
         self._initialize_default_rules()
         
@@ -185,7 +195,9 @@ class ThreatDetectionService:
                 "max_risk_score": float(os.getenv('MAX_RISK_SCORE', '100.0')),
                 "log_retention_days": int(os.getenv('LOG_RETENTION_DAYS', '90')),
                 "ml_model_path": os.getenv('ML_MODEL_PATH', 'models/threat_detection.pkl'),
-                "update_rules_interval": int(os.getenv('UPDATE_RULES_INTERVAL', '3600'))  # 1 hour
+                "update_rules_interval": int(os.getenv('UPDATE_RULES_INTERVAL', '3600')),  # 1 hour
+                "max_scan_length": int(os.getenv('THREAT_MAX_SCAN_LENGTH', '65536')),  # characters scanned per request
+                "max_tracked_sources": int(os.getenv('THREAT_MAX_TRACKED_SOURCES', '20000'))
             }
         except Exception as e:
             self.logger.error(f"Error loading threat detection configuration: {str(e)}")
@@ -264,12 +276,21 @@ class ThreatDetectionService:
             
             for rule in default_rules:
                 self.security_rules[rule.rule_id] = rule
+                self._register_rule_windows(rule)
             
             self.logger.info(f"Initialized {len(default_rules)} default security rules")
             
         except Exception as e:
             self.logger.error(f"Error initializing default rules: {str(e)}")
     
+    def _register_rule_windows(self, rule: SecurityRule):
+        """Register the sliding windows a rate-based rule counts over."""
+        if rule.threat_type == ThreatType.BRUTE_FORCE:
+            self.traffic_tracker.register_window("login", rule.conditions.get("time_window", 300))
+        elif rule.threat_type == ThreatType.DDOS:
+            self.traffic_tracker.register_window("requests", 60)
+            self.traffic_tracker.register_window("requests", 10)
+    
     async def _monitoring_loop(self):
         """Main monitoring loop for threat detection."""
         while True:
@@ -339,12 +360,17 @@ class ThreatDetectionService:
                 total_risk_score += 30.0
                 response_actions.append(ResponseAction.RATE_LIMIT)
             
-            # Pattern-based detection
+            # Pattern-based detection (all pattern rules in one compiled scan)
+            scan_result = self._scan_patterns(request_data)
+            
             for rule_id, rule in self.security_rules.items():
                 if not rule.enabled:
                     continue
                 
-                threat_result = await self._check_security_rule(rule, request_data)
+                if self._is_pattern_rule(rule):
+                    threat_result = self._evaluate_pattern_matches(rule, scan_result.matches.get(rule_id))
+                else:
+                    threat_result = await self._check_security_rule(rule, request_data)
                 if threat_result["detected"]:
                     threats_detected.append({
                         "type": rule.threat_type,
@@ -397,12 +423,16 @@ class ThreatDetectionService:
                     "threat_detected": True,
                     "threats": threats_detected,
                     "total_risk_score": total_risk_score,
-                    "actions": response_actions
+                    "actions": response_actions,
+                    "fired_rules": scan_result.fired_rules,
+                    "scan_truncated": scan_result.truncated
                 }
             
             return {
                 "threat_detected": False,
-                "risk_score": total_risk_score
+                "risk_score": total_risk_score,
+                "fired_rules": scan_result.fired_rules,
+                "scan_truncated": scan_result.truncated
             }
             
         except Exception as e:
@@ -426,36 +456,56 @@ class ThreatDetectionService:
             self.logger.error(f"Error checking security rule {rule.rule_id}: {str(e)}")
             return {"detected": False, "error": str(e)}
     
+    def _is_pattern_rule(self, rule: SecurityRule) -> bool:
+        """Whether a rule is evaluated by the compiled pattern scanner."""
+        return bool(rule.pattern) and rule.threat_type not in (ThreatType.BRUTE_FORCE, ThreatType.DDOS)
+    
+    def _build_scan_text(self, request_data: Dict[str, Any]) -> str:
+        """Combine request path, body and query parameters into the text to scan."""
+        request_body = request_data.get("body", "")
+        request_path = request_data.get("path", "")
+        query_params = request_data.get("query_params", {})
+        
+        parts = [str(request_path), str(request_body)]
+        parts.extend(f"{key}={value}" for key, value in query_params.items())
+        return " ".join(parts)
+    
+    def _scan_patterns(self, request_data: Dict[str, Any]) -> PatternScanResult:
+        """Scan request with all enabled pattern rules."""
+        try:
+            self.pattern_scanner.compile(
+                rule for rule in self.security_rules.values()
+                if rule.enabled and self._is_pattern_rule(rule)
+            )
+            return self.pattern_scanner.scan(self._build_scan_text(request_data))
+            
+        except Exception as e:
+            self.logger.error(f"Error scanning request patterns: {str(e)}")
+            return PatternScanResult()
+    
+    def _evaluate_pattern_matches(self, rule: SecurityRule, matches: Optional[List[Any]]) -> Dict[str, Any]:
+        """Turn the matches of one pattern rule into a detection result."""
+        if matches:
+            confidence = min(len(matches) * 0.2, 1.0)  # Confidence based on number of matches
+            min_confidence = rule.conditions.get("min_confidence", 0.5)
+            
+            if confidence >= min_confidence:
+                risk_score = self._calculate_risk_score(rule.severity, confidence)
+                return {
+                    "detected": True,
+                    "risk_score": risk_score,
+                    "description": f"Pattern '{rule.pattern}' matched {len(matches)} times",
+                    "confidence": confidence,
+                    "matches": matches
+                }
+        
+        return {"detected": False, "risk_score": 0.0}
+    
     async def _check_pattern_rule(self, rule: SecurityRule, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Check pattern-based security rule."""
         try:
-            # Extract relevant data from request
-            request_body = request_data.get("body", "")
-            request_path = request_data.get("path", "")
-            query_params = request_data.get("query_params", {})
-            
-            # Combine all text data for pattern matching
-            text_data = f"{request_path} {request_body}"
-            for key, value in query_params.items():
-                text_data += f" {key}={value}"
-            
-            # Check pattern
-            matches = re.findall(rule.pattern, text_data)
-            if matches:
-                confidence = min(len(matches) * 0.2, 1.0)  # Confidence based on number of matches
-                min_confidence = rule.conditions.get("min_confidence", 0.5)
-                
-                if confidence >= min_confidence:
-                    risk_score = self._calculate_risk_score(rule.severity, confidence)
-                    return {
-                        "detected": True,
-                        "risk_score": risk_score,
-                        "description": f"Pattern '{rule.pattern}' matched {len(matches)} times",
-                        "confidence": confidence,
-                        "matches": matches
-                    }
-            
-            return {"detected": False, "risk_score": 0.0}
+            scan_result = self._scan_patterns(request_data)
+            return self._evaluate_pattern_matches(rule, scan_result.matches.get(rule.rule_id))
             
         except Exception as e:
             self.logger.error(f"Error checking pattern rule {rule.rule_id}: {str(e)}")
@@ -474,19 +524,16 @@ class ThreatDetectionService:
                 return {"detected": False, "risk_score": 0.0}
             
             # Get recent login attempts
-            current_time = time.time()
-            recent_attempts = [
-                req_time for req_time in self.request_history[source_ip]
-                if current_time - req_time <= time_window
-            ]
+            self.traffic_tracker.register_window("login", time_window)
+            recent_attempts = self.traffic_tracker.count(source_ip, "login", time_window, time.time())
             
-            if len(recent_attempts) >= max_attempts:
+            if recent_attempts >= max_attempts:
                 risk_score = self._calculate_risk_score(rule.severity, 1.0)
                 return {
                     "detected": True,
                     "risk_score": risk_score,
-                    "description": f"{len(recent_attempts)} login attempts in {time_window} seconds",
-                    "attempts": len(recent_attempts),
+                    "description": f"{recent_attempts} login attempts in {time_window} seconds",
+                    "attempts": recent_attempts,
                     "time_window": time_window
                 }
             
@@ -505,37 +552,29 @@ class ThreatDetectionService:
             
             # Get recent requests
             current_time = time.time()
-            one_minute_ago = current_time - 60
-            recent_requests = [
-                req_time for req_time in self.request_history[source_ip]
-                if req_time >= one_minute_ago
-            ]
+            recent_requests = self.traffic_tracker.count(source_ip, "requests", 60, current_time)
             
             # Check sustained rate
-            if len(recent_requests) >= requests_per_minute:
+            if recent_requests >= requests_per_minute:
                 risk_score = self._calculate_risk_score(rule.severity, 1.0)
                 return {
                     "detected": True,
                     "risk_score": risk_score,
-                    "description": f"{len(recent_requests)} requests in last minute",
-                    "requests_per_minute": len(recent_requests),
+                    "description": f"{recent_requests} requests in last minute",
+                    "requests_per_minute": recent_requests,
                     "threshold": requests_per_minute
                 }
             
             # Check burst rate (last 10 seconds)
-            ten_seconds_ago = current_time - 10
-            burst_requests = [
-                req_time for req_time in self.request_history[source_ip]
-                if req_time >= ten_seconds_ago
-            ]
+            burst_requests = self.traffic_tracker.count(source_ip, "requests", 10, current_time)
             
-            if len(burst_requests) >= burst_threshold:
+            if burst_requests >= burst_threshold:
                 risk_score = self._calculate_risk_score(rule.severity, 0.8)
                 return {
                     "detected": True,
                     "risk_score": risk_score,
-                    "description": f"{len(burst_requests)} requests in last 10 seconds",
-                    "burst_requests": len(burst_requests),
+                    "description": f"{burst_requests} requests in last 10 seconds",
+                    "burst_requests": burst_requests,
                     "threshold": burst_threshold
                 }
             
@@ -628,20 +667,14 @@ class ThreatDetectionService:
             rate_limit_requests = self.config.get("rate_limit_requests", 100)
             rate_limit_window = self.config.get("rate_limit_window", 60)
             
-            current_time = time.time()
-            window_start = current_time - rate_limit_window
-            
             # Count requests in window
-            recent_requests = [
-                req_time for req_time in self.request_history[source_ip]
-                if req_time >= window_start
-            ]
+            recent_requests = self.traffic_tracker.count(source_ip, "requests", rate_limit_window, time.time())
             
-            if len(recent_requests) >= rate_limit_requests:
+            if recent_requests >= rate_limit_requests:
                 return {
                     "violated": True,
-                    "description": f"Rate limit exceeded: {len(recent_requests)} requests in {rate_limit_window} seconds",
-                    "requests": len(recent_requests),
+                    "description": f"Rate limit exceeded: {recent_requests} requests in {rate_limit_window} seconds",
+                    "requests": recent_requests,
                     "limit": rate_limit_requests
                 }
             
@@ -672,7 +705,10 @@ class ThreatDetectionService:
         """Update request history for IP address."""
         try:
             current_time = time.time()
-            self.request_history[source_ip].append(current_time)
+            self.traffic_tracker.record(source_ip, "requests", current_time)
+            
+            if "login" in str(request_data.get("path", "")).lower():
+                self.traffic_tracker.record(source_ip, "login", current_time)
             
         except Exception as e:
             self.logger.error(f"Error updating request history: {str(e)}")
@@ -1135,7 +1171,12 @@ class ThreatDetectionService:
                 },
                 "security_rules": {
                     "total_rules": len(self.security_rules),
-                    "enabled_rules": len([r for r in self.security_rules.values() if r.enabled])
+                    "enabled_rules": len([r for r in self.security_rules.values() if r.enabled]),
+                    "pattern_scanner": self.pattern_scanner.get_stats()
+                },
+                "traffic": {
+                    **self.traffic_tracker.get_stats(),
+                    "top_sources": self.traffic_tracker.top_sources(10, time.time())
                 },
                 "configuration": {
                     "detection_enabled": self.detection_enabled,
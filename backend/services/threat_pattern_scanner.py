@@ -0,0 +1,200 @@
+"""
+Compiled multi-pattern scanner for threat detection rules.
+
+Every pattern rule is compiled once, and the literal strings that any match of
+the rule must contain are extracted from its parsed pattern. A request is first
+checked for those literals (case-folded substring search, shared between rules),
+and only the rules whose literals occur are confirmed with their own compiled
+regex. Clean requests therefore cost one pass per distinct literal instead of
+one regex scan per rule. Rules without an extractable literal are always
+confirmed.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+logger = logging.getLogger(__name__)
+
+_REPEAT_OPS = {"MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"}
+
+
+def _better_literals(current: Optional[Set[str]], candidate: Optional[Set[str]]) -> Optional[Set[str]]:
+    """Pick the more selective literal set (longest shortest literal, then fewest literals)."""
+    if not candidate:
+        return current
+    if not current:
+        return candidate
+    current_key = (min(map(len, current)), -len(current))
+    candidate_key = (min(map(len, candidate)), -len(candidate))
+    return candidate if candidate_key > current_key else current
+
+
+def required_literals(parsed) -> Optional[Set[str]]:
+    """Literals of which every match of a parsed pattern contains at least one.
+
+    Returns:
+        Case-folded literal set, or None if no literal is required
+    """
+    best: Optional[Set[str]] = None
+    run: List[str] = []
+
+    for op, av in parsed:
+        name = str(op)
+        if name == "LITERAL":
+            run.append(chr(av))
+            continue
+
+        if run:
+            best = _better_literals(best, {"".join(run).casefold()})
+            run = []
+
+        candidate = None
+        if name == "SUBPATTERN":
+            candidate = required_literals(av[-1])
+        elif name == "ATOMIC_GROUP":
+            candidate = required_literals(av)
+        elif name == "BRANCH":
+            branches = [required_literals(branch) for branch in av[1]]
+            if all(branches):
+                candidate = set().union(*branches)
+        elif name in _REPEAT_OPS:
+            minimum, _, item = av
+            if minimum >= 1:
+                candidate = required_literals(item)
+
+        best = _better_literals(best, candidate)
+
+    if run:
+        best = _better_literals(best, {"".join(run).casefold()})
+
+    return best
+
+
+@dataclass
+class PatternScanResult:
+    """Result of scanning one request."""
+    matches: Dict[str, List[Any]] = field(default_factory=dict)  # rule_id -> re.findall() result
+    scanned_length: int = 0
+    truncated: bool = False
+
+    @property
+    def fired_rules(self) -> List[str]:
+        return list(self.matches.keys())
+
+
+class ThreatPatternScanner:
+    """Compiles enabled pattern rules into one scanner and recompiles only when they change."""
+
+    def __init__(self, max_scan_length: int = 65536):
+        self.max_scan_length = max_scan_length
+
+        self._signature: Optional[Tuple[Tuple[str, str], ...]] = None
+        self._rule_order: List[str] = []
+        self._rule_patterns: Dict[str, Pattern] = {}
+        self._literal_rules: Dict[str, List[str]] = {}  # literal -> rule ids
+        self._unfiltered_rules: List[str] = []
+
+        # Statistics
+        self.stats = {
+            "compilations": 0,
+            "scans": 0,
+            "clean_scans": 0,
+            "truncated_scans": 0,
+            "confirmations": 0,
+            "invalid_rules": 0
+        }
+
+    def compile(self, rules: Iterable[Any]) -> bool:
+        """Compile pattern rules (objects with rule_id and pattern).
+
+        Returns:
+            True if the scanner was rebuilt, False if the rules were unchanged
+        """
+        rules = [rule for rule in rules if rule.pattern]
+        signature = tuple((rule.rule_id, rule.pattern) for rule in rules)
+        if signature == self._signature:
+            return False
+
+        rule_order: List[str] = []
+        rule_patterns: Dict[str, Pattern] = {}
+        literal_rules: Dict[str, List[str]] = {}
+        unfiltered_rules: List[str] = []
+
+        for rule in rules:
+            try:
+                rule_patterns[rule.rule_id] = re.compile(rule.pattern)
+            except re.error as e:
+                self.stats["invalid_rules"] += 1
+                logger.error(f"Invalid pattern in security rule {rule.rule_id}: {str(e)}")
+                continue
+
+            rule_order.append(rule.rule_id)
+            try:
+                literals = required_literals(sre_parse.parse(rule.pattern))
+            except Exception as e:
+                logger.error(f"Error extracting literals from rule {rule.rule_id}: {str(e)}")
+                literals = None
+
+            if not literals:
+                unfiltered_rules.append(rule.rule_id)
+                continue
+            for literal in literals:
+                literal_rules.setdefault(literal, []).append(rule.rule_id)
+
+        self._signature = signature
+        self._rule_order = rule_order
+        self._rule_patterns = rule_patterns
+        self._literal_rules = literal_rules
+        self._unfiltered_rules = unfiltered_rules
+        self.stats["compilations"] += 1
+        logger.info(
+            f"Compiled {len(rule_order)} threat patterns with {len(literal_rules)} prefilter literals "
+            f"({len(unfiltered_rules)} without prefilter)"
+        )
+        return True
+
+    def scan(self, text: str) -> PatternScanResult:
+        """Scan text (capped at max_scan_length) and return the rules that fired."""
+        truncated = len(text) > self.max_scan_length
+        if truncated:
+            text = text[:self.max_scan_length]
+            self.stats["truncated_scans"] += 1
+        self.stats["scans"] += 1
+
+        candidates = set(self._unfiltered_rules)
+        if self._literal_rules:
+            folded = text.casefold()
+            for literal, rule_ids in self._literal_rules.items():
+                if literal in folded:
+                    candidates.update(rule_ids)
+
+        matches: Dict[str, List[Any]] = {}
+        if candidates:
+            for rule_id in self._rule_order:
+                if rule_id in candidates:
+                    found = self._rule_patterns[rule_id].findall(text)
+                    if found:
+                        matches[rule_id] = found
+            self.stats["confirmations"] += len(candidates)
+
+        if not matches:
+            self.stats["clean_scans"] += 1
+
+        return PatternScanResult(matches=matches, scanned_length=len(text), truncated=truncated)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Scanner statistics."""
+        return {
+            **self.stats,
+            "compiled_rules": len(self._rule_order),
+            "prefilter_literals": len(self._literal_rules),
+            "unfiltered_rules": len(self._unfiltered_rules),
+            "max_scan_length": self.max_scan_length
+        }
@@ -0,0 +1,604 @@
+"""
+Time-series storage engines for TimescaleService.
+
+``TimeSeriesStorage`` is the interface TimescaleService writes to and reads
+from. ``SQLiteTimeSeriesStorage`` implements it locally with:
+
+- raw tables for stock (OHLCV) and sentiment samples plus a generic JSON
+  table for the other hypertables,
+- ``time_bucket``-style GROUP BY on integer epoch buckets,
+- 1m/5m/1h/1d rollup tables maintained incrementally: inserts record the
+  touched time range per symbol in ``rollup_pending`` (in the same
+  transaction), and a refresh recomputes only the buckets in those ranges,
+  cascading 1m -> 5m -> 1h -> 1d,
+- query planning that reads the coarsest rollup whose width divides the
+  requested resolution.
+
+All SQLite work runs on a single worker thread, which also serializes writes.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rollup resolutions, finest first: (name, width in seconds)
+ROLLUP_RESOLUTIONS: List[Tuple[str, int]] = [("1m", 60), ("5m", 300), ("1h", 3600), ("1d", 86400)]
+
+OHLCV_TABLE = "stock_data"
+SENTIMENT_TABLE = "sentiment_data"
+
+_INTERVAL_UNITS = {
+    "s": 1, "sec": 1, "second": 1, "seconds": 1,
+    "m": 60, "min": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hour": 3600, "hours": 3600,
+    "d": 86400, "day": 86400, "days": 86400,
+    "w": 604800, "week": 604800, "weeks": 604800
+}
+
+
+def parse_interval(value: Any) -> Optional[int]:
+    """Parse "5m", "1 hour", "1d" or a number of seconds into seconds."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = re.fullmatch(r"\s*(\d+)\s*([a-zA-Z]+)\s*", str(value))
+    if not match or match.group(2).lower() not in _INTERVAL_UNITS:
+        raise ValueError(f"Invalid interval: {value}")
+    return int(match.group(1)) * _INTERVAL_UNITS[match.group(2).lower()]
+
+
+def to_epoch(value: Any) -> float:
+    """Convert a datetime (naive = UTC), ISO string or number to epoch seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    raise ValueError(f"Invalid timestamp: {value!r}")
+
+
+def from_epoch(value: float) -> datetime:
+    """Epoch seconds to a naive UTC datetime (the convention used across the backend)."""
+    return datetime.utcfromtimestamp(value)
+
+
+def bucket_expr(column: str, width: int) -> str:
+    """SQL equivalent of time_bucket(width, column) for epoch-second columns."""
+    return f"(CAST({column} / {width} AS INTEGER) * {width})"
+
+
+class TimeSeriesStorage(ABC):
+    """Storage engine interface used by TimescaleService."""
+
+    @abstractmethod
+    async def insert(self, table_name: str, rows: List[Dict[str, Any]]) -> int:
+        """Insert rows (each with a "timestamp") and return the number inserted."""
+
+    @abstractmethod
+    async def query(
+        self,
+        table_name: str,
+        symbol: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 1000,
+        resolution: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Query rows, bucketed to ``resolution`` seconds when given."""
+
+    @abstractmethod
+    async def refresh_rollups(self) -> Dict[str, int]:
+        """Bring rollups up to date with newly inserted data."""
+
+    @abstractmethod
+    async def get_table_stats(self, table_name: str) -> Dict[str, Any]:
+        """Row counts for a table and its rollups."""
+
+    @abstractmethod
+    async def drop_table(self, table_name: str) -> int:
+        """Delete all data of a table and its rollups."""
+
+    @abstractmethod
+    async def close(self):
+        """Release resources."""
+
+
+class SQLiteTimeSeriesStorage(TimeSeriesStorage):
+    """SQLite storage with incrementally maintained rollups."""
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="timeseries-sqlite")
+
+        # Statistics
+        self.stats = {
+            "rows_inserted": 0,
+            "rollup_refreshes": 0,
+            "buckets_refreshed": 0,
+            "queries": 0,
+            "rollup_queries": 0
+        }
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path != ":memory:" and os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            if self.path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(connection)
+            self._connection = connection
+        return self._connection
+
+    def _create_schema(self, connection: sqlite3.Connection):
+        statements = [
+            f"""CREATE TABLE IF NOT EXISTS {OHLCV_TABLE} (
+                symbol TEXT NOT NULL, ts REAL NOT NULL,
+                open REAL, high REAL, low REAL, close REAL NOT NULL,
+                volume REAL NOT NULL DEFAULT 0, market_cap REAL)""",
+            f"CREATE INDEX IF NOT EXISTS idx_{OHLCV_TABLE}_symbol_ts ON {OHLCV_TABLE} (symbol, ts)",
+            f"""CREATE TABLE IF NOT EXISTS {SENTIMENT_TABLE} (
+                symbol TEXT NOT NULL, ts REAL NOT NULL, score REAL NOT NULL,
+                mentions INTEGER NOT NULL DEFAULT 1, confidence REAL, source TEXT)""",
+            f"CREATE INDEX IF NOT EXISTS idx_{SENTIMENT_TABLE}_symbol_ts ON {SENTIMENT_TABLE} (symbol, ts)",
+            """CREATE TABLE IF NOT EXISTS series_data (
+                table_name TEXT NOT NULL, series TEXT, ts REAL NOT NULL, payload TEXT NOT NULL)""",
+            "CREATE INDEX IF NOT EXISTS idx_series_data_table_ts ON series_data (table_name, series, ts)",
+            """CREATE TABLE IF NOT EXISTS rollup_pending (
+                kind TEXT NOT NULL, symbol TEXT NOT NULL, min_ts REAL NOT NULL, max_ts REAL NOT NULL,
+                PRIMARY KEY (kind, symbol))"""
+        ]
+        for name, _ in ROLLUP_RESOLUTIONS:
+            statements.append(f"""CREATE TABLE IF NOT EXISTS ohlcv_{name} (
+                symbol TEXT NOT NULL, bucket INTEGER NOT NULL,
+                open REAL, high REAL, low REAL, close REAL, volume REAL,
+                open_ts REAL, close_ts REAL, samples INTEGER,
+                PRIMARY KEY (symbol, bucket))""")
+            statements.append(f"""CREATE TABLE IF NOT EXISTS sentiment_{name} (
+                symbol TEXT NOT NULL, bucket INTEGER NOT NULL,
+                score_sum REAL, score_min REAL, score_max REAL, mentions INTEGER, samples INTEGER,
+                PRIMARY KEY (symbol, bucket))""")
+        with connection:
+            for statement in statements:
+                connection.execute(statement)
+
+    # Inserts
+
+    async def insert(self, table_name: str, rows: List[Dict[str, Any]]) -> int:
+        return await self._run(self._insert_sync, table_name, rows)
+
+    def _insert_sync(self, table_name: str, rows: List[Dict[str, Any]]) -> int:
+        connection = self._connect()
+        pending: Dict[str, List[float]] = {}
+
+        def touch(symbol: str, ts: float):
+            bounds = pending.get(symbol)
+            if bounds is None:
+                pending[symbol] = [ts, ts]
+            else:
+                bounds[0] = min(bounds[0], ts)
+                bounds[1] = max(bounds[1], ts)
+
+        with connection:
+            if table_name == OHLCV_TABLE:
+                params = []
+                for row in rows:
+                    ts = to_epoch(row["timestamp"])
+                    close = row.get("close", row.get("price"))
+                    params.append((
+                        row["symbol"], ts,
+                        row.get("open", close), row.get("high", close), row.get("low", close), close,
+                        row.get("volume") or 0, row.get("market_cap")
+                    ))
+                    touch(row["symbol"], ts)
+                connection.executemany(
+                    f"INSERT INTO {OHLCV_TABLE} (symbol, ts, open, high, low, close, volume, market_cap) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", params
+                )
+            elif table_name == SENTIMENT_TABLE:
+                params = []
+                for row in rows:
+                    ts = to_epoch(row["timestamp"])
+                    score = row.get("compound_score", row.get("sentiment_score", row.get("score")))
+                    params.append((
+                        row["symbol"], ts, score, row.get("mention_count", row.get("mentions", 1)),
+                        row.get("confidence"), row.get("source")
+                    ))
+                    touch(row["symbol"], ts)
+                connection.executemany(
+                    f"INSERT INTO {SENTIMENT_TABLE} (symbol, ts, score, mentions, confidence, source) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", params
+                )
+            else:
+                params = []
+                for row in rows:
+                    payload = {key: value for key, value in row.items() if key != "timestamp"}
+                    series = row.get("symbol", row.get("market", row.get("user_id")))
+                    params.append((
+                        table_name, str(series) if series is not None else None,
+                        to_epoch(row["timestamp"]), json.dumps(payload, default=str)
+                    ))
+                connection.executemany(
+                    "INSERT INTO series_data (table_name, series, ts, payload) VALUES (?, ?, ?, ?)", params
+                )
+
+            if pending:
+                connection.executemany(
+                    """INSERT INTO rollup_pending (kind, symbol, min_ts, max_ts) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (kind, symbol) DO UPDATE SET
+                        min_ts = MIN(min_ts, excluded.min_ts), max_ts = MAX(max_ts, excluded.max_ts)""",
+                    [(table_name, symbol, bounds[0], bounds[1]) for symbol, bounds in pending.items()]
+                )
+
+        self.stats["rows_inserted"] += len(rows)
+        return len(rows)
+
+    # Rollups
+
+    async def refresh_rollups(self) -> Dict[str, int]:
+        return await self._run(self._refresh_rollups_sync, None)
+
+    def _refresh_rollups_sync(self, symbol: Optional[str] = None) -> Dict[str, int]:
+        """Recompute rollup buckets over pending ranges (optionally one symbol only)."""
+        connection = self._connect()
+        if symbol is None:
+            pending = connection.execute("SELECT kind, symbol, min_ts, max_ts FROM rollup_pending").fetchall()
+        else:
+            pending = connection.execute(
+                "SELECT kind, symbol, min_ts, max_ts FROM rollup_pending WHERE symbol = ?", (symbol,)
+            ).fetchall()
+
+        refreshed: Dict[str, int] = {}
+        if not pending:
+            return refreshed
+
+        with connection:
+            for kind, pending_symbol, min_ts, max_ts in pending:
+                for name, width in ROLLUP_RESOLUTIONS:
+                    start = int(min_ts // width) * width
+                    end = int(max_ts // width) * width + width
+                    if kind == OHLCV_TABLE:
+                        count = self._refresh_ohlcv_buckets(connection, name, width, pending_symbol, start, end)
+                    else:
+                        count = self._refresh_sentiment_buckets(connection, name, width, pending_symbol, start, end)
+                    refreshed[f"{kind}_{name}"] = refreshed.get(f"{kind}_{name}", 0) + count
+                connection.execute(
+                    "DELETE FROM rollup_pending WHERE kind = ? AND symbol = ? AND min_ts = ? AND max_ts = ?",
+                    (kind, pending_symbol, min_ts, max_ts)
+                )
+
+        self.stats["rollup_refreshes"] += 1
+        self.stats["buckets_refreshed"] += sum(refreshed.values())
+        return refreshed
+
+    def _finer_source(self, prefix: str, name: str) -> Optional[Tuple[str, int]]:
+        """The next finer rollup table (None for the finest, which reads raw data)."""
+        names = [n for n, _ in ROLLUP_RESOLUTIONS]
+        index = names.index(name)
+        if index == 0:
+            return None
+        finer_name, finer_width = ROLLUP_RESOLUTIONS[index - 1]
+        return f"{prefix}_{finer_name}", finer_width
+
+    @staticmethod
+    def _ohlcv_select(source: str, time_column: str, open_column: str, close_column: str,
+                      volume_expr: str, samples_expr: str, open_ts_expr: str, close_ts_expr: str,
+                      width: int, where: str) -> str:
+        """Bucketed OHLCV select over a source table.
+
+        Open and close use SQLite's documented bare-column behaviour: with a
+        single MIN() or MAX() aggregate, other selected columns come from the
+        row holding that minimum/maximum.
+        """
+        bucket = bucket_expr(time_column, width)
+        return f"""
+            SELECT a.symbol, a.out_bucket AS bucket, o.open, a.high, a.low, c.close, a.volume,
+                   a.open_ts, a.close_ts, a.samples
+            FROM (
+                SELECT symbol, {bucket} AS out_bucket, MAX(high) AS high, MIN(low) AS low,
+                       {volume_expr} AS volume, {open_ts_expr} AS open_ts, {close_ts_expr} AS close_ts,
+                       {samples_expr} AS samples
+                FROM {source} WHERE {where} GROUP BY symbol, out_bucket
+            ) a
+            JOIN (
+                SELECT symbol, {bucket} AS out_bucket, MIN({time_column}), {open_column} AS open
+                FROM {source} WHERE {where} GROUP BY symbol, out_bucket
+            ) o ON o.symbol = a.symbol AND o.out_bucket = a.out_bucket
+            JOIN (
+                SELECT symbol, {bucket} AS out_bucket, MAX({time_column}), {close_column} AS close
+                FROM {source} WHERE {where} GROUP BY symbol, out_bucket
+            ) c ON c.symbol = a.symbol AND c.out_bucket = a.out_bucket
+        """
+
+    def _ohlcv_source_select(self, source: Optional[Tuple[str, int]], width: int, where: str) -> str:
+        if source is None:
+            return self._ohlcv_select(
+                OHLCV_TABLE, "ts", "open", "close", "SUM(volume)", "COUNT(*)", "MIN(ts)", "MAX(ts)",
+                width, where.format(time="ts")
+            )
+        return self._ohlcv_select(
+            source[0], "bucket", "open", "close", "SUM(volume)", "SUM(samples)", "MIN(open_ts)", "MAX(close_ts)",
+            width, where.format(time="bucket")
+        )
+
+    def _refresh_ohlcv_buckets(self, connection, name: str, width: int, symbol: str, start: int, end: int) -> int:
+        source = self._finer_source("ohlcv", name)
+        where = "symbol = ? AND {time} >= ? AND {time} < ?"
+        select = self._ohlcv_source_select(source, width, where)
+        params = (symbol, start, end) * 3
+        connection.execute(f"DELETE FROM ohlcv_{name} WHERE symbol = ? AND bucket >= ? AND bucket < ?",
+                           (symbol, start, end))
+        cursor = connection.execute(
+            f"INSERT INTO ohlcv_{name} (symbol, bucket, open, high, low, close, volume, open_ts, close_ts, samples) "
+            f"{select}", params
+        )
+        return cursor.rowcount
+
+    def _refresh_sentiment_buckets(self, connection, name: str, width: int, symbol: str, start: int, end: int) -> int:
+        source = self._finer_source("sentiment", name)
+        if source is None:
+            select = f"""SELECT symbol, {bucket_expr('ts', width)} AS bucket, SUM(score), MIN(score), MAX(score),
+                    SUM(mentions), COUNT(*)
+                FROM {SENTIMENT_TABLE} WHERE symbol = ? AND ts >= ? AND ts < ? GROUP BY symbol, bucket"""
+        else:
+            select = f"""SELECT symbol, {bucket_expr('bucket', width)} AS rollup_bucket, SUM(score_sum),
+                    MIN(score_min), MAX(score_max), SUM(mentions), SUM(samples)
+                FROM {source[0]} WHERE symbol = ? AND bucket >= ? AND bucket < ? GROUP BY symbol, rollup_bucket"""
+        connection.execute(f"DELETE FROM sentiment_{name} WHERE symbol = ? AND bucket >= ? AND bucket < ?",
+                           (symbol, start, end))
+        cursor = connection.execute(
+            f"INSERT INTO sentiment_{name} (symbol, bucket, score_sum, score_min, score_max, mentions, samples) "
+            f"{select}", (symbol, start, end)
+        )
+        return cursor.rowcount
+
+    # Queries
+
+    @staticmethod
+    def choose_rollup(resolution: int) -> Optional[Tuple[str, int]]:
+        """Coarsest rollup whose width divides the resolution (None if finer than all rollups)."""
+        best = None
+        for name, width in ROLLUP_RESOLUTIONS:
+            if width <= resolution and resolution % width == 0:
+                best = (name, width)
+        return best
+
+    async def query(
+        self,
+        table_name: str,
+        symbol: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 1000,
+        resolution: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return await self._run(self._query_sync, table_name, symbol, start_time, end_time, limit, resolution)
+
+    def _query_sync(self, table_name, symbol, start_time, end_time, limit, resolution) -> Dict[str, Any]:
+        connection = self._connect()
+        self.stats["queries"] += 1
+        start = to_epoch(start_time) if start_time is not None else None
+        end = to_epoch(end_time) if end_time is not None else None
+
+        if table_name not in (OHLCV_TABLE, SENTIMENT_TABLE):
+            return self._query_series(connection, table_name, symbol, start, end, limit)
+
+        # Long ranges without an explicit resolution are bucketed to fit the limit
+        if resolution is None and start is not None and end is not None and limit:
+            needed = (end - start) / limit
+            if needed > ROLLUP_RESOLUTIONS[0][1]:
+                resolution = next(
+                    (width for _, width in ROLLUP_RESOLUTIONS if width >= needed),
+                    ROLLUP_RESOLUTIONS[-1][1]
+                )
+
+        if resolution is None:
+            return self._query_raw(connection, table_name, symbol, start, end, limit)
+
+        # Fold in data that arrived since the last refresh before reading rollups
+        if connection.execute("SELECT 1 FROM rollup_pending LIMIT 1").fetchone():
+            self._refresh_rollups_sync(symbol)
+
+        rollup = self.choose_rollup(resolution)
+        self.stats["rollup_queries"] += 1 if rollup else 0
+        if table_name == OHLCV_TABLE:
+            return self._query_ohlcv(connection, symbol, start, end, limit, resolution, rollup)
+        return self._query_sentiment(connection, symbol, start, end, limit, resolution, rollup)
+
+    @staticmethod
+    def _time_filter(time_column: str, symbol, start, end) -> Tuple[str, List[Any]]:
+        clauses, params = ["1 = 1"], []
+        if symbol:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if start is not None:
+            clauses.append(f"{time_column} >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append(f"{time_column} < ?")
+            params.append(end)
+        return " AND ".join(clauses), params
+
+    def _query_raw(self, connection, table_name, symbol, start, end, limit) -> Dict[str, Any]:
+        where, params = self._time_filter("ts", symbol, start, end)
+        rows = connection.execute(
+            f"SELECT * FROM (SELECT * FROM {table_name} WHERE {where} ORDER BY ts DESC LIMIT ?) ORDER BY ts",
+            params + [limit]
+        ).fetchall()
+        data = []
+        for row in rows:
+            record = dict(row)
+            record["timestamp"] = from_epoch(record.pop("ts"))
+            if table_name == OHLCV_TABLE:
+                record["price"] = record["close"]
+            data.append(record)
+        return {"data": data, "source": table_name, "resolution": None}
+
+    def _query_ohlcv(self, connection, symbol, start, end, limit, resolution, rollup) -> Dict[str, Any]:
+        # Align the range to whole output buckets
+        aligned_start = int(start // resolution) * resolution if start is not None else None
+        where, params = self._time_filter("{time}", symbol, aligned_start, end)
+
+        if rollup is None:
+            select = self._ohlcv_source_select(None, resolution, where)
+            params = params * 3
+            source = OHLCV_TABLE
+        else:
+            name, width = rollup
+            source = f"ohlcv_{name}"
+            if width == resolution:
+                select = "SELECT symbol, bucket, open, high, low, close, volume, open_ts, close_ts, samples " \
+                         f"FROM {source} WHERE {where.format(time='bucket')}"
+            else:
+                # time_bucket over a finer rollup (e.g. 15m from 5m)
+                select = self._ohlcv_source_select((source, width), resolution, where)
+                params = params * 3
+
+        rows = connection.execute(
+            f"SELECT * FROM ({select}) ORDER BY bucket DESC LIMIT ?", list(params) + [limit]
+        ).fetchall()
+        data = [
+            {
+                "symbol": row["symbol"],
+                "timestamp": from_epoch(row["bucket"]),
+                "open": row["open"],
+                "high": row["high"],
+                "low": row["low"],
+                "close": row["close"],
+                "price": row["close"],
+                "volume": row["volume"],
+                "samples": row["samples"]
+            }
+            for row in reversed(rows)
+        ]
+        return {"data": data, "source": source, "resolution": resolution}
+
+    def _query_sentiment(self, connection, symbol, start, end, limit, resolution, rollup) -> Dict[str, Any]:
+        aligned_start = int(start // resolution) * resolution if start is not None else None
+        if rollup is None:
+            where, params = self._time_filter("ts", symbol, aligned_start, end)
+            select = f"""SELECT symbol, {bucket_expr('ts', resolution)} AS bucket, SUM(score) AS score_sum,
+                    MIN(score) AS score_min, MAX(score) AS score_max, SUM(mentions) AS mentions, COUNT(*) AS samples
+                FROM {SENTIMENT_TABLE} WHERE {where} GROUP BY symbol, bucket"""
+            source = SENTIMENT_TABLE
+        else:
+            name, _ = rollup
+            source = f"sentiment_{name}"
+            where, params = self._time_filter("bucket", symbol, aligned_start, end)
+            select = f"""SELECT symbol, {bucket_expr('bucket', resolution)} AS out_bucket, SUM(score_sum) AS score_sum,
+                    MIN(score_min) AS score_min, MAX(score_max) AS score_max, SUM(mentions) AS mentions,
+                    SUM(samples) AS samples
+                FROM {source} WHERE {where} GROUP BY symbol, out_bucket"""
+            select = f"SELECT symbol, out_bucket AS bucket, score_sum, score_min, score_max, mentions, samples " \
+                     f"FROM ({select})"
+
+        rows = connection.execute(
+            f"SELECT * FROM ({select}) ORDER BY bucket DESC LIMIT ?", list(params) + [limit]
+        ).fetchall()
+        data = [
+            {
+                "symbol": row["symbol"],
+                "timestamp": from_epoch(row["bucket"]),
+                "sentiment_score": row["score_sum"] / row["samples"] if row["samples"] else None,
+                "min_score": row["score_min"],
+                "max_score": row["score_max"],
+                "mention_count": row["mentions"],
+                "samples": row["samples"]
+            }
+            for row in reversed(rows)
+        ]
+        return {"data": data, "source": source, "resolution": resolution}
+
+    def _query_series(self, connection, table_name, series, start, end, limit) -> Dict[str, Any]:
+        clauses, params = ["table_name = ?"], [table_name]
+        if series:
+            clauses.append("series = ?")
+            params.append(series)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(end)
+        rows = connection.execute(
+            f"SELECT * FROM (SELECT ts, payload FROM series_data WHERE {' AND '.join(clauses)} "
+            "ORDER BY ts DESC LIMIT ?) ORDER BY ts",
+            params + [limit]
+        ).fetchall()
+        data = [{**json.loads(row["payload"]), "timestamp": from_epoch(row["ts"])} for row in rows]
+        return {"data": data, "source": "series_data", "resolution": None}
+
+    # Maintenance
+
+    async def get_table_stats(self, table_name: str) -> Dict[str, Any]:
+        return await self._run(self._get_table_stats_sync, table_name)
+
+    def _get_table_stats_sync(self, table_name: str) -> Dict[str, Any]:
+        connection = self._connect()
+        if table_name == OHLCV_TABLE or table_name == SENTIMENT_TABLE:
+            prefix = "ohlcv" if table_name == OHLCV_TABLE else "sentiment"
+            stats = {"row_count": connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]}
+            stats["rollups"] = {
+                name: connection.execute(f"SELECT COUNT(*) FROM {prefix}_{name}").fetchone()[0]
+                for name, _ in ROLLUP_RESOLUTIONS
+            }
+            stats["pending_symbols"] = connection.execute(
+                "SELECT COUNT(*) FROM rollup_pending WHERE kind = ?", (table_name,)
+            ).fetchone()[0]
+            return stats
+        return {
+            "row_count": connection.execute(
+                "SELECT COUNT(*) FROM series_data WHERE table_name = ?", (table_name,)
+            ).fetchone()[0]
+        }
+
+    async def drop_table(self, table_name: str) -> int:
+        return await self._run(self._drop_table_sync, table_name)
+
+    def _drop_table_sync(self, table_name: str) -> int:
+        connection = self._connect()
+        with connection:
+            if table_name in (OHLCV_TABLE, SENTIMENT_TABLE):
+                prefix = "ohlcv" if table_name == OHLCV_TABLE else "sentiment"
+                deleted = connection.execute(f"DELETE FROM {table_name}").rowcount
+                for name, _ in ROLLUP_RESOLUTIONS:
+                    connection.execute(f"DELETE FROM {prefix}_{name}")
+                connection.execute("DELETE FROM rollup_pending WHERE kind = ?", (table_name,))
+                return deleted
+            return connection.execute("DELETE FROM series_data WHERE table_name = ?", (table_name,)).rowcount
+
+    async def close(self):
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+        self._executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "backend": "sqlite", "path": self.path}
+
+
+def create_time_series_storage(backend: str = "sqlite", path: str = ":memory:") -> TimeSeriesStorage:
+    """Create a storage engine by name."""
+    if backend == "sqlite":
+        return SQLiteTimeSeriesStorage(path)
+    raise ValueError(f"Unsupported time-series storage backend: {backend}")
@@ -0,0 +1,250 @@
+"""
+Fixed-memory traffic counters for threat detection.
+
+Per-source request rates are kept in ring-bucketed sliding-window counters
+(one small fixed array per window instead of a timestamp list), and the
+least recently seen sources are evicted once ``max_tracked_sources`` is
+reached. A windowed count-min sketch with a heavy-hitters list gives an
+approximate global view of the busiest sources that does not grow with the
+number of distinct IPs.
+"""
+
+import random
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class RingBucketCounter:
+    """Sliding-window event counter over a ring of fixed-width buckets.
+
+    Counts may include up to one bucket width of events older than the window,
+    so they err on the side of over-counting.
+    """
+
+    __slots__ = ("bucket_width", "buckets", "head", "total")
+
+    def __init__(self, window_seconds: float, buckets: int = 10):
+        self.bucket_width = window_seconds / buckets
+        self.buckets = [0] * buckets
+        self.head = 0  # epoch of the newest bucket
+        self.total = 0
+
+    def _advance(self, now: float):
+        epoch = int(now // self.bucket_width)
+        if epoch <= self.head:
+            return
+
+        size = len(self.buckets)
+        if epoch - self.head >= size:
+            if self.total:
+                self.buckets = [0] * size
+                self.total = 0
+        else:
+            for stale in range(self.head + 1, epoch + 1):
+                index = stale % size
+                self.total -= self.buckets[index]
+                self.buckets[index] = 0
+        self.head = epoch
+
+    def add(self, now: float, amount: int = 1):
+        self._advance(now)
+        self.buckets[self.head % len(self.buckets)] += amount
+        self.total += amount
+
+    def count(self, now: float) -> int:
+        self._advance(now)
+        return self.total
+
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+class CountMinSketch:
+    """Count-min sketch with conservative update.
+
+    Rows use independent multiply-add hashes over ``hash(key)`` modulo a
+    Mersenne prime, so collisions in one row say nothing about the others.
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4, seed: Optional[int] = None):
+        self.width = width
+        self.depth = depth
+        rng = random.Random(seed)
+        self._hashes = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(_MERSENNE_PRIME))
+            for _ in range(depth)
+        ]
+        self.rows = [[0] * width for _ in range(depth)]
+        self.total = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        h = hash(key)
+        return [((a * h + b) % _MERSENNE_PRIME) % self.width for a, b in self._hashes]
+
+    def add(self, key: str, amount: int = 1) -> int:
+        """Add to a key and return its new estimate."""
+        indexes = self._indexes(key)
+        estimate = min(row[index] for row, index in zip(self.rows, indexes)) + amount
+        for row, index in zip(self.rows, indexes):
+            if row[index] < estimate:
+                row[index] = estimate
+        self.total += amount
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self.rows, self._indexes(key)))
+
+    def clear(self):
+        for row in self.rows:
+            row[:] = [0] * self.width
+        self.total = 0
+
+
+class HeavyHitters:
+    """Approximate top-k sources over a sliding window.
+
+    Two count-min sketches are rotated every window; estimates combine the
+    current window with the part of the previous window that still overlaps.
+    """
+
+    def __init__(self, window_seconds: float = 60.0, capacity: int = 100,
+                 width: int = 2048, depth: int = 4):
+        self.window_seconds = window_seconds
+        self.capacity = capacity
+        self._current = CountMinSketch(width, depth)
+        self._previous = CountMinSketch(width, depth)
+        self._window_start = 0.0
+        self._candidates: Dict[str, int] = {}
+        self._min_candidate = 0
+
+    def _rotate(self, now: float):
+        window_start = now - now % self.window_seconds
+        if window_start == self._window_start:
+            return
+        if window_start - self._window_start >= 2 * self.window_seconds:
+            self._previous.clear()
+        else:
+            self._previous, self._current = self._current, self._previous
+        self._current.clear()
+        self._window_start = window_start
+
+        # Re-rank candidates against the new window
+        for key in list(self._candidates):
+            estimate = self._previous.estimate(key)
+            if estimate:
+                self._candidates[key] = estimate
+            else:
+                del self._candidates[key]
+        self._min_candidate = min(self._candidates.values(), default=0)
+
+    def add(self, key: str, now: float, amount: int = 1):
+        self._rotate(now)
+        estimate = self._current.add(key, amount)
+
+        if key in self._candidates or len(self._candidates) < self.capacity:
+            # Estimates only grow, so the stored minimum stays a lower bound
+            if not self._candidates:
+                self._min_candidate = estimate
+            self._candidates[key] = estimate
+            self._min_candidate = min(self._min_candidate, estimate)
+        elif estimate > self._min_candidate:
+            smallest = min(self._candidates, key=self._candidates.get)
+            if estimate > self._candidates[smallest]:
+                del self._candidates[smallest]
+                self._candidates[key] = estimate
+            self._min_candidate = min(self._candidates.values())
+
+    def estimate(self, key: str, now: float) -> float:
+        self._rotate(now)
+        overlap = 1.0 - (now - self._window_start) / self.window_seconds
+        return self._current.estimate(key) + self._previous.estimate(key) * overlap
+
+    def top(self, n: int, now: float) -> List[Tuple[str, float]]:
+        self._rotate(now)
+        ranked = [(key, self.estimate(key, now)) for key in self._candidates]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:n]
+
+
+class SourceTrafficTracker:
+    """Bounded per-source sliding-window counters plus a global heavy-hitters view."""
+
+    def __init__(
+        self,
+        max_tracked_sources: int = 20000,
+        buckets_per_window: int = 10,
+        heavy_hitter_window: float = 60.0,
+        heavy_hitter_capacity: int = 100,
+        sketch_width: int = 2048,
+        sketch_depth: int = 4
+    ):
+        self.max_tracked_sources = max_tracked_sources
+        self.buckets_per_window = buckets_per_window
+
+        # stream -> windows (seconds) tracked for every source
+        self.windows: Dict[str, List[float]] = {}
+        self._sources: "OrderedDict[str, Dict[Tuple[str, float], RingBucketCounter]]" = OrderedDict()
+        self.heavy_hitters = HeavyHitters(
+            window_seconds=heavy_hitter_window,
+            capacity=heavy_hitter_capacity,
+            width=sketch_width,
+            depth=sketch_depth
+        )
+
+        # Statistics
+        self.stats = {
+            "events": 0,
+            "evicted_sources": 0
+        }
+
+    def register_window(self, stream: str, window_seconds: float):
+        """Track a sliding window for a stream (e.g. "requests", "login")."""
+        windows = self.windows.setdefault(stream, [])
+        if window_seconds not in windows:
+            windows.append(window_seconds)
+
+    def record(self, source: str, stream: str, now: float, amount: int = 1):
+        """Record events for a source in every window of a stream."""
+        counters = self._sources.get(source)
+        if counters is None:
+            counters = {}
+            self._sources[source] = counters
+            if len(self._sources) > self.max_tracked_sources:
+                self._sources.popitem(last=False)
+                self.stats["evicted_sources"] += 1
+        else:
+            self._sources.move_to_end(source)
+
+        for window in self.windows.get(stream, ()):
+            counter = counters.get((stream, window))
+            if counter is None:
+                counter = RingBucketCounter(window, self.buckets_per_window)
+                counters[(stream, window)] = counter
+            counter.add(now, amount)
+
+        if stream == "requests":
+            self.heavy_hitters.add(source, now, amount)
+        self.stats["events"] += amount
+
+    def count(self, source: str, stream: str, window_seconds: float, now: float) -> int:
+        """Events of a stream from a source within the window."""
+        counters = self._sources.get(source)
+        if counters is None:
+            return 0
+        counter = counters.get((stream, window_seconds))
+        return counter.count(now) if counter is not None else 0
+
+    def top_sources(self, n: int, now: float) -> List[Dict[str, Any]]:
+        """Approximate busiest sources over the heavy-hitter window."""
+        return [
+            {"source": source, "estimated_requests": round(estimate, 1)}
+            for source, estimate in self.heavy_hitters.top(n, now)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "tracked_sources": len(self._sources),
+            "max_tracked_sources": self.max_tracked_sources,
+            "windows": {stream: list(windows) for stream, windows in self.windows.items()}
+        }
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import logging
 import statistics
 import math
+import time
 import pandas as pd
 from dataclasses import dataclass
 
@@ -24,6 +25,7 @@ from ..models.unified_models import (
 )
 from ..cache.unified_cache import UnifiedCacheManager
 from .realtime_data_collector import DataSource
+from .downsampling import downsample_frame, resample_ohlcv
 
 
 @dataclass
@@ -403,8 +405,128 @@ class UnifiedService:
             self.logger.error(f"Error getting market statistics: {str(e)}")
             return {}
     
-    async def compare_stocks(self, symbols: List[str], period: str, include_sentiment: bool) -> Dict[str, Any]:
-        """Compare multiple stocks with comprehensive analysis."""
+    async def get_stocks(self, symbols: List[str], include_sentiment: bool = True) -> Dict[str, Optional[UnifiedStockData]]:
+        """Get unified stock data for several symbols concurrently.
+        
+        Returns:
+            Mapping of symbol to stock data (None for symbols that could not be loaded)
+        """
+        unique_symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        results = await asyncio.gather(
+            *(self.get_stock_data(symbol, include_sentiment) for symbol in unique_symbols),
+            return_exceptions=True
+        )
+        
+        stocks = {}
+        for symbol, result in zip(unique_symbols, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error getting stock data for {symbol}: {str(result)}")
+                result = None
+            stocks[symbol] = result
+        return stocks
+    
+    async def get_dashboard(
+        self,
+        symbols: Optional[List[str]] = None,
+        trending_limit: int = 10,
+        timeframe: str = "24h",
+        include_sentiment: bool = True,
+        section_timeout: float = 10.0
+    ) -> Dict[str, Any]:
+        """Gather the dashboard sections concurrently.
+        
+        Each section runs under its own timeout; a failing or slow section is
+        reported in ``errors`` and does not hold back the others.
+        """
+        async def trending():
+            stocks = await self.get_trending_stocks(trending_limit, timeframe)
+            return [stock.to_dict() for stock in stocks]
+        
+        async def stocks():
+            results = await self.get_stocks(symbols or [], include_sentiment)
+            return {symbol: stock.to_dict() if stock else None for symbol, stock in results.items()}
+        
+        sections = {
+            'indices': self.get_market_indices,
+            'market_sentiment': self.get_market_sentiment,
+            'trending': trending,
+            'statistics': self.get_market_statistics
+        }
+        if symbols:
+            sections['stocks'] = stocks
+        
+        async def run_section(name, fetch):
+            start = time.perf_counter()
+            try:
+                return await asyncio.wait_for(fetch(), timeout=section_timeout), None
+            except asyncio.TimeoutError:
+                return None, f"Timed out after {section_timeout}s"
+            except Exception as e:
+                self.logger.error(f"Error loading dashboard section {name}: {str(e)}")
+                return None, str(e)
+            finally:
+                timings[name] = round((time.perf_counter() - start) * 1000, 1)
+        
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        results = await asyncio.gather(*(run_section(name, fetch) for name, fetch in sections.items()))
+        
+        dashboard = {'sections': {}, 'errors': {}, 'timings_ms': timings}
+        for name, (data, error) in zip(sections, results):
+            dashboard['sections'][name] = data
+            if error:
+                dashboard['errors'][name] = error
+        dashboard['total_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        dashboard['last_updated'] = datetime.utcnow().isoformat()
+        return dashboard
+    
+    async def get_historical_data(
+        self,
+        symbol: str,
+        period: str = "1y",
+        max_points: Optional[int] = None,
+        chart_type: str = "candlestick"
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get historical bars for charting, downsampled to at most max_points.
+        
+        Candlestick series are re-bucketed into OHLCV bars; line series keep
+        the points LTTB selects on the close price.
+        """
+        try:
+            hist_data = await self.stock_service.get_historical_data(symbol, period)
+            if hist_data is None or hist_data.empty:
+                return None
+            
+            if chart_type == "line":
+                hist_data = downsample_frame(hist_data, max_points)
+            else:
+                hist_data = resample_ohlcv(hist_data, max_points)
+            
+            timestamps = [
+                ts.isoformat() if hasattr(ts, 'isoformat') else ts
+                for ts in hist_data.index
+            ]
+            columns = {column: hist_data[column].tolist() for column in hist_data.columns}
+            return [
+                {'timestamp': timestamp, **{column: values[i] for column, values in columns.items()}}
+                for i, timestamp in enumerate(timestamps)
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error getting historical data for {symbol}: {str(e)}")
+            return None
+    
+    async def compare_stocks(
+        self,
+        symbols: List[str],
+        period: str,
+        include_sentiment: bool,
+        max_points: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Compare multiple stocks with comprehensive analysis.
+        
+        Historical series are downsampled with LTTB to at most max_points each.
+        """
         try:
             if len(symbols) > 10:
                 raise ValueError("Maximum 10 symbols can be compared at once")
@@ -448,6 +570,7 @@ class UnifiedService:
                 historical_data = historical_results[i]
                 if historical_data is not None and not isinstance(historical_data, Exception):
                     # Convert to dict for JSON serialization
+                    historical_data = downsample_frame(historical_data, max_points)
                     comparison_data['historical_data'][symbol] = historical_data.to_dict()
             
             # Calculate performance metrics
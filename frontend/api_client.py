@@ -6,7 +6,10 @@ This module provides a client interface to communicate with the InsiteChart back
 
 import requests
 import streamlit as st
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import pandas as pd
 
@@ -14,10 +17,18 @@ import pandas as pd
 class InsiteChartAPIClient:
     """Client for interacting with InsiteChart API."""
     
-    def __init__(self, base_url: str = "http://localhost:8000/api/v1"):
+    def __init__(self, base_url: str = "http://localhost:8000/api/v1", max_workers: int = 8):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
         
+        # Keep-alive connection pool sized for concurrent requests
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api-client")
+        # Worker threads have no Streamlit script context; their errors are collected here
+        self._local = threading.local()
+        
         # Set default headers
         self.session.headers.update({
             'Content-Type': 'application/json',
@@ -48,13 +59,45 @@ class InsiteChartAPIClient:
             
         except requests.exceptions.RequestException as e:
             error_msg = f"API request failed: {str(e)}"
-            st.error(error_msg)
+            self._report_error(error_msg)
             return {"success": False, "error": error_msg}
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            st.error(error_msg)
+            self._report_error(error_msg)
             return {"success": False, "error": error_msg}
     
+    def _report_error(self, message: str):
+        """Show an error, or collect it when running in a fetch_concurrently worker."""
+        errors = getattr(self._local, "errors", None)
+        if errors is not None:
+            errors.append(message)
+        else:
+            st.error(message)
+    
+    def _call_collecting_errors(self, call: Callable[[], Dict[str, Any]]):
+        self._local.errors = []
+        try:
+            return call(), self._local.errors
+        finally:
+            self._local.errors = None
+    
+    def fetch_concurrently(self, calls: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """Run independent API calls concurrently and return their responses by name.
+        
+        Errors raised in the workers are reported from the calling thread.
+        """
+        futures = {name: self.executor.submit(self._call_collecting_errors, call) for name, call in calls.items()}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name], errors = future.result()
+            except Exception as e:
+                error_msg = f"Unexpected error: {str(e)}"
+                results[name], errors = {"success": False, "error": error_msg}, [error_msg]
+            for error_msg in errors:
+                st.error(error_msg)
+        return results
+    
     def health_check(self) -> Dict[str, Any]:
         """Check API health status."""
         return self._make_request("GET", "/health")
@@ -67,6 +110,41 @@ class InsiteChartAPIClient:
         }
         return self._make_request("POST", "/stock", json=data)
     
+    def get_stocks(self, symbols: List[str], include_sentiment: bool = True) -> Dict[str, Any]:
+        """Get comprehensive stock data for several symbols in one request."""
+        data = {
+            "symbols": [s.upper() for s in symbols],
+            "include_sentiment": include_sentiment
+        }
+        return self._make_request("POST", "/stocks/batch", json=data)
+    
+    def get_dashboard(self, symbols: Optional[List[str]] = None, trending_limit: int = 10,
+                      timeframe: str = "24h", include_sentiment: bool = True) -> Dict[str, Any]:
+        """Get all dashboard sections in one request (per-section errors in "errors")."""
+        params = {
+            "trending_limit": trending_limit,
+            "timeframe": timeframe,
+            "include_sentiment": include_sentiment
+        }
+        if symbols:
+            params["symbols"] = ",".join(s.upper() for s in symbols)
+        return self._make_request("GET", "/dashboard", params=params)
+    
+    def get_dashboard_sections(self, symbols: Optional[List[str]] = None, trending_limit: int = 10,
+                               timeframe: str = "24h", sections: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch dashboard sections (all, or only the named ones) concurrently from their own endpoints."""
+        calls = {
+            "indices": self.get_market_indices,
+            "market_sentiment": self.get_market_sentiment,
+            "trending": lambda: self.get_trending_stocks(trending_limit, timeframe),
+            "statistics": self.get_market_statistics
+        }
+        if symbols:
+            calls["stocks"] = lambda: self.get_stocks(symbols)
+        if sections is not None:
+            calls = {name: call for name, call in calls.items() if name in sections}
+        return self.fetch_concurrently(calls)
+    
     def search_stocks(self, query: str, filters: Optional[Dict] = None, limit: int = 10) -> Dict[str, Any]:
         """Search for stocks."""
         data = {
@@ -96,12 +174,14 @@ class InsiteChartAPIClient:
         """Get market-wide statistics."""
         return self._make_request("GET", "/market/statistics")
     
-    def compare_stocks(self, symbols: List[str], period: str = "1mo", include_sentiment: bool = True) -> Dict[str, Any]:
+    def compare_stocks(self, symbols: List[str], period: str = "1mo", include_sentiment: bool = True,
+                       max_points: int = 1000) -> Dict[str, Any]:
         """Compare multiple stocks."""
         data = {
             "symbols": [s.upper() for s in symbols],
             "period": period,
-            "include_sentiment": include_sentiment
+            "include_sentiment": include_sentiment,
+            "max_points": max_points
         }
         return self._make_request("POST", "/compare", json=data)
     
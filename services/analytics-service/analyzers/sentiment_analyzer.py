@@ -2,7 +2,7 @@
 
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import numpy as np
 
@@ -36,6 +36,9 @@ class SentimentAnalyzer:
         self.vader_weight = 0.4
         self.bert_weight = 0.6
 
+        # Maximum texts per BERT forward pass in batch_analyze
+        self.bert_batch_size = 32
+
     def analyze_vader(self, text: str) -> Dict[str, float]:
         """Analyze sentiment using VADER.
 
@@ -94,6 +97,60 @@ class SentimentAnalyzer:
             logger.error(f"BERT analysis failed: {e}")
             return {}
 
+    def analyze_bert_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """Analyze sentiment for several texts with batched BERT passes.
+
+        Texts are tokenized together and padded to the longest item of each
+        chunk, so a chunk of ``bert_batch_size`` texts costs one forward pass.
+
+        Args:
+            texts: Texts to analyze (each truncated to 512 tokens)
+
+        Returns:
+            List of score dictionaries, empty for texts that failed
+        """
+        if not self.bert_available:
+            return [{} for _ in texts]
+
+        results: List[Dict[str, float]] = []
+        for start in range(0, len(texts), self.bert_batch_size):
+            chunk = texts[start:start + self.bert_batch_size]
+            try:
+                inputs = self.bert_tokenizer(
+                    chunk,
+                    return_tensors="pt",
+                    padding="longest",
+                    truncation=True,
+                    max_length=512
+                )
+
+                with torch.no_grad():
+                    probabilities = torch.softmax(self.bert_model(**inputs).logits, dim=-1)
+
+                for neg_score, pos_score in probabilities[:, :2].tolist():
+                    results.append({
+                        "positive": pos_score,
+                        "negative": neg_score,
+                        "neutral": 1.0 - (pos_score + neg_score),
+                        "compound": pos_score - neg_score
+                    })
+            except Exception as e:
+                logger.error(f"BERT batch analysis failed: {e}")
+                results.extend({} for _ in chunk)
+
+        return results
+
+    def _combine_ensemble(
+        self,
+        vader_scores: Dict[str, float],
+        bert_scores: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Weighted average of VADER and BERT scores."""
+        return {
+            key: vader_scores[key] * self.vader_weight + bert_scores[key] * self.bert_weight
+            for key in ("positive", "negative", "neutral", "compound")
+        }
+
     def analyze_ensemble(self, text: str) -> Dict[str, float]:
         """Analyze sentiment using VADER and BERT ensemble.
 
@@ -111,25 +168,7 @@ class SentimentAnalyzer:
             bert_scores = self.analyze_bert(text)
             if bert_scores:
                 # Weighted average
-                ensemble_scores = {
-                    "positive": (
-                        vader_scores["positive"] * self.vader_weight +
-                        bert_scores["positive"] * self.bert_weight
-                    ),
-                    "negative": (
-                        vader_scores["negative"] * self.vader_weight +
-                        bert_scores["negative"] * self.bert_weight
-                    ),
-                    "neutral": (
-                        vader_scores["neutral"] * self.vader_weight +
-                        bert_scores["neutral"] * self.bert_weight
-                    ),
-                    "compound": (
-                        vader_scores["compound"] * self.vader_weight +
-                        bert_scores["compound"] * self.bert_weight
-                    )
-                }
-                return ensemble_scores
+                return self._combine_ensemble(vader_scores, bert_scores)
 
         # Return VADER scores if BERT not available
         return vader_scores
@@ -150,13 +189,7 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with sentiment analysis results
         """
-        # Validate input
-        if not text or len(text.strip()) == 0:
-            raise ValueError("Text cannot be empty")
-
-        if len(text) > 5000:
-            logger.warning(f"Text truncated from {len(text)} to 5000 characters")
-            text = text[:5000]
+        text = self._validate_text(text)
 
         # Select analysis method
         if model == "vader":
@@ -168,6 +201,21 @@ class SentimentAnalyzer:
         else:  # ensemble
             scores = self.analyze_ensemble(text)
 
+        return self._build_result(scores, model)
+
+    def _validate_text(self, text: str) -> str:
+        """Reject empty text and truncate overly long text."""
+        if not text or len(text.strip()) == 0:
+            raise ValueError("Text cannot be empty")
+
+        if len(text) > 5000:
+            logger.warning(f"Text truncated from {len(text)} to 5000 characters")
+            text = text[:5000]
+
+        return text
+
+    def _build_result(self, scores: Dict[str, float], model: str) -> Dict[str, Any]:
+        """Format raw scores as an analysis result."""
         # Calculate confidence score
         confidence = self._calculate_confidence(scores)
 
@@ -224,15 +272,36 @@ class SentimentAnalyzer:
         Returns:
             List of sentiment analysis results
         """
-        results = []
-        for text in texts:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        valid: List[tuple] = []
+        for index, text in enumerate(texts):
+            try:
+                valid.append((index, self._validate_text(text)))
+            except Exception as e:
+                logger.error(f"Error analyzing text: {e}")
+                results[index] = {
+                    "error": str(e),
+                    "text": (text or "")[:100]
+                }
+
+        # Score every valid text with batched BERT passes up front
+        use_bert = model != "vader" and self.bert_available
+        bert_batch = self.analyze_bert_batch([text for _, text in valid]) if use_bert else []
+
+        for position, (index, text) in enumerate(valid):
             try:
-                result = self.analyze(text, model)
-                results.append(result)
+                bert_scores = bert_batch[position] if use_bert else {}
+                if model == "bert" and bert_scores:
+                    scores = bert_scores
+                elif model not in ("vader", "bert") and bert_scores:
+                    scores = self._combine_ensemble(self.analyze_vader(text), bert_scores)
+                else:
+                    scores = self.analyze_vader(text)
+                results[index] = self._build_result(scores, model)
             except Exception as e:
                 logger.error(f"Error analyzing text: {e}")
-                results.append({
+                results[index] = {
                     "error": str(e),
                     "text": text[:100]
-                })
+                }
         return results
@@ -7,6 +7,7 @@ from typing import Optional, List
 
 from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 import uvicorn
 
 from analyzers.sentiment_analyzer import SentimentAnalyzer
@@ -154,7 +155,9 @@ async def analyze_sentiment(request: SentimentRequest):
         raise HTTPException(status_code=503, detail="Sentiment analyzer not initialized")
 
     try:
-        analysis = sentiment_analyzer.analyze(
+        # Model inference is CPU-bound; keep it off the event loop
+        analysis = await run_in_threadpool(
+            sentiment_analyzer.analyze,
             text=request.text,
             model=request.model,
             symbol=request.symbol
@@ -186,7 +189,7 @@ async def analyze_sentiment_batch(
         raise HTTPException(status_code=400, detail="Maximum 100 texts per batch")
 
     try:
-        results = sentiment_analyzer.batch_analyze(texts, model)
+        results = await run_in_threadpool(sentiment_analyzer.batch_analyze, texts, model)
         return {
             "count": len(results),
             "model": model,
@@ -1,11 +1,15 @@
 """Data Collectors Package."""
 
+from .batch_scheduler import BatchFetchScheduler, RateLimitError, TokenBucket
 from .yahoo_finance_collector import YahooFinanceCollector
 from .reddit_collector import RedditCollector
 from .twitter_collector import TwitterCollector
 from .stocktwits_collector import StockTwitsCollector
 
 __all__ = [
+    "BatchFetchScheduler",
+    "RateLimitError",
+    "TokenBucket",
     "YahooFinanceCollector",
     "RedditCollector",
     "TwitterCollector",
@@ -0,0 +1,248 @@
+"""
+Batch Fetch Scheduler
+
+Groups symbols into multi-symbol batches and fetches them under a bounded
+concurrency limit, with a shared token bucket for upstream politeness.
+Symbols that fail are retried with jittered exponential backoff in later
+batches, so one slow or failing symbol never holds up the rest.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BatchFetcher = Callable[[List[str]], Awaitable[Dict[str, Optional[Dict[str, Any]]]]]
+
+
+class RateLimitError(Exception):
+    """Raised by a fetcher when the upstream rejects a request for rate limiting.
+
+    ``results`` carries data for symbols of the batch that were still fetched.
+    """
+
+    def __init__(
+        self,
+        message: str = "Rate limited",
+        retry_after: Optional[float] = None,
+        results: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.results = results or {}
+
+
+class TokenBucket:
+    """Async token bucket shared by all requests to one upstream."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until tokens are available and take them (waiters are served in order).
+
+        Requests larger than the capacity wait for a full bucket and leave it in
+        debt, so later callers wait until the excess has been paid back.
+        """
+        needed = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= needed:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((needed - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for a while, e.g. after the upstream rate-limited us."""
+        now = time.monotonic()
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0.0
+        self.updated_at = self.blocked_until
+
+
+class BatchFetchScheduler:
+    """Runs a batch fetcher over many symbols with bounded concurrency and retries."""
+
+    def __init__(
+        self,
+        fetcher: BatchFetcher,
+        batch_size: int = 50,
+        max_concurrency: int = 4,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        tokens_per_symbol: bool = False
+    ):
+        """
+        Initialize batch fetch scheduler.
+
+        Args:
+            fetcher: Coroutine fetching a list of symbols; returns data by symbol
+                (missing or None entries count as failures) and raises
+                RateLimitError or other exceptions for whole-batch failures
+            batch_size: Maximum symbols per fetch
+            max_concurrency: Maximum fetches in flight
+            rate_limiter: Token bucket taken once per fetch
+                (once per symbol with tokens_per_symbol)
+            max_retries: Retries per symbol before giving up
+            base_delay: First retry delay in seconds (doubled per attempt)
+            max_delay: Upper bound of a retry delay in seconds
+            tokens_per_symbol: Charge one token per symbol, for fetchers that
+                make one upstream request per symbol
+        """
+        self.fetcher = fetcher
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.tokens_per_symbol = tokens_per_symbol
+
+        self.errors: Dict[str, str] = {}
+        self.stats = {
+            "batches": 0,
+            "retried_symbols": 0,
+            "rate_limited": 0,
+            "failed_symbols": 0
+        }
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Jittered exponential backoff (between half and all of the capped delay)."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = delay / 2 + random.random() * delay / 2
+        return max(delay, retry_after or 0.0)
+
+    async def run(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch all symbols.
+
+        Args:
+            symbols: Symbols to fetch (duplicates are fetched once)
+
+        Returns:
+            Dictionary mapping symbols to their data, None for symbols that failed
+        """
+        pending = list(dict.fromkeys(symbols))
+        results: Dict[str, Optional[Dict[str, Any]]] = {symbol: None for symbol in pending}
+        self.errors = {}
+        if not pending:
+            return results
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for i in range(0, len(pending), self.batch_size):
+            queue.put_nowait(pending[i:i + self.batch_size])
+
+        attempts: Dict[str, int] = defaultdict(int)
+        remaining = len(pending)
+        done = asyncio.Event()
+        retry_tasks = set()
+
+        def finish(symbol: str, data: Optional[Dict[str, Any]], error: Optional[str] = None):
+            nonlocal remaining
+            results[symbol] = data
+            if error:
+                self.errors[symbol] = error
+                self.stats["failed_symbols"] += 1
+            remaining -= 1
+            if remaining == 0:
+                done.set()
+
+        async def requeue(batch: List[str], delay: float):
+            await asyncio.sleep(delay)
+            queue.put_nowait(batch)
+
+        def retry(batch: List[str], error: str, retry_after: Optional[float] = None):
+            retry_batch = []
+            for symbol in batch:
+                attempts[symbol] += 1
+                if attempts[symbol] > self.max_retries:
+                    logger.warning(f"Giving up on {symbol} after {self.max_retries} retries: {error}")
+                    finish(symbol, None, error)
+                else:
+                    retry_batch.append(symbol)
+            if not retry_batch:
+                return
+            self.stats["retried_symbols"] += len(retry_batch)
+            delay = self.backoff_delay(max(attempts[s] for s in retry_batch), retry_after)
+            task = asyncio.create_task(requeue(retry_batch, delay))
+            retry_tasks.add(task)
+            task.add_done_callback(retry_tasks.discard)
+
+        async def worker():
+            while True:
+                batch = await queue.get()
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(len(batch) if self.tokens_per_symbol else 1)
+                self.stats["batches"] += 1
+                try:
+                    fetched = await self.fetcher(batch) or {}
+                except RateLimitError as e:
+                    self.stats["rate_limited"] += 1
+                    limited = []
+                    for symbol in batch:
+                        data = e.results.get(symbol)
+                        if data is None:
+                            limited.append(symbol)
+                        else:
+                            finish(symbol, data)
+                    delay = self.backoff_delay(max(attempts[s] for s in batch) + 1, e.retry_after)
+                    # Slow every worker down, not just this batch
+                    if self.rate_limiter:
+                        self.rate_limiter.pause(delay)
+                    logger.warning(f"Rate limited fetching {len(limited)} of {len(batch)} symbols, "
+                                   f"backing off {delay:.2f}s")
+                    if limited:
+                        retry(limited, str(e), delay)
+                    continue
+                except Exception as e:
+                    logger.warning(f"Batch fetch of {len(batch)} symbols failed: {str(e)}")
+                    retry(batch, str(e))
+                    continue
+
+                failed = []
+                for symbol in batch:
+                    data = fetched.get(symbol)
+                    if data is None:
+                        failed.append(symbol)
+                    else:
+                        finish(symbol, data)
+                if failed:
+                    retry(failed, "No data returned")
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+        try:
+            await done.wait()
+        finally:
+            for task in workers + list(retry_tasks):
+                task.cancel()
+            await asyncio.gather(*workers, *retry_tasks, return_exceptions=True)
+
+        return results
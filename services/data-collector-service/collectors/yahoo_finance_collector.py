@@ -5,29 +5,72 @@ Collects stock price, volume, and market data from Yahoo Finance.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import asyncio
 
 import yfinance as yf
 import pandas as pd
 
+from .batch_scheduler import BatchFetcher, BatchFetchScheduler, RateLimitError, TokenBucket
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # older yfinance
+    YFRateLimitError = None
+
 logger = logging.getLogger(__name__)
 
+# Threads per batch download, matching yf.download(threads=True)
+_DOWNLOAD_THREADS = (os.cpu_count() or 1) * 2
+_RATE_LIMIT_PATTERN = re.compile(r"too many requests|rate limit|\b429\b", re.IGNORECASE)
+
 
 class YahooFinanceCollector:
     """Collects stock data from Yahoo Finance."""
 
-    def __init__(self, cache_ttl: int = 300):
+    def __init__(
+        self,
+        cache_ttl: int = 300,
+        batch_size: int = 50,
+        max_concurrency: int = 4,
+        requests_per_second: float = 10.0,
+        max_retries: int = 3,
+        fetcher: Optional[BatchFetcher] = None
+    ):
         """
         Initialize Yahoo Finance Collector.
 
         Args:
             cache_ttl: Cache time-to-live in seconds
+            batch_size: Symbols per multi-ticker download
+            max_concurrency: Batches in flight at once
+            requests_per_second: Upstream request rate shared by all downloads; Yahoo
+                is queried once per ticker, so a batch costs one token per symbol
+            max_retries: Retries per failed symbol
+            fetcher: Batch fetcher (defaults to multi-ticker Yahoo Finance downloads)
         """
         self.cache_ttl = cache_ttl
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.cache_timestamps: Dict[str, datetime] = {}
+        # Price-only rows from batch downloads; kept apart so collect() never serves them
+        self.batch_cache: Dict[str, Dict[str, Any]] = {}
+        self.batch_cache_timestamps: Dict[str, datetime] = {}
+        # Fundamentals from single-symbol collection; batch downloads only carry prices
+        self.info_cache: Dict[str, Dict[str, Any]] = {}
+
+        self.rate_limiter = TokenBucket(rate=requests_per_second, capacity=batch_size)
+        self.scheduler = BatchFetchScheduler(
+            fetcher or self._fetch_batch,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            rate_limiter=self.rate_limiter,
+            max_retries=max_retries,
+            tokens_per_symbol=True
+        )
 
     async def collect(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -66,6 +109,10 @@ class YahooFinanceCollector:
         """
         Collect stock data for multiple symbols.
 
+        Symbols without a fresh single-symbol or batch entry are fetched in
+        concurrent multi-ticker batches; failed symbols are retried and map to
+        None if they keep failing.
+
         Args:
             symbols: List of stock symbols
 
@@ -73,11 +120,131 @@ class YahooFinanceCollector:
             Dictionary mapping symbols to their data
         """
         results = {}
+        to_fetch = []
+
+        for symbol in dict.fromkeys(symbols):
+            if self._is_cached(symbol):
+                results[symbol] = self.cache[symbol]
+            elif self._is_cached(symbol, self.batch_cache, self.batch_cache_timestamps):
+                results[symbol] = self.batch_cache[symbol]
+            else:
+                to_fetch.append(symbol)
+
+        if to_fetch:
+            fetched = await self.scheduler.run(to_fetch)
+            now = datetime.utcnow()
+            for symbol, data in fetched.items():
+                if data:
+                    self.batch_cache[symbol] = data
+                    self.batch_cache_timestamps[symbol] = now
+                results[symbol] = data
+
+            logger.info(f"Collected {sum(1 for d in fetched.values() if d)}/{len(to_fetch)} symbols "
+                        f"in batches of {self.scheduler.batch_size}")
+
+        return results
+
+    async def _fetch_batch(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch the latest bar of several symbols with one multi-ticker download.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dictionary mapping symbols to stock data (symbols without data are omitted)
+
+        Raises:
+            RateLimitError: If Yahoo rate-limited any ticker of the batch
+                (carrying the data of the tickers that were fetched)
+        """
+        try:
+            hist, errors = await asyncio.to_thread(self._download, symbols)
+        except Exception as e:
+            if YFRateLimitError is not None and isinstance(e, YFRateLimitError):
+                raise RateLimitError(str(e))
+            raise
+
+        results = self._latest_bars(symbols, hist)
+
+        # yf.download catches per-ticker errors (including 429s) and only records them
+        limited = [
+            symbol for symbol, error in errors.items()
+            if (YFRateLimitError is not None and isinstance(error, YFRateLimitError))
+            or _RATE_LIMIT_PATTERN.search(str(error))
+        ]
+        if limited:
+            raise RateLimitError(f"Rate limited for {len(limited)} of {len(symbols)} tickers: {errors[limited[0]]}",
+                                 results=results)
+        return results
+
+    @staticmethod
+    def _download(symbols: List[str]) -> Tuple[Optional[pd.DataFrame], Dict[str, Any]]:
+        """
+        Download several tickers in parallel and return them with their per-ticker errors.
+
+        This is what yf.download(threads=True) does, except that yf.download
+        collects results and errors in module globals (yfinance.shared) that
+        it resets on every call, so concurrent batches would clobber each other.
+        Each ticker's history is fetched on its own here, so batches can overlap.
+        """
+        def fetch(symbol: str) -> pd.DataFrame:
+            return yf.Ticker(symbol).history(period="1d", auto_adjust=False, raise_errors=True)
+
+        frames: Dict[str, pd.DataFrame] = {}
+        errors: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(len(symbols), _DOWNLOAD_THREADS))) as executor:
+            futures = {symbol: executor.submit(fetch, symbol) for symbol in symbols}
+            for symbol, future in futures.items():
+                try:
+                    frame = future.result()
+                except Exception as e:
+                    errors[symbol] = e
+                    continue
+                if frame is not None and not frame.empty:
+                    frames[symbol] = frame
+
+        hist = pd.concat(frames, axis=1) if frames else None
+        return hist, errors
+
+    def _latest_bars(self, symbols: List[str], hist: Optional[pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+        """Latest bar of each symbol in a multi-ticker download frame."""
+        results = {}
+        if hist is None or hist.empty:
+            return results
 
+        timestamp = datetime.utcnow().isoformat()
         for symbol in symbols:
-            results[symbol] = await self.collect(symbol)
-            # Small delay to avoid rate limiting
-            await asyncio.sleep(0.1)
+            if isinstance(hist.columns, pd.MultiIndex):
+                if symbol not in hist.columns.get_level_values(0):
+                    continue
+                frame = hist[symbol]
+            else:
+                frame = hist
+            frame = frame.dropna(how="all")
+            if frame.empty:
+                continue
+
+            latest = frame.iloc[-1]
+            info = self.info_cache.get(symbol, {})
+            results[symbol] = {
+                "symbol": symbol,
+                "price": float(latest.get("Close", 0)),
+                "open": float(latest.get("Open", 0)),
+                "high": float(latest.get("High", 0)),
+                "low": float(latest.get("Low", 0)),
+                "volume": int(latest.get("Volume", 0)),
+                "market_cap": info.get("marketCap", 0),
+                "pe_ratio": info.get("trailingPE", 0),
+                "dividend_yield": info.get("dividendYield", 0),
+                "52_week_high": info.get("fiftyTwoWeekHigh", 0),
+                "52_week_low": info.get("fiftyTwoWeekLow", 0),
+                "avg_volume_30d": info.get("averageVolume", 0),
+                "currency": info.get("currency", "USD"),
+                "exchange": info.get("exchange", ""),
+                "timestamp": timestamp,
+                "source": "yahoo_finance"
+            }
 
         return results
 
@@ -107,6 +274,7 @@ class YahooFinanceCollector:
 
             # Get info
             info = ticker.info
+            self.info_cache[symbol] = info
 
             return {
                 "symbol": symbol,
@@ -131,32 +299,45 @@ class YahooFinanceCollector:
             logger.error(f"Error fetching data from Yahoo Finance for {symbol}: {str(e)}")
             return None
 
-    def _is_cached(self, symbol: str) -> bool:
+    def _is_cached(
+        self,
+        symbol: str,
+        cache: Optional[Dict[str, Dict[str, Any]]] = None,
+        timestamps: Optional[Dict[str, datetime]] = None
+    ) -> bool:
         """
         Check if data is cached and not expired.
 
         Args:
             symbol: Stock symbol
+            cache: Cache to check (defaults to the single-symbol cache)
+            timestamps: Cache times of that cache
 
         Returns:
             True if cached and not expired, False otherwise
         """
-        if symbol not in self.cache or symbol not in self.cache_timestamps:
+        if cache is None:
+            cache, timestamps = self.cache, self.cache_timestamps
+        if symbol not in cache or symbol not in timestamps:
             return False
 
-        cache_age = (datetime.utcnow() - self.cache_timestamps[symbol]).total_seconds()
+        cache_age = (datetime.utcnow() - timestamps[symbol]).total_seconds()
         return cache_age < self.cache_ttl
 
     def clear_cache(self):
         """Clear all cached data."""
         self.cache.clear()
         self.cache_timestamps.clear()
+        self.batch_cache.clear()
+        self.batch_cache_timestamps.clear()
         logger.info("Cache cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         return {
             "cached_symbols": len(self.cache),
+            "batch_cached_symbols": len(self.batch_cache),
             "cache_ttl": self.cache_ttl,
-            "symbols": list(self.cache.keys())
+            "symbols": list(self.cache.keys()),
+            "batch_stats": dict(self.scheduler.stats)
         }
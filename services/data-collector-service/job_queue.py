@@ -0,0 +1,451 @@
+"""
+Collection Job Queue
+
+Durable job pipeline on Redis Streams. Jobs are appended to a stream with
+XADD and consumed by any number of workers through a consumer group, so
+replicas share the work and jobs survive restarts. While a job runs, its
+worker refreshes the entry's idle time with XCLAIM ... JUSTID, so only
+entries a crashed worker left pending go idle and are reassigned with
+XAUTOCLAIM, never a job that is merely slow. Jobs that keep failing are
+moved to a dead-letter stream after a bounded number of attempts. Job state
+and results are stored as JSON.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values json cannot handle natively (datetimes, numpy scalars, sets)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_payload(data: Any) -> str:
+    """Serialize data for storage in Redis."""
+    return json.dumps(data, default=_json_default, separators=(",", ":"))
+
+
+def decode_payload(raw: Optional[str]) -> Any:
+    """Deserialize data written by encode_payload."""
+    if raw is None:
+        return None
+    return json.loads(raw)
+
+
+@dataclass
+class Job:
+    """A job delivered to a consumer."""
+    job_id: str
+    job_type: str
+    payload: Dict[str, Any]
+    entry_id: str
+    attempts: int
+
+
+JobHandler = Callable[[Job], Awaitable[Any]]
+
+
+class JobQueue:
+    """Redis Streams job queue with a consumer group and dead-letter stream."""
+
+    def __init__(
+        self,
+        redis_client,
+        consumer: str,
+        stream: str = "collector:jobs",
+        group: str = "collector-workers",
+        dead_letter_stream: Optional[str] = None,
+        max_attempts: int = 3,
+        claim_idle_ms: int = 60000,
+        job_ttl: int = 86400,
+        max_stream_length: int = 100000,
+        heartbeat_interval: Optional[float] = None
+    ):
+        """
+        Initialize job queue.
+
+        Args:
+            redis_client: redis.asyncio client created with decode_responses=True
+            consumer: Unique consumer name of this worker within the group
+            stream: Job stream key
+            group: Consumer group shared by all workers
+            dead_letter_stream: Stream receiving jobs that exhausted their attempts
+            max_attempts: Deliveries per job before it is dead-lettered
+            claim_idle_ms: Idle time after which a pending job is reclaimed from its consumer
+            job_ttl: Seconds job state is kept after the job finishes
+            max_stream_length: Approximate cap on stream length (XADD MAXLEN ~)
+            heartbeat_interval: Seconds between ownership refreshes of a running
+                job (defaults to a third of claim_idle_ms)
+        """
+        self.redis = redis_client
+        self.consumer = consumer
+        self.stream = stream
+        self.group = group
+        self.dead_letter_stream = dead_letter_stream or f"{stream}:dead"
+        self.max_attempts = max_attempts
+        self.claim_idle_ms = claim_idle_ms
+        self.job_ttl = job_ttl
+        self.max_stream_length = max_stream_length
+        self.heartbeat_interval = heartbeat_interval or claim_idle_ms / 3000
+
+        self.stats = {
+            "enqueued": 0,
+            "processed": 0,
+            "failed": 0,
+            "retried": 0,
+            "reclaimed": 0,
+            "dead_lettered": 0,
+            "heartbeats": 0
+        }
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.stream}:job:{job_id}"
+
+    async def ensure_group(self):
+        """Create the stream and consumer group if they do not exist."""
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+            logger.info(f"Created consumer group {self.group} on {self.stream}")
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def enqueue(self, job_type: str, payload: Dict[str, Any], job_id: Optional[str] = None) -> str:
+        """
+        Add a job to the stream.
+
+        Args:
+            job_type: Job type used to dispatch to a handler
+            payload: JSON-serializable job arguments
+            job_id: Optional job ID (generated if omitted)
+
+        Returns:
+            Job ID
+        """
+        job_id = job_id or str(uuid4())
+        encoded = encode_payload(payload)
+
+        await self.redis.hset(self._job_key(job_id), mapping={
+            "id": job_id,
+            "type": job_type,
+            "status": "queued",
+            "payload": encoded,
+            "attempts": 0,
+            "progress": 0,
+            "result_count": 0,
+            "error": "",
+            "created_at": datetime.utcnow().isoformat(),
+            "completed_at": ""
+        })
+        await self._add_entry(job_id, job_type, encoded)
+
+        self.stats["enqueued"] += 1
+        return job_id
+
+    async def _add_entry(self, job_id: str, job_type: str, encoded_payload: str):
+        await self.redis.xadd(
+            self.stream,
+            {"job_id": job_id, "type": job_type, "payload": encoded_payload},
+            maxlen=self.max_stream_length,
+            approximate=True
+        )
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get job state.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job state with decoded payload and result, or None if unknown
+        """
+        job = await self.redis.hgetall(self._job_key(job_id))
+        if not job:
+            return None
+
+        job["payload"] = decode_payload(job.get("payload"))
+        job["result"] = decode_payload(job.get("result"))
+        job["attempts"] = int(job.get("attempts", 0))
+        job["progress"] = float(job.get("progress", 0))
+        job["result_count"] = int(job.get("result_count", 0))
+        job["error"] = job.get("error") or None
+        job["completed_at"] = job.get("completed_at") or None
+        return job
+
+    async def update_job(self, job_id: str, **fields):
+        """Update job state fields."""
+        await self.redis.hset(self._job_key(job_id), mapping=fields)
+
+    async def read(self, count: int = 10, block_ms: Optional[int] = None) -> List[Job]:
+        """
+        Fetch jobs for this consumer.
+
+        Jobs left idle by other consumers are reclaimed first, then new jobs
+        are read. Jobs that have already been delivered max_attempts times are
+        dead-lettered instead of being returned.
+
+        Args:
+            count: Maximum jobs to return
+            block_ms: Milliseconds to block waiting for new jobs (None to not block)
+
+        Returns:
+            Delivered jobs
+        """
+        entries = []
+
+        _, claimed, deleted_ids = await self._autoclaim(count)
+        if deleted_ids:
+            # Entries trimmed from the stream while pending can only be acknowledged
+            await self.redis.xack(self.stream, self.group, *deleted_ids)
+        if claimed:
+            self.stats["reclaimed"] += len(claimed)
+            logger.warning(f"Consumer {self.consumer} reclaimed {len(claimed)} idle jobs")
+            entries.extend(claimed)
+
+        if len(entries) < count:
+            response = await self.redis.xreadgroup(
+                self.group,
+                self.consumer,
+                {self.stream: ">"},
+                count=count - len(entries),
+                block=None if entries else block_ms
+            )
+            for _, stream_entries in response or []:
+                entries.extend(stream_entries)
+
+        jobs = []
+        for entry_id, fields in entries:
+            job = await self._deliver(entry_id, fields)
+            if job:
+                jobs.append(job)
+        return jobs
+
+    async def _autoclaim(self, count: int):
+        response = await self.redis.xautoclaim(
+            self.stream, self.group, self.consumer,
+            min_idle_time=self.claim_idle_ms, start_id="0-0", count=count
+        )
+        # Redis < 7 returns no list of deleted IDs
+        next_id, claimed = response[0], response[1]
+        deleted_ids = response[2] if len(response) > 2 else []
+        # Entries deleted from the stream come back without fields
+        deleted_ids = list(deleted_ids) + [entry_id for entry_id, fields in claimed if not fields]
+        claimed = [(entry_id, fields) for entry_id, fields in claimed if fields]
+        return next_id, claimed, deleted_ids
+
+    async def _deliver(self, entry_id: str, fields: Dict[str, str]) -> Optional[Job]:
+        job_id = fields.get("job_id")
+        try:
+            payload = decode_payload(fields.get("payload")) or {}
+        except ValueError as e:
+            await self._dead_letter(entry_id, fields, f"Invalid payload: {str(e)}")
+            return None
+        if not job_id:
+            await self._dead_letter(entry_id, fields, "Missing job_id")
+            return None
+
+        job = Job(
+            job_id=job_id,
+            job_type=fields.get("type", ""),
+            payload=payload,
+            entry_id=entry_id,
+            attempts=await self.redis.hincrby(self._job_key(job_id), "attempts", 1)
+        )
+        if job.attempts > self.max_attempts:
+            # The job keeps taking its worker down with it; stop redelivering
+            await self._dead_letter(entry_id, fields, f"Exceeded {self.max_attempts} delivery attempts")
+            return None
+
+        await self.update_job(job_id, status="running", consumer=self.consumer)
+        return job
+
+    async def _heartbeat(self, job: Job):
+        """Keep a running job's entry from going idle so it is not reclaimed."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                # JUSTID resets the idle time without counting another delivery
+                await self.redis.xclaim(
+                    self.stream, self.group, self.consumer, 0, [job.entry_id], justid=True
+                )
+                self.stats["heartbeats"] += 1
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {job.job_id} failed: {str(e)}")
+
+    async def complete(self, job: Job, result: Any = None, result_count: int = 0):
+        """
+        Acknowledge a job and store its result.
+
+        Args:
+            job: Delivered job
+            result: JSON-serializable job result
+            result_count: Number of items produced
+        """
+        await self.update_job(
+            job.job_id,
+            status="completed",
+            progress=100.0,
+            result_count=result_count,
+            result=encode_payload(result),
+            error="",
+            completed_at=datetime.utcnow().isoformat()
+        )
+        await self.redis.expire(self._job_key(job.job_id), self.job_ttl)
+        await self.redis.xack(self.stream, self.group, job.entry_id)
+        self.stats["processed"] += 1
+
+    async def fail(self, job: Job, error: str):
+        """
+        Record a failed attempt, retrying or dead-lettering the job.
+
+        Args:
+            job: Delivered job
+            error: Failure description
+        """
+        self.stats["failed"] += 1
+        if job.attempts >= self.max_attempts:
+            await self._dead_letter(job.entry_id, {
+                "job_id": job.job_id,
+                "type": job.job_type,
+                "payload": encode_payload(job.payload)
+            }, error)
+            return
+
+        # Re-append so the retry is picked up right away instead of after claim_idle_ms
+        await self.update_job(job.job_id, status="retrying", error=error)
+        await self._add_entry(job.job_id, job.job_type, encode_payload(job.payload))
+        await self.redis.xack(self.stream, self.group, job.entry_id)
+        self.stats["retried"] += 1
+
+    async def _dead_letter(self, entry_id: str, fields: Dict[str, str], error: str):
+        await self.redis.xadd(self.dead_letter_stream, {
+            **fields,
+            "error": error,
+            "source_entry_id": entry_id,
+            "failed_at": datetime.utcnow().isoformat()
+        })
+        await self.redis.xack(self.stream, self.group, entry_id)
+
+        job_id = fields.get("job_id")
+        if job_id:
+            await self.update_job(
+                job_id,
+                status="dead_lettered",
+                error=error,
+                completed_at=datetime.utcnow().isoformat()
+            )
+            await self.redis.expire(self._job_key(job_id), self.job_ttl)
+
+        self.stats["dead_lettered"] += 1
+        logger.error(f"Job {job_id} moved to {self.dead_letter_stream}: {error}")
+
+    async def get_dead_letters(self, count: int = 100) -> List[Dict[str, Any]]:
+        """
+        List the most recent dead-lettered jobs.
+
+        Args:
+            count: Maximum entries to return
+
+        Returns:
+            Dead-letter entries, newest first
+        """
+        entries = await self.redis.xrevrange(self.dead_letter_stream, count=count)
+        return [
+            {**fields, "entry_id": entry_id, "payload": decode_payload(fields.get("payload"))}
+            for entry_id, fields in entries
+        ]
+
+    async def process(self, handler: JobHandler, count: int = 1, block_ms: Optional[int] = None) -> int:
+        """
+        Read a batch of jobs and run the handler on each.
+
+        The handler returns (result, result_count) or a result; raising marks
+        the attempt as failed.
+
+        Args:
+            handler: Coroutine processing one job
+            count: Maximum jobs to read
+            block_ms: Milliseconds to block waiting for jobs
+
+        Returns:
+            Number of jobs handled
+        """
+        jobs = await self.read(count=count, block_ms=block_ms)
+        for job in jobs:
+            heartbeat = asyncio.create_task(self._heartbeat(job))
+            try:
+                outcome = await handler(job)
+            except asyncio.CancelledError:
+                # Left pending; another consumer reclaims it after claim_idle_ms
+                raise
+            except Exception as e:
+                logger.error(f"Error processing job {job.job_id}: {str(e)}")
+                await self.fail(job, str(e))
+                continue
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+
+            if isinstance(outcome, tuple):
+                result, result_count = outcome
+            else:
+                result, result_count = outcome, 0
+            await self.complete(job, result, result_count)
+        return len(jobs)
+
+    async def run(
+        self,
+        handler: JobHandler,
+        count: int = 1,
+        block_ms: int = 5000,
+        idle_delay: float = 0.1,
+        error_delay: float = 1.0
+    ):
+        """
+        Process jobs until cancelled.
+
+        Args:
+            handler: Coroutine processing one job
+            count: Maximum jobs read per batch
+            block_ms: Milliseconds to block waiting for jobs
+            idle_delay: Seconds to wait when a read returned no jobs (guards
+                against busy-looping on servers that do not honour BLOCK)
+            error_delay: Seconds to wait after a Redis error
+        """
+        await self.ensure_group()
+        logger.info(f"Job worker {self.consumer} consuming {self.stream}")
+        while True:
+            try:
+                if not await self.process(handler, count=count, block_ms=block_ms):
+                    await asyncio.sleep(idle_delay)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {self.consumer} error: {str(e)}")
+                await asyncio.sleep(error_delay)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and counters."""
+        stats = dict(self.stats)
+        try:
+            pending = await self.redis.xpending(self.stream, self.group)
+            stats["stream_length"] = await self.redis.xlen(self.stream)
+            stats["pending"] = pending.get("pending", 0) if isinstance(pending, dict) else pending[0]
+            stats["dead_letter_length"] = await self.redis.xlen(self.dead_letter_stream)
+        except Exception as e:
+            logger.warning(f"Could not read queue stats: {str(e)}")
+        return stats
@@ -9,6 +9,7 @@ Microservice for collecting financial data from multiple sources:
 
 import logging
 import os
+import socket
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from uuid import uuid4
@@ -20,6 +21,7 @@ from pydantic import BaseModel, Field
 import redis.asyncio as redis
 
 from collectors import YahooFinanceCollector, RedditCollector, TwitterCollector, StockTwitsCollector
+from job_queue import Job, JobQueue, encode_payload
 
 # Configure logging
 logging.basicConfig(
@@ -67,20 +69,27 @@ app = FastAPI(
 )
 
 # Global services
-yahoo_collector = YahooFinanceCollector(cache_ttl=300)
+yahoo_collector = YahooFinanceCollector(
+    cache_ttl=300,
+    batch_size=int(os.getenv("YAHOO_BATCH_SIZE", "50")),
+    max_concurrency=int(os.getenv("YAHOO_MAX_CONCURRENCY", "4")),
+    requests_per_second=float(os.getenv("YAHOO_REQUESTS_PER_SECOND", "10"))
+)
 reddit_collector = RedditCollector()
 twitter_collector = TwitterCollector()
 stocktwits_collector = StockTwitsCollector()
 
-# Job tracking
+# Job tracking (in-process fallback when Redis is unavailable)
 jobs: Dict[str, Dict[str, Any]] = {}
 redis_client: Optional[redis.Redis] = None
+job_queue: Optional[JobQueue] = None
+worker_tasks: List[asyncio.Task] = []
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    global redis_client
+    global redis_client, job_queue
 
     logger.info("Data Collector Service starting...")
 
@@ -94,6 +103,23 @@ async def startup_event():
         logger.warning(f"Could not connect to Redis: {str(e)}")
         redis_client = None
 
+    # Start job workers on the shared Redis stream
+    if redis_client:
+        try:
+            job_queue = JobQueue(
+                redis_client,
+                consumer=os.getenv("COLLECTOR_CONSUMER_NAME", f"{socket.gethostname()}-{os.getpid()}"),
+                max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "3")),
+                claim_idle_ms=int(os.getenv("JOB_CLAIM_IDLE_MS", "60000"))
+            )
+            await job_queue.ensure_group()
+            for _ in range(int(os.getenv("COLLECTOR_WORKERS", "2"))):
+                worker_tasks.append(asyncio.create_task(job_queue.run(_handle_job)))
+            logger.info(f"Started {len(worker_tasks)} job workers as {job_queue.consumer}")
+        except Exception as e:
+            logger.warning(f"Could not start job queue, using in-process jobs: {str(e)}")
+            job_queue = None
+
     logger.info("Data Collector Service started successfully")
 
 
@@ -102,6 +128,12 @@ async def shutdown_event():
     """Cleanup on shutdown."""
     global redis_client
 
+    # Jobs still running stay pending in the stream and are reclaimed by another worker
+    for task in worker_tasks:
+        task.cancel()
+    await asyncio.gather(*worker_tasks, return_exceptions=True)
+    worker_tasks.clear()
+
     if redis_client:
         await redis_client.close()
         logger.info("Redis connection closed")
@@ -126,6 +158,7 @@ async def get_metrics():
         "active_jobs": len([j for j in jobs.values() if j["status"] == "running"]),
         "completed_jobs": len([j for j in jobs.values() if j["status"] == "completed"]),
         "failed_jobs": len([j for j in jobs.values() if j["status"] == "failed"]),
+        "job_queue": await job_queue.get_stats() if job_queue else None,
         "cache_stats": yahoo_collector.get_cache_stats(),
         "timestamp": datetime.utcnow().isoformat()
     }
@@ -147,28 +180,34 @@ async def collect_stocks(
         Job information with job_id for tracking progress
     """
     try:
-        job_id = str(uuid4())
-
-        # Create job entry
-        jobs[job_id] = {
-            "id": job_id,
-            "status": "started",
-            "type": "stocks",
-            "symbols": request.symbols,
-            "priority": request.priority,
-            "progress": 0,
-            "result_count": 0,
-            "error": None,
-            "created_at": datetime.utcnow().isoformat(),
-            "completed_at": None
-        }
+        if job_queue:
+            job_id = await job_queue.enqueue("stocks", {
+                "symbols": request.symbols,
+                "priority": request.priority
+            })
+        else:
+            job_id = str(uuid4())
+
+            # Create job entry
+            jobs[job_id] = {
+                "id": job_id,
+                "status": "started",
+                "type": "stocks",
+                "symbols": request.symbols,
+                "priority": request.priority,
+                "progress": 0,
+                "result_count": 0,
+                "error": None,
+                "created_at": datetime.utcnow().isoformat(),
+                "completed_at": None
+            }
 
-        # Start background task
-        background_tasks.add_task(
-            _collect_stocks_job,
-            job_id,
-            request.symbols
-        )
+            # Start background task
+            background_tasks.add_task(
+                _collect_stocks_job,
+                job_id,
+                request.symbols
+            )
 
         logger.info(f"Started stock collection job {job_id} for symbols: {request.symbols}")
 
@@ -196,19 +235,7 @@ async def get_stocks_job_status(job_id: str):
     Returns:
         Job status information
     """
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    job = jobs[job_id]
-
-    return JobStatusResponse(
-        job_id=job["id"],
-        status=job["status"],
-        progress=job["progress"],
-        result_count=job["result_count"],
-        error=job.get("error"),
-        timestamp=datetime.utcnow().isoformat()
-    )
+    return await _get_job_status(job_id)
 
 
 # Sentiment Collection Endpoints
@@ -227,29 +254,35 @@ async def collect_sentiment(
         Job information with job_id for tracking progress
     """
     try:
-        job_id = str(uuid4())
-
-        # Create job entry
-        jobs[job_id] = {
-            "id": job_id,
-            "status": "started",
-            "type": "sentiment",
-            "symbols": request.symbols,
-            "sources": request.sources,
-            "progress": 0,
-            "result_count": 0,
-            "error": None,
-            "created_at": datetime.utcnow().isoformat(),
-            "completed_at": None
-        }
+        if job_queue:
+            job_id = await job_queue.enqueue("sentiment", {
+                "symbols": request.symbols,
+                "sources": request.sources
+            })
+        else:
+            job_id = str(uuid4())
+
+            # Create job entry
+            jobs[job_id] = {
+                "id": job_id,
+                "status": "started",
+                "type": "sentiment",
+                "symbols": request.symbols,
+                "sources": request.sources,
+                "progress": 0,
+                "result_count": 0,
+                "error": None,
+                "created_at": datetime.utcnow().isoformat(),
+                "completed_at": None
+            }
 
-        # Start background task
-        background_tasks.add_task(
-            _collect_sentiment_job,
-            job_id,
-            request.symbols,
-            request.sources
-        )
+            # Start background task
+            background_tasks.add_task(
+                _collect_sentiment_job,
+                job_id,
+                request.symbols,
+                request.sources
+            )
 
         logger.info(f"Started sentiment collection job {job_id} for symbols: {request.symbols}")
 
@@ -277,10 +310,49 @@ async def get_sentiment_job_status(job_id: str):
     Returns:
         Job status information
     """
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    return await _get_job_status(job_id)
+
 
-    job = jobs[job_id]
+@app.get("/api/v1/jobs/dead-letter", tags=["Data Collection"])
+async def get_dead_letter_jobs(count: int = Query(50, ge=1, le=500)):
+    """
+    List jobs that exhausted their attempts.
+
+    Args:
+        count: Maximum number of entries to return
+
+    Returns:
+        Dead-lettered jobs, newest first
+    """
+    if not job_queue:
+        raise HTTPException(status_code=503, detail="Job queue not available")
+
+    try:
+        return {
+            "jobs": await job_queue.get_dead_letters(count),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    except Exception as e:
+        logger.error(f"Error listing dead-letter jobs: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _get_job_status(job_id: str) -> JobStatusResponse:
+    """
+    Look up a job in the Redis job queue or the in-process fallback.
+
+    Args:
+        job_id: Job ID to check
+
+    Returns:
+        Job status information
+    """
+    job = await job_queue.get_job(job_id) if job_queue else None
+    if job is None:
+        job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
 
     return JobStatusResponse(
         job_id=job["id"],
@@ -292,7 +364,92 @@ async def get_sentiment_job_status(job_id: str):
     )
 
 
-# Background Job Functions
+# Job Functions
+async def _collect_stocks(symbols: List[str]) -> Dict[str, Any]:
+    """
+    Collect stock data and store each symbol's data in Redis as JSON.
+
+    Args:
+        symbols: List of symbols to collect
+
+    Returns:
+        Collected and failed symbols
+    """
+    results = await yahoo_collector.collect_multiple(symbols)
+
+    # Filter out None results
+    successful_results = {k: v for k, v in results.items() if v is not None}
+
+    # Store results in Redis if available
+    if redis_client and successful_results:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for symbol, data in successful_results.items():
+                    pipe.set(f"stock:{symbol}", encode_payload(data), ex=300)  # 5 minute expiry
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not cache results in Redis: {str(e)}")
+
+    return {
+        "collected": list(successful_results),
+        "failed": [symbol for symbol, data in results.items() if data is None]
+    }
+
+
+async def _collect_sentiment(symbols: List[str], sources: List[str]) -> int:
+    """
+    Collect sentiment data from the requested sources.
+
+    Args:
+        symbols: List of symbols to collect
+        sources: List of sources (reddit, twitter, stocktwits)
+
+    Returns:
+        Number of results collected
+    """
+    results_count = 0
+
+    # Collect from Reddit
+    if "reddit" in sources:
+        reddit_results = await reddit_collector.collect_multiple(symbols)
+        results_count += len([r for r in reddit_results.values() if r is not None])
+
+    # Collect from Twitter
+    if "twitter" in sources:
+        twitter_results = await twitter_collector.collect_multiple(symbols)
+        results_count += len([r for r in twitter_results.values() if r is not None])
+
+    # Collect from StockTwits
+    if "stocktwits" in sources:
+        stocktwits_results = await stocktwits_collector.collect_multiple(symbols)
+        results_count += len([r for r in stocktwits_results.values() if r is not None])
+
+    return results_count
+
+
+async def _handle_job(job: Job):
+    """
+    Run a job delivered by the Redis job queue.
+
+    Args:
+        job: Delivered job
+
+    Returns:
+        Tuple of job result and result count
+    """
+    if job.job_type == "stocks":
+        result = await _collect_stocks(job.payload["symbols"])
+        logger.info(f"Stock collection job {job.job_id} completed with {len(result['collected'])} results")
+        return result, len(result["collected"])
+
+    if job.job_type == "sentiment":
+        results_count = await _collect_sentiment(job.payload["symbols"], job.payload["sources"])
+        logger.info(f"Sentiment collection job {job.job_id} completed with {results_count} results")
+        return {"result_count": results_count}, results_count
+
+    raise ValueError(f"Unknown job type: {job.job_type}")
+
+
 async def _collect_stocks_job(job_id: str, symbols: List[str]):
     """
     Background job for collecting stock data.
@@ -304,32 +461,16 @@ async def _collect_stocks_job(job_id: str, symbols: List[str]):
     try:
         jobs[job_id]["status"] = "running"
 
-        # Collect data for each symbol
-        results = await yahoo_collector.collect_multiple(symbols)
-
-        # Filter out None results
-        successful_results = {k: v for k, v in results.items() if v is not None}
-
-        # Store results in Redis if available
-        if redis_client:
-            try:
-                for symbol, data in successful_results.items():
-                    cache_key = f"stock:{symbol}"
-                    await redis_client.set(
-                        cache_key,
-                        str(data),
-                        ex=300  # 5 minute expiry
-                    )
-            except Exception as e:
-                logger.warning(f"Could not cache results in Redis: {str(e)}")
+        result = await _collect_stocks(symbols)
+        result_count = len(result["collected"])
 
         # Update job status
         jobs[job_id]["status"] = "completed"
         jobs[job_id]["progress"] = 100.0
-        jobs[job_id]["result_count"] = len(successful_results)
+        jobs[job_id]["result_count"] = result_count
         jobs[job_id]["completed_at"] = datetime.utcnow().isoformat()
 
-        logger.info(f"Stock collection job {job_id} completed with {len(successful_results)} results")
+        logger.info(f"Stock collection job {job_id} completed with {result_count} results")
 
     except Exception as e:
         logger.error(f"Error in stock collection job {job_id}: {str(e)}")
@@ -349,22 +490,7 @@ async def _collect_sentiment_job(job_id: str, symbols: List[str], sources: List[
     """
     try:
         jobs[job_id]["status"] = "running"
-        results_count = 0
-
-        # Collect from Reddit
-        if "reddit" in sources:
-            reddit_results = await reddit_collector.collect_multiple(symbols)
-            results_count += len([r for r in reddit_results.values() if r is not None])
-
-        # Collect from Twitter
-        if "twitter" in sources:
-            twitter_results = await twitter_collector.collect_multiple(symbols)
-            results_count += len([r for r in twitter_results.values() if r is not None])
-
-        # Collect from StockTwits
-        if "stocktwits" in sources:
-            stocktwits_results = await stocktwits_collector.collect_multiple(symbols)
-            results_count += len([r for r in stocktwits_results.values() if r is not None])
+        results_count = await _collect_sentiment(symbols, sources)
 
         # Update job status
         jobs[job_id]["status"] = "completed"
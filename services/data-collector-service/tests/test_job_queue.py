@@ -0,0 +1,210 @@
+"""Unit tests for the Redis Streams job queue."""
+
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+import fakeredis.aioredis
+
+# Add parent directory to path
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from job_queue import JobQueue, decode_payload, encode_payload
+
+
+@pytest.fixture
+def redis_client():
+    """Shared fake Redis server for all consumers in a test."""
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+async def make_queue(redis_client, consumer, **kwargs):
+    queue = JobQueue(redis_client, consumer=consumer, **kwargs)
+    await queue.ensure_group()
+    return queue
+
+
+async def collect_handler(job):
+    symbols = job.payload["symbols"]
+    return {"collected": symbols}, len(symbols)
+
+
+class TestPayloadEncoding:
+    """Test payload encoding."""
+
+    def test_round_trip(self):
+        """Test collector data survives encoding, unlike str(data)."""
+        data = {
+            "symbol": "AAPL",
+            "price": np.float64(189.5),
+            "volume": np.int64(1000),
+            "timestamp": datetime(2024, 1, 2, 3, 4, 5),
+            "tags": ("tech",)
+        }
+
+        decoded = decode_payload(encode_payload(data))
+
+        assert decoded == {
+            "symbol": "AAPL",
+            "price": 189.5,
+            "volume": 1000,
+            "timestamp": "2024-01-02T03:04:05",
+            "tags": ["tech"]
+        }
+
+
+class TestJobQueue:
+    """Test job queue."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_and_complete(self, redis_client):
+        """Test a job is processed, acknowledged and its result stored."""
+        queue = await make_queue(redis_client, "worker-1")
+        job_id = await queue.enqueue("stocks", {"symbols": ["AAPL", "MSFT"]})
+
+        assert (await queue.get_job(job_id))["status"] == "queued"
+        assert await queue.process(collect_handler) == 1
+
+        job = await queue.get_job(job_id)
+        assert job["status"] == "completed"
+        assert job["result"] == {"collected": ["AAPL", "MSFT"]}
+        assert job["result_count"] == 2
+        assert job["attempts"] == 1
+        assert (await queue.get_stats())["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_consumers_share_jobs(self, redis_client):
+        """Test workers in one group each receive different jobs."""
+        producer = await make_queue(redis_client, "api")
+        workers = [await make_queue(redis_client, f"worker-{i}") for i in range(3)]
+        job_ids = [await producer.enqueue("stocks", {"symbols": [f"SYM{i}"]}) for i in range(6)]
+
+        delivered = []
+        for worker in workers:
+            jobs = await worker.read(count=2)
+            delivered.extend(job.job_id for job in jobs)
+            for job in jobs:
+                await worker.complete(job)
+
+        assert sorted(delivered) == sorted(job_ids)
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_job_is_reclaimed(self, redis_client):
+        """Test a job left pending by a crashed worker is reclaimed once idle."""
+        crashed = await make_queue(redis_client, "worker-1", claim_idle_ms=100)
+        survivor = await make_queue(redis_client, "worker-2", claim_idle_ms=100)
+        job_id = await crashed.enqueue("stocks", {"symbols": ["AAPL"]})
+
+        async def hang(job):
+            await asyncio.sleep(10)
+
+        # Worker dies mid-job: the entry is never acknowledged
+        task = asyncio.create_task(crashed.process(hang))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert (await redis_client.xpending(crashed.stream, crashed.group))["pending"] == 1
+
+        # Not idle long enough yet
+        assert await survivor.process(collect_handler) == 0
+
+        await asyncio.sleep(0.15)
+        assert await survivor.process(collect_handler) == 1
+
+        job = await survivor.get_job(job_id)
+        assert job["status"] == "completed"
+        assert job["attempts"] == 2
+        assert job["consumer"] == "worker-2"
+        assert survivor.stats["reclaimed"] == 1
+        assert (await survivor.get_stats())["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_job_is_not_reclaimed(self, redis_client):
+        """Test a job running longer than claim_idle_ms keeps its ownership through heartbeats."""
+        worker = await make_queue(redis_client, "worker-1", claim_idle_ms=100, heartbeat_interval=0.02)
+        other = await make_queue(redis_client, "worker-2", claim_idle_ms=100)
+        job_id = await worker.enqueue("stocks", {"symbols": ["AAPL"]})
+
+        async def slow_handler(job):
+            await asyncio.sleep(0.4)
+            return await collect_handler(job)
+
+        task = asyncio.create_task(worker.process(slow_handler))
+        for _ in range(8):
+            await asyncio.sleep(0.05)
+            assert await other.process(collect_handler) == 0
+        assert await task == 1
+
+        job = await worker.get_job(job_id)
+        assert job["status"] == "completed"
+        assert job["attempts"] == 1
+        assert job["consumer"] == "worker-1"
+        assert other.stats["reclaimed"] == 0
+        assert worker.stats["heartbeats"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_job_retried_then_dead_lettered(self, redis_client):
+        """Test a failing job is retried and moved to the dead-letter stream after max attempts."""
+        queue = await make_queue(redis_client, "worker-1", max_attempts=3)
+        job_id = await queue.enqueue("stocks", {"symbols": ["BAD"]})
+        ok_id = await queue.enqueue("stocks", {"symbols": ["AAPL"]})
+
+        async def handler(job):
+            if "BAD" in job.payload["symbols"]:
+                raise ConnectionError("upstream unavailable")
+            return await collect_handler(job)
+
+        while await queue.process(handler):
+            pass
+
+        job = await queue.get_job(job_id)
+        assert job["status"] == "dead_lettered"
+        assert job["attempts"] == 3
+        assert job["error"] == "upstream unavailable"
+        assert (await queue.get_job(ok_id))["status"] == "completed"
+
+        dead = await queue.get_dead_letters()
+        assert len(dead) == 1
+        assert dead[0]["job_id"] == job_id
+        assert dead[0]["payload"] == {"symbols": ["BAD"]}
+        assert queue.stats["retried"] == 2
+
+        stats = await queue.get_stats()
+        assert stats["pending"] == 0
+        assert stats["dead_letter_length"] == 1
+
+    @pytest.mark.asyncio
+    async def test_job_crashing_every_worker_is_dead_lettered(self, redis_client):
+        """Test a job whose workers keep dying is dead-lettered instead of redelivered forever."""
+        queue = await make_queue(redis_client, "worker-0", max_attempts=2, claim_idle_ms=0)
+        job_id = await queue.enqueue("stocks", {"symbols": ["POISON"]})
+
+        for i in range(2):
+            worker = await make_queue(redis_client, f"worker-{i}", max_attempts=2, claim_idle_ms=0)
+            assert len(await worker.read()) == 1  # crashes without acknowledging
+
+        assert await queue.read() == []
+
+        job = await queue.get_job(job_id)
+        assert job["status"] == "dead_lettered"
+        assert (await queue.get_dead_letters())[0]["error"] == "Exceeded 2 delivery attempts"
+        assert (await queue.get_stats())["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_run_processes_until_cancelled(self, redis_client):
+        """Test the worker loop picks up jobs enqueued after it started."""
+        queue = await make_queue(redis_client, "worker-1")
+        task = asyncio.create_task(queue.run(collect_handler, block_ms=20, idle_delay=0.01))
+
+        job_id = await queue.enqueue("stocks", {"symbols": ["AAPL"]})
+        for _ in range(50):
+            if (await queue.get_job(job_id))["status"] == "completed":
+                break
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert (await queue.get_job(job_id))["status"] == "completed"
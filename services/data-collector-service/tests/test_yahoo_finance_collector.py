@@ -0,0 +1,304 @@
+"""Unit tests for batched Yahoo Finance collection."""
+
+import asyncio
+import threading
+import time
+import types
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Register the collectors package without running its __init__, which imports
+# the social collectors and their optional clients (praw, tweepy)
+if "collectors" not in sys.modules:
+    collectors_package = types.ModuleType("collectors")
+    collectors_package.__path__ = [os.path.join(os.path.dirname(__file__), '..', 'collectors')]
+    sys.modules["collectors"] = collectors_package
+
+from collectors.batch_scheduler import BatchFetchScheduler, RateLimitError, TokenBucket
+from collectors.yahoo_finance_collector import YahooFinanceCollector
+
+
+class FakeFetcher:
+    """Batch fetcher simulating latency, rate limiting and partial failures."""
+
+    def __init__(self, latency=0.05, rate_limited_calls=(), flaky_symbols=None, dead_symbols=(), failing_calls=()):
+        self.latency = latency
+        self.rate_limited_calls = set(rate_limited_calls)
+        self.failing_calls = set(failing_calls)
+        # symbol -> number of times it is missing from a batch result before it succeeds
+        self.flaky_symbols = dict(flaky_symbols or {})
+        self.dead_symbols = set(dead_symbols)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, symbols):
+        call = len(self.calls)
+        self.calls.append(list(symbols))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if call in self.rate_limited_calls:
+                raise RateLimitError("Too Many Requests", retry_after=0.05)
+            if call in self.failing_calls:
+                raise ConnectionError("connection reset")
+
+            results = {}
+            for symbol in symbols:
+                if symbol in self.dead_symbols:
+                    continue
+                if self.flaky_symbols.get(symbol, 0) > 0:
+                    self.flaky_symbols[symbol] -= 1
+                    continue
+                results[symbol] = {"symbol": symbol, "price": 100.0}
+            return results
+        finally:
+            self.in_flight -= 1
+
+
+def make_symbols(count):
+    return [f"SYM{i:03d}" for i in range(count)]
+
+
+class TestTokenBucket:
+    """Test token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_rate_is_enforced(self):
+        """Test tokens beyond the burst are spaced by the rate."""
+        bucket = TokenBucket(rate=50, capacity=2)
+
+        start = time.perf_counter()
+        for _ in range(7):
+            await bucket.acquire()
+        elapsed = time.perf_counter() - start
+
+        # 2 burst tokens, then 5 tokens at 50/s
+        assert elapsed >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_pause_blocks_acquire(self):
+        """Test a pause holds back all callers."""
+        bucket = TokenBucket(rate=1000, capacity=10)
+        bucket.pause(0.1)
+
+        start = time.perf_counter()
+        await bucket.acquire()
+
+        assert time.perf_counter() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_request_larger_than_capacity(self):
+        """Test a request above the capacity is served and paid back by later callers."""
+        bucket = TokenBucket(rate=100, capacity=5)
+
+        start = time.perf_counter()
+        await bucket.acquire(20)
+        assert time.perf_counter() - start < 0.05
+
+        await bucket.acquire(1)
+        # 15 tokens of debt plus one token at 100/s
+        assert time.perf_counter() - start >= 0.15
+
+
+class TestBatchFetchScheduler:
+    """Test batch fetch scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently(self):
+        """Test 500 symbols are fetched in bounded concurrent batches."""
+        fetcher = FakeFetcher(latency=0.05)
+        scheduler = BatchFetchScheduler(fetcher, batch_size=50, max_concurrency=4)
+
+        start = time.perf_counter()
+        results = await scheduler.run(make_symbols(500))
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 500
+        assert all(data is not None for data in results.values())
+        assert len(fetcher.calls) == 10
+        assert max(len(call) for call in fetcher.calls) == 50
+        assert fetcher.max_in_flight == 4
+        # 10 batches over 4 workers: 3 rounds of latency, not 10
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_limits_request_rate(self):
+        """Test the shared token bucket paces batch requests."""
+        fetcher = FakeFetcher(latency=0.0)
+        scheduler = BatchFetchScheduler(fetcher, batch_size=10, max_concurrency=4,
+                                        rate_limiter=TokenBucket(rate=40, capacity=1))
+
+        start = time.perf_counter()
+        await scheduler.run(make_symbols(100))
+
+        assert time.perf_counter() - start >= 9 / 40 - 0.01
+
+    @pytest.mark.asyncio
+    async def test_partial_failures_are_retried(self):
+        """Test symbols missing from a batch are retried without stalling other batches."""
+        fetcher = FakeFetcher(latency=0.01, flaky_symbols={"SYM003": 2, "SYM042": 1}, dead_symbols={"SYM007"})
+        scheduler = BatchFetchScheduler(fetcher, batch_size=20, max_concurrency=2, max_retries=3,
+                                        base_delay=0.01, max_delay=0.05)
+
+        results = await scheduler.run(make_symbols(60))
+
+        assert results["SYM003"] == {"symbol": "SYM003", "price": 100.0}
+        assert results["SYM042"] is not None
+        assert results["SYM007"] is None
+        assert scheduler.errors == {"SYM007": "No data returned"}
+        # Retries only carry failed symbols
+        assert all(len(call) <= 2 for call in fetcher.calls[3:])
+        assert sum(call.count("SYM007") for call in fetcher.calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_and_batch_errors_are_retried(self):
+        """Test rate-limited and failed batches are retried as a whole."""
+        fetcher = FakeFetcher(latency=0.01, rate_limited_calls={0}, failing_calls={1})
+        scheduler = BatchFetchScheduler(fetcher, batch_size=10, max_concurrency=2,
+                                        rate_limiter=TokenBucket(rate=1000, capacity=2),
+                                        base_delay=0.01, max_delay=0.05)
+
+        results = await scheduler.run(make_symbols(30))
+
+        assert all(data is not None for data in results.values())
+        assert scheduler.stats["rate_limited"] == 1
+        assert scheduler.stats["retried_symbols"] == 20
+        assert len(fetcher.calls) == 5
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_batch_keeps_fetched_symbols(self):
+        """Test only the rate-limited symbols of a batch are retried."""
+        calls = []
+
+        async def fetcher(symbols):
+            calls.append(list(symbols))
+            data = {symbol: {"symbol": symbol} for symbol in symbols}
+            if len(calls) == 1:
+                raise RateLimitError("Too Many Requests", retry_after=0.01,
+                                     results={symbol: data[symbol] for symbol in symbols[:7]})
+            return data
+
+        scheduler = BatchFetchScheduler(fetcher, batch_size=10, max_concurrency=1,
+                                        rate_limiter=TokenBucket(rate=1000, capacity=10),
+                                        base_delay=0.01, max_delay=0.05, tokens_per_symbol=True)
+
+        results = await scheduler.run(make_symbols(10))
+
+        assert all(data is not None for data in results.values())
+        assert calls[1] == make_symbols(10)[7:]
+        assert scheduler.stats["rate_limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tokens_charged_per_symbol(self):
+        """Test a batch takes one token per symbol when configured."""
+        fetcher = FakeFetcher(latency=0.0)
+        scheduler = BatchFetchScheduler(fetcher, batch_size=10, max_concurrency=2,
+                                        rate_limiter=TokenBucket(rate=200, capacity=10),
+                                        tokens_per_symbol=True)
+
+        start = time.perf_counter()
+        await scheduler.run(make_symbols(30))
+
+        # First batch from the full bucket, then 20 symbols at 200/s
+        assert time.perf_counter() - start >= 20 / 200 - 0.01
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        """Test backoff delay bounds."""
+        scheduler = BatchFetchScheduler(FakeFetcher(), base_delay=0.5, max_delay=4.0)
+
+        delays = [scheduler.backoff_delay(3) for _ in range(100)]
+
+        assert all(1.0 <= delay <= 2.0 for delay in delays)
+        assert len(set(delays)) > 1
+        assert 2.0 <= scheduler.backoff_delay(10) <= 4.0
+        assert scheduler.backoff_delay(1, retry_after=5.0) == 5.0
+
+
+class TestYahooFinanceCollector:
+    """Test Yahoo Finance collector batching."""
+
+    @pytest.mark.asyncio
+    async def test_collect_multiple_uses_batches_and_cache(self):
+        """Test collect_multiple fetches uncached symbols in batches."""
+        fetcher = FakeFetcher(latency=0.01)
+        collector = YahooFinanceCollector(batch_size=25, max_concurrency=4, requests_per_second=1000,
+                                          fetcher=fetcher)
+        symbols = make_symbols(100)
+
+        results = await collector.collect_multiple(symbols)
+        assert len(fetcher.calls) == 4
+        assert list(results) == symbols
+
+        # Second call is served from the cache
+        await collector.collect_multiple(symbols[:10] + ["NEW"])
+        assert fetcher.calls[-1] == ["NEW"]
+        assert collector.get_cache_stats()["batch_cached_symbols"] == 101
+
+    @pytest.mark.asyncio
+    async def test_collect_not_served_price_only_batch_data(self):
+        """Test collect() fetches fundamentals even when a batch row is cached."""
+        collector = YahooFinanceCollector(requests_per_second=1000, fetcher=FakeFetcher(latency=0.0))
+        await collector.collect_multiple(["AAPL"])
+
+        full = {"symbol": "AAPL", "price": 100.0, "market_cap": 3e12}
+        with patch.object(collector, "_fetch_stock_data", AsyncMock(return_value=full)) as fetch:
+            assert await collector.collect("AAPL") == full
+            fetch.assert_awaited_once_with("AAPL")
+
+        # Full data also satisfies later batch requests
+        assert (await collector.collect_multiple(["AAPL"]))["AAPL"] == full
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_tickers_detected_from_download_errors(self):
+        """Test per-ticker 429s recorded by yf.download raise RateLimitError."""
+        collector = YahooFinanceCollector()
+        bar = pd.DataFrame({"Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [100]},
+                           index=pd.DatetimeIndex(["2024-01-02"]))
+        hist = pd.concat({"AAPL": bar}, axis=1)
+        errors = {"MSFT": "YFRateLimitError('Too Many Requests. Rate limited. Try after a while.')"}
+
+        with patch.object(YahooFinanceCollector, "_download", return_value=(hist, errors)):
+            with pytest.raises(RateLimitError) as excinfo:
+                await collector._fetch_batch(["AAPL", "MSFT"])
+
+        assert list(excinfo.value.results) == ["AAPL"]
+        assert excinfo.value.results["AAPL"]["price"] == 1.5
+
+    @pytest.mark.asyncio
+    async def test_batch_downloads_run_concurrently(self):
+        """Test batch downloads overlap and keep their own results and errors."""
+        collector = YahooFinanceCollector()
+        bar = pd.DataFrame({"Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [100]},
+                           index=pd.DatetimeIndex(["2024-01-02"]))
+        # Both batches must be downloading at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        class FakeTicker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            def history(self, **kwargs):
+                if self.symbol in ("AAPL", "MSFT"):
+                    barrier.wait()
+                if self.symbol == "BAD":
+                    raise ValueError("BAD: No data found, symbol may be delisted")
+                return bar
+
+        with patch("collectors.yahoo_finance_collector.yf.Ticker", FakeTicker):
+            first, second = await asyncio.gather(
+                collector._fetch_batch(["AAPL", "BAD"]),
+                collector._fetch_batch(["MSFT"])
+            )
+
+        assert list(first) == ["AAPL"]
+        assert list(second) == ["MSFT"]
+        assert second["MSFT"]["price"] == 1.5
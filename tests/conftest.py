@@ -410,6 +410,26 @@ pytest.mark.gateway = pytest.mark.gateway
 pytest.mark.sentiment = pytest.mark.sentiment
 pytest.mark.realtime = pytest.mark.realtime
 pytest.mark.security = pytest.mark.security
+pytest.mark.timing_sensitive = pytest.mark.timing_sensitive
+
+
+def _coverage_active():
+    """커버리지 측정 중인지 확인 (추적 오버헤드로 마이크로벤치마크가 무의미해짐)"""
+    try:
+        import coverage
+    except ImportError:
+        return False
+    return coverage.Coverage.current() is not None or sys.gettrace() is not None
+
+
+def pytest_collection_modifyitems(config, items):
+    """커버리지 측정 중에는 절대 시간 기준의 마이크로벤치마크를 건너뜀"""
+    if not _coverage_active():
+        return
+    skip_timing = pytest.mark.skip(reason="timing assertion is not meaningful under coverage tracing")
+    for item in items:
+        if "timing_sensitive" in item.keywords:
+            item.add_marker(skip_timing)
 
 
 # 테스트 유틸리티 함수
@@ -0,0 +1,67 @@
+"""
+인증 성능 테스트
+
+요청당 JWT 인증 오버헤드를 검증 캐시 사용/미사용 시로 측정합니다.
+"""
+
+import pytest
+import time
+import asyncio
+import statistics
+
+import jwt
+from starlette.requests import Request
+
+from backend.middleware.auth_middleware import JWTAuthMiddleware
+
+
+@pytest.mark.performance
+class TestAuthPerformance:
+    """인증 성능 테스트 클래스"""
+
+    def _token(self, secret):
+        now = int(time.time())
+        return jwt.encode(
+            {"user_id": "user1", "role": "user", "permissions": ["stock:read", "watchlist:write"],
+             "iat": now, "exp": now + 3600},
+            secret,
+            algorithm="HS256"
+        )
+
+    def _measure(self, middleware, token, iterations):
+        headers = [(b"authorization", f"Bearer {token}".encode())]
+        loop = asyncio.new_event_loop()
+        try:
+            timings = []
+            for _ in range(iterations):
+                request = Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+                start = time.perf_counter()
+                loop.run_until_complete(middleware.verify_token(request))
+                middleware.check_permission(request, "watchlist:write")
+                timings.append((time.perf_counter() - start) * 1_000_000)
+            return timings
+        finally:
+            loop.close()
+
+    def test_cached_verification_overhead(self):
+        """요청당 인증 오버헤드: 검증 캐시 vs 매 요청 jwt.decode"""
+        secret = "benchmark-secret"
+        iterations = 5000
+        token = self._token(secret)
+
+        uncached = JWTAuthMiddleware(secret_key=secret)
+        uncached.token_cache.max_size = 0  # 캐시 비활성화
+        cached = JWTAuthMiddleware(secret_key=secret)
+
+        uncached_timings = self._measure(uncached, token, iterations)
+        cached_timings = self._measure(cached, token, iterations)
+
+        uncached_mean = statistics.mean(uncached_timings)
+        cached_mean = statistics.mean(cached_timings)
+        cached_p99 = sorted(cached_timings)[int(iterations * 0.99)]
+
+        print(f"\nAuth overhead per request (mean): uncached {uncached_mean:.1f}us, cached {cached_mean:.1f}us")
+        print(f"Cached p99: {cached_p99:.1f}us, hit rate: {cached.token_cache.get_stats()['hits'] / iterations:.3f}")
+
+        assert cached.token_cache.get_stats()["misses"] == 1
+        assert cached_mean < uncached_mean
@@ -0,0 +1,75 @@
+"""
+엔벨로프 암호화 성능 테스트
+
+10만 개의 작은 필드에 대해 기존 방식(페이로드별 키 생성 + 연산별 감사 캐시 기록)과
+데이터 키 재사용 encrypt_data, 배치 encrypt_many/decrypt_many의 처리량을 비교합니다.
+"""
+
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.data_encryption_service import DataEncryptionService, EncryptionType, KeyType
+
+FIELD_COUNT = 100_000
+BASELINE_COUNT = 10_000
+
+
+def make_cache():
+    cache = Mock()
+    cache.set = AsyncMock()
+    cache.get = AsyncMock(return_value=None)
+    return cache
+
+
+@pytest.mark.performance
+class TestEncryptionPerformance:
+    """엔벨로프 암호화 성능 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_small_field_encryption_throughput(self):
+        """작은 필드 10만 건 암복호화 처리량 테스트"""
+        fields = [f"user-{i}@example.com" for i in range(FIELD_COUNT)]
+
+        # 기존 방식: 페이로드마다 키 생성/캐시 기록, 연산마다 감사 레코드 캐시 기록
+        baseline_cache = make_cache()
+        baseline = DataEncryptionService(baseline_cache)
+        start = time.perf_counter()
+        for field in fields[:BASELINE_COUNT]:
+            key = await baseline._create_encryption_key(EncryptionType.AES_256_GCM, KeyType.DATA)
+            await baseline._encrypt_aes_gcm(field.encode(), key)
+            await baseline_cache.set(f"encryption_operation_{key.key_id}", {}, ttl=86400)
+        baseline_us = (time.perf_counter() - start) / BASELINE_COUNT * 1e6
+        await baseline.close()
+
+        cache = make_cache()
+        service = DataEncryptionService(cache)
+
+        start = time.perf_counter()
+        for field in fields:
+            await service.encrypt_data(field, "personal_info")
+        single_us = (time.perf_counter() - start) / FIELD_COUNT * 1e6
+        single_writes = cache.set.await_count
+
+        start = time.perf_counter()
+        batch = await service.encrypt_many(fields, "personal_info")
+        batch_us = (time.perf_counter() - start) / FIELD_COUNT * 1e6
+
+        start = time.perf_counter()
+        decrypted = await service.decrypt_many(batch["encrypted_data"])
+        decrypt_us = (time.perf_counter() - start) / FIELD_COUNT * 1e6
+        await service.close()
+
+        print(f"\n{FIELD_COUNT} fields: per-payload keys {baseline_us:.1f}us/op ({BASELINE_COUNT} sampled), "
+              f"encrypt_data {single_us:.1f}us/op, encrypt_many {batch_us:.1f}us/op, "
+              f"decrypt_many {decrypt_us:.1f}us/op; keys {len(service.encryption_keys)} "
+              f"(baseline {len(baseline.encryption_keys)}), cache writes {single_writes} "
+              f"(baseline {baseline_cache.set.await_count})")
+
+        assert decrypted["errors"] == {}
+        assert decrypted["decrypted_data"][-1] == fields[-1].encode()
+        assert len(service.encryption_keys) == 1
+        assert single_writes <= FIELD_COUNT // service.audit_batch_size + 1
+        assert single_us < baseline_us
+        assert batch_us * 5 < baseline_us
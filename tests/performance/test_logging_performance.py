@@ -0,0 +1,121 @@
+"""
+구조화된 로깅 성능 테스트
+
+동기 핸들러와 비동기 배치 파이프라인의 초당 로그 처리량,
+요청당 추가 지연시간 및 샘플링된 DEBUG 로그 비용을 측정합니다.
+"""
+
+import pytest
+import asyncio
+import statistics
+import time
+
+from backend.logging.structured_logger import StructuredLogger
+
+
+def _make_logger(name: str, log_file, **kwargs) -> StructuredLogger:
+    return StructuredLogger(
+        name,
+        enable_console=False,
+        log_file_path=str(log_file),
+        max_queue_size=200000,
+        **kwargs
+    )
+
+
+class TestLoggingPerformance:
+    """로깅 파이프라인 성능 테스트 클래스"""
+
+    @pytest.mark.performance
+    def test_records_per_second(self, tmp_path):
+        """동기/비동기 모드 초당 로그 처리량 테스트"""
+        record_count = 20000
+        results = {}
+
+        for mode in ("sync", "async"):
+            structured_logger = _make_logger(
+                f"bench_rps_{mode}", tmp_path / f"{mode}.log", async_mode=(mode == "async")
+            )
+
+            start = time.perf_counter()
+            for i in range(record_count):
+                structured_logger.info("Quote update", symbol="AAPL", price=190.5 + i, request_id=f"req-{i}")
+            caller_elapsed = time.perf_counter() - start
+            structured_logger.close()
+            total_elapsed = time.perf_counter() - start
+
+            results[mode] = {
+                "caller_rps": record_count / caller_elapsed,
+                "end_to_end_rps": record_count / total_elapsed
+            }
+            assert len((tmp_path / f"{mode}.log").read_text().splitlines()) == record_count
+
+        for mode, result in results.items():
+            print(
+                f"{mode:<5} caller={result['caller_rps']:10.0f} rec/s  "
+                f"end_to_end={result['end_to_end_rps']:10.0f} rec/s"
+            )
+
+        # 호출 측 비용은 비동기 모드가 더 낮아야 함
+        assert results["async"]["caller_rps"] > results["sync"]["caller_rps"]
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_added_request_latency(self, tmp_path):
+        """요청당 로깅으로 인한 이벤트 루프 지연시간 테스트"""
+        logs_per_request = 10
+        request_count = 500
+        latency_ms = {}
+
+        async def handle_request(structured_logger, request_id):
+            start = time.perf_counter()
+            for step in range(logs_per_request):
+                structured_logger.info("Request step", request_id=request_id, step=step)
+            await asyncio.sleep(0)
+            return (time.perf_counter() - start) * 1000
+
+        for mode in ("none", "sync", "async"):
+            structured_logger = _make_logger(
+                f"bench_latency_{mode}", tmp_path / f"latency_{mode}.log", async_mode=(mode == "async")
+            )
+            if mode == "none":
+                structured_logger.logger.setLevel("CRITICAL")
+
+            samples = [await handle_request(structured_logger, f"req-{i}") for i in range(request_count)]
+            structured_logger.close()
+            latency_ms[mode] = samples
+
+        baseline = statistics.median(latency_ms["none"])
+        for mode, samples in latency_ms.items():
+            ordered = sorted(samples)
+            print(
+                f"{mode:<5} p50={statistics.median(ordered) - baseline:7.3f}ms  "
+                f"p99={ordered[int(len(ordered) * 0.99)] - baseline:7.3f}ms added per request"
+            )
+
+        assert statistics.median(latency_ms["async"]) < statistics.median(latency_ms["sync"])
+
+    @pytest.mark.performance
+    @pytest.mark.timing_sensitive
+    def test_sampled_debug_cost(self, tmp_path):
+        """샘플링된 DEBUG 로그 호출 비용 테스트"""
+        call_count = 100000
+        structured_logger = _make_logger(
+            "bench_sampling",
+            tmp_path / "sampling.log",
+            log_level="DEBUG",
+            async_mode=True,
+            sample_rates={"DEBUG": 0.01}
+        )
+
+        start = time.perf_counter()
+        for i in range(call_count):
+            structured_logger.debug("Cache hit", key=i)
+        per_call_us = (time.perf_counter() - start) / call_count * 1e6
+        structured_logger.close()
+
+        sampled_out = structured_logger.get_stats()["sampled_out"]
+        print(f"sampled debug: {per_call_us:.3f}us/call, sampled_out={sampled_out}")
+
+        assert sampled_out > call_count * 0.95
+        assert per_call_us < 5
@@ -0,0 +1,86 @@
+"""
+과거 OHLCV 캐시 성능 테스트
+
+10년 일봉과 30일 1분봉에 대해 기존 DataFrame.to_json 캐시 경로와 컬럼형 저장소의
+로드 시간, 할당 메모리 및 캐시 항목 크기를 비교합니다.
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.ohlcv_store import ColumnarOHLCVStore
+
+
+def make_frame(periods, freq, tz):
+    """yfinance history() 형태의 프레임 생성"""
+    rng = np.random.default_rng(42)
+    index = pd.date_range("2015-01-02", periods=periods, freq=freq, tz=tz, name="Date")
+    close = 100 + rng.standard_normal(periods).cumsum()
+    return pd.DataFrame({
+        "Open": close - 0.5,
+        "High": close + 1.0,
+        "Low": close - 1.0,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 5_000_000, periods),
+        "Dividends": np.zeros(periods),
+        "Stock Splits": np.zeros(periods)
+    }, index=index)
+
+
+def measure(load, rounds=5):
+    """최소 로드 시간(ms)과 최대 할당 메모리(bytes)"""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            load()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak
+
+
+@pytest.mark.performance
+class TestOHLCVStorePerformance:
+    """컬럼형 저장소 성능 테스트 클래스"""
+
+    @pytest.mark.parametrize("name,periods,freq,tz", [
+        ("10y daily", 2520, "B", "America/New_York"),
+        ("30d 1-minute", 30 * 390, "min", "America/New_York")
+    ])
+    def test_store_vs_json_cache(self, tmp_path, name, periods, freq, tz):
+        """JSON 캐시 대비 컬럼형 저장소 로드 시간/메모리 테스트"""
+        frame = make_frame(periods, freq, tz)
+        store = ColumnarOHLCVStore(str(tmp_path))
+
+        blob = frame.to_json()
+        version = store.write("AAPL", "bars", frame)
+        pointer = json.dumps({"symbol": "AAPL", "interval": "bars", "start": frame.index[0].isoformat(),
+                              "end": frame.index[-1].isoformat(), "version": version})
+
+        json_ms, json_peak = measure(lambda: pd.read_json(StringIO(blob)))
+        store_ms, store_peak = measure(lambda: store.read("AAPL", "bars", frame.index[0], frame.index[-1]))
+        # 마지막 1/10 구간만 조회
+        slice_ms, _ = measure(lambda: store.read("AAPL", "bars", frame.index[-periods // 10], frame.index[-1]))
+
+        print(f"\n{name} ({periods} bars): json {json_ms:.2f}ms / {json_peak / 1024:.0f}KiB peak / "
+              f"{len(blob) / 1024:.0f}KiB entry, store {store_ms:.2f}ms / {store_peak / 1024:.0f}KiB peak / "
+              f"{len(pointer)}B entry, 10% slice {slice_ms:.2f}ms")
+
+        pd.testing.assert_frame_equal(store.read("AAPL", "bars"), frame, check_freq=False)
+        assert store_ms * 5 < json_ms
+        assert store_peak < json_peak
+        assert len(store.read("AAPL", "bars", frame.index[-periods // 10], frame.index[-1])) == periods // 10
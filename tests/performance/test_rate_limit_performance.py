@@ -0,0 +1,73 @@
+"""
+속도 제한 성능 테스트
+
+GCRA Lua 스크립트 속도 제한기의 판정 처리량을 측정합니다.
+"""
+
+import pytest
+import time
+import asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from backend.middleware.rate_limit_middleware import AdvancedRateLimiter
+
+
+@pytest.mark.performance
+class TestRateLimitPerformance:
+    """속도 제한 성능 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_gcra_decision_throughput(self):
+        """단일/다중 정책 판정 처리량 측정"""
+        limiter = AdvancedRateLimiter()
+        limiter.redis_client = fakeredis.FakeAsyncRedis()
+        iterations = 2000
+        limits = [("default", "default"), ("search", "default"), ("sentiment", "default")]
+
+        await limiter.is_allowed("ip:warmup")
+
+        start = time.perf_counter()
+        await asyncio.gather(*[limiter.is_allowed(f"ip:{i % 100}", burst_mode=True) for i in range(iterations)])
+        single_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await asyncio.gather(*[limiter.check_multiple_limits(f"ip:{i % 100}", limits) for i in range(iterations)])
+        multi_elapsed = time.perf_counter() - start
+
+        print(f"\nGCRA is_allowed (burst): {iterations / single_elapsed:.0f} decisions/s")
+        print(f"GCRA check_multiple_limits (3 policies): {iterations / multi_elapsed:.0f} decisions/s")
+
+        assert iterations / single_elapsed > 200
+        assert iterations / multi_elapsed > 200
+
+
+@pytest.mark.performance
+class TestHybridRateLimitPerformance:
+    """로컬 토큰 버킷 속도 제한 성능 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_local_fast_path_vs_global_checks(self):
+        """로컬 토큰 임대 사용 시와 매 요청 전역 검사 시의 처리량 비교"""
+        from unittest.mock import MagicMock
+        from backend.services.rate_limit_service import RateLimitService
+
+        iterations = 5000
+        server = fakeredis.FakeServer()
+        hybrid = RateLimitService(MagicMock(), redis_client=fakeredis.FakeAsyncRedis(server=server))
+        strict = RateLimitService(MagicMock(), redis_client=fakeredis.FakeAsyncRedis(server=server), local_share=0.0)
+
+        timings = {}
+        for name, service in (("hybrid", hybrid), ("strict", strict)):
+            start = time.perf_counter()
+            for i in range(iterations):
+                await service.is_allowed(f"{name}:{i % 10}", "api", "enterprise")
+            timings[name] = time.perf_counter() - start
+            await service.close()
+
+        print(f"\nHybrid limiter: {iterations / timings['hybrid']:.0f} decisions/s "
+              f"({hybrid.limiter_stats['local_decisions']} local)")
+        print(f"Global check per request: {iterations / timings['strict']:.0f} decisions/s")
+
+        assert timings["hybrid"] < timings["strict"]
@@ -0,0 +1,146 @@
+"""
+감성 분석 추론 성능 테스트
+
+DynamicBatchInferenceWorker의 배치 크기별 CPU 처리량을 측정합니다.
+"""
+
+import pytest
+import os
+import random
+import time
+import zlib
+
+import psutil
+import torch
+from transformers import BertConfig, BertForSequenceClassification
+
+from backend.services.inference_batcher import DynamicBatchInferenceWorker
+from backend.services.onnx_sentiment_backend import (
+    ONNX_RUNTIME_AVAILABLE,
+    OnnxSequenceClassifier,
+    check_accuracy_parity,
+    export_to_onnx,
+    get_model_paths,
+    quantize_model
+)
+
+
+class HashTokenizer:
+    """어휘 파일 없이 동작하는 해시 기반 토크나이저"""
+
+    def __init__(self, vocab_size: int):
+        self.vocab_size = vocab_size
+
+    def __call__(self, texts, padding="longest", truncation=True, max_length=512, return_tensors="pt"):
+        ids = [
+            [101] + [zlib.crc32(word.encode()) % (self.vocab_size - 200) + 200 for word in text.split()][:max_length - 2] + [102]
+            for text in texts
+        ]
+        longest = max(len(row) for row in ids)
+        input_ids = torch.tensor([row + [0] * (longest - len(row)) for row in ids])
+        return {"input_ids": input_ids, "attention_mask": (input_ids != 0).long()}
+
+
+def _sample_texts(count: int):
+    words = ["stock", "rally", "earnings", "beat", "miss", "guidance", "bullish",
+             "bearish", "revenue", "growth", "decline", "shares", "market", "AAPL"]
+    rng = random.Random(42)
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(8, 48))) for _ in range(count)]
+
+
+class TestSentimentInferencePerformance:
+    """배치 추론 성능 테스트 클래스"""
+
+    @pytest.fixture(scope="class")
+    def model(self):
+        """BERT 구조의 소형 모델 (무작위 가중치, CPU)"""
+        torch.manual_seed(0)
+        config = BertConfig(
+            vocab_size=8000,
+            hidden_size=256,
+            num_hidden_layers=4,
+            num_attention_heads=4,
+            intermediate_size=1024,
+            num_labels=3,
+            id2label={0: "positive", 1: "negative", 2: "neutral"},
+            label2id={"positive": 0, "negative": 1, "neutral": 2}
+        )
+        return BertForSequenceClassification(config).eval()
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_throughput_by_batch_size(self, model):
+        """배치 크기별 처리량 테스트"""
+        texts = _sample_texts(256)
+        tokenizer = HashTokenizer(model.config.vocab_size)
+        throughput = {}
+
+        for batch_size in [1, 4, 8, 16, 32]:
+            worker = DynamicBatchInferenceWorker(
+                model, tokenizer, max_batch_size=batch_size, max_wait_ms=5
+            )
+            await worker.submit_many(texts[:batch_size])  # warmup
+
+            start = time.perf_counter()
+            results = await worker.submit_many(texts)
+            elapsed = time.perf_counter() - start
+
+            throughput[batch_size] = len(texts) / elapsed
+            stats = worker.get_stats()
+            await worker.stop()
+            worker.shutdown()
+
+            assert len(results) == len(texts)
+            print(
+                f"batch_size={batch_size:>2}  {throughput[batch_size]:8.1f} texts/s  "
+                f"avg_batch={stats['avg_batch_size']:.1f}  "
+                f"avg_forward={stats['avg_inference_time_ms']:.1f}ms"
+            )
+
+        # 배치 처리가 단건 처리보다 처리량이 높아야 함
+        assert throughput[16] > throughput[1]
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    @pytest.mark.skipif(not ONNX_RUNTIME_AVAILABLE, reason="onnxruntime not installed")
+    def test_onnx_int8_latency_memory_and_parity(self, model, tmp_path):
+        """PyTorch 대비 ONNX fp32/int8 지연시간, 메모리, 정확도 비교 테스트"""
+        texts = _sample_texts(128)
+        tokenizer = HashTokenizer(model.config.vocab_size)
+        paths = get_model_paths("bench/tiny-bert", str(tmp_path))
+        export_to_onnx(model, tokenizer, paths["fp32"])
+        quantize_model(paths["fp32"], paths["int8"])
+
+        process = psutil.Process()
+        backends = {"torch": model}
+        # PyTorch 모델은 이미 로드되어 있으므로 파라미터 크기로 대체
+        rss_delta = {"torch": sum(p.numel() * p.element_size() for p in model.parameters())}
+        for name in ("fp32", "int8"):
+            before = process.memory_info().rss
+            backends[f"onnx-{name}"] = OnnxSequenceClassifier(paths[name], model.config)
+            rss_delta[f"onnx-{name}"] = process.memory_info().rss - before
+
+        latency_ms = {}
+        for name, backend in backends.items():
+            batches = [tokenizer(texts[i:i + 16]) for i in range(0, len(texts), 16)]
+            with torch.inference_mode():
+                backend(**batches[0])  # warmup
+                start = time.perf_counter()
+                for encoded in batches:
+                    backend(**encoded)
+            latency_ms[name] = (time.perf_counter() - start) / len(batches) * 1000
+
+        parity = check_accuracy_parity(model, backends["onnx-int8"], tokenizer, texts)
+
+        for name in backends:
+            size = os.path.getsize(paths[name[5:]]) if name.startswith("onnx") else rss_delta[name]
+            print(
+                f"{name:<10} {latency_ms[name]:7.2f}ms/batch(16)  "
+                f"model={size / 1e6:6.1f}MB  rss_delta={rss_delta[name] / 1e6:6.1f}MB"
+            )
+        print(f"int8 parity: {parity}")
+
+        assert os.path.getsize(paths["int8"]) < os.path.getsize(paths["fp32"]) / 2
+        assert parity["label_agreement"] >= 0.9
+        assert latency_ms["onnx-int8"] < latency_ms["torch"]
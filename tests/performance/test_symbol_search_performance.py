@@ -0,0 +1,93 @@
+"""
+로컬 종목 검색 인덱스 성능 테스트
+
+50,000개 종목에서 티커/접두사/회사명/오타 질의의 지연 시간(p50, p99)을 측정합니다.
+"""
+
+import gc
+import random
+import time
+
+import pytest
+
+from backend.services.symbol_index import SymbolIndex
+
+SYLLABLES = [
+    "ap", "ple", "mi", "cro", "soft", "tech", "gen", "bio", "an", "tra", "ver", "sys",
+    "net", "dat", "on", "ex", "ia", "or", "ium", "lo", "qua", "zen", "pha", "med"
+]
+SUFFIXES = ["Inc", "Corp", "Holdings", "Group", "Ltd", "Technologies", "Therapeutics", ""]
+EXCHANGES = ["NASDAQ", "NYSE", "AMEX"]
+SECTORS = ["Technology", "Healthcare", "Financial Services", "Energy", "Industrials", "Consumer Cyclical"]
+
+
+def generate_listings(count, rng):
+    """합성 상장 목록 생성"""
+    listings, seen = [], set()
+    while len(listings) < count:
+        symbol = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(rng.randint(1, 5)))
+        if symbol in seen:
+            continue
+        seen.add(symbol)
+        words = [
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+            for _ in range(rng.randint(1, 2))
+        ]
+        listings.append({
+            "symbol": symbol,
+            "company_name": f"{' '.join(words)} {rng.choice(SUFFIXES)}".strip(),
+            "exchange": rng.choice(EXCHANGES),
+            "sector": rng.choice(SECTORS)
+        })
+    return listings
+
+
+@pytest.mark.performance
+class TestSymbolSearchPerformance:
+    """종목 검색 성능 테스트 클래스"""
+
+    @pytest.mark.timing_sensitive
+    def test_search_latency_50k_symbols(self):
+        """50k 종목 자동완성 p99 1ms 미만 테스트"""
+        rng = random.Random(7)
+        listings = generate_listings(50000, rng)
+        index = SymbolIndex()
+
+        start = time.perf_counter()
+        index.load(listings)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        queries = (
+            [row["symbol"] for row in rng.sample(listings, 250)]
+            + [row["symbol"][:2] for row in rng.sample(listings, 250)]
+            + [row["company_name"][:5] for row in rng.sample(listings, 250)]
+            + [row["company_name"][:9].replace("a", "e") for row in rng.sample(listings, 250)]
+        )
+        filters = [None, {"exchange": "NYSE"}, {"sector": "tech"}]
+
+        for query in queries[:100]:
+            index.search(query)
+
+        # 일시적 잡음을 배제하기 위해 3회 측정 중 가장 좋은 p99 사용
+        rounds = []
+        for _ in range(3):
+            latencies = []
+            gc.disable()
+            try:
+                for i, query in enumerate(queries):
+                    start = time.perf_counter()
+                    index.search(query, filters[i % 3])
+                    latencies.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+            latencies.sort()
+            rounds.append((
+                latencies[len(latencies) // 2] * 1_000_000,
+                latencies[int(len(latencies) * 0.99)] * 1_000_000
+            ))
+
+        p50, p99 = min(rounds, key=lambda item: item[1])
+        print(f"\nSymbol index: {len(listings)} listings built in {build_ms:.0f}ms; "
+              f"search p50 {p50:.0f}us, p99 {p99:.0f}us")
+
+        assert p99 < 1000
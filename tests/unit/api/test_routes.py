@@ -667,4 +667,42 @@ class TestRoutes:
             data = response.json()
             
             assert "detail" in data
-            assert "Internal server error" in data["detail"]
\ No newline at end of file
+            assert "Internal server error" in data["detail"]
+
+class TestGlobalServices:
+    """전역 서비스 초기화/종료 테스트 클래스"""
+    
+    @pytest.fixture
+    def routes_module(self, monkeypatch, tmp_path):
+        """전역 서비스 상태를 격리한 routes 모듈 픽스처"""
+        from backend.api import routes
+        for name in ("_stock_service", "_sentiment_service", "_cache_manager",
+                     "_unified_service", "_advanced_sentiment_service"):
+            monkeypatch.setattr(routes, name, None)
+        monkeypatch.setenv("OHLCV_STORE_PATH", str(tmp_path / "ohlcv"))
+        monkeypatch.delenv("SYMBOL_LISTINGS_PATH", raising=False)
+        monkeypatch.setattr(
+            "backend.services.advanced_sentiment_service.AdvancedSentimentService",
+            Mock(return_value=Mock(close=AsyncMock()))
+        )
+        return routes
+    
+    @pytest.mark.asyncio
+    async def test_lifespan_index_is_shared_with_search_and_stopped_on_close(self, routes_module):
+        """lifespan에서 적재한 심볼 인덱스를 /search 서비스가 사용하고 종료 시 갱신 작업이 멈추는지 테스트"""
+        records = [{"symbol": "AAPL", "company_name": "Apple Inc."}]
+        
+        with patch("backend.services.symbol_index.SymbolIndex.load_from_database",
+                   autospec=True, side_effect=lambda index, _: index.load(records)):
+            stock_service = await routes_module.initialize_global_services(session_factory=Mock())
+        
+        unified_service = await routes_module.get_unified_service()
+        assert unified_service.stock_service is stock_service
+        assert stock_service.symbol_index.is_loaded
+        refresh_task = stock_service.symbol_index._watch_task
+        assert refresh_task is not None and not refresh_task.done()
+        
+        await routes_module.close_global_services()
+        
+        assert refresh_task.cancelled()
+        assert stock_service.symbol_index._watch_task is None
@@ -0,0 +1,214 @@
+"""
+감성 분석 결과 캐시 단위 테스트
+
+정규화 텍스트 해시 키, LRU 제한, Redis 계층, 일괄 조회 및
+모델별 적중률 통계를 테스트합니다.
+"""
+
+import pytest
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis.aioredis
+
+from backend.cache.sentiment_result_cache import SentimentResultCache
+from backend.services.advanced_sentiment_service import AdvancedSentimentService, SentimentModel
+from backend.services.sentiment_service import SentimentService
+
+
+SCORES = [{"label": "positive", "score": 0.9}, {"label": "negative", "score": 0.1}]
+
+
+class TestSentimentResultCache:
+    """SentimentResultCache 테스트 클래스"""
+
+    @pytest.fixture
+    def cache(self):
+        """로컬 전용 캐시 픽스처"""
+        return SentimentResultCache(max_local_entries=3)
+
+    @pytest.fixture
+    async def redis_cache(self):
+        """fakeredis 계층을 사용하는 캐시 픽스처"""
+        cache = SentimentResultCache(max_local_entries=100)
+        await cache.initialize(fakeredis.aioredis.FakeRedis(decode_responses=True))
+        yield cache
+        await cache.close()
+
+    def test_key_is_stable_across_processes(self, cache):
+        """프로세스 간 키 안정성 테스트 (hash() 무작위화 회피)"""
+        code = (
+            "from backend.cache.sentiment_result_cache import SentimentResultCache;"
+            "print(SentimentResultCache().make_key('finbert', 'AAPL to the moon'))"
+        )
+        other = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+        assert other == cache.make_key("finbert", "AAPL to the moon")
+
+    def test_normalization_shares_entries(self, cache):
+        """공백/유니코드 정규화 테스트"""
+        cache.set_local("vader", "TSLA  rally\n today ", {"compound": 0.5})
+
+        assert cache.get_local("vader", "TSLA rally today") == {"compound": 0.5}
+        assert cache.get_local("vader", "ＴＳＬＡ rally today") == {"compound": 0.5}
+        # 대소문자는 모델 결과에 영향을 주므로 구분
+        assert cache.get_local("vader", "tsla rally today") is None
+
+    def test_entries_are_namespaced_by_model(self, cache):
+        """모델별 키 분리 테스트"""
+        cache.set_local("vader", "text", {"compound": 0.1})
+
+        assert cache.get_local("finbert", "text") is None
+
+    def test_local_tier_is_bounded_lru(self, cache):
+        """LRU 크기 제한 테스트"""
+        for text in ["a", "b", "c"]:
+            cache.set_local("m", text, text)
+        cache.get_local("m", "a")  # a를 최근 사용으로 갱신
+        cache.set_local("m", "d", "d")
+
+        assert cache.get_local("m", "b") is None
+        assert cache.get_local("m", "a") == "a"
+        assert cache.get_stats()["local_size"] == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_local_entries_are_dropped(self):
+        """로컬 TTL 만료 테스트"""
+        cache = SentimentResultCache(local_ttl=0)
+        cache.set_local("m", "text", 1)
+
+        assert cache.get_local("m", "text") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_serves_other_processes(self, redis_cache):
+        """로컬 미스 시 Redis 계층 조회 및 로컬 승격 테스트"""
+        await redis_cache.set("finbert", "beat and raise", SCORES)
+        redis_cache.clear_local()
+
+        assert await redis_cache.get("finbert", "beat and raise") == SCORES
+        assert redis_cache.get_local("finbert", "beat and raise") == SCORES
+
+        stats = redis_cache.get_stats()["models"]["finbert"]
+        assert stats["redis_hits"] == 1
+        assert stats["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self, redis_cache):
+        """일괄 조회 테스트"""
+        await redis_cache.set_many("finbert", {"one": SCORES, "two": SCORES})
+        redis_cache.clear_local()
+        redis_cache.set_local("finbert", "three", SCORES)
+        mget_calls = []
+        original_mget = redis_cache.redis_client.mget
+
+        async def counting_mget(keys):
+            mget_calls.append(keys)
+            return await original_mget(keys)
+
+        redis_cache.redis_client.mget = counting_mget
+
+        hits = await redis_cache.get_many("finbert", ["one", "two", "three", "four"])
+
+        assert set(hits) == {"one", "two", "three"}
+        assert len(mget_calls) == 1 and len(mget_calls[0]) == 3
+        stats = redis_cache.get_stats()["models"]["finbert"]
+        assert (stats["local_hits"], stats["redis_hits"], stats["misses"]) == (1, 2, 1)
+        assert stats["hit_rate"] == pytest.approx(0.75)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_does_not_count_as_lookup(self, redis_cache):
+        """선조회 통계 제외 테스트"""
+        await redis_cache.set("m", "cached", 1)
+        redis_cache.clear_local()
+
+        loaded = await redis_cache.prefetch("m", ["cached", "missing"])
+
+        assert loaded == 1
+        assert redis_cache.get_stats()["models"]["m"]["misses"] == 0
+        assert redis_cache.get_local("m", "cached") == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_degrades_to_local(self, redis_cache):
+        """Redis 장애 시 로컬 계층 동작 테스트"""
+        redis_cache.redis_client.mget = AsyncMock(side_effect=ConnectionError("down"))
+        redis_cache.redis_client.pipeline = MagicMock(side_effect=ConnectionError("down"))
+
+        assert await redis_cache.set("m", "text", 1) is False
+        assert await redis_cache.get("m", "text") == 1
+        assert await redis_cache.get("m", "other") is None
+        assert redis_cache.get_stats()["redis_errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_initialize_without_redis_stays_local(self):
+        """Redis 연결 실패 시 로컬 전용 모드 테스트"""
+        client = MagicMock()
+        client.ping = AsyncMock(side_effect=ConnectionError("refused"))
+        cache = SentimentResultCache()
+
+        assert await cache.initialize(client) is False
+        assert cache.get_stats()["redis_connected"] is False
+
+
+class TestSentimentServicesShareResultCache:
+    """감성 분석 서비스의 결과 캐시 사용 테스트"""
+
+    def test_vader_scores_each_text_once(self):
+        """동일 게시글 VADER 재계산 방지 테스트"""
+        service = SentimentService()
+        service.result_cache = SentimentResultCache()
+        service.analyzer = MagicMock(wraps=service.analyzer)
+
+        first = service.analyze_sentiment("AAPL earnings beat, very bullish")
+        second = service.analyze_sentiment("AAPL earnings beat,  very bullish")
+
+        assert service.analyzer.polarity_scores.call_count == 1
+        assert first.compound_score == second.compound_score
+        assert service.result_cache.get_stats()["models"]["vader_stock_lexicon"]["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_scoring_skips_scored_texts(self):
+        """배치 분석 시 기존 결과 재사용 및 중복 제거 테스트"""
+        cache_manager = MagicMock()
+        cache_manager.get = AsyncMock(return_value=None)
+        cache_manager.set = AsyncMock(return_value=True)
+        service = AdvancedSentimentService(cache_manager=cache_manager)
+        service.result_cache = SentimentResultCache()
+        worker = MagicMock()
+        worker.submit = AsyncMock(return_value=SCORES)
+        service.batchers[SentimentModel.DISTILBERT] = worker
+
+        await service.analyze_batch_sentiment(["stock up"], SentimentModel.DISTILBERT)
+        results = await service.analyze_batch_sentiment(
+            ["stock up", "stock down", "stock down"], SentimentModel.DISTILBERT
+        )
+
+        assert len(results) == 3
+        assert worker.submit.await_count == 2
+        stats = service.result_cache.get_stats()["models"]["distilbert"]
+        assert stats["local_hits"] == 1
+        assert stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_inference_backends_do_not_share_entries(self):
+        """torch/ONNX 백엔드별 결과 캐시 분리 테스트"""
+        cache_manager = MagicMock()
+        cache_manager.get = AsyncMock(return_value=None)
+        cache_manager.set = AsyncMock(return_value=True)
+        service = AdvancedSentimentService(cache_manager=cache_manager)
+        service.result_cache = SentimentResultCache()
+        worker = MagicMock()
+        worker.submit = AsyncMock(return_value=SCORES)
+        service.batchers[SentimentModel.DISTILBERT] = worker
+
+        service.result_cache_model_ids[SentimentModel.DISTILBERT] = "distilbert:torch"
+        await service.analyze_batch_sentiment(["stock up"], SentimentModel.DISTILBERT)
+        service.result_cache_model_ids[SentimentModel.DISTILBERT] = "distilbert:onnx"
+        await service.analyze_batch_sentiment(["stock up"], SentimentModel.DISTILBERT)
+
+        assert worker.submit.await_count == 2
+        models = service.result_cache.get_stats()["models"]
+        assert models["distilbert:torch"]["misses"] == 1
+        assert models["distilbert:onnx"]["misses"] == 1
@@ -0,0 +1,168 @@
+"""
+비동기 엔진 및 대량 적재 writer 단위 테스트
+
+비동기 드라이버 URL 변환, 크기/시간 기준 배치 플러시, ON CONFLICT 중복 무시,
+플러시 실패 시 재시도 버퍼링 및 종료 시 플러시를 aiosqlite로 테스트합니다.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.database import get_async_database_url
+from backend.models.database_models import SentimentData, Stock, StockPrice
+from backend.services.bulk_writer import BulkWriter
+
+
+def price_row(stock_id=1, price=100.0, **overrides):
+    """stock_prices 행 생성"""
+    row = {
+        "stock_id": stock_id, "price": price, "open_price": price, "high_price": price + 1,
+        "low_price": price - 1, "close_price": price, "volume": 1000, "timestamp": datetime.utcnow()
+    }
+    row.update(overrides)
+    return row
+
+
+def sentiment_row(stock_id=1, score=0.5):
+    """sentiment_data 행 생성"""
+    return {
+        "stock_id": stock_id, "source": "REDDIT", "compound_score": score, "positive_score": 0.6,
+        "negative_score": 0.1, "neutral_score": 0.3, "confidence": 0.9, "mention_count": 1,
+        "positive_mentions": 1, "negative_mentions": 0, "neutral_mentions": 0
+    }
+
+
+async def count_rows(session_factory, model):
+    """테이블 행 수 조회"""
+    async with session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(model.__table__))).scalar()
+
+
+class TestAsyncDatabaseUrl:
+    """비동기 드라이버 URL 변환 테스트 클래스"""
+
+    def test_maps_sync_urls_to_async_drivers(self):
+        """SQLite/PostgreSQL URL이 aiosqlite/asyncpg로 변환되는지 테스트"""
+        assert get_async_database_url("sqlite:///./dev.db") == "sqlite+aiosqlite:///./dev.db"
+        assert get_async_database_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+        assert get_async_database_url("postgresql+asyncpg://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+
+
+class TestBulkWriter:
+    """BulkWriter 테스트 클래스"""
+
+    @pytest.fixture
+    async def session_factory(self, tmp_path):
+        """임시 SQLite 파일을 사용하는 비동기 세션 팩토리"""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(
+                lambda sync_connection: [
+                    table.create(sync_connection)
+                    for table in (Stock.__table__, StockPrice.__table__, SentimentData.__table__)
+                ]
+            )
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches(self, session_factory):
+        """배치 크기에 도달하면 자동으로 플러시되는지 테스트"""
+        writer = BulkWriter(session_factory, max_batch_size=10, flush_interval=60)
+        for i in range(25):
+            await writer.add_stock_price(price_row(price=100.0 + i))
+
+        assert await count_rows(session_factory, StockPrice) == 20
+        assert writer.get_stats()["pending_rows"]["stock_prices"] == 5
+
+        assert await writer.flush() == 5
+        assert await count_rows(session_factory, StockPrice) == 25
+        assert writer.stats["batches_written"] == 3
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush(self, session_factory):
+        """주기적 플러시 및 누락된 timestamp 기본값 테스트"""
+        writer = BulkWriter(session_factory, max_batch_size=1000, flush_interval=0.02)
+        await writer.start()
+        try:
+            await writer.add_sentiment_data(sentiment_row())
+            await writer.add_many("sentiment_data", [sentiment_row(score=0.1), sentiment_row(score=0.2)])
+            for _ in range(50):
+                if writer.stats["rows_written"] == 3:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await writer.close()
+
+        assert await count_rows(session_factory, SentimentData) == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicate_rows_are_ignored(self, session_factory):
+        """명시적 id가 중복된 행이 ON CONFLICT DO NOTHING으로 무시되는지 테스트"""
+        writer = BulkWriter(session_factory, max_batch_size=100, flush_interval=60)
+        await writer.add_many("stock_prices", [price_row(id=i) for i in range(1, 6)])
+        await writer.flush()
+
+        await writer.add_many("stock_prices", [price_row(id=i) for i in range(3, 9)])
+        await writer.flush()
+
+        assert await count_rows(session_factory, StockPrice) == 8
+        assert writer.stats["flush_errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_rows(self, session_factory):
+        """플러시 실패 시 행이 보존되고 버퍼 상한을 넘는 오래된 행은 버려지는지 테스트"""
+        def unavailable():
+            raise ConnectionError("database unavailable")
+
+        writer = BulkWriter(unavailable, max_batch_size=100, flush_interval=60, max_buffered_rows=4)
+        await writer.add_many("stock_prices", [price_row(price=float(i)) for i in range(6)])
+
+        assert await writer.flush() == 0
+        assert writer.stats["flush_errors"] == 1
+        assert writer.stats["rows_dropped"] == 2
+
+        writer.session_factory = session_factory
+        assert await writer.flush() == 4
+        async with session_factory() as session:
+            prices = (await session.execute(select(StockPrice.__table__.c.price))).scalars().all()
+        assert sorted(prices) == [2.0, 3.0, 4.0, 5.0]
+
+    @pytest.mark.asyncio
+    async def test_rejected_rows_are_isolated(self, session_factory):
+        """제약 조건 위반 행만 격리(dead-letter)되고 나머지 행은 기록되는지 테스트"""
+        writer = BulkWriter(session_factory, max_batch_size=100, flush_interval=60)
+        rows = [price_row(price=float(i)) for i in range(8)]
+        rows[5]["stock_id"] = None  # NOT NULL 위반
+        await writer.add_many("stock_prices", rows)
+
+        assert await writer.flush() == 7
+        assert await count_rows(session_factory, StockPrice) == 7
+
+        stats = writer.get_stats()
+        assert stats["pending_rows"]["stock_prices"] == 0
+        assert stats["rows_rejected"] == 1
+        assert stats["dead_letters"] == 1
+        assert writer.dead_letters[0]["row"]["price"] == 5.0
+        assert "NOT NULL" in writer.dead_letters[0]["error"]
+
+        # 불량 행이 테이블을 막지 않음
+        await writer.add_stock_price(price_row(price=9.0))
+        assert await writer.flush() == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_rows(self, session_factory):
+        """종료 시 남은 행이 기록되는지 테스트"""
+        writer = BulkWriter(session_factory, max_batch_size=1000, flush_interval=60)
+        await writer.start()
+        await writer.add_stock_price(price_row())
+
+        await writer.close()
+
+        assert await count_rows(session_factory, StockPrice) == 1
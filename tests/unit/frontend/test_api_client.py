@@ -0,0 +1,128 @@
+"""
+프론트엔드 API 클라이언트 단위 테스트
+
+경로별 지연을 주입한 가짜 전송 어댑터로 대시보드 섹션을 순차 조회할 때와
+동시 조회할 때의 지연을 비교하고, 통합 엔드포인트 요청 형식을 테스트합니다.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+pytest.importorskip("streamlit")
+
+from frontend.api_client import InsiteChartAPIClient
+
+
+PATH_LATENCY = {
+    "/api/v1/market/indices": 0.15,
+    "/api/v1/market/sentiment": 0.10,
+    "/api/v1/trending": 0.12,
+    "/api/v1/market/statistics": 0.20,
+    "/api/v1/stocks/batch": 0.10,
+    "/api/v1/dashboard": 0.20
+}
+
+
+class LatencyAdapter(BaseAdapter):
+    """경로별 지연 후 고정 JSON 응답을 반환하는 가짜 어댑터"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        path = requests.utils.urlparse(request.url).path
+        self.requests.append(request)
+        time.sleep(PATH_LATENCY.get(path, 0))
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = json.dumps({"success": True, "data": {"path": path}}).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def api_client():
+    client = InsiteChartAPIClient("http://testserver/api/v1")
+    adapter = LatencyAdapter()
+    client.session.mount("http://", adapter)
+    client.adapter = adapter
+    yield client
+    client.executor.shutdown()
+
+
+class TestAPIClient:
+    """InsiteChartAPIClient 테스트 클래스"""
+
+    def test_concurrent_sections_latency(self, api_client):
+        """섹션 동시 조회 시 지연이 합이 아닌 최댓값 수준인지 테스트"""
+        start = time.perf_counter()
+        api_client.get_market_indices()
+        api_client.get_market_sentiment()
+        api_client.get_trending_stocks(5)
+        api_client.get_market_statistics()
+        api_client.get_stocks(["AAPL", "MSFT"])
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sections = api_client.get_dashboard_sections(symbols=["AAPL", "MSFT"], trending_limit=5)
+        concurrent = time.perf_counter() - start
+
+        print(f"\nAPI client dashboard: sequential {sequential * 1000:.0f}ms, concurrent {concurrent * 1000:.0f}ms")
+
+        assert sequential >= 0.67
+        assert concurrent < 0.3
+        assert sections["trending"]["data"]["path"] == "/api/v1/trending"
+        assert all(response["success"] for response in sections.values())
+
+    def test_fetch_concurrently_reports_errors(self, api_client):
+        """동시 조회 중 예외가 해당 항목의 오류 응답으로 반환되는지 테스트"""
+        def failing_call():
+            raise RuntimeError("boom")
+
+        results = api_client.fetch_concurrently({"ok": api_client.get_market_sentiment, "broken": failing_call})
+
+        assert results["ok"]["success"] is True
+        assert results["broken"] == {"success": False, "error": "Unexpected error: boom"}
+
+    def test_worker_errors_reported_from_calling_thread(self, api_client):
+        """워커 스레드의 요청 오류가 st.error 없이 수집되어 호출 스레드에서 표시되는지 테스트"""
+        def unreachable():
+            raise requests.exceptions.ConnectionError("refused")
+
+        api_client.session.request = lambda *args, **kwargs: unreachable()
+        reported = []
+        with patch("frontend.api_client.st.error",
+                   side_effect=lambda message: reported.append((message, threading.current_thread()))):
+            results = api_client.fetch_concurrently({"indices": api_client.get_market_indices})
+
+        assert results["indices"] == {"success": False, "error": "API request failed: refused"}
+        assert reported == [("API request failed: refused", threading.current_thread())]
+
+    def test_dashboard_sections_subset(self, api_client):
+        """지정한 섹션만 조회하는지 테스트"""
+        sections = api_client.get_dashboard_sections(symbols=["AAPL"], sections=["stocks", "trending"])
+
+        assert sorted(sections) == ["stocks", "trending"]
+        assert sections["stocks"]["data"]["path"] == "/api/v1/stocks/batch"
+
+    def test_dashboard_request(self, api_client):
+        """통합 대시보드 요청 파라미터 테스트"""
+        api_client.get_dashboard(symbols=["aapl", "msft"], trending_limit=5)
+
+        request = api_client.adapter.requests[-1]
+        query = requests.utils.urlparse(request.url).query
+        assert request.method == "GET"
+        assert "symbols=AAPL%2CMSFT" in query
+        assert "trending_limit=5" in query
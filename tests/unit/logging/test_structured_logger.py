@@ -427,4 +427,153 @@ class TestStructuredLogger:
         assert "Debug message" not in log_output
         assert "Info message" not in log_output
         assert "Warning message" in log_output
-        assert "Error message" in log_output
\ No newline at end of file
+        assert "Error message" in log_output
+
+class TestAsyncLogPipeline:
+    """비동기 배치 로그 파이프라인 테스트 클래스"""
+    
+    @pytest.fixture
+    def async_logger(self, tmp_path):
+        """비동기 모드 로거 픽스처 (파일 출력)"""
+        log_file = tmp_path / "async.log"
+        structured_logger = StructuredLogger(
+            "test_async_logger",
+            log_level="DEBUG",
+            enable_console=False,
+            log_file_path=str(log_file),
+            async_mode=True,
+            flush_interval=0.01
+        )
+        yield structured_logger, log_file
+        structured_logger.close()
+    
+    def _read_lines(self, log_file):
+        return [json.loads(line) for line in log_file.read_text().splitlines() if line]
+    
+    def test_records_are_written_by_background_thread(self, async_logger):
+        """기록 스레드에서 JSON 라인 기록 테스트"""
+        structured_logger, log_file = async_logger
+        
+        structured_logger.info("Async message", request_id="req-1", iteration=3)
+        structured_logger.flush()
+        
+        entries = self._read_lines(log_file)
+        assert len(entries) == 1
+        assert entries[0]["message"] == "Async message"
+        assert entries[0]["context"]["request_id"] == "req-1"
+        assert entries[0]["extra"]["iteration"] == 3
+        assert structured_logger.writer._thread.name == "structured-log-writer"
+    
+    def test_records_are_batched(self, async_logger):
+        """여러 레코드의 배치 기록 테스트"""
+        structured_logger, log_file = async_logger
+        
+        for i in range(500):
+            structured_logger.info(f"Batched message {i}")
+        structured_logger.flush()
+        
+        stats = structured_logger.get_stats()
+        assert len(self._read_lines(log_file)) == 500
+        assert stats["records_written"] == 500
+        assert stats["batches_written"] < 500
+    
+    def test_close_drains_pending_records(self, tmp_path):
+        """종료 시 남은 레코드 기록 테스트"""
+        log_file = tmp_path / "drain.log"
+        structured_logger = StructuredLogger(
+            "test_drain_logger",
+            enable_console=False,
+            log_file_path=str(log_file),
+            async_mode=True
+        )
+        
+        for i in range(100):
+            structured_logger.warning(f"Pending {i}")
+        structured_logger.close()
+        
+        assert len(log_file.read_text().splitlines()) == 100
+    
+    def test_full_queue_drops_without_blocking(self, tmp_path):
+        """큐가 가득 찬 경우 비차단 폐기 테스트"""
+        structured_logger = StructuredLogger(
+            "test_full_queue_logger",
+            enable_console=False,
+            log_file_path=str(tmp_path / "full.log"),
+            async_mode=True,
+            max_queue_size=10
+        )
+        structured_logger.writer.stop()
+        
+        for i in range(50):
+            structured_logger.info(f"Overflow {i}")
+        
+        assert structured_logger.get_stats()["dropped"] == 40
+        structured_logger.close()
+    
+    def test_level_sampling_skips_record_creation(self):
+        """레벨별 샘플링 테스트 (샘플링 제외 시 레코드 생성 생략)"""
+        mock_log_handler = logging.StreamHandler(StringIO())
+        structured_logger = StructuredLogger(
+            "test_sampling_logger",
+            log_level="DEBUG",
+            enable_console=False,
+            sample_rates={"DEBUG": 0.0}
+        )
+        structured_logger.logger.addHandler(mock_log_handler)
+        
+        with patch.object(structured_logger.logger, "makeRecord", wraps=structured_logger.logger.makeRecord) as make_record:
+            for i in range(100):
+                structured_logger.debug(f"Hot path {i}")
+            structured_logger.info("Kept")
+        
+        assert make_record.call_count == 1
+        assert structured_logger.get_stats()["sampled_out"] == 100
+        assert "Hot path" not in mock_log_handler.stream.getvalue()
+    
+    def test_bound_logger_shares_parent_pipeline(self, async_logger):
+        """바인딩된 로거의 핸들러 공유 및 close() 후 부모 로깅 유지 테스트"""
+        structured_logger, log_file = async_logger
+        
+        bound_logger = structured_logger.bind(request_id="req-1")
+        bound_logger.info("Bound message")
+        bound_logger.close()
+        structured_logger.info("Parent message")
+        structured_logger.flush()
+        
+        entries = self._read_lines(log_file)
+        assert [entry["message"] for entry in entries] == ["Bound message", "Parent message"]
+        assert entries[0]["context"]["request_id"] == "req-1"
+        assert structured_logger.queue_handler in structured_logger.logger.handlers
+        assert bound_logger.writer is structured_logger.writer
+        assert structured_logger.get_stats()["records_written"] == 2
+    
+    def test_level_sampling_applies_to_propagated_records(self, tmp_path):
+        """하위 모듈 로거(logging.getLogger)에서 전파된 레코드 샘플링 테스트"""
+        log_file = tmp_path / "hot_path.log"
+        structured_logger = StructuredLogger(
+            "test_hot_path",
+            log_level="DEBUG",
+            enable_console=False,
+            log_file_path=str(log_file),
+            async_mode=True,
+            sample_rates={"DEBUG": 0.0}
+        )
+        module_logger = logging.getLogger("test_hot_path.cache")
+        
+        for i in range(100):
+            module_logger.debug("Cache hit for key %s", i)
+        module_logger.info("Kept")
+        structured_logger.close()
+        
+        assert [entry["message"] for entry in self._read_lines(log_file)] == ["Kept"]
+        assert structured_logger.get_stats()["sampled_out"] == 100
+    
+    def test_level_sampling_rate(self):
+        """샘플링 비율 테스트"""
+        from backend.logging.structured_logger import LevelSamplingFilter
+        
+        sampling_filter = LevelSamplingFilter({"DEBUG": 0.1})
+        kept = sum(sampling_filter.should_sample(logging.DEBUG) for _ in range(10000))
+        
+        assert 700 < kept < 1300
+        assert all(sampling_filter.should_sample(logging.ERROR) for _ in range(100))
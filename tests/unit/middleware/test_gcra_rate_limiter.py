@@ -0,0 +1,175 @@
+"""
+GCRA 속도 제한기 단위 테스트
+
+Lua 스크립트 기반 GCRA 판정의 원자성(동시 요청), 요청당 Redis 왕복 횟수,
+다중 정책 일괄 평가, 버스트/패널티, 동적 조정 및 스크립트 재적재를 fakeredis로 테스트합니다.
+"""
+
+import pytest
+import asyncio
+import time
+from unittest.mock import patch
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from backend.middleware.rate_limit_middleware import AdvancedRateLimiter, RateLimitPolicy
+
+
+class CountingRedis(fakeredis.FakeAsyncRedis):
+    """명령 실행 횟수(네트워크 왕복)를 세는 fakeredis 클라이언트"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.round_trips = 0
+
+    async def execute_command(self, *args, **options):
+        self.round_trips += 1
+        return await super().execute_command(*args, **options)
+
+
+def _limiter(server, requests=100, window=60, penalty=0):
+    limiter = AdvancedRateLimiter()
+    limiter.redis_client = CountingRedis(server=server)
+    limiter.default_policies["default"] = RateLimitPolicy(requests=requests, window=window, penalty=penalty)
+    return limiter
+
+
+class TestGCRARateLimiter:
+    """GCRA 속도 제한기 테스트 클래스"""
+
+    @pytest.fixture
+    def server(self):
+        """인스턴스 간 공유되는 fakeredis 서버"""
+        return fakeredis.FakeServer()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_never_exceed_limit(self, server):
+        """여러 인스턴스의 동시 요청에서도 허용 수가 정확히 제한과 같은지 테스트"""
+        limiters = [_limiter(server, requests=100) for _ in range(4)]
+        now = time.time()
+
+        # 시계를 고정해 실행 중 새 토큰이 생기지 않도록 함
+        with patch("backend.middleware.rate_limit_middleware.time.time", return_value=now):
+            results = await asyncio.gather(*[
+                limiters[i % 4].is_allowed("ip:10.0.0.1") for i in range(400)
+            ])
+
+        assert sum(result.allowed for result in results) == 100
+        assert all(result.retry_after >= 1 for result in results if not result.allowed)
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip_per_decision(self, server):
+        """판정마다 Redis 왕복이 한 번(EVALSHA)인지 테스트"""
+        limiter = _limiter(server)
+        await limiter.is_allowed("ip:1")  # 스크립트 적재
+
+        limiter.redis_client.round_trips = 0
+        for _ in range(10):
+            await limiter.is_allowed("ip:1", burst_mode=True)
+
+        assert limiter.redis_client.round_trips == 10
+
+    @pytest.mark.asyncio
+    async def test_remaining_and_refill(self, server):
+        """남은 요청 수와 시간 경과에 따른 회복 테스트"""
+        limiter = _limiter(server, requests=5, window=60)
+        now = time.time()
+
+        with patch("backend.middleware.rate_limit_middleware.time.time", return_value=now):
+            remaining = [(await limiter.is_allowed("ip:1")).remaining for _ in range(5)]
+            denied = await limiter.is_allowed("ip:1")
+
+        assert remaining == [4, 3, 2, 1, 0]
+        assert not denied.allowed
+        assert denied.retry_after == 12
+
+        # 방출 간격(12초)이 지나면 한 건 허용
+        with patch("backend.middleware.rate_limit_middleware.time.time", return_value=now + 12):
+            assert (await limiter.is_allowed("ip:1")).allowed
+            assert not (await limiter.is_allowed("ip:1")).allowed
+
+    @pytest.mark.asyncio
+    async def test_state_is_one_key_per_identifier(self, server):
+        """식별자당 TAT 키 하나만 저장되는지 테스트"""
+        limiter = _limiter(server)
+        for _ in range(50):
+            await limiter.is_allowed("ip:1")
+
+        keys = await limiter.redis_client.keys(f"{limiter.key_prefix}gcra:ip:1*")
+        assert len(keys) == 1
+        assert await limiter.redis_client.pttl(keys[0]) > 0
+
+    @pytest.mark.asyncio
+    async def test_multiple_limits_in_one_call(self, server):
+        """다중 정책을 한 번의 호출로 평가하고 거부 시 어떤 카운터도 소비하지 않는지 테스트"""
+        limiter = _limiter(server, requests=100)
+        limiter.default_policies["search"] = RateLimitPolicy(requests=2, window=60)
+        limits = [("default", "default"), ("search", "search")]
+        await limiter.is_allowed("ip:warmup")
+
+        limiter.redis_client.round_trips = 0
+        results = [await limiter.check_multiple_limits("ip:1", limits) for _ in range(4)]
+
+        assert limiter.redis_client.round_trips == 4
+        assert [result.allowed for result in results] == [True, True, False, False]
+        assert results[1].remaining == 0
+        assert results[2].policy.requests == 2
+
+        stats = await limiter.get_rate_limit_stats("ip:1", user_tier="default")
+        assert stats["default"]["current_window"] == 2
+
+    @pytest.mark.asyncio
+    async def test_burst_limit_and_penalty(self, server):
+        """버스트 제한 초과 시 패널티 적용 테스트"""
+        limiter = _limiter(server, requests=100, window=60, penalty=30)  # 버스트 = 25 / 15초
+
+        results = [await limiter.is_allowed("ip:1", burst_mode=True) for _ in range(26)]
+
+        assert all(result.allowed for result in results[:25])
+        assert not results[25].allowed
+        assert results[25].retry_after == 30
+        # 패널티 동안에는 버스트 없이도 거부
+        assert not (await limiter.is_allowed("ip:1")).allowed
+
+    @pytest.mark.asyncio
+    async def test_window_limit_without_burst_sets_no_penalty(self, server):
+        """기본 윈도우 초과만으로는 패널티가 부과되지 않는지 테스트 (버스트 위반 시에만 부과)"""
+        limiter = _limiter(server, requests=2, window=60, penalty=30)
+
+        results = [await limiter.is_allowed("ip:1") for _ in range(3)]
+
+        assert [result.allowed for result in results] == [True, True, False]
+        assert results[2].retry_after <= 30
+        assert await limiter.redis_client.keys("*:penalty") == []
+
+    @pytest.mark.asyncio
+    async def test_dynamic_adjustment_is_applied_in_script(self, server):
+        """동적 조정 계수가 추가 왕복 없이 적용되는지 테스트"""
+        limiter = _limiter(server, requests=100)
+        await limiter.update_dynamic_adjustment(0.95)  # 고부하: 50% 감소
+
+        info = await limiter.is_allowed("ip:1")
+
+        assert info.policy.requests == 50
+        assert info.remaining == 49
+
+    @pytest.mark.asyncio
+    async def test_script_reloaded_after_flush(self, server):
+        """SCRIPT FLUSH 후 NOSCRIPT 시 스크립트가 자동 재적재되는지 테스트"""
+        limiter = _limiter(server)
+        await limiter.is_allowed("ip:1")
+        await limiter.redis_client.script_flush()
+
+        assert (await limiter.is_allowed("ip:1")).allowed
+
+    @pytest.mark.asyncio
+    async def test_redis_error_fails_open(self):
+        """Redis 오류 시 기본 정책으로 허용하는지 테스트"""
+        limiter = AdvancedRateLimiter()
+        limiter.redis_client = None
+
+        info = await limiter.is_allowed("ip:1")
+
+        assert info.allowed
+        assert info.policy is limiter.default_policies["default"]
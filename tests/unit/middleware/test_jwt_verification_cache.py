@@ -0,0 +1,148 @@
+"""
+JWT 검증 캐시 단위 테스트
+
+검증된 토큰 캐시(exp 만료, LRU 제한), 미리 계산된 권한 집합 및
+반복 토큰의 서명 검증 생략을 테스트합니다.
+"""
+
+import pytest
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import jwt
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from backend.middleware.auth_middleware import JWTAuthMiddleware, VerifiedTokenCache
+
+
+SECRET = "test-secret-key"
+
+
+def _token(exp_offset=3600, iat_offset=0, **claims):
+    now = int(time.time())
+    payload = {"user_id": "user1", "role": "user", "permissions": ["stock:read"], **claims}
+    payload["iat"] = now + iat_offset
+    if exp_offset is not None:
+        payload["exp"] = now + exp_offset
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+def _request():
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+def _bearer_request(token):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"authorization", f"Bearer {token}".encode())]
+    })
+
+
+class TestJWTVerificationCache:
+    """JWT 검증 캐시 테스트 클래스"""
+
+    @pytest.fixture
+    def middleware(self):
+        """테스트용 미들웨어 픽스처"""
+        return JWTAuthMiddleware(secret_key=SECRET)
+
+    def test_repeat_token_skips_signature_verification(self, middleware):
+        """반복 토큰은 jwt.decode를 다시 호출하지 않는지 테스트"""
+        token = _token()
+
+        with patch("backend.middleware.auth_middleware.jwt.decode", wraps=jwt.decode) as decode:
+            for _ in range(5):
+                assert middleware.decode_token(token)["user_id"] == "user1"
+
+        assert decode.call_count == 1
+        assert middleware.token_cache.get_stats()["hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_verify_token_populates_permission_set(self, middleware):
+        """verify_token이 요청 상태에 미리 계산된 권한 집합을 저장하는지 테스트"""
+        request = _bearer_request(_token(permissions=["stock:read", "watchlist:write"]))
+
+        await middleware.verify_token(request)
+
+        assert request.state.user_id == "user1"
+        assert request.state.permission_set == frozenset({"stock:read", "watchlist:write"})
+        assert middleware.check_permission(request, "watchlist:write")
+        assert not middleware.check_permission(request, "admin:write")
+
+    def test_admin_has_all_permissions(self, middleware):
+        """관리자 권한 확인 테스트"""
+        request = _request()
+        middleware._apply_user_state(request, _token(role="admin", permissions=[]))
+
+        assert middleware.check_permission(request, "anything")
+
+    def test_check_permission_without_precomputed_set(self, middleware):
+        """권한 집합이 없는 요청 상태도 처리하는지 테스트"""
+        request = _request()
+        request.state.user = {"user_id": "user1"}
+        request.state.user_role = "user"
+        request.state.permissions = ["stock:read"]
+
+        assert middleware.check_permission(request, "stock:read")
+        assert request.state.permission_set == frozenset({"stock:read"})
+
+    def test_cached_entry_expires_at_token_exp(self, middleware):
+        """캐시 항목이 토큰 exp 시각 이후 사용되지 않는지 테스트"""
+        token = _token(exp_offset=1)
+        middleware.decode_token(token)
+
+        with patch("backend.middleware.auth_middleware.time.time", return_value=time.time() + 5):
+            assert middleware.token_cache.get(token) is None
+        assert middleware.token_cache.get_stats()["expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_rejected(self, middleware):
+        """만료된 토큰 거부 테스트"""
+        with pytest.raises(HTTPException) as exc_info:
+            await middleware.verify_token(_bearer_request(_token(exp_offset=-10)))
+
+        assert exc_info.value.status_code == 401
+        assert middleware.token_cache.get_stats()["size"] == 0
+
+    def test_future_iat_is_rejected(self, middleware):
+        """발행 시각이 미래인 토큰 거부 테스트"""
+        with pytest.raises(jwt.InvalidTokenError):
+            middleware.decode_token(_token(iat_offset=600))
+
+        assert middleware.token_cache.get_stats()["size"] == 0
+
+    def test_invalid_signature_is_not_cached(self, middleware):
+        """서명이 잘못된 토큰은 캐시되지 않는지 테스트"""
+        forged = jwt.encode({"user_id": "user1", "exp": int(time.time()) + 60}, "other-secret", algorithm="HS256")
+
+        for _ in range(2):
+            with pytest.raises(jwt.InvalidSignatureError):
+                middleware.decode_token(forged)
+
+        assert middleware.token_cache.get_stats()["size"] == 0
+
+    def test_cache_is_bounded_lru(self):
+        """LRU 캐시 크기 제한 테스트"""
+        cache = VerifiedTokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.put("a", {"exp": exp}, frozenset())
+        cache.put("b", {"exp": exp}, frozenset())
+        cache.get("a")
+        cache.put("c", {"exp": exp}, frozenset())
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_tokens_without_exp_use_default_ttl(self):
+        """exp 클레임이 없는 토큰의 기본 캐시 시간 테스트"""
+        cache = VerifiedTokenCache(default_ttl=10)
+        cache.put("token", {"user_id": "user1"}, frozenset())
+
+        assert cache.get("token") is not None
+        with patch("backend.middleware.auth_middleware.time.time", return_value=time.time() + 11):
+            assert cache.get("token") is None
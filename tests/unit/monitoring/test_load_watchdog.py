@@ -0,0 +1,236 @@
+"""
+이벤트 루프 부하 감시자 단위 테스트
+
+루프 지연 측정, 실행기 큐 깊이 및 처리 중 요청 수 신호, 부하 단계 히스테리시스,
+부하 차단 핸들러(캐시 워밍 중지, 알림 주기 연장, 만료 캐시 제공) 및
+OperationalMonitor 상태 평가 연동을 테스트합니다.
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.cache.unified_cache import UnifiedCacheManager
+from backend.monitoring.load_watchdog import LoadLevel, LoadWatchdog
+from backend.monitoring.operational_monitor import (
+    OperationalMonitor,
+    OperationalStatus,
+    SystemHealthMetrics
+)
+from backend.services.intelligent_cache_manager import IntelligentCacheManager
+
+
+class TestLoadWatchdog:
+    """LoadWatchdog 테스트 클래스"""
+
+    @pytest.fixture
+    def watchdog(self):
+        """빠른 회복 설정의 감시자 픽스처"""
+        return LoadWatchdog(check_interval=0.02, recovery_checks=3)
+
+    @pytest.mark.asyncio
+    async def test_measures_event_loop_lag(self, watchdog):
+        """이벤트 루프를 막는 작업이 지연으로 측정되는지 테스트"""
+        await watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            time.sleep(0.3)  # 이벤트 루프 점유
+            await asyncio.sleep(0.05)
+        finally:
+            await watchdog.stop()
+
+        assert watchdog.stats["max_loop_lag_ms"] >= 200
+        assert watchdog.stats["checks"] >= 2
+
+    @pytest.mark.asyncio
+    async def test_escalates_immediately_and_recovers_with_hysteresis(self, watchdog):
+        """악화는 즉시, 회복은 연속 안정 측정 후 반영되는지 테스트"""
+        assert (await watchdog.check(600.0)).level == LoadLevel.OVERLOADED
+
+        for _ in range(2):
+            assert (await watchdog.check(1.0)).level == LoadLevel.OVERLOADED
+        # 회복 도중 다시 지연이 발생하면 카운트 초기화
+        await watchdog.check(600.0)
+        for _ in range(2):
+            await watchdog.check(1.0)
+        assert watchdog.level == LoadLevel.OVERLOADED
+
+        await watchdog.check(1.0)
+        assert watchdog.level == LoadLevel.NORMAL
+        assert watchdog.stats["level_changes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_executor_queue_depth_signal(self, watchdog):
+        """실행기 큐 깊이가 부하 단계에 반영되는지 테스트"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        watchdog.register_executor("stock_service", executor)
+        try:
+            futures = [executor.submit(release.wait) for _ in range(10)]
+            signals = await watchdog.check(0.0)
+        finally:
+            release.set()
+            for future in futures:
+                future.result()
+            executor.shutdown()
+
+        assert signals.executor_queue_depth >= 8
+        assert signals.level == LoadLevel.ELEVATED
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_tracked(self, watchdog):
+        """처리 중 요청 수 추적 테스트"""
+        with watchdog.track_request(), watchdog.track_request():
+            assert (await watchdog.check(0.0)).in_flight_requests == 2
+
+        assert (await watchdog.check(0.0)).in_flight_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_handler_does_not_block_others(self, watchdog):
+        """핸들러 오류 격리 및 코루틴 핸들러 지원 테스트"""
+        received = []
+
+        async def on_level(level):
+            received.append(level)
+
+        watchdog.register_shedding_handler("broken", MagicMock(side_effect=RuntimeError("boom")))
+        watchdog.register_shedding_handler("async", on_level)
+
+        await watchdog.check(150.0)
+
+        assert received == [LoadLevel.ELEVATED]
+        assert watchdog.stats["handler_errors"] == 1
+
+
+class TestLoadShedding:
+    """부하 차단 서비스 연동 테스트 클래스"""
+
+    @pytest.fixture
+    def notification_service(self):
+        """알림 서비스 픽스처"""
+        from backend.services.realtime_notification_service import RealtimeNotificationService
+        return RealtimeNotificationService(MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_degradable_services_follow_load_level(self, notification_service):
+        """부하 단계에 따라 워밍 중지, 알림 주기 연장, 만료 캐시 제공이 전환되는지 테스트"""
+        watchdog = LoadWatchdog(recovery_checks=1)
+        cache_manager = UnifiedCacheManager(backend=None)
+        intelligent_cache = IntelligentCacheManager()
+        watchdog.attach_degradable_services(
+            cache_manager=cache_manager,
+            intelligent_cache_manager=intelligent_cache,
+            notification_service=notification_service
+        )
+
+        await watchdog.check(600.0)
+        assert cache_manager.serve_stale
+        assert intelligent_cache.warmups_paused
+        assert notification_service.monitor_interval_multiplier == 4.0
+
+        await watchdog.check(0.0)
+        assert not cache_manager.serve_stale
+        assert not intelligent_cache.warmups_paused
+        assert notification_service.monitor_interval_multiplier == 1.0
+
+    @pytest.mark.asyncio
+    async def test_stop_restores_normal_behaviour(self, notification_service):
+        """감시자 중지 시 서비스가 정상 동작으로 복원되는지 테스트"""
+        watchdog = LoadWatchdog()
+        watchdog.attach_degradable_services(notification_service=notification_service)
+
+        await watchdog.check(150.0)
+        assert notification_service.monitor_interval_multiplier == 2.0
+
+        await watchdog.stop()
+        assert notification_service.monitor_interval_multiplier == 1.0
+
+    @pytest.mark.asyncio
+    async def test_stale_local_entries_served_while_shedding(self):
+        """부하 차단 중 만료된 로컬 항목을 백엔드 호출 없이 반환하는지 테스트"""
+        backend = MagicMock()
+        backend.get = AsyncMock(return_value=None)
+        cache_manager = UnifiedCacheManager(backend=backend)
+        cache_manager._store_in_local_cache("stock:AAPL", {"price": 1.0}, ttl=60)
+        cache_manager._local_cache_ttl["stock:AAPL"] = time.time() - 10
+
+        cache_manager.set_serve_stale(True)
+        assert await cache_manager.get("stock:AAPL") == {"price": 1.0}
+        backend.get.assert_not_called()
+        assert cache_manager.stale_hits == 1
+
+        cache_manager.set_serve_stale(False)
+        assert await cache_manager.get("stock:AAPL") is None
+        backend.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_beyond_grace_are_not_served(self):
+        """유예 시간을 넘긴 항목은 부하 차단 중에도 제공하지 않는지 테스트"""
+        cache_manager = UnifiedCacheManager(backend=None)
+        cache_manager._store_in_local_cache("stock:MSFT", {"price": 2.0}, ttl=60)
+        cache_manager._local_cache_ttl["stock:MSFT"] = time.time() - cache_manager.stale_grace_seconds - 1
+        cache_manager.set_serve_stale(True)
+
+        assert await cache_manager.get("stock:MSFT") is None
+
+    @pytest.mark.asyncio
+    async def test_monitor_sleep_is_stretched(self, notification_service):
+        """알림 모니터 대기 시간이 배수만큼 늘어나는지 테스트"""
+        notification_service.set_monitor_interval_multiplier(3.0)
+
+        with patch("backend.services.realtime_notification_service.asyncio.sleep", new=AsyncMock()) as sleep:
+            await notification_service._monitor_sleep(60)
+
+        sleep.assert_awaited_once_with(180.0)
+
+
+class TestOperationalStatusWithLoadSignals:
+    """OperationalMonitor 상태 평가의 부하 신호 반영 테스트 클래스"""
+
+    def _metrics(self, **overrides):
+        values = dict(
+            timestamp=datetime.utcnow(),
+            status=OperationalStatus.HEALTHY,
+            cpu_usage=10.0,
+            memory_usage=10.0,
+            disk_usage=10.0,
+            network_latency=1.0,
+            cache_hit_rate=90.0,
+            api_response_time=100.0,
+            error_rate=0.0,
+            active_connections=1,
+            queue_size=0
+        )
+        values.update(overrides)
+        return SystemHealthMetrics(**values)
+
+    def test_loop_lag_makes_status_unhealthy(self):
+        """임계 루프 지연 시 UNHEALTHY 평가 테스트"""
+        monitor = OperationalMonitor()
+
+        assert monitor._evaluate_overall_status(self._metrics()) == OperationalStatus.HEALTHY
+        assert monitor._evaluate_overall_status(self._metrics(loop_lag_ms=800.0)) == OperationalStatus.UNHEALTHY
+
+    def test_saturation_warnings_degrade_status(self):
+        """루프 지연/실행기 큐/처리 중 요청 경고 누적 시 DEGRADED 평가 테스트"""
+        monitor = OperationalMonitor()
+        metrics = self._metrics(loop_lag_ms=150.0, executor_queue_depth=10, in_flight_requests=300)
+
+        assert monitor._evaluate_overall_status(metrics) == OperationalStatus.DEGRADED
+
+    @pytest.mark.asyncio
+    async def test_collected_metrics_include_load_signals(self):
+        """수집된 상태 메트릭에 부하 신호가 포함되는지 테스트"""
+        monitor = OperationalMonitor()
+        watchdog = LoadWatchdog()
+        await watchdog.check(42.0)
+
+        with patch("backend.monitoring.operational_monitor.load_watchdog", watchdog):
+            await monitor._collect_metrics()
+
+        assert monitor.health_metrics[-1].loop_lag_ms == 42.0
+        assert monitor.health_metrics[-1].pending_tasks >= 1
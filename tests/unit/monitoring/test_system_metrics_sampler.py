@@ -0,0 +1,192 @@
+"""
+공유 시스템 메트릭 샘플러 단위 테스트
+
+비차단 delta 샘플링, 불변 스냅샷, 구독 콜백, 프로세스/워커별 분해 및
+모니터들의 스냅샷 사용 여부를 테스트합니다.
+"""
+
+import pytest
+import asyncio
+import dataclasses
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.monitoring.system_metrics_sampler import SystemMetricsSampler
+
+
+NetIO = namedtuple("NetIO", "bytes_sent bytes_recv packets_sent packets_recv")
+
+
+class TestSystemMetricsSampler:
+    """SystemMetricsSampler 테스트 클래스"""
+
+    @pytest.fixture
+    def sampler(self):
+        """샘플러 픽스처 (짧은 간격)"""
+        sampler = SystemMetricsSampler(interval=0.05)
+        yield sampler
+        sampler.stop()
+
+    def test_latest_starts_sampler_without_blocking(self, sampler):
+        """최초 조회 시 블로킹 없이 샘플러가 시작되는지 테스트"""
+        start = time.perf_counter()
+        snapshot = sampler.latest()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert sampler.running
+        assert snapshot is not None and not snapshot.is_warm
+
+    def test_stopped_sampler_stays_stopped(self, sampler):
+        """stop() 이후 latest() 호출이 샘플러를 재시작하지 않는지 테스트"""
+        first = sampler.latest()
+        sampler.stop()
+
+        assert sampler.latest() is first
+        assert not sampler.running
+
+        sampler.start()
+        assert sampler.running
+
+    def test_snapshots_are_immutable(self, sampler):
+        """스냅샷 불변성 테스트"""
+        snapshot = sampler.latest()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.cpu_percent = 0.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.process.cpu_percent = 0.0
+
+    def test_background_thread_publishes_warm_deltas(self, sampler):
+        """백그라운드 스레드가 delta 기반 스냅샷을 게시하는지 테스트"""
+        first = sampler.latest()
+        deadline = time.time() + 2
+        while sampler.latest().sequence < first.sequence + 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+        snapshot = sampler.latest()
+        assert snapshot.is_warm
+        assert snapshot.interval > 0
+        assert 0.0 <= snapshot.cpu_percent <= 100.0
+        assert len(snapshot.per_cpu_percent) >= 1
+        assert snapshot.memory_total > 0
+        assert snapshot.to_dict()["timestamp"] == snapshot.timestamp.isoformat()
+
+    def test_network_rates_come_from_deltas(self):
+        """네트워크 처리량이 샘플 간 차이로 계산되는지 테스트"""
+        sampler = SystemMetricsSampler(include_workers=False)
+        counters = iter([NetIO(1000, 5000, 1, 1), NetIO(3000, 9000, 2, 2)])
+        clock = iter([100.0, 102.0])
+
+        with patch("psutil.net_io_counters", side_effect=lambda: next(counters)), \
+                patch("backend.monitoring.system_metrics_sampler.time.monotonic", side_effect=lambda: next(clock)):
+            sampler.sample()
+            snapshot = sampler.sample()
+
+        assert snapshot.network_bytes_sent_per_sec == pytest.approx(1000.0)
+        assert snapshot.network_bytes_recv_per_sec == pytest.approx(2000.0)
+
+    def test_subscribers_receive_snapshots(self, sampler):
+        """동기 구독 콜백 및 구독 해제 테스트"""
+        received = []
+        sampler.subscribe(received.append)
+
+        snapshot = sampler.sample()
+        sampler.unsubscribe(received.append)
+        sampler.sample()
+
+        assert received == [snapshot]
+        assert sampler.get_stats()["subscribers"] == 0
+
+    def test_failing_subscriber_does_not_stop_publishing(self, sampler):
+        """구독 콜백 오류 격리 테스트"""
+        received = []
+        sampler.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        sampler.subscribe(received.append)
+
+        sampler.sample()
+
+        assert len(received) == 1
+        assert sampler.get_stats()["subscriber_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_subscriber_runs_on_its_event_loop(self, sampler):
+        """코루틴 구독 콜백이 구독한 이벤트 루프에서 실행되는지 테스트"""
+        received = asyncio.Queue()
+
+        async def on_snapshot(snapshot):
+            await received.put((snapshot, asyncio.get_running_loop()))
+
+        sampler.subscribe(on_snapshot)
+        sampler.latest()
+
+        snapshot, loop = await asyncio.wait_for(received.get(), timeout=2)
+        assert loop is asyncio.get_running_loop()
+        assert snapshot.sequence >= 0
+
+    def test_process_and_worker_breakdown(self, sampler):
+        """현재 프로세스와 워커(자식) 프로세스 분해 테스트"""
+        worker = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        try:
+            sampler.sample()
+            snapshot = sampler.sample()
+        finally:
+            worker.kill()
+            worker.wait()
+
+        assert snapshot.process.role == "main"
+        assert snapshot.process.memory_rss > 0
+        assert worker.pid in {w.pid for w in snapshot.workers}
+        assert all(w.role == "worker" for w in snapshot.workers)
+
+        sampler.sample()
+        assert worker.pid not in {w.pid for w in sampler.latest().workers}
+
+
+class TestMonitorsUseSharedSnapshot:
+    """모니터의 공유 스냅샷 사용 테스트"""
+
+    @pytest.fixture
+    def sampler(self):
+        """테스트용 샘플러로 전역 샘플러 대체 (테스트 중 스냅샷 고정)"""
+        sampler = SystemMetricsSampler(interval=60)
+        yield sampler
+        sampler.stop()
+
+    @pytest.mark.asyncio
+    async def test_performance_monitor_reads_snapshot(self, sampler):
+        """PerformanceMonitor가 블로킹 cpu_percent 호출 없이 스냅샷을 사용하는지 테스트"""
+        from backend.monitoring.performance_monitor import PerformanceMonitor
+
+        with patch("backend.monitoring.performance_monitor.system_metrics_sampler", sampler), \
+                patch("psutil.cpu_percent", wraps=__import__("psutil").cpu_percent) as cpu_percent:
+            metric = await PerformanceMonitor()._collect_system_metrics()
+
+        snapshot = sampler.latest()
+        assert metric.memory_used == snapshot.memory_used
+        assert all(call.kwargs.get("interval") is None for call in cpu_percent.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_services_read_snapshot(self, sampler):
+        """AutoScaling/ResourceOptimization 서비스의 스냅샷 사용 테스트"""
+        from backend.services.auto_scaling_service import AutoScalingService
+        from backend.services.resource_optimization_service import ResourceOptimizationService
+
+        cache_manager = MagicMock()
+        cache_manager.get = AsyncMock(return_value=None)
+        cache_manager.get_stats = AsyncMock(return_value={})
+
+        with patch("backend.services.auto_scaling_service.system_metrics_sampler", sampler), \
+                patch("backend.services.resource_optimization_service.system_metrics_sampler", sampler):
+            start = time.perf_counter()
+            scaling_metrics = await AutoScalingService(cache_manager)._collect_metrics()
+            usage = await ResourceOptimizationService(cache_manager)._collect_resource_usage()
+            elapsed = time.perf_counter() - start
+
+        snapshot = sampler.latest()
+        assert elapsed < 0.5
+        assert scaling_metrics.memory_usage == snapshot.memory_percent
+        assert usage.disk_usage == snapshot.disk_percent
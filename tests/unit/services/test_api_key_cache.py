@@ -0,0 +1,209 @@
+"""
+API 키 검증 캐시 및 쓰기 지연 사용량 집계 단위 테스트
+
+검증된 키 메타데이터 로컬 캐시, Pub/Sub 기반 무효화, 파이프라인 사용량 플러시 및
+인증 경로의 Redis 왕복 횟수를 fakeredis로 테스트합니다.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from backend.services.api_key_service import APIKeyService
+
+
+class CountingRedis(fakeredis.FakeAsyncRedis):
+    """명령 및 파이프라인 실행 횟수(네트워크 왕복)를 세는 fakeredis 클라이언트"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.round_trips = 0
+
+    async def execute_command(self, *args, **options):
+        self.round_trips += 1
+        return await super().execute_command(*args, **options)
+
+    def pipeline(self, *args, **kwargs):
+        pipe = super().pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def counted_execute(*execute_args, **execute_kwargs):
+            self.round_trips += 1
+            return await execute(*execute_args, **execute_kwargs)
+
+        pipe.execute = counted_execute
+        return pipe
+
+
+class TestAPIKeyVerifiedCache:
+    """API 키 검증 캐시 테스트 클래스"""
+
+    @pytest.fixture
+    def server(self):
+        """인스턴스 간 공유되는 fakeredis 서버"""
+        return fakeredis.FakeServer()
+
+    @pytest.fixture
+    async def service(self, server):
+        """fakeredis를 사용하는 API 키 서비스 픽스처 (주기 플러시는 테스트 중 발생하지 않도록 길게)"""
+        service = APIKeyService(cache_ttl=60, usage_flush_interval_ms=60000)
+        service.redis_client = CountingRedis(server=server)
+        await service.start()
+        yield service
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_generated_key_round_trips_through_redis(self, service):
+        """생성된 키 정보가 Redis 해시로 저장/복원되는지 테스트"""
+        api_key = await service.generate_api_key("user1", "test", tier="premium")
+
+        key_info = await service._get_key_info(api_key)
+
+        assert key_info.permissions == service.default_permissions["premium"]
+        assert key_info.is_active is True
+        assert key_info.last_used is None
+        assert key_info.rate_limit == 5000
+
+    @pytest.mark.asyncio
+    async def test_auth_path_uses_at_most_one_round_trip(self, service):
+        """캐시 적재 후 검증 + 속도 제한 확인이 네트워크 호출 없이 처리되는지 테스트"""
+        api_key = await service.generate_api_key("user1", "test")
+        assert await service.validate_api_key(api_key) is not None
+        assert (await service.check_rate_limit(api_key))[0]
+
+        service.redis_client.round_trips = 0
+        for _ in range(100):
+            assert await service.validate_api_key(api_key) is not None
+            allowed, info = await service.check_rate_limit(api_key)
+            assert allowed
+
+        assert service.redis_client.round_trips <= 1
+        assert info["remaining"] == 1000 - 101
+        assert service.get_cache_stats()["cache_hits"] >= 200
+
+    @pytest.mark.asyncio
+    async def test_usage_is_flushed_in_one_pipeline(self, service):
+        """로컬 사용량이 파이프라인 한 번으로 Redis에 반영되는지 테스트"""
+        api_key = await service.generate_api_key("user1", "test")
+        for _ in range(25):
+            await service.validate_api_key(api_key)
+            await service.check_rate_limit(api_key)
+
+        service.redis_client.round_trips = 0
+        flushed = await service.flush_usage()
+
+        assert flushed == 50
+        assert service.redis_client.round_trips == 1
+
+        client = service.redis_client
+        today = datetime.utcnow().strftime('%Y-%m-%d')
+        current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0).isoformat()
+        assert int(await client.hget(f"{service.key_prefix}info:{api_key}", "usage_count")) == 25
+        assert int(await client.get(f"{service.usage_prefix}daily:{api_key}:{today}")) == 25
+        assert int(await client.get(f"{service.usage_prefix}hourly:{api_key}:{current_hour}")) == 25
+        assert await client.ttl(f"{service.usage_prefix}hourly:{api_key}:{current_hour}") > 0
+
+    @pytest.mark.asyncio
+    async def test_background_flusher_runs_periodically(self, server):
+        """주기적 플러시 테스트"""
+        service = APIKeyService(cache_ttl=60, usage_flush_interval_ms=50)
+        service.redis_client = CountingRedis(server=server)
+        await service.start()
+        try:
+            api_key = await service.generate_api_key("user1", "test")
+            await service.validate_api_key(api_key)
+
+            await asyncio.sleep(0.2)
+
+            assert service.get_cache_stats()["pending_usage"] == 0
+            assert int(await service.redis_client.hget(f"{service.key_prefix}info:{api_key}", "usage_count")) == 1
+        finally:
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_usage_for_retry(self, service, monkeypatch):
+        """플러시 실패 시 집계가 유지되어 재시도되는지 테스트"""
+        api_key = await service.generate_api_key("user1", "test")
+        for _ in range(3):
+            await service.validate_api_key(api_key)
+
+        def unavailable_pipeline(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+
+        monkeypatch.setattr(service.redis_client, "pipeline", unavailable_pipeline)
+        assert await service.flush_usage() == 0
+        assert service.get_cache_stats()["usage_flush_errors"] == 1
+
+        monkeypatch.undo()
+        await service.flush_usage()
+        assert int(await service.redis_client.hget(f"{service.key_prefix}info:{api_key}", "usage_count")) == 3
+
+    @pytest.mark.asyncio
+    async def test_shared_rate_limit_across_instances(self, service, server):
+        """플러시된 사용량이 다른 인스턴스의 속도 제한에 반영되는지 테스트"""
+        other = APIKeyService(cache_ttl=60, usage_flush_interval_ms=50)
+        other.redis_client = CountingRedis(server=server)
+        api_key = await service.generate_api_key("user1", "test")
+        await service._update_key_fields(api_key, rate_limit=10)
+
+        for _ in range(6):
+            assert (await service.check_rate_limit(api_key))[0]
+        await service.flush_usage()
+
+        results = [(await other.check_rate_limit(api_key))[0] for _ in range(6)]
+
+        assert results == [True] * 4 + [False] * 2
+
+    @pytest.mark.asyncio
+    async def test_revoke_invalidates_other_instances(self, service, server):
+        """폐기 시 Pub/Sub으로 다른 인스턴스의 캐시가 무효화되는지 테스트"""
+        other = APIKeyService(cache_ttl=60, usage_flush_interval_ms=50)
+        other.redis_client = CountingRedis(server=server)
+        await other.start()
+        try:
+            api_key = await service.generate_api_key("user1", "test")
+            assert await other.validate_api_key(api_key) is not None
+            await asyncio.sleep(0.05)  # 구독 준비
+
+            assert await service.revoke_api_key(api_key)
+            for _ in range(50):
+                if other.get_cache_stats()["cached_keys"] == 0:
+                    break
+                await asyncio.sleep(0.02)
+
+            assert await other.validate_api_key(api_key) is None
+            assert other.get_cache_stats()["invalidations"] >= 1
+        finally:
+            await other.close()
+
+    @pytest.mark.asyncio
+    async def test_permission_update_is_visible_immediately_locally(self, service):
+        """권한 변경 시 로컬 캐시가 즉시 무효화되는지 테스트"""
+        api_key = await service.generate_api_key("user1", "test")
+        await service.validate_api_key(api_key)
+
+        await service.update_api_key_permissions(api_key, ["stock:read", "admin:write"])
+
+        assert (await service.validate_api_key(api_key)).permissions == ["stock:read", "admin:write"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_keys_are_negatively_cached(self, service):
+        """존재하지 않는 키 반복 조회 시 Redis 호출이 캐시되는지 테스트"""
+        assert await service.validate_api_key("ic_unknown") is None
+        service.redis_client.round_trips = 0
+
+        for _ in range(10):
+            assert await service.validate_api_key("ic_unknown") is None
+
+        assert service.redis_client.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, service):
+        """LRU 캐시 크기 제한 테스트"""
+        service.max_cached_keys = 3
+        for i in range(5):
+            await service.validate_api_key(f"ic_key_{i}")
+
+        assert service.get_cache_stats()["cached_keys"] == 3
@@ -0,0 +1,291 @@
+"""
+자동 스케일링 서비스 단위 테스트
+
+실제 애플리케이션 신호(요청률, 지연시간 분위수, 큐 크기, 소켓 수) 연동,
+Holt-Winters 예측 및 재생된 부하 트레이스 기반 예측 스케일링을 테스트합니다.
+"""
+
+import pytest
+import asyncio
+import math
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.monitoring.performance_monitor import PerformanceMonitor, RequestWindowCounters
+from backend.services.auto_scaling_service import (
+    AutoScalingService,
+    HoltWintersForecaster,
+    ScalingPolicy,
+    ScalingTrigger
+)
+
+
+CAPACITY_PER_INSTANCE = 50.0
+
+
+def _ramp_trace():
+    """재생용 부하 트레이스: 20 샘플 동안 50 req/s 유지 후 샘플당 8 req/s 증가"""
+    return [50.0] * 20 + [50.0 + 8.0 * step for step in range(1, 31)]
+
+
+class ReplayedPerformanceMonitor:
+    """트레이스의 전체 부하를 현재 인스턴스 수로 나눠 인스턴스당 요청률을 반환하는 모의 모니터"""
+
+    def __init__(self, service: AutoScalingService):
+        self.service = service
+        self.fleet_rate = 0.0
+
+    def get_request_window_stats(self, window_seconds: int = 60):
+        per_instance = self.fleet_rate / self.service.current_instances
+        return {
+            "request_count": int(per_instance * window_seconds),
+            "requests_per_second": per_instance,
+            "p50_response_time": 0.05,
+            "p95_response_time": 0.1,
+            "p99_response_time": 0.2,
+            "error_rate": 0.0
+        }
+
+
+class TestHoltWintersForecaster:
+    """HoltWintersForecaster 테스트 클래스"""
+
+    def test_linear_trend_is_extrapolated(self):
+        """선형 추세 외삽 테스트"""
+        forecaster = HoltWintersForecaster(season_length=0)
+        forecast = forecaster.forecast([10.0 + 5 * i for i in range(20)], horizon=3)
+
+        assert forecast == pytest.approx([110.0, 115.0, 120.0], rel=0.02)
+
+    def test_seasonal_pattern_is_forecast(self):
+        """계절성 패턴 예측 테스트"""
+        season = 12
+        series = [100 + 40 * math.sin(2 * math.pi * t / season) for t in range(season * 4)]
+        forecaster = HoltWintersForecaster(season_length=season)
+
+        forecast = forecaster.forecast(series, horizon=season)
+        expected = [100 + 40 * math.sin(2 * math.pi * t / season) for t in range(season * 4, season * 5)]
+
+        assert max(abs(f - e) for f, e in zip(forecast, expected)) < 10
+
+    def test_forecast_is_never_negative(self):
+        """음수 예측 방지 테스트"""
+        forecast = HoltWintersForecaster().forecast([50.0, 30.0, 10.0], horizon=5)
+
+        assert min(forecast) == 0.0
+
+
+class TestAutoScalingSignals:
+    """실제 애플리케이션 신호 연동 테스트 클래스"""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        """모의 Kubernetes 클라이언트를 사용하는 서비스 픽스처"""
+        monkeypatch.setenv("CLOUD_PROVIDER", "kubernetes")
+        cache_manager = MagicMock()
+        cache_manager.set = AsyncMock(return_value=True)
+        cache_manager.get = AsyncMock(return_value=None)
+        return AutoScalingService(cache_manager)
+
+    @pytest.mark.asyncio
+    async def test_unattached_signals_are_zero_not_random(self, service):
+        """신호 미연결 시 무작위 값 대신 0을 반환하는지 테스트"""
+        first = await service._collect_metrics()
+        second = await service._collect_metrics()
+
+        for metrics in (first, second):
+            assert (metrics.request_rate, metrics.response_time) == (0.0, 0.0)
+            assert (metrics.queue_depth, metrics.active_connections) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_request_rate_and_latency_come_from_performance_monitor(self, service):
+        """PerformanceMonitor 요청률 및 지연시간 분위수 연동 테스트"""
+        monitor = PerformanceMonitor()
+        for i in range(120):
+            await monitor.record_request(
+                request_id=f"req-{i}",
+                method="GET",
+                endpoint="/api/v1/stocks",
+                status_code=500 if i % 20 == 0 else 200,
+                response_time=(i + 1) / 1000
+            )
+        service.attach_signal_sources(performance_monitor=monitor)
+
+        metrics = await service._collect_metrics()
+
+        # 분위수는 히스토그램 구간 상한 (상대 오차 5% 이내)
+        assert metrics.request_rate == pytest.approx(2.0)
+        assert metrics.response_time == pytest.approx(115.0, rel=0.05)
+        assert metrics.custom_metrics["response_time_p99"] == pytest.approx(119.0, rel=0.05)
+        assert metrics.custom_metrics["error_rate"] == pytest.approx(0.05)
+
+    def test_request_window_counts_beyond_sample_buffer(self):
+        """요청량이 많아도 윈도우 요청률이 잘리지 않는지 테스트 (1000 req/s x 60초)"""
+        counters = RequestWindowCounters()
+        start = 1_700_000_000
+        for second in range(start - 70, start + 1):
+            for i in range(1000):
+                counters.add(0.010 if i % 10 else 0.200, is_error=(i % 100 == 0), now=second)
+
+        stats = counters.window_stats(60, now=start)
+
+        assert stats["request_count"] == 60_000
+        assert stats["error_count"] == 600
+        assert stats["p50_response_time"] == pytest.approx(0.010, rel=0.05)
+        assert stats["p99_response_time"] == pytest.approx(0.200, rel=0.05)
+        assert counters.count(60, now=start + 30) == 30_000
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_and_connections_from_services(self, service):
+        """데이터 수집 큐, 알림 큐 및 WebSocket 연결 수 연동 테스트"""
+        data_collector = SimpleNamespace(task_queues={"high": asyncio.Queue(), "low": asyncio.Queue()})
+        for _ in range(3):
+            data_collector.task_queues["high"].put_nowait(object())
+        data_collector.task_queues["low"].put_nowait(object())
+
+        notification_service = SimpleNamespace(
+            notification_queue=asyncio.Queue(),
+            active_connections={"u1": object(), "u2": object()}
+        )
+        notification_service.notification_queue.put_nowait(object())
+
+        connected = SimpleNamespace(state=SimpleNamespace(value="connected"))
+        reconnecting = SimpleNamespace(state=SimpleNamespace(value="reconnecting"))
+        websocket_managers = {"u3": connected, "u4": reconnecting, "u5": connected}
+
+        service.attach_signal_sources(
+            data_collector=data_collector,
+            notification_service=notification_service,
+            websocket_managers=websocket_managers
+        )
+        metrics = await service._collect_metrics()
+
+        assert metrics.queue_depth == 5
+        assert metrics.active_connections == 4
+
+    @pytest.mark.asyncio
+    async def test_lazily_created_notification_service(self, service, monkeypatch):
+        """WebSocket 알림 서비스가 나중에 생성되어도 연결 수가 반영되는지 테스트"""
+        from backend.api import websocket_routes
+
+        monkeypatch.setattr(websocket_routes, "notification_service", None)
+        service.attach_signal_sources(notification_service=lambda: websocket_routes.notification_service)
+        assert (await service._collect_metrics()).active_connections == 0
+
+        monkeypatch.setattr(websocket_routes, "notification_service", SimpleNamespace(
+            notification_queue=asyncio.Queue(),
+            active_connections={"u1": object(), "u2": object(), "u3": object()}
+        ))
+        metrics = await service._collect_metrics()
+
+        assert metrics.active_connections == 3
+        assert "notification_websockets" in service.connection_sources
+
+    @pytest.mark.asyncio
+    async def test_failing_source_is_skipped(self, service):
+        """오류가 발생한 신호 소스 격리 테스트"""
+        service.register_queue_source("broken", MagicMock(side_effect=RuntimeError("gone")))
+        service.register_queue_source("ok", lambda: 7)
+
+        metrics = await service._collect_metrics()
+
+        assert metrics.queue_depth == 7
+
+
+class TestPredictiveScaling:
+    """재생된 부하 트레이스 기반 예측 스케일링 테스트 클래스"""
+
+    def _configure(self, service, policy):
+        service.current_instances = 2
+        service.cloud_client["instances"] = 2
+        service.config.target_requests_per_instance = CAPACITY_PER_INSTANCE
+        service.config.forecast_horizon = 5
+        service.config.policies = [policy]
+
+    def _predictive_policy(self):
+        return ScalingPolicy(
+            name="predictive_load",
+            trigger_type=ScalingTrigger.PREDICTED_LOAD,
+            threshold_min=0.0,
+            threshold_max=80.0,
+            scale_out_cooldown=0,
+            scale_in_cooldown=0,
+            min_instances=1,
+            max_instances=10,
+            scale_out_step=1,
+            scale_in_step=0
+        )
+
+    def _reactive_policy(self):
+        return ScalingPolicy(
+            name="request_rate",
+            trigger_type=ScalingTrigger.REQUEST_RATE,
+            threshold_min=0.0,
+            threshold_max=CAPACITY_PER_INSTANCE * 0.8,
+            scale_out_cooldown=0,
+            scale_in_cooldown=0,
+            min_instances=1,
+            max_instances=10,
+            scale_out_step=1,
+            scale_in_step=0
+        )
+
+    async def _replay(self, service, trace):
+        """트레이스 재생 후 (첫 스케일 아웃 시점의 관측 사용률, 목표 초과 샘플 수) 반환"""
+        monitor = ReplayedPerformanceMonitor(service)
+        service.attach_signal_sources(performance_monitor=monitor)
+        first_scale_utilization = None
+        over_target_samples = 0
+
+        for fleet_rate in trace:
+            monitor.fleet_rate = fleet_rate
+            utilization = fleet_rate / (service.current_instances * CAPACITY_PER_INSTANCE) * 100
+            if utilization > 80:
+                over_target_samples += 1
+
+            decisions = await service.run_scaling_iteration()
+            if decisions and first_scale_utilization is None:
+                first_scale_utilization = utilization
+
+        return first_scale_utilization, over_target_samples
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ["kubernetes", "docker"])
+    async def test_predictive_policy_scales_out_before_saturation(self, monkeypatch, provider):
+        """예측 정책이 반응형 정책보다 먼저 스케일 아웃하는지 테스트 (모의 K8s/Docker 클라이언트)"""
+        monkeypatch.setenv("CLOUD_PROVIDER", provider)
+        cache_manager = MagicMock()
+        cache_manager.set = AsyncMock(return_value=True)
+        cache_manager.get = AsyncMock(return_value=None)
+
+        predictive = AutoScalingService(cache_manager)
+        self._configure(predictive, self._predictive_policy())
+        reactive = AutoScalingService(cache_manager)
+        self._configure(reactive, self._reactive_policy())
+
+        trace = _ramp_trace()
+        predictive_first, predictive_over = await self._replay(predictive, trace)
+        reactive_first, reactive_over = await self._replay(reactive, trace)
+
+        assert predictive.cloud_client["type"] == f"mock_{provider}"
+        assert predictive.cloud_client["instances"] == predictive.current_instances
+        assert predictive.cloud_client["scale_count"] == len(predictive.scaling_history)
+
+        # 예측 정책은 관측 사용률이 목표(80%)에 도달하기 전에 스케일 아웃
+        assert predictive_first < 80 <= reactive_first
+        assert predictive_over < reactive_over
+        assert predictive.current_instances * CAPACITY_PER_INSTANCE >= trace[-1]
+        assert predictive.last_forecast["horizon"] == 5
+
+    @pytest.mark.asyncio
+    async def test_flat_load_does_not_trigger_predictive_scaling(self, monkeypatch):
+        """평탄한 부하에서 예측 정책 미동작 테스트"""
+        cache_manager = MagicMock()
+        cache_manager.set = AsyncMock(return_value=True)
+        service = AutoScalingService(cache_manager)
+        self._configure(service, self._predictive_policy())
+
+        await self._replay(service, [60.0] * 30)
+
+        assert service.scaling_history == []
+        assert service.last_forecast["predicted_utilization"] == pytest.approx(60.0)
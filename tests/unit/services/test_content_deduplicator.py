@@ -0,0 +1,249 @@
+"""
+콘텐츠 중복 제거 단위 테스트
+
+Bloom 필터 기반 정확 중복, MinHash LSH 기반 유사 중복, 시간 윈도우 만료,
+Redis 영속화 및 DistributedDataCollector 파이프라인 연동을 테스트합니다.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis.aioredis
+
+from backend.services.content_deduplicator import (
+    BloomFilter,
+    ContentDeduplicator,
+    MinHasher,
+    content_digest,
+    shingle_features
+)
+from backend.services.distributed_data_collector import (
+    DataCollectionTask,
+    DataPriority,
+    DataSourceType,
+    DistributedDataCollector
+)
+
+
+POST = "Apple just crushed earnings expectations, iPhone revenue up 12% and services at a record high"
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self, now: float = 1_700_000_000):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestContentDeduplicator:
+    """ContentDeduplicator 테스트 클래스"""
+
+    @pytest.fixture
+    def clock(self):
+        """시계 픽스처"""
+        return FakeClock()
+
+    @pytest.fixture
+    def deduplicator(self, clock):
+        """중복 제거기 픽스처 (1시간 윈도우, 4세대)"""
+        return ContentDeduplicator(
+            namespace="test", window_seconds=3600, generations=4,
+            capacity_per_generation=1000, clock=clock
+        )
+
+    def test_bloom_filter_membership(self):
+        """Bloom 필터 포함 여부 테스트"""
+        bloom = BloomFilter(capacity=1000, error_rate=1e-3)
+        digests = [content_digest(f"post {i}") for i in range(1000)]
+        for digest in digests:
+            bloom.add(digest)
+
+        assert all(digest in bloom for digest in digests)
+        false_positives = sum(content_digest(f"other {i}") in bloom for i in range(10000))
+        assert false_positives < 50
+
+    def test_minhash_estimates_jaccard_similarity(self):
+        """MinHash 유사도 추정 테스트"""
+        minhasher = MinHasher(num_perm=128)
+        tokens = POST.lower().split()
+        edited = ["rt"] + tokens + ["stocks"]
+        unrelated = "fed holds rates steady as inflation cools across the eurozone".split()
+
+        def similarity(a, b):
+            return (minhasher.signature(shingle_features(a)) == minhasher.signature(shingle_features(b))).mean()
+
+        assert similarity(tokens, edited) > 0.7
+        assert similarity(tokens, unrelated) < 0.2
+
+    def test_exact_repeat_is_caught_after_normalization(self, deduplicator):
+        """정규화 후 정확 중복 탐지 테스트 (대소문자, 공백, URL)"""
+        assert deduplicator.check_and_add(POST + " https://t.co/abc") is None
+        assert deduplicator.check_and_add("  " + POST.upper() + "  https://bit.ly/xyz") == "exact"
+        assert deduplicator.get_stats()["exact_duplicates"] == 1
+
+    def test_near_duplicate_repost_is_caught(self, deduplicator):
+        """유사 중복 (리포스트 편집) 탐지 테스트"""
+        original = (
+            "Breaking: Tesla recalls 200,000 vehicles over a rear camera software issue that can delay the "
+            "image, according to a filing with the national highway traffic safety administration on tuesday"
+        )
+        assert deduplicator.check_and_add(original) is None
+        assert deduplicator.check_and_add(original + " via reuters") == "near"
+        assert deduplicator.check_and_add("RT @newsdesk: " + original + " #TSLA") == "near"
+        assert deduplicator.check_and_add("Nvidia guidance beats estimates as data center demand keeps growing") is None
+
+    def test_short_texts_only_match_exactly(self, deduplicator):
+        """짧은 텍스트의 유사 중복 제외 테스트"""
+        assert deduplicator.check_and_add("AAPL to the moon") is None
+        assert deduplicator.check_and_add("TSLA to the moon") is None
+
+    def test_entries_expire_after_window(self, deduplicator, clock):
+        """시간 윈도우 만료 테스트"""
+        deduplicator.check_and_add(POST)
+
+        clock.now += 1800
+        assert deduplicator.check_and_add(POST) == "exact"
+
+        clock.now += 3600 + 900
+        assert deduplicator.check_and_add(POST) is None
+        assert deduplicator.get_stats()["live_generations"] <= 5
+
+    @pytest.mark.asyncio
+    async def test_staged_batch_is_recorded_only_on_commit(self, deduplicator):
+        """커밋 전까지 스테이징된 항목이 인덱스에 기록되지 않는지 테스트"""
+        items = [{"content": POST}, {"content": POST}]
+
+        unique, dropped, fingerprints = deduplicator.stage_batch(items, lambda item: item["content"])
+        assert len(unique) == 1 and dropped["exact"] == 1
+        assert deduplicator.check_and_add("unrelated filler text") is None
+
+        # 커밋하지 않은 배치는 다시 스테이징해도 고유 항목으로 판정
+        unique_again, _, _ = deduplicator.stage_batch(items, lambda item: item["content"])
+        assert len(unique_again) == 1
+
+        await deduplicator.commit(fingerprints)
+        unique_after, _, _ = deduplicator.stage_batch(items, lambda item: item["content"])
+        assert unique_after == []
+
+    @pytest.mark.asyncio
+    async def test_filter_batch_drops_in_batch_and_cross_batch_duplicates(self, deduplicator):
+        """배치 내/배치 간 중복 제거 테스트"""
+        first, dropped = await deduplicator.filter_batch(
+            [{"content": POST}, {"content": POST}], lambda item: item["content"]
+        )
+        second, dropped_again = await deduplicator.filter_batch(
+            [{"content": POST}, {"content": "Completely different story about oil prices today"}],
+            lambda item: item["content"]
+        )
+
+        assert len(first) == 1 and dropped == {"exact": 1, "near": 0}
+        assert [item["content"] for item in second] == ["Completely different story about oil prices today"]
+        assert dropped_again["exact"] == 1
+
+    @pytest.mark.asyncio
+    async def test_index_persists_across_instances(self, clock):
+        """Redis 영속화 및 재시작 후 복원 테스트"""
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        writer = ContentDeduplicator(namespace="persist", window_seconds=3600, clock=clock)
+        await writer.initialize(client)
+        await writer.filter_batch([{"content": POST}], lambda item: item["content"])
+
+        restarted = ContentDeduplicator(namespace="persist", window_seconds=3600, clock=clock)
+        await restarted.initialize(client)
+
+        assert restarted.get_stats()["entries_loaded"] == 1
+        assert restarted.check_and_add(POST) == "exact"
+
+    @pytest.mark.asyncio
+    async def test_runs_without_persistence_when_redis_unavailable(self, clock):
+        """Redis 미사용 시 로컬 동작 테스트"""
+        client = MagicMock()
+        client.ping = AsyncMock(side_effect=ConnectionError("refused"))
+        deduplicator = ContentDeduplicator(clock=clock)
+
+        assert await deduplicator.initialize(client) is False
+        assert deduplicator.check_and_add(POST) is None
+        assert deduplicator.check_and_add(POST) == "exact"
+
+
+class TestCollectorDeduplicationStage:
+    """DistributedDataCollector 중복 제거 단계 테스트 클래스"""
+
+    @pytest.fixture
+    async def collector(self):
+        """데이터 수집기 픽스처"""
+        cache_manager = MagicMock()
+        cache_manager.set = AsyncMock(return_value=True)
+        collector = DistributedDataCollector(cache_manager)
+        collector.worker_active = False
+        yield collector
+        await collector.shutdown()
+
+    def _task(self, source_type, source_config):
+        from datetime import datetime
+        return DataCollectionTask(
+            task_id="task-1",
+            source_type=source_type,
+            priority=DataPriority.NORMAL,
+            source_config=source_config,
+            created_at=datetime.utcnow(),
+            scheduled_at=datetime.utcnow()
+        )
+
+    @pytest.mark.asyncio
+    async def test_duplicates_dropped_before_sentiment_and_store(self, collector):
+        """감성 분석/저장 전에 중복이 제거되는지 테스트"""
+        pipeline = collector._get_pipeline_for_source(DataSourceType.SOCIAL_MEDIA)
+        task = self._task(DataSourceType.SOCIAL_MEDIA, {"platforms": ["reddit", "twitter"], "keywords": ["AAPL"]})
+        collector._analyze_sentiment = AsyncMock(side_effect=lambda data: data)
+
+        first = await collector._execute_pipeline(pipeline, task)
+        second = await collector._execute_pipeline(pipeline, task)
+
+        analyzed_counts = [len(call.args[0]["posts"]) for call in collector._analyze_sentiment.await_args_list]
+        assert pipeline.processors.index("deduplicate") < pipeline.processors.index("analyze_sentiment")
+        assert analyzed_counts == [2, 0]
+        assert second["cross_batch_duplicates_removed"] == 10
+
+        metrics = (await collector.get_collection_metrics())["deduplication"]
+        assert metrics["downstream_items_skipped"] == 18
+        assert metrics["downstream_stage_runs_saved"] == 36
+        assert metrics["indexes"]["social_media"]["unique_items"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_store_does_not_mark_items_seen(self, collector):
+        """저장 실패 후 재시도 시 항목이 중복으로 버려지지 않는지 테스트"""
+        pipeline = collector._get_pipeline_for_source(DataSourceType.SOCIAL_MEDIA)
+        task = self._task(DataSourceType.SOCIAL_MEDIA, {"platforms": ["reddit", "twitter"], "keywords": ["AAPL"]})
+        store_data = collector._store_data
+        collector._store_data = AsyncMock(side_effect=ConnectionError("cache down"))
+
+        with pytest.raises(ConnectionError):
+            await collector._execute_pipeline(pipeline, task)
+        assert collector.deduplicators[DataSourceType.SOCIAL_MEDIA].get_stats()["indexed_items"] == 0
+
+        collector._store_data = store_data
+        retried = await collector._execute_pipeline(pipeline, task)
+        repeated = await collector._execute_pipeline(pipeline, task)
+
+        assert len(retried["posts"]) == 2
+        assert retried["cross_batch_duplicates_removed"] == 8
+        assert len(repeated["posts"]) == 0
+        assert collector.deduplicators[DataSourceType.SOCIAL_MEDIA].get_stats()["unique_items"] == 2
+
+    @pytest.mark.asyncio
+    async def test_news_duplicate_removal_hashes_title_and_content(self, collector):
+        """뉴스 배치 내 중복 제거 해시 오류 수정 테스트"""
+        data = {"articles": [
+            {"title": "Fed holds", "content": "Rates unchanged"},
+            {"title": "Fed holds", "content": "Rates unchanged"},
+            {"title": "Fed cuts", "content": "Rates lower"}
+        ]}
+
+        result = await collector._remove_duplicates(DataSourceType.NEWS_FEEDS, data)
+
+        assert len(result["articles"]) == 2
+        assert result["duplicates_removed"] == 1
@@ -0,0 +1,199 @@
+"""
+데이터 암호화 서비스 엔벨로프 암호화 단위 테스트
+
+데이터 유형/기간별 데이터 키(DEK) 재사용, 헤더의 키 ID로 복호화, 사용 횟수/기간에 따른
+키 교체, 다른 워커의 래핑된 키 로드, 배치 암복호화 및 감사 로그 일괄 기록을 테스트합니다.
+"""
+
+import base64
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services import data_encryption_service as encryption_module
+from backend.services.data_encryption_service import (
+    DataEncryptionService,
+    EncryptionType,
+    KeyStatus,
+    KeyType
+)
+
+
+class FakeCache:
+    """워커 간 공유되는 딕셔너리 기반 캐시"""
+
+    def __init__(self):
+        self.data = {}
+        self.get = AsyncMock(side_effect=lambda key: self.data.get(key))
+        self.set = AsyncMock(side_effect=self._set)
+
+    async def _set(self, key, value, ttl=None):
+        self.data[key] = value
+
+
+def make_service(cache=None, **config):
+    """이벤트 루프 안에서 서비스 생성"""
+    service = DataEncryptionService(cache or FakeCache())
+    for name, value in config.items():
+        setattr(service, name, value)
+    return service
+
+
+class TestEnvelopeEncryption:
+    """엔벨로프 암호화 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_reuses_data_key(self):
+        """데이터 키 재사용 및 키 ID 없이 복호화 테스트"""
+        service = make_service()
+
+        results = [await service.encrypt_data(f"user-{i}@example.com", "personal_info") for i in range(50)]
+
+        assert {r["key_id"] for r in results} == {results[0]["key_id"]}
+        assert len(service.encryption_keys) == 1
+        assert results[0]["metadata"]["envelope"] is True
+
+        decrypted = await service.decrypt_data(results[7]["encrypted_data"])
+        assert decrypted["decrypted_data"] == b"user-7@example.com"
+        assert decrypted["metadata"]["key_id"] == results[7]["key_id"]
+        # 래핑된 키만 저장
+        assert service.encryption_keys[results[0]["key_id"]].metadata["wrapped"] is True
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_tampered_ciphertext_rejected(self):
+        """헤더/암호문 변조 시 복호화 실패 테스트"""
+        service = make_service()
+        result = await service.encrypt_data("secret", "api_keys")
+        blob = bytearray(base64.b64decode(result["encrypted_data"]))
+
+        tampered_body = bytes(blob[:-1]) + bytes([blob[-1] ^ 1])
+        decrypted = await service.decrypt_data(base64.b64encode(tampered_body).decode())
+        assert decrypted["success"] is False
+        assert decrypted["error"] == "Ciphertext authentication failed"
+
+        blob[3] = 2  # 알고리즘 ID 변경
+        decrypted = await service.decrypt_data(base64.b64encode(bytes(blob)).decode())
+        assert decrypted["success"] is False
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_data_key_rollover(self, monkeypatch):
+        """사용 횟수 한도 및 기간 변경 시 키 교체 테스트"""
+        service = make_service(dek_max_uses=3)
+
+        first = [await service.encrypt_data(str(i), "financial_info") for i in range(4)]
+        assert first[2]["key_id"] == first[0]["key_id"]
+        assert first[3]["key_id"] != first[0]["key_id"]
+        assert service.encryption_keys[first[0]["key_id"]].status == KeyStatus.ROTATED
+
+        now = encryption_module.time.time()
+        monkeypatch.setattr(encryption_module.time, "time", lambda: now + service.dek_window_seconds)
+        later = await service.encrypt_data("later", "financial_info")
+        assert later["key_id"] not in {r["key_id"] for r in first}
+
+        # 교체된 키로 암호화된 데이터도 복호화 가능
+        assert (await service.decrypt_data(first[0]["encrypted_data"]))["decrypted_data"] == b"0"
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_other_worker_loads_wrapped_key(self):
+        """다른 워커가 캐시의 래핑된 키로 복호화하는지 테스트"""
+        cache = FakeCache()
+        writer = make_service(cache)
+        reader = make_service(cache, dek_cache_size=1)
+        reader.master_cipher = writer.master_cipher
+
+        a = await writer.encrypt_data("a", "personal_info")
+        b = await writer.encrypt_data("b", "financial_info")
+
+        assert (await reader.decrypt_data(a["encrypted_data"]))["decrypted_data"] == b"a"
+        assert (await reader.decrypt_data(b["encrypted_data"]))["decrypted_data"] == b"b"
+        assert (await reader.decrypt_data(a["encrypted_data"]))["decrypted_data"] == b"a"
+        # LRU 크기 1: 키 전환마다 다시 언래핑
+        assert reader.envelope_stats["dek_cache_misses"] == 3
+        assert len(reader._dek_cache) == 1
+        await writer.close()
+        await reader.close()
+
+    @pytest.mark.asyncio
+    async def test_explicit_key_id_uses_legacy_path(self):
+        """지정 키 ID 사용 시 기존 암호화 방식 유지 테스트"""
+        service = make_service()
+        key = await service._create_encryption_key(EncryptionType.FERNET, KeyType.DATA)
+
+        result = await service.encrypt_data("legacy", "personal_info", EncryptionType.FERNET, key_id=key.key_id)
+        decrypted = await service.decrypt_data(result["encrypted_data"], key.key_id, EncryptionType.FERNET)
+
+        assert result["metadata"]["envelope"] is False
+        assert decrypted["decrypted_data"] == b"legacy"
+        await service.close()
+
+
+class TestBatchEncryption:
+    """배치 암복호화 및 감사 로그 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_encrypt_decrypt_many(self):
+        """배치 암복호화 및 항목별 오류 테스트"""
+        service = make_service()
+
+        encrypted = await service.encrypt_many([f"acct-{i}" for i in range(1000)], "financial_info")
+        assert encrypted["count"] == 1000
+        assert len(encrypted["key_ids"]) == 1
+
+        items = encrypted["encrypted_data"][:3] + ["bm90IGFuIGVudmVsb3Bl"]
+        decrypted = await service.decrypt_many(items)
+
+        assert decrypted["decrypted_data"][:3] == [b"acct-0", b"acct-1", b"acct-2"]
+        assert decrypted["decrypted_data"][3] is None
+        assert decrypted["errors"] == {3: "Not an envelope ciphertext"}
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_encrypt_many_requires_aead(self):
+        """배치 암호화의 AEAD 알고리즘 요구 테스트"""
+        service = make_service()
+
+        result = await service.encrypt_many(["x"], "personal_info", EncryptionType.FERNET)
+
+        assert result["success"] is False
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_audit_records_flushed_in_batches(self):
+        """감사 레코드 일괄 기록 테스트"""
+        cache = Mock()
+        cache.set = AsyncMock()
+        service = make_service(cache, audit_batch_size=100)
+
+        for i in range(250):
+            await service.encrypt_data(str(i), "personal_info")
+
+        audit_writes = [c for c in cache.set.await_args_list if c.args[0].startswith("encryption_operations_")]
+        assert len(audit_writes) == 2
+        assert len(audit_writes[0].args[1]) == 100
+        assert len(service._audit_buffer) == 50
+
+        await service.close()
+        assert service.envelope_stats["audit_records_flushed"] == 250
+        assert len(service.encryption_operations) == 250
+
+    @pytest.mark.asyncio
+    async def test_failed_audit_flush_buffer_is_bounded(self):
+        """캐시 장애 중 재시도용 감사 버퍼가 상한을 넘지 않는지 테스트"""
+        cache = Mock()
+        cache.set = AsyncMock(side_effect=ConnectionError("cache unavailable"))
+        service = make_service(cache, audit_batch_size=10, max_audit_buffer=25)
+
+        for i in range(100):
+            await service.encrypt_data(str(i), "personal_info")
+
+        assert len(service._audit_buffer) <= 25
+        assert service.envelope_stats["audit_records_dropped"] >= 75
+        # 가장 최근 레코드는 유지
+        assert service._audit_buffer[-1] is service.encryption_operations[-1]
+
+        cache.set = AsyncMock()
+        await service.close()
+        assert service.envelope_stats["audit_records_flushed"] == 100 - service.envelope_stats["audit_records_dropped"]
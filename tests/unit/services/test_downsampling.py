@@ -0,0 +1,167 @@
+"""
+차트 다운샘플링 단위 테스트
+
+LTTB 점 선택, 버킷 최소/최대 사전 선택과 전역 극값 보존, OHLCV 재버킷팅 및
+UnifiedService 과거 데이터/비교 응답의 max_points 적용을 테스트합니다.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.downsampling import (
+    downsample_frame,
+    downsample_line,
+    lttb_indices,
+    minmax_indices,
+    resample_ohlcv
+)
+from backend.services.unified_service import UnifiedService
+
+
+def make_history(periods=5000, seed=0):
+    """분봉 OHLCV 프레임 생성"""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(periods).cumsum()
+    return pd.DataFrame({
+        "Open": close + rng.uniform(-0.5, 0.5, periods),
+        "High": close + rng.uniform(0.5, 1.5, periods),
+        "Low": close - rng.uniform(0.5, 1.5, periods),
+        "Close": close,
+        "Volume": rng.integers(100, 1000, periods)
+    }, index=pd.date_range("2024-01-02 09:30", periods=periods, freq="min", name="Date"))
+
+
+def reference_lttb(x, y, threshold):
+    """원 논문 방식의 순차 LTTB 구현"""
+    n = len(x)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n) if i < threshold - 3 else n
+        next_start = end if i < threshold - 3 else n - 1
+        avg_x = np.mean(x[next_start:next_end])
+        avg_y = np.mean(y[next_start:next_end])
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+class TestDownsampling:
+    """다운샘플링 함수 테스트 클래스"""
+
+    def test_lttb_matches_reference(self):
+        """벡터화 LTTB와 순차 참조 구현 결과 일치 테스트"""
+        rng = np.random.default_rng(1)
+        x = np.arange(997, dtype=float)
+        y = rng.standard_normal(997).cumsum()
+
+        assert lttb_indices(x, y, 50).tolist() == reference_lttb(x, y, 50)
+
+    def test_lttb_small_input_unchanged(self):
+        """max_points 이하 입력은 그대로 반환 테스트"""
+        assert lttb_indices(np.arange(5.0), np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+
+    def test_lttb_keeps_spike(self):
+        """LTTB가 단일 스파이크를 선택하는지 테스트"""
+        y = np.zeros(100)
+        y[42] = 10.0
+
+        assert 42 in lttb_indices(np.arange(100.0), y, 10)
+
+    def test_minmax_indices(self):
+        """버킷별 최소/최대 인덱스 선택 테스트"""
+        y = np.array([3, 1, 2, 9, 5, 4, 0, 8, 7.0])
+
+        assert minmax_indices(y, 3).tolist() == [0, 1, 3, 5, 6, 7]
+
+    def test_downsample_line_keeps_global_extrema(self):
+        """MinMaxLTTB 결과가 전역 최소/최대를 포함하는지 테스트"""
+        rng = np.random.default_rng(2)
+        y = rng.standard_normal(100_000).cumsum()
+        y[31_337] = 1e6
+        y[77_777] = -1e6
+
+        indices = downsample_line(np.arange(100_000.0), y, 500)
+
+        assert len(indices) == 500
+        assert np.all(np.diff(indices) > 0)
+        assert indices[0] == 0 and indices[-1] == 99_999
+        assert 31_337 in indices and 77_777 in indices
+
+    def test_resample_ohlcv(self):
+        """OHLCV 재버킷팅 first/max/min/last/sum 테스트"""
+        frame = make_history(periods=10)
+
+        result = resample_ohlcv(frame, 4)
+
+        assert len(result) == 4
+        assert result.index[1] == frame.index[3]
+        window = frame.iloc[3:6]
+        row = result.iloc[1]
+        assert row["Open"] == window["Open"].iloc[0]
+        assert row["High"] == window["High"].max()
+        assert row["Low"] == window["Low"].min()
+        assert row["Close"] == window["Close"].iloc[-1]
+        assert row["Volume"] == window["Volume"].sum()
+        assert result["Volume"].sum() == frame["Volume"].sum()
+        assert result["High"].max() == frame["High"].max()
+
+    def test_frame_helpers_pass_through(self):
+        """max_points 미지정/충분한 경우 원본 유지 테스트"""
+        frame = make_history(periods=100)
+
+        assert downsample_frame(frame, None) is frame
+        assert resample_ohlcv(frame, 100) is frame
+        assert len(downsample_frame(frame, 20)) == 20
+
+
+class TestUnifiedServiceDownsampling:
+    """UnifiedService 다운샘플링 연동 테스트 클래스"""
+
+    @pytest.fixture
+    def unified_service(self):
+        stock_service = Mock()
+        stock_service.get_historical_data = AsyncMock(return_value=make_history())
+        stock_service.get_stock_info = AsyncMock(return_value=None)
+        cache_manager = Mock()
+        cache_manager.get = AsyncMock(return_value=None)
+        cache_manager.set = AsyncMock()
+        return UnifiedService(stock_service, Mock(), cache_manager)
+
+    @pytest.mark.asyncio
+    async def test_get_historical_data_candles(self, unified_service):
+        """캔들 과거 데이터 재버킷팅 테스트"""
+        bars = await unified_service.get_historical_data("AAPL", "1mo", max_points=250)
+
+        assert len(bars) == 250
+        assert set(bars[0]) == {"timestamp", "Open", "High", "Low", "Close", "Volume"}
+        assert bars[0]["timestamp"] == "2024-01-02T09:30:00"
+        assert sum(bar["Volume"] for bar in bars) == int(make_history()["Volume"].sum())
+
+    @pytest.mark.asyncio
+    async def test_get_historical_data_line(self, unified_service):
+        """라인 과거 데이터 LTTB 테스트"""
+        bars = await unified_service.get_historical_data("AAPL", "1mo", max_points=300, chart_type="line")
+
+        assert len(bars) == 300
+        closes = [bar["Close"] for bar in bars]
+        assert max(closes) == make_history()["Close"].max()
+
+    @pytest.mark.asyncio
+    async def test_compare_stocks_downsamples_history(self, unified_service):
+        """비교 응답의 과거 시계열 max_points 적용 테스트"""
+        result = await unified_service.compare_stocks(["AAPL", "MSFT"], "1mo", False, max_points=200)
+
+        assert set(result["historical_data"]) == {"AAPL", "MSFT"}
+        assert len(result["historical_data"]["AAPL"]["Close"]) == 200
@@ -0,0 +1,154 @@
+"""
+컴파일된 i18n 카탈로그 단위 테스트
+
+메시지 사전 컴파일(변수/복수형), 폴백 체인 사전 해석, translate_many 일괄 조회,
+캐시 왕복 횟수 및 버전 스탬프를 통한 워커 간 카탈로그 교체를 테스트합니다.
+"""
+
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.i18n_catalog import CompiledCatalog, PLURAL_RULES, compile_message
+from backend.services.i18n_service import I18nService, Locale, TranslationNamespace
+
+
+class FakeCache:
+    """워커 간 공유되는 딕셔너리 기반 캐시"""
+
+    def __init__(self):
+        self.data = {}
+        self.get = AsyncMock(side_effect=lambda key: self.data.get(key))
+        self.set = AsyncMock(side_effect=self._set)
+
+    async def _set(self, key, value, ttl=None):
+        self.data[key] = value
+
+
+@pytest.fixture
+def shared_cache():
+    return FakeCache()
+
+
+class TestCompiledMessage:
+    """메시지 컴파일 테스트 클래스"""
+
+    def test_placeholders(self):
+        """변수 치환 및 누락 변수 유지 테스트"""
+        message = compile_message("Hello {name}, missing {missing_var}")
+
+        assert message.format({"name": "John"}) == "Hello John, missing {missing_var}"
+        assert message.format() == "Hello {name}, missing {missing_var}"
+
+    def test_literal_braces(self):
+        """변수가 아닌 중괄호 텍스트 보존 테스트"""
+        message = compile_message('Payload {"a": 1} for {symbol}}')
+
+        assert message.format({"symbol": "AAPL"}) == 'Payload {"a": 1} for AAPL}'
+
+    def test_plural_english(self):
+        """영어 복수형 및 정확 일치 분기 테스트"""
+        message = compile_message("{count, plural, =0 {No alerts} one {# alert} other {# alerts}} for {symbol}")
+
+        assert message.format({"count": 0, "symbol": "AAPL"}) == "No alerts for AAPL"
+        assert message.format({"count": 1, "symbol": "AAPL"}) == "1 alert for AAPL"
+        assert message.format({"count": 5, "symbol": "AAPL"}) == "5 alerts for AAPL"
+
+    def test_plural_locale_rules(self):
+        """로케일별 CLDR 복수 규칙 테스트"""
+        message = compile_message("{n, plural, one {# акция} few {# акции} many {# акций} other {# акции}}", "ru")
+
+        assert message.format({"n": 21}) == "21 акция"
+        assert message.format({"n": 3}) == "3 акции"
+        assert message.format({"n": 11}) == "11 акций"
+        assert PLURAL_RULES["ko"](1) == "other"
+        assert PLURAL_RULES["fr"](0) == "one"
+        assert PLURAL_RULES["ar"](103) == "few"
+
+    def test_malformed_plural_is_text(self):
+        """잘못된 복수형 구문을 텍스트로 처리하는지 테스트"""
+        message = compile_message("{count, plural, one {# item}")
+
+        assert message.format({"count": 2}) == "{count, plural, one {# item}"
+
+
+class TestCompiledCatalog:
+    """카탈로그 폴백 사전 해석 테스트 클래스"""
+
+    def test_fallback_resolved(self):
+        """폴백 로케일 메시지가 병합되는지 테스트"""
+        catalog = CompiledCatalog({
+            "en": {"common": {"loading": "Loading...", "save": "Save"}},
+            "ko": {"common": {"loading": "로딩 중..."}}
+        }, "en")
+
+        assert catalog.lookup("ko", "common", "loading").format() == "로딩 중..."
+        assert catalog.lookup("ko", "common", "save").format() == "Save"
+        assert catalog.lookup("ko", "common", "missing") is None
+        assert catalog.lookup("xx", "common", "save").format() == "Save"
+        assert catalog.message_count == 4
+
+
+class TestI18nCatalogService:
+    """I18nService 컴파일 카탈로그 연동 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_lookups_avoid_cache_round_trips(self, shared_cache):
+        """페이지 렌더링 시 캐시 왕복이 키 수에 비례하지 않는지 테스트"""
+        service = I18nService(shared_cache)
+        keys = list(service.translations["en"]["common"]) * 10
+
+        start = time.perf_counter()
+        for key in keys:
+            await service.get_translation(key, Locale.KOREAN, TranslationNamespace.COMMON)
+        elapsed = time.perf_counter() - start
+        print(f"\n{len(keys)} lookups in {elapsed * 1000:.2f}ms, cache gets: {shared_cache.get.await_count}")
+
+        assert shared_cache.get.await_count <= 1
+        assert shared_cache.set.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_translate_many(self, shared_cache):
+        """네임스페이스 일괄 조회 및 키별 변수 테스트"""
+        service = I18nService(shared_cache)
+        await service.add_translation("price_alert", "{symbol} 가격 알림", Locale.KOREAN, TranslationNamespace.NOTIFICATIONS)
+
+        whole = await service.translate_many(TranslationNamespace.NOTIFICATIONS, Locale.KOREAN)
+        assert whole["alerts"] == "Alerts"
+        assert len(whole) == len(service.translations["en"]["notifications"])
+
+        selected = await service.translate_many(
+            TranslationNamespace.NOTIFICATIONS, Locale.KOREAN,
+            keys=["price_alert", "unknown_key"], variables={"price_alert": {"symbol": "AAPL"}}
+        )
+        assert selected == {"price_alert": "AAPL 가격 알림", "unknown_key": "unknown_key"}
+
+    @pytest.mark.asyncio
+    async def test_workers_hot_swap_catalog(self, shared_cache):
+        """다른 워커의 번역 변경이 버전 스탬프로 반영되는지 테스트"""
+        writer = I18nService(shared_cache)
+        reader = I18nService(shared_cache)
+        assert await reader.get_translation("loading", Locale.KOREAN) == "Loading..."
+
+        await writer.import_translations({"ko": {"common": {"loading": "로딩 중..."}}})
+        version = shared_cache.data[writer.catalog_version_cache_key]
+        assert version == writer.catalog.version
+
+        # 확인 주기 내에는 기존 카탈로그 사용
+        assert await reader.get_translation("loading", Locale.KOREAN) == "Loading..."
+
+        reader._last_version_check = 0.0
+        assert await reader.get_translation("loading", Locale.KOREAN) == "로딩 중..."
+        assert reader.catalog.version == version
+        assert reader.stats["catalog_reloads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unavailable_cache_keeps_serving(self):
+        """캐시 장애 시에도 메모리 카탈로그로 번역하는지 테스트"""
+        cache_manager = Mock()
+        cache_manager.get = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        service = I18nService(cache_manager)
+
+        assert await service.get_translation("loading") == "Loading..."
@@ -0,0 +1,154 @@
+"""
+DynamicBatchInferenceWorker 단위 테스트
+
+동시 요청을 패딩된 배치로 묶어 한 번의 forward pass로 처리하는지 테스트합니다.
+"""
+
+import pytest
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import torch
+
+from backend.services.inference_batcher import DynamicBatchInferenceWorker
+from backend.services.advanced_sentiment_service import AdvancedSentimentService, SentimentModel
+
+
+VOCAB = {"up": 1, "down": 2}
+
+
+class FakeTokenizer:
+    """단어 단위 토크나이저 (0 = 패딩)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, padding, truncation, max_length, return_tensors):
+        self.calls.append(list(texts))
+        ids = [[VOCAB.get(word, 3) for word in text.split()][:max_length] or [3] for text in texts]
+        longest = max(len(row) for row in ids)
+        input_ids = torch.tensor([row + [0] * (longest - len(row)) for row in ids])
+        return {"input_ids": input_ids, "attention_mask": (input_ids != 0).long()}
+
+
+class FakeModel:
+    """'up'/'down' 개수를 로짓으로 반환하는 모델"""
+
+    def __init__(self, fail: bool = False):
+        self.config = SimpleNamespace(id2label={0: "negative", 1: "positive"})
+        self.batch_shapes = []
+        self.threads = []
+        self.fail = fail
+
+    def __call__(self, input_ids, attention_mask):
+        if self.fail:
+            raise RuntimeError("forward failed")
+        self.batch_shapes.append(tuple(input_ids.shape))
+        self.threads.append(threading.current_thread().name)
+        down = (input_ids == VOCAB["down"]).sum(dim=1).float()
+        up = (input_ids == VOCAB["up"]).sum(dim=1).float()
+        return SimpleNamespace(logits=torch.stack([down, up], dim=1))
+
+
+def _label(scores):
+    return max(scores, key=lambda s: s["score"])["label"]
+
+
+class TestDynamicBatchInferenceWorker:
+    """DynamicBatchInferenceWorker 테스트 클래스"""
+
+    @pytest.fixture
+    async def worker(self):
+        """배치 워커 픽스처"""
+        worker = DynamicBatchInferenceWorker(
+            FakeModel(), FakeTokenizer(), max_batch_size=8, max_wait_ms=20
+        )
+        yield worker
+        await worker.stop()
+        worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_padded_batch(self, worker):
+        """동시 요청이 하나의 패딩 배치로 처리되는지 테스트"""
+        texts = ["up", "down down", "up up up up", "down"]
+
+        results = await asyncio.gather(*[worker.submit(text) for text in texts])
+
+        assert worker.model.batch_shapes == [(4, 4)]
+        assert worker.tokenizer.calls == [texts]
+        assert [_label(r) for r in results] == ["positive", "negative", "positive", "negative"]
+        assert worker.get_stats()["batches"] == 1
+        assert worker.get_stats()["avg_batch_size"] == 4
+
+    @pytest.mark.asyncio
+    async def test_results_sum_to_one(self, worker):
+        """확률 합계 테스트"""
+        scores = await worker.submit("up down up")
+
+        assert {s["label"] for s in scores} == {"negative", "positive"}
+        assert sum(s["score"] for s in scores) == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_batch_size(self, worker):
+        """최대 배치 크기 제한 테스트"""
+        results = await worker.submit_many(["up"] * 20)
+
+        assert len(results) == 20
+        assert [shape[0] for shape in worker.model.batch_shapes] == [8, 8, 4]
+        assert worker.get_stats()["max_batch_size_seen"] == 8
+
+    @pytest.mark.asyncio
+    async def test_forward_pass_runs_off_event_loop(self, worker):
+        """forward pass가 전용 스레드에서 실행되는지 테스트"""
+        await worker.submit("up")
+
+        assert worker.model.threads[0].startswith("sentiment-inference")
+        assert worker.model.threads[0] != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_every_caller(self):
+        """배치 실패 시 모든 요청에 예외 전달 테스트"""
+        worker = DynamicBatchInferenceWorker(FakeModel(fail=True), FakeTokenizer(), max_wait_ms=20)
+
+        results = await asyncio.gather(
+            worker.submit("up"), worker.submit("down"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert worker.get_stats()["failed_batches"] == 1
+        await worker.stop()
+        worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_advanced_service_routes_transformer_through_worker(self, worker):
+        """AdvancedSentimentService가 배치 워커를 사용하는지 테스트"""
+        service = AdvancedSentimentService(cache_manager=MagicMock())
+        service.pipelines[SentimentModel.DISTILBERT] = MagicMock()
+        service.batchers[SentimentModel.DISTILBERT] = worker
+
+        results = await asyncio.gather(
+            service._analyze_with_transformer("up up", SentimentModel.DISTILBERT),
+            service._analyze_with_transformer("down", SentimentModel.DISTILBERT)
+        )
+
+        assert results[0]["sentiment_score"] > 0
+        assert results[1]["sentiment_score"] < 0
+        assert worker.model.batch_shapes == [(2, 2)]
+        service.pipelines[SentimentModel.DISTILBERT].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_service_close_releases_inference_threads(self, worker):
+        """서비스 종료 시 추론 스레드 해제 테스트"""
+        service = AdvancedSentimentService(cache_manager=MagicMock())
+        service.batchers[SentimentModel.DISTILBERT] = worker
+        await worker.submit("up")
+
+        await service.close()
+
+        assert not worker.is_running
+        assert worker._executor._shutdown
+        assert service.batchers == {}
+        with pytest.raises(RuntimeError):
+            worker._executor.submit(lambda: None)
@@ -977,4 +977,221 @@ class TestIntelligentCacheManager:
         
         assert key == "cache:pattern:test_key"
         assert ttl == 86400
-        assert json.loads(pattern_dict)["key"] == "test_key"
\ No newline at end of file
+        assert json.loads(pattern_dict)["key"] == "test_key"
+
+class TestWarmupScheduler:
+    """힙 기반 워밍 스케줄러 및 백그라운드 패턴 분석 테스트 클래스"""
+    
+    @pytest.fixture
+    def manager(self):
+        """짧은 간격 설정의 IntelligentCacheManager 인스턴스"""
+        return IntelligentCacheManager(
+            max_pattern_history=50,
+            warmup_queue_size=100,
+            max_concurrent_warmups=2,
+            pattern_sample_size=10
+        )
+    
+    def _task(self, key, priority=1, delay=0.0, loader="loader"):
+        return CacheWarmupTask(
+            key=key,
+            scheduled_time=datetime.utcnow() + timedelta(seconds=delay),
+            priority=priority,
+            data_loader=loader,
+            params={}
+        )
+    
+    async def _run_scheduler(self, manager, duration):
+        manager.running = True
+        scheduler = asyncio.create_task(manager._warmup_scheduler())
+        await asyncio.sleep(duration)
+        manager.running = False
+        scheduler.cancel()
+        try:
+            await scheduler
+        except asyncio.CancelledError:
+            pass
+    
+    @pytest.mark.asyncio
+    async def test_same_key_is_deduplicated(self, manager):
+        """같은 키의 워밍 작업 병합 테스트"""
+        await manager._add_to_warmup_queue(self._task("AAPL", priority=5, delay=60))
+        await manager._add_to_warmup_queue(self._task("AAPL", priority=2, delay=30))
+        
+        assert len(manager.warmup_queue) == 1
+        assert manager.warmup_queue[0].priority == 5
+        assert manager.warmup_stats["deduplicated"] == 1
+        # 병합 후 이전 힙 항목은 무효화되어 실행되지 않음
+        assert manager._pop_due_warmup(datetime.utcnow() + timedelta(seconds=45)).key == "AAPL"
+        assert manager._pop_due_warmup(datetime.utcnow() + timedelta(seconds=120)) is None
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_keeps_highest_priorities(self, manager):
+        """큐가 가득 찼을 때 우선순위가 낮은 작업부터 제거되는지 테스트"""
+        manager.warmup_queue_size = 3
+        for priority in [4, 9, 1, 7, 3, 8]:
+            await manager._add_to_warmup_queue(self._task(f"key_{priority}", priority=priority))
+        
+        assert sorted(t.priority for t in manager.warmup_queue) == [7, 8, 9]
+        assert manager.warmup_stats["evicted"] + manager.warmup_stats["dropped"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_due_tasks_run_with_bounded_concurrency(self, manager):
+        """동시 실행 한도 내에서 워밍 작업이 실행되는지 테스트"""
+        running = 0
+        peak = 0
+        loaded = []
+        
+        async def loader():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return {"ok": True}
+        
+        manager.register_data_loader("loader", loader)
+        for i in range(6):
+            await manager._add_to_warmup_queue(self._task(f"key_{i}"))
+        
+        with patch.object(manager, "_save_to_cache", new=AsyncMock(side_effect=lambda key, *_: loaded.append(key))):
+            await self._run_scheduler(manager, 0.3)
+        
+        assert sorted(loaded) == [f"key_{i}" for i in range(6)]
+        assert peak == 2
+        assert manager.warmup_tasks == {}
+    
+    @pytest.mark.asyncio
+    async def test_future_task_wakes_scheduler_on_time(self, manager):
+        """예약 시각에 맞춰 스케줄러가 깨어나는지 테스트 (1분 폴링 없음)"""
+        executed = []
+        manager.running = True
+        
+        with patch.object(manager, "_execute_warmup_task", new=AsyncMock(side_effect=lambda task: executed.append(task.key))):
+            scheduler = asyncio.create_task(manager._warmup_scheduler())
+            await asyncio.sleep(0.01)
+            await manager._add_to_warmup_queue(self._task("MSFT", delay=0.1))
+            await asyncio.sleep(0.05)
+            assert executed == []
+            await asyncio.sleep(0.15)
+            manager.running = False
+            scheduler.cancel()
+            try:
+                await scheduler
+            except asyncio.CancelledError:
+                pass
+        
+        assert executed == ["MSFT"]
+    
+    @pytest.mark.asyncio
+    async def test_paused_scheduler_keeps_tasks_queued(self, manager):
+        """워밍 일시 중지 중 작업이 큐에 유지되는지 테스트"""
+        manager.pause_warmups()
+        await manager._add_to_warmup_queue(self._task("GOOG"))
+        
+        with patch.object(manager, "_execute_warmup_task", new=AsyncMock()) as execute:
+            await self._run_scheduler(manager, 0.05)
+            assert execute.await_count == 0
+            assert len(manager.warmup_queue) == 1
+            
+            manager.resume_warmups()
+            await self._run_scheduler(manager, 0.05)
+        
+        execute.assert_awaited_once()
+        assert manager.warmup_queue == []
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_only_bumps_counter(self, manager):
+        """캐시 히트 경로에서 패턴 분석과 Redis 접근 기록이 수행되지 않는지 테스트"""
+        manager.redis_client = AsyncMock()
+        manager.redis_client.get.return_value = json.dumps({"price": 1.0})
+        
+        with patch.object(manager, "_analyze_access_pattern", new=AsyncMock()) as analyze:
+            for _ in range(100):
+                assert await manager.get_with_predictive_warming("stock:AAPL", "stock_price", "loader") == {"price": 1.0}
+        
+        analyze.assert_not_awaited()
+        manager.redis_client.lpush.assert_not_called()
+        assert manager.access_counts["stock:AAPL"] == 100
+        assert "stock:AAPL" in manager._pending_analysis
+    
+    @pytest.mark.asyncio
+    async def test_tracked_keys_are_capped(self, manager):
+        """접근 카운터가 최대 추적 키 수를 넘지 않고 오래된 키부터 제거되는지 테스트"""
+        manager.max_tracked_keys = 3
+        for key in ["a", "b", "c", "a", "d", "e"]:
+            manager._note_access(key, "stock_price", None, None)
+        
+        assert list(manager.access_counts) == ["a", "d", "e"]
+        assert manager.access_counts["a"] == 2
+        assert "b" not in manager.access_history and "b" not in manager._pending_analysis
+        assert manager.warmup_stats["untracked_keys"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_access_patterns_evicted_with_tracked_keys(self, manager):
+        """키 교체가 계속되어도 접근 패턴이 추적 키 수를 넘지 않는지 테스트"""
+        manager.max_tracked_keys = 3
+        manager.prediction_params["min_samples"] = 2
+        for i in range(20):
+            key = f"stock:SYM{i}"
+            manager._note_access(key, "stock_price", None, None)
+            manager._note_access(key, "stock_price", None, None)
+            assert await manager._analyze_access_pattern(key) is not None
+        
+        assert list(manager.access_patterns) == ["stock:SYM17", "stock:SYM18", "stock:SYM19"]
+        assert await manager._analyze_access_pattern("stock:SYM0") is None
+        assert "stock:SYM0" not in manager.access_history
+    
+    def test_wakeup_event_created_on_scheduler_loop(self):
+        """워밍 이벤트가 생성자가 아닌 스케줄러 루프에서 생성되는지 테스트"""
+        manager = IntelligentCacheManager()
+        assert manager._warmup_wakeup is None
+        manager.resume_warmups()
+        manager._wake_warmup_scheduler()
+        
+        async def run_scheduler():
+            manager.running = True
+            scheduler = asyncio.create_task(manager._warmup_scheduler())
+            await asyncio.sleep(0.01)
+            event = manager._warmup_wakeup
+            manager.running = False
+            scheduler.cancel()
+            await asyncio.gather(scheduler, return_exceptions=True)
+            return event
+        
+        for _ in range(2):
+            # 루프마다 새 이벤트 사용
+            assert asyncio.run(run_scheduler()) is not None
+    
+    @pytest.mark.asyncio
+    async def test_background_pass_samples_pending_keys(self, manager):
+        """백그라운드 분석 패스의 표본 추출 및 예측 워밍 예약 테스트"""
+        start = datetime.utcnow() - timedelta(minutes=30)
+        for i in range(25):
+            key = f"stock:{i}"
+            manager._note_access(key, "stock_price", "loader", {"symbol": str(i)})
+            # 정확히 60초 주기의 접근 이력
+            manager.access_history[key] = deque(
+                [start + timedelta(seconds=60 * n) for n in range(50)], maxlen=50
+            )
+        
+        analyzed = await manager._run_pattern_analysis_pass()
+        
+        assert analyzed == 10
+        assert len(manager._pending_analysis) == 15
+        assert len(manager.warmup_queue) == 10
+        assert {t.data_loader for t in manager.warmup_queue} == {"loader"}
+    
+    @pytest.mark.asyncio
+    async def test_access_history_persisted_in_one_pipeline(self, manager):
+        """접근 이력이 파이프라인으로 저장되는지 테스트 (최신 접근이 앞)"""
+        fakeredis = pytest.importorskip("fakeredis")
+        manager.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        times = [datetime(2024, 1, 1, 9, 30, n) for n in range(3)]
+        manager.access_history["stock:AAPL"] = deque(times, maxlen=50)
+        
+        await manager._persist_access_history(["stock:AAPL"])
+        
+        stored = await manager.redis_client.lrange("cache:access:stock:AAPL", 0, -1)
+        assert stored == [t.isoformat() for t in reversed(times)]
+        assert await manager.redis_client.ttl("cache:access:stock:AAPL") > 0
@@ -0,0 +1,208 @@
+"""
+컬럼형 OHLCV 저장소 단위 테스트
+
+심볼/인터벌별 컬럼 파일 저장과 메모리 맵 구간 조회, 꼬리 구간 덮어쓰기 및 추가 쓰기,
+버전 관리와 StockService의 캐시 포인터 연동을 테스트합니다.
+"""
+
+import pytest
+import os
+import numpy as np
+import pandas as pd
+from unittest.mock import AsyncMock, Mock, patch
+
+from backend.services.ohlcv_store import ColumnarOHLCVStore
+from backend.services.stock_service import StockService
+
+
+def make_bars(start="2024-01-02", periods=10, freq="D", tz="America/New_York", seed=0):
+    """yfinance history()와 같은 형태의 OHLCV 프레임 생성"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=periods, freq=freq, tz=tz, name="Date")
+    close = 100 + rng.standard_normal(periods).cumsum()
+    return pd.DataFrame({
+        "Open": close - 0.5,
+        "High": close + 1.0,
+        "Low": close - 1.0,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 5_000_000, periods),
+        "Dividends": np.zeros(periods),
+        "Stock Splits": np.zeros(periods)
+    }, index=index)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 디렉터리 저장소"""
+    return ColumnarOHLCVStore(str(tmp_path / "ohlcv"))
+
+
+class TestColumnarOHLCVStore:
+    """ColumnarOHLCVStore 테스트 클래스"""
+
+    def test_round_trip(self, store):
+        """쓰기 후 전체 조회 시 프레임 복원 테스트"""
+        bars = make_bars()
+
+        version = store.write("AAPL", "1d", bars)
+        result = store.read("AAPL", "1d")
+
+        assert version == 1
+        pd.testing.assert_frame_equal(result, bars, check_freq=False)
+
+    def test_range_read(self, store):
+        """구간 조회 테스트"""
+        bars = make_bars(periods=30)
+        store.write("AAPL", "1d", bars)
+
+        result = store.read("AAPL", "1d", start=bars.index[5], end=bars.index[9])
+
+        pd.testing.assert_frame_equal(result, bars.iloc[5:10], check_freq=False)
+        assert store.read("AAPL", "1d", start="2030-01-01").empty
+
+    def test_column_subset(self, store):
+        """일부 컬럼만 조회 테스트"""
+        store.write("AAPL", "1d", make_bars())
+
+        result = store.read("AAPL", "1d", columns=["Close"])
+
+        assert list(result.columns) == ["Close"]
+
+    def test_append_and_tail_overwrite(self, store):
+        """새 봉 추가 및 겹치는 꼬리 구간 덮어쓰기 테스트"""
+        history = make_bars(periods=20)
+        store.write("AAPL", "1d", history.iloc[:15])
+
+        # 마지막 봉이 갱신된 채로 다시 수신됨
+        update = history.iloc[14:].copy()
+        update.loc[update.index[0], "Close"] = 999.0
+        version = store.write("AAPL", "1d", update)
+
+        result = store.read("AAPL", "1d")
+        expected = pd.concat([history.iloc[:14], update])
+        assert version == 2
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+        assert store.stats["appended_rows"] == 20
+        assert store.stats["rewritten_rows"] == 1
+
+    def test_older_frame_replaces_series(self, store):
+        """저장된 범위보다 앞에서 시작하는 프레임은 전체를 대체하는지 테스트"""
+        store.write("AAPL", "1d", make_bars(start="2024-03-01", periods=5))
+        longer = make_bars(start="2024-01-02", periods=40, seed=1)
+
+        store.write("AAPL", "1d", longer)
+
+        pd.testing.assert_frame_equal(store.read("AAPL", "1d"), longer, check_freq=False)
+
+    def test_intraday_naive_index(self, store):
+        """타임존 없는 분봉 인덱스 테스트"""
+        bars = make_bars(start="2024-01-02 09:30", periods=390, freq="min", tz=None)
+
+        store.write("MSFT", "1m", bars)
+        result = store.read("MSFT", "1m", start="2024-01-02 10:00", end="2024-01-02 10:04")
+
+        assert len(result) == 5
+        assert result.index.tz is None
+        assert result.index[0] == pd.Timestamp("2024-01-02 10:00")
+
+    def test_missing_series_and_delete(self, store):
+        """없는 시리즈 조회 및 삭제 테스트"""
+        assert store.read("NOPE", "1d") is None
+        assert store.get_version("NOPE", "1d") == 0
+
+        store.write("AAPL", "1d", make_bars())
+        first, last = store.get_range("AAPL", "1d")
+        assert first < last
+
+        store.delete("AAPL", "1d")
+        assert store.read("AAPL", "1d") is None
+
+    def test_crashed_overwrite_keeps_previous_version(self, store):
+        """꼬리 덮어쓰기 중 meta 교체 전에 실패해도 이전 버전을 읽을 수 있는지 테스트"""
+        history = make_bars(periods=20)
+        store.write("AAPL", "1d", history.iloc[:15])
+        update = history.iloc[10:].copy()
+        update["Close"] = 999.0
+
+        with patch.object(ColumnarOHLCVStore, "_write_meta", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                store.write("AAPL", "1d", update)
+
+        fresh = ColumnarOHLCVStore(store.root)
+        assert fresh.get_version("AAPL", "1d") == 1
+        pd.testing.assert_frame_equal(fresh.read("AAPL", "1d"), history.iloc[:15], check_freq=False)
+
+        # 다음 쓰기는 남은 파일을 정리하고 정상 반영
+        store.write("AAPL", "1d", update)
+        pd.testing.assert_frame_equal(
+            fresh.read("AAPL", "1d"), pd.concat([history.iloc[:10], update]), check_freq=False
+        )
+        directory = store._directory("AAPL", "1d")
+        assert len([name for name in os.listdir(directory) if name.endswith(".bin")]) == len(history.columns) + 1
+
+    def test_overwrite_does_not_touch_mapped_rows(self, store):
+        """다른 인스턴스가 매핑한 커밋된 행은 꼬리 덮어쓰기 후에도 바뀌지 않는지 테스트"""
+        history = make_bars(periods=20)
+        store.write("AAPL", "1d", history.iloc[:15])
+        reader = ColumnarOHLCVStore(store.root)
+        meta = reader._read_meta(reader._directory("AAPL", "1d"))
+        mapped_close = reader._maps_for(("AAPL", "1d"), meta)["Close"]
+
+        update = history.iloc[5:].copy()
+        update["Close"] = 999.0
+        store.write("AAPL", "1d", update)
+
+        np.testing.assert_array_equal(np.asarray(mapped_close), history["Close"].to_numpy()[:15])
+        assert reader.read("AAPL", "1d")["Close"].iloc[-1] == 999.0
+        assert store.stats["generations_written"] == 2
+
+        # 순수 추가 쓰기는 새 세대를 만들지 않음
+        store.write("AAPL", "1d", make_bars(start="2024-02-01", periods=3, seed=2))
+        assert store.stats["generations_written"] == 2
+
+
+class TestStockServiceHistoricalStore:
+    """StockService 과거 데이터 저장소 연동 테스트 클래스"""
+
+    @pytest.fixture
+    def cache_manager(self):
+        cache = {}
+        manager = Mock()
+        manager.get = AsyncMock(side_effect=lambda key: cache.get(key))
+        manager.set = AsyncMock(side_effect=lambda key, value, ttl=None: cache.__setitem__(key, value))
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_cache_holds_pointer_and_hit_reads_store(self, cache_manager, store):
+        """캐시에는 포인터만 저장되고 히트 시 저장소에서 읽는지 테스트"""
+        service = StockService(cache_manager=cache_manager, ohlcv_store=store)
+        service.requests_per_minute = 1000
+        bars = make_bars(periods=250)
+        service._get_historical_data_sync = Mock(return_value=bars)
+
+        first = await service.get_historical_data("AAPL", "1y")
+        cached = cache_manager.set.call_args[0][1]
+        second = await service.get_historical_data("AAPL", "1y")
+
+        assert set(cached) == {"ohlcv_store"}
+        assert cached["ohlcv_store"]["version"] == 1
+        assert service._get_historical_data_sync.call_count == 1
+        pd.testing.assert_frame_equal(first, bars)
+        pd.testing.assert_frame_equal(second, bars, check_freq=False)
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_pointer_ahead_of_store_refetches(self, cache_manager, store):
+        """저장소가 포인터 버전보다 뒤처지면 다시 조회하는지 테스트"""
+        service = StockService(cache_manager=cache_manager, ohlcv_store=store)
+        service.requests_per_minute = 1000
+        service._get_historical_data_sync = Mock(return_value=make_bars())
+        await cache_manager.set("hist_AAPL_1y", {"ohlcv_store": {
+            "symbol": "AAPL", "interval": "1d", "start": "2024-01-02", "end": "2024-01-11", "version": 3
+        }})
+
+        result = await service.get_historical_data("AAPL", "1y")
+
+        assert len(result) == 10
+        assert service._get_historical_data_sync.call_count == 1
+        await service.close()
@@ -0,0 +1,137 @@
+"""
+ONNX 감성 분석 백엔드 단위 테스트
+
+ONNX 변환, int8 양자화, 정확도 일치 검사 및 배치 워커 연동을 테스트합니다.
+"""
+
+import pytest
+import os
+import zlib
+
+import numpy as np
+import torch
+
+pytest.importorskip("onnxruntime")
+
+from transformers import BertConfig, BertForSequenceClassification
+
+from backend.services.inference_batcher import DynamicBatchInferenceWorker
+from backend.services.onnx_sentiment_backend import (
+    OnnxSequenceClassifier,
+    check_accuracy_parity,
+    default_intra_op_threads,
+    export_to_onnx,
+    get_model_paths,
+    quantize_model
+)
+
+
+TEXTS = [
+    "earnings beat expectations and shares rally",
+    "guidance cut sends the stock lower",
+    "flat session",
+    "analysts upgrade on strong revenue growth and record margins this quarter",
+    "bearish",
+    "market closes mixed ahead of the fed decision"
+]
+
+
+class HashTokenizer:
+    """어휘 파일 없이 동작하는 해시 기반 토크나이저"""
+
+    def __call__(self, texts, padding="longest", truncation=True, max_length=512, return_tensors="pt"):
+        ids = [[zlib.crc32(word.encode()) % 900 + 100 for word in text.split()][:max_length] for text in texts]
+        longest = max(len(row) for row in ids)
+        input_ids = torch.tensor([row + [0] * (longest - len(row)) for row in ids])
+        return {
+            "input_ids": input_ids,
+            "attention_mask": (input_ids != 0).long(),
+            "token_type_ids": torch.zeros_like(input_ids)
+        }
+
+
+class TestOnnxSentimentBackend:
+    """ONNX 백엔드 테스트 클래스"""
+
+    @pytest.fixture(scope="class")
+    def model(self):
+        """소형 BERT 분류 모델 픽스처"""
+        torch.manual_seed(0)
+        config = BertConfig(
+            vocab_size=1000,
+            hidden_size=64,
+            num_hidden_layers=2,
+            num_attention_heads=2,
+            intermediate_size=128,
+            num_labels=3,
+            id2label={0: "positive", 1: "negative", 2: "neutral"},
+            label2id={"positive": 0, "negative": 1, "neutral": 2}
+        )
+        return BertForSequenceClassification(config).eval()
+
+    @pytest.fixture(scope="class")
+    def exported(self, model, tmp_path_factory):
+        """fp32/int8 ONNX 모델 픽스처"""
+        paths = get_model_paths("test/tiny-bert", str(tmp_path_factory.mktemp("onnx")))
+        export_to_onnx(model, HashTokenizer(), paths["fp32"])
+        quantize_model(paths["fp32"], paths["int8"])
+        return paths
+
+    def test_model_paths_are_namespaced(self, tmp_path):
+        """모델 경로 테스트"""
+        paths = get_model_paths("ProsusAI/finbert", str(tmp_path))
+
+        assert paths["fp32"] == os.path.join(str(tmp_path), "ProsusAI--finbert", "model.onnx")
+        assert paths["int8"].endswith("model.int8.onnx")
+
+    def test_default_intra_op_threads(self):
+        """스레드 수 분배 테스트"""
+        assert default_intra_op_threads() >= 1
+        assert default_intra_op_threads(workers=10_000) == 1
+
+    def test_fp32_export_matches_torch(self, model, exported):
+        """fp32 ONNX 모델 정확도 일치 테스트"""
+        classifier = OnnxSequenceClassifier(exported["fp32"], model.config, intra_op_threads=1)
+
+        parity = check_accuracy_parity(model, classifier, HashTokenizer(), TEXTS, batch_size=4)
+
+        assert parity["sample_size"] == len(TEXTS)
+        assert parity["label_agreement"] == 1.0
+        assert parity["max_abs_prob_diff"] < 1e-4
+
+    def test_int8_model_is_smaller_and_close(self, model, exported):
+        """int8 양자화 모델 크기 및 근사 테스트"""
+        classifier = OnnxSequenceClassifier(exported["int8"], model.config, intra_op_threads=1)
+
+        parity = check_accuracy_parity(model, classifier, HashTokenizer(), TEXTS)
+
+        assert os.path.getsize(exported["int8"]) < os.path.getsize(exported["fp32"])
+        assert parity["max_abs_prob_diff"] < 0.1
+
+    def test_classifier_accepts_numpy_and_ignores_unknown_inputs(self, model, exported):
+        """입력 형식 변환 테스트"""
+        classifier = OnnxSequenceClassifier(exported["fp32"], model.config, intra_op_threads=1)
+        encoded = HashTokenizer()(TEXTS[:2])
+
+        output = classifier(
+            input_ids=encoded["input_ids"].numpy(),
+            attention_mask=encoded["attention_mask"],
+            token_type_ids=encoded["token_type_ids"],
+            unused=np.zeros(1)
+        )
+
+        assert output.logits.shape == (2, 3)
+
+    @pytest.mark.asyncio
+    async def test_batch_worker_serves_onnx_classifier(self, model, exported):
+        """배치 워커의 ONNX 모델 사용 테스트"""
+        classifier = OnnxSequenceClassifier(exported["int8"], model.config, intra_op_threads=1)
+        worker = DynamicBatchInferenceWorker(classifier, HashTokenizer(), max_wait_ms=20)
+
+        results = await worker.submit_many(TEXTS)
+
+        assert len(results) == len(TEXTS)
+        assert {s["label"] for s in results[0]} == {"positive", "negative", "neutral"}
+        assert worker.get_stats()["batches"] == 1
+        await worker.stop()
+        worker.shutdown()
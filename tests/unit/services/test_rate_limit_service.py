@@ -0,0 +1,188 @@
+"""
+속도 제한 서비스 단위 테스트
+
+워커별 로컬 토큰 버킷 빠른 경로, Redis 일괄 동기화, 소진 임박 시 전역 엄격 검사,
+워커 간 전역 제한 유지 및 Redis 장애 처리를 fakeredis로 테스트합니다.
+"""
+
+import pytest
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from backend.services.rate_limit_service import RateLimitPolicy, RateLimitService, UserTier
+
+
+class CountingRedis(fakeredis.FakeAsyncRedis):
+    """명령 및 파이프라인 실행 횟수(네트워크 왕복)를 세는 fakeredis 클라이언트"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.round_trips = 0
+
+    async def execute_command(self, *args, **options):
+        self.round_trips += 1
+        return await super().execute_command(*args, **options)
+
+    def pipeline(self, *args, **kwargs):
+        pipe = super().pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def counted_execute(*execute_args, **execute_kwargs):
+            self.round_trips += 1
+            return await execute(*execute_args, **execute_kwargs)
+
+        pipe.execute = counted_execute
+        return pipe
+
+
+def _service(server, **kwargs):
+    """주기 동기화가 테스트 중 개입하지 않도록 긴 동기화 주기를 사용하는 서비스"""
+    kwargs.setdefault("sync_interval", 60)
+    return RateLimitService(MagicMock(), redis_client=CountingRedis(server=server), **kwargs)
+
+
+class TestHybridRateLimiter:
+    """로컬 토큰 버킷 + 전역 동기화 속도 제한 테스트 클래스"""
+
+    @pytest.fixture(autouse=True)
+    def frozen_clock(self):
+        """테스트 도중 윈도우 경계를 넘지 않도록 윈도우 중간 시각으로 고정"""
+        now = (int(time.time()) // 60) * 60 + 10
+        with patch("backend.services.rate_limit_service.time.time", return_value=now):
+            yield now
+
+    @pytest.fixture
+    def server(self):
+        """워커 간 공유되는 fakeredis 서버"""
+        return fakeredis.FakeServer()
+
+    @pytest.fixture
+    async def service(self, server):
+        service = _service(server)
+        yield service
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_hot_identifier_is_decided_locally(self, service):
+        """빈번한 식별자는 대부분 Redis 왕복 없이 판정되는지 테스트"""
+        for _ in range(1000):
+            info = await service.is_allowed("user:hot", "api", UserTier.ENTERPRISE.value)
+            assert info.allowed
+
+        assert service.redis_client.round_trips < 50
+        assert service.limiter_stats["local_decisions"] > 950
+
+    @pytest.mark.asyncio
+    async def test_pending_usage_is_synced_in_one_pipeline(self, service):
+        """로컬 사용량이 파이프라인 한 번으로 Redis에 반영되는지 테스트"""
+        for identifier in ("user:a", "user:b"):
+            for _ in range(20):
+                await service.is_allowed(identifier, "api", UserTier.ENTERPRISE.value)
+
+        service.redis_client.round_trips = 0
+        assert await service.sync_usage() > 0
+        assert service.redis_client.round_trips == 1
+
+        status = await service.get_rate_limit_status("user:a", "api", UserTier.ENTERPRISE.value)
+        assert status["current_requests"] == 20
+
+    @pytest.mark.asyncio
+    async def test_requests_near_exhaustion_are_checked_globally(self, service):
+        """남은 예산이 임계값 이하이면 모든 요청이 전역으로 검사되는지 테스트"""
+        results = [(await service.is_allowed("user:1", "search")).allowed for _ in range(55)]
+
+        assert results == [True] * 50 + [False] * 5
+
+        service.redis_client.round_trips = 0
+        await service.is_allowed("user:1", "search")
+        assert service.redis_client.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_global_limit_holds_across_workers(self, server):
+        """여러 워커가 같은 식별자를 처리해도 전역 제한이 유지되는지 테스트"""
+        workers = [_service(server) for _ in range(4)]
+        try:
+            allowed = 0
+            for i in range(400):
+                if i % 25 == 0:
+                    await asyncio.gather(*[worker.sync_usage() for worker in workers])
+                worker = workers[i % len(workers)]
+                allowed += (await worker.is_allowed("ip:1", "default", UserTier.BASIC.value)).allowed
+
+            limit = 500
+            assert allowed == 400
+            for i in range(200):
+                worker = workers[i % len(workers)]
+                allowed += (await worker.is_allowed("ip:1", "default", UserTier.BASIC.value)).allowed
+
+            # 소진 임박 구간은 전역 검사이므로 초과량은 워커당 임대 토큰 이하
+            assert limit <= allowed <= limit + len(workers) * int(limit * 0.1 * 0.1)
+        finally:
+            for worker in workers:
+                await worker.close()
+
+    @pytest.mark.asyncio
+    async def test_burst_mode_allows_burst_allowance(self, service):
+        """버스트 모드에서 requests + burst까지 허용되는지 테스트"""
+        service.custom_policies["user:1"] = {"default": RateLimitPolicy(requests=10, window=60, burst=5)}
+
+        results = [(await service.is_allowed("user:1", burst_mode=True)).allowed for _ in range(16)]
+
+        assert results == [True] * 15 + [False]
+
+    @pytest.mark.asyncio
+    async def test_new_window_resets_budget(self, service, frozen_clock):
+        """윈도우가 바뀌면 예산이 초기화되는지 테스트"""
+        service.custom_policies["user:1"] = {"default": RateLimitPolicy(requests=3, window=60)}
+        now = frozen_clock
+
+        with patch("backend.services.rate_limit_service.time.time", return_value=now):
+            results = [(await service.is_allowed("user:1")).allowed for _ in range(4)]
+            assert results[-1] is False
+        with patch("backend.services.rate_limit_service.time.time", return_value=now + 60):
+            assert (await service.is_allowed("user:1")).allowed
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_fails_open_and_keeps_usage(self, service, monkeypatch):
+        """Redis 장애 시 요청을 허용하고 사용량을 다음 동기화까지 보존하는지 테스트"""
+        def unavailable_pipeline(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+
+        monkeypatch.setattr(service.redis_client, "pipeline", unavailable_pipeline)
+        assert (await service.is_allowed("user:1")).allowed
+        assert service.limiter_stats["sync_errors"] == 1
+
+        monkeypatch.undo()
+        await service.sync_usage()
+        assert (await service.get_rate_limit_status("user:1"))["current_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_sync_runs_periodically(self, server):
+        """주기적 동기화 테스트"""
+        service = _service(server, sync_interval=0.05)
+        try:
+            for _ in range(30):
+                await service.is_allowed("user:1", "api", UserTier.ENTERPRISE.value)
+
+            await asyncio.sleep(0.2)
+
+            assert all(bucket.pending == 0 for bucket in service.local_buckets.values())
+            assert service.limiter_stats["syncs"] >= 1
+        finally:
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_local_only_without_redis(self):
+        """Redis가 없으면 워커 단위로 제한하는지 테스트"""
+        cache_manager = MagicMock()
+        cache_manager.backend = None
+        service = RateLimitService(cache_manager)
+        service.custom_policies["user:1"] = {"default": RateLimitPolicy(requests=5, window=60)}
+
+        results = [(await service.is_allowed("user:1")).allowed for _ in range(6)]
+        await service.close()
+
+        assert results == [True] * 5 + [False]
@@ -0,0 +1,251 @@
+"""
+로컬 종목 검색 인덱스 단위 테스트
+
+티커 정확/접두사 검색, 회사명 접두사 및 트라이그램 유사 검색, 비트셋 필터,
+상장 목록 파일의 원자적 핫 리로드, stocks 테이블 적재 및 StockService 연동을 테스트합니다.
+"""
+
+import pytest
+import asyncio
+import csv
+import os
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from backend.services.stock_service import StockService
+from backend.services.symbol_index import CONFIDENT_MATCH_SCORE, SymbolIndex, SymbolRecord
+
+
+LISTINGS = [
+    {"symbol": "AAPL", "company_name": "Apple Inc.", "exchange": "NASDAQ", "sector": "Technology"},
+    {"symbol": "AAP", "company_name": "Advance Auto Parts, Inc.", "exchange": "NYSE", "sector": "Consumer Cyclical"},
+    {"symbol": "AMZN", "company_name": "Amazon.com, Inc.", "exchange": "NASDAQ", "sector": "Consumer Cyclical"},
+    {"symbol": "MSFT", "company_name": "Microsoft Corporation", "exchange": "NASDAQ", "sector": "Technology"},
+    {"symbol": "MU", "company_name": "Micron Technology, Inc.", "exchange": "NASDAQ", "sector": "Technology"},
+    {"symbol": "JPM", "company_name": "JPMorgan Chase & Co.", "exchange": "NYSE", "sector": "Financial Services"},
+    {"symbol": "SPY", "company_name": "SPDR S&P 500 ETF Trust", "stock_type": "ETF", "exchange": "NYSEARCA", "sector": ""}
+]
+
+
+def write_listings(path, rows):
+    """상장 목록 CSV 작성"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["symbol", "company_name", "stock_type", "exchange", "sector"])
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({"stock_type": "EQUITY", **row})
+
+
+class TestSymbolIndex:
+    """SymbolIndex 테스트 클래스"""
+
+    @pytest.fixture
+    def index(self):
+        index = SymbolIndex()
+        index.load(LISTINGS, version="test")
+        return index
+
+    def test_exact_symbol_ranks_first(self, index):
+        """정확한 티커가 접두사 결과보다 앞서는지 테스트"""
+        results = index.search("aap")
+
+        assert [r["symbol"] for r in results[:2]] == ["AAP", "AAPL"]
+        assert results[0]["relevance_score"] == 100.0
+        assert results[1]["relevance_score"] == 80.0
+
+    def test_company_name_prefix(self, index):
+        """회사명 접두사 검색 테스트"""
+        results = index.search("micro")
+
+        assert {r["symbol"] for r in results} == {"MSFT", "MU"}
+        assert all(r["relevance_score"] == 60.0 for r in results)
+
+    def test_fuzzy_name_match(self, index):
+        """오타가 있는 회사명의 트라이그램 유사 검색 테스트"""
+        results = index.search("Mircosoft Corp")
+
+        assert results[0]["symbol"] == "MSFT"
+        assert 0 < results[0]["relevance_score"] < 60.0
+
+    def test_bitset_filters(self, index):
+        """거래소/종목 유형/섹터 필터 테스트"""
+        assert [r["symbol"] for r in index.search("A", {"exchange": "nyse"})] == ["AAP"]
+        assert index.search("SPDR", {"stock_type": "EQUITY"}) == []
+        assert [r["symbol"] for r in index.search("SPDR", {"stock_type": "etf"})] == ["SPY"]
+        assert {r["symbol"] for r in index.search("m", {"sector": "tech"})} == {"MSFT", "MU"}
+        assert index.search("AAPL", {"exchange": "LSE"}) == []
+
+    def test_unknown_query_returns_nothing(self, index):
+        """일치 항목이 없을 때 빈 결과 테스트"""
+        assert index.search("zzzzqq") == []
+        assert SymbolIndex().search("AAPL") == []
+
+    def test_file_hot_reload_is_atomic(self, tmp_path):
+        """목록 파일 변경 시 새 스냅샷으로 교체되고 이전 스냅샷은 유지되는지 테스트"""
+        path = str(tmp_path / "listings.csv")
+        write_listings(path, LISTINGS[:2])
+        index = SymbolIndex()
+        index.load_file(path)
+        previous = index._snapshot
+
+        assert not index.reload_file_if_changed(path)
+
+        write_listings(path, LISTINGS)
+        os.utime(path, (os.path.getmtime(path) + 10,) * 2)
+        assert index.reload_file_if_changed(path)
+
+        assert index.search("MSFT")[0]["symbol"] == "MSFT"
+        assert index.get_stats()["listings"] == len(LISTINGS)
+        assert len(previous) == 2
+
+    def test_failed_reload_keeps_serving(self, tmp_path):
+        """잘못된 목록 파일 리로드 시 기존 인덱스가 유지되는지 테스트"""
+        path = str(tmp_path / "listings.json")
+        with open(path, "w") as f:
+            f.write('[{"symbol": "AAPL", "company_name": "Apple Inc."}]')
+        index = SymbolIndex()
+        index.load_file(path)
+
+        with open(path, "w") as f:
+            f.write("{broken")
+        os.utime(path, (os.path.getmtime(path) + 10,) * 2)
+
+        assert not index.reload_file_if_changed(path)
+        assert index.search("AAPL")[0]["symbol"] == "AAPL"
+        assert index.get_stats()["reload_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_watcher_picks_up_changes(self, tmp_path):
+        """파일 감시 작업이 변경을 반영하는지 테스트"""
+        path = str(tmp_path / "listings.csv")
+        write_listings(path, LISTINGS[:1])
+        index = SymbolIndex()
+        index.load_file(path)
+        index.start_watching(path, interval=0.01)
+        try:
+            write_listings(path, LISTINGS)
+            os.utime(path, (os.path.getmtime(path) + 10,) * 2)
+            for _ in range(100):
+                if index.get_stats()["listings"] == len(LISTINGS):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await index.stop_watching()
+
+        assert index.search("JPM")[0]["symbol"] == "JPM"
+
+    def test_load_from_database(self):
+        """stocks 테이블에서 인덱스 적재 테스트"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from backend.models.database_models import Stock
+
+        engine = create_engine("sqlite://")
+        Stock.__table__.create(engine)
+        with engine.begin() as connection:
+            connection.execute(Stock.__table__.insert(), [
+                {"symbol": row["symbol"], "company_name": row["company_name"], "exchange": row["exchange"],
+                 "sector": row["sector"], "stock_type": row.get("stock_type", "EQUITY"),
+                 "created_at": datetime.utcnow(), "updated_at": datetime.utcnow()}
+                for row in LISTINGS
+            ])
+        Session = sessionmaker(bind=engine)
+
+        index = SymbolIndex()
+        assert index.load_from_database(Session) == len(LISTINGS)
+        assert index.search("JPMorgan")[0]["symbol"] == "JPM"
+
+
+    @pytest.mark.asyncio
+    async def test_database_refresh_picks_up_new_listings(self):
+        """stocks 테이블 주기적 재적재가 신규 종목을 반영하는지 테스트"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from backend.models.database_models import Stock
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Stock.__table__.create(engine)
+        rows = [
+            {"symbol": row["symbol"], "company_name": row["company_name"], "exchange": row["exchange"],
+             "sector": row["sector"], "stock_type": row.get("stock_type", "EQUITY"),
+             "created_at": datetime.utcnow(), "updated_at": datetime.utcnow()}
+            for row in LISTINGS
+        ]
+        with engine.begin() as connection:
+            connection.execute(Stock.__table__.insert(), rows[:1])
+        Session = sessionmaker(bind=engine)
+
+        index = SymbolIndex()
+        index.load_from_database(Session)
+        index.start_database_refresh(Session, interval=0.01)
+        try:
+            with engine.begin() as connection:
+                connection.execute(Stock.__table__.insert(), rows[1:])
+            for _ in range(100):
+                if index.get_stats()["listings"] == len(LISTINGS):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await index.stop_watching()
+
+        assert index.search("JPM")[0]["symbol"] == "JPM"
+
+
+class TestStockServiceLocalSearch:
+    """StockService 로컬 검색 연동 테스트 클래스"""
+
+    @pytest.fixture
+    def stock_service(self, mock_cache_manager):
+        index = SymbolIndex()
+        index.load([SymbolRecord.from_dict(row) for row in LISTINGS])
+        service = StockService(cache_manager=mock_cache_manager, symbol_index=index)
+        service._get_session = AsyncMock(side_effect=AssertionError("network access"))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_search_served_locally(self, stock_service):
+        """인덱스 적중 시 네트워크 호출 없이 결과를 반환하는지 테스트"""
+        results = await stock_service.search_stocks("AAPL")
+
+        assert results[0]["symbol"] == "AAPL"
+        assert results[0]["data_sources"] == ["symbol_index"]
+        stock_service._get_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_remote_search(self, stock_service, mock_cache_manager):
+        """인덱스에 없는 종목은 원격 검색으로 대체되는지 테스트"""
+        mock_cache_manager.get_search_results = AsyncMock(return_value=None)
+        stock_service._get_session = AsyncMock(side_effect=RuntimeError("offline"))
+
+        assert await stock_service.search_stocks("zzzzqq") == []
+        stock_service._get_session.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_weak_fuzzy_match_falls_back_to_remote_search(self, stock_service, mock_cache_manager):
+        """약한 퍼지 일치만 있으면 로컬 결과 대신 원격 검색을 시도하는지 테스트"""
+        stock_service.symbol_index.load([SymbolRecord.from_dict(row) for row in LISTINGS]
+                                        + [SymbolRecord("ZNZN", "Zenzen")])
+        mock_cache_manager.get_search_results = AsyncMock(return_value=None)
+        stock_service._get_session = AsyncMock(side_effect=RuntimeError("offline"))
+
+        for query in ["ZZZZZ", "Zenith"]:
+            local = stock_service.symbol_index.search(query)
+            assert local[0]["symbol"] == "ZNZN" and local[0]["relevance_score"] < CONFIDENT_MATCH_SCORE
+            await stock_service.search_stocks(query)
+
+        assert stock_service._get_session.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_load_symbol_index_from_listings_file(self, tmp_path, mock_cache_manager):
+        """SYMBOL_LISTINGS_PATH 목록 파일 적재 테스트"""
+        path = str(tmp_path / "listings.csv")
+        write_listings(path, LISTINGS)
+
+        with patch.dict(os.environ, {"SYMBOL_LISTINGS_PATH": path}):
+            service = StockService(cache_manager=mock_cache_manager)
+        try:
+            assert service.symbol_index.is_loaded
+            assert await service.load_symbol_index() == len(LISTINGS)
+        finally:
+            await service.close()
@@ -0,0 +1,170 @@
+"""
+위협 패턴 스캐너 단위 테스트
+
+패턴 규칙 컴파일과 리터럴 사전 필터, 규칙 변경 시에만 재컴파일, 스캔 길이 제한, 발동 규칙 보고,
+겹치는 패턴의 정확성 및 ThreatDetectionService.analyze_request 연동을 테스트합니다.
+"""
+
+import pytest
+import random
+import re
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.services.threat_detection_service import (
+    ResponseAction,
+    SecurityRule,
+    ThreatDetectionService,
+    ThreatSeverity,
+    ThreatType
+)
+from backend.services.threat_pattern_scanner import ThreatPatternScanner
+
+
+def _rule(rule_id, pattern):
+    return SimpleNamespace(rule_id=rule_id, pattern=pattern)
+
+
+class TestThreatPatternScanner:
+    """ThreatPatternScanner 테스트 클래스"""
+
+    def test_reports_fired_rules_with_findall_results(self):
+        """발동 규칙과 규칙별 매치 결과 보고 테스트"""
+        scanner = ThreatPatternScanner()
+        scanner.compile([
+            _rule("sql", r"(?i)(union|select)\s+"),
+            _rule("xss", r"(?i)(<script|javascript:)"),
+            _rule("cmd", r"cmd\.exe")
+        ])
+
+        result = scanner.scan("UNION SELECT * FROM users <script>")
+
+        assert result.fired_rules == ["sql", "xss"]
+        assert result.matches["sql"] == ["UNION", "SELECT"]
+        assert result.matches["xss"] == ["<script"]
+
+    def test_recompiles_only_when_rules_change(self):
+        """규칙이 바뀔 때만 재컴파일하는지 테스트"""
+        scanner = ThreatPatternScanner()
+        rules = [_rule("a", "foo"), _rule("b", "bar")]
+
+        assert scanner.compile(rules)
+        assert not scanner.compile(list(rules))
+        assert scanner.compile(rules + [_rule("c", "baz")])
+        assert scanner.stats["compilations"] == 2
+
+    def test_scan_is_capped(self):
+        """스캔 길이 제한 테스트"""
+        scanner = ThreatPatternScanner(max_scan_length=100)
+        scanner.compile([_rule("a", "attack")])
+
+        result = scanner.scan("x" * 200 + "attack")
+
+        assert result.truncated
+        assert result.scanned_length == 100
+        assert result.fired_rules == []
+
+    def test_shadowed_rules_are_still_reported(self):
+        """다른 규칙의 매치와 겹치는 규칙도 보고되는지 테스트"""
+        scanner = ThreatPatternScanner()
+        scanner.compile([_rule("long", r"bash -c"), _rule("short", r"sh"), _rule("inner", r"-c")])
+
+        result = scanner.scan("run bash -c now")
+
+        assert set(result.fired_rules) == {"long", "short", "inner"}
+
+    def test_matches_per_rule_findall(self):
+        """무작위 입력에서 규칙별 re.findall과 결과가 같은지 테스트"""
+        patterns = {
+            "sql": r"(?i)(union|select|drop)\s+",
+            "sh": r"sh",
+            "bash": r"(?i)bash",
+            "eval": r"eval\(",
+            "digits": r"\d{3,}",
+            "backref": r"(ab)\1",
+            "named": r"(?P<word>zz+)"
+        }
+        scanner = ThreatPatternScanner()
+        scanner.compile([_rule(rule_id, pattern) for rule_id, pattern in patterns.items()])
+        alphabet = ["union ", "SELECT ", "drop", "bash", "sh", "eval(", "123", "4", "abab", "zz", " ", "x"]
+        rng = random.Random(7)
+
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            expected = {
+                rule_id: re.findall(pattern, text)
+                for rule_id, pattern in patterns.items()
+                if re.findall(pattern, text)
+            }
+            assert scanner.scan(text).matches == expected, text
+
+    def test_invalid_pattern_is_skipped(self):
+        """잘못된 패턴 규칙은 건너뛰는지 테스트"""
+        scanner = ThreatPatternScanner()
+        scanner.compile([_rule("broken", "(unclosed"), _rule("ok", "attack")])
+
+        assert scanner.scan("attack").fired_rules == ["ok"]
+        assert scanner.stats["invalid_rules"] == 1
+
+
+class TestThreatDetectionPatternScan:
+    """ThreatDetectionService 패턴 스캔 연동 테스트 클래스"""
+
+    @pytest.fixture
+    async def service(self):
+        cache_manager = MagicMock()
+        cache_manager.set = AsyncMock(return_value=True)
+        service = ThreatDetectionService(cache_manager)
+        service.config["anomaly_detection_enabled"] = False
+        return service
+
+    @pytest.mark.asyncio
+    async def test_sql_injection_detected_with_fired_rules(self, service):
+        """SQL 인젝션 탐지 및 발동 규칙 보고 테스트"""
+        result = await service.analyze_request({
+            "client_ip": "10.0.0.1",
+            "path": "/api/v1/stocks",
+            "body": "union select a; select b; drop table c; delete from d",
+            "query_params": {"q": "AAPL"}
+        })
+
+        assert result["threat_detected"]
+        assert result["threats"][0]["rule_id"] == "sql_injection_basic"
+        assert "sql_injection_basic" in result["fired_rules"]
+        assert not result["scan_truncated"]
+
+    @pytest.mark.asyncio
+    async def test_clean_request_scanned_once(self, service):
+        """정상 요청은 규칙별 정규식 확인 없이 처리되는지 테스트"""
+        result = await service.analyze_request({"client_ip": "10.0.0.2", "path": "/api/v1/stocks", "body": "hello"})
+
+        assert not result["threat_detected"]
+        assert result["fired_rules"] == []
+        assert service.pattern_scanner.stats["confirmations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rule_changes_trigger_recompile(self, service):
+        """규칙 추가/비활성화 시 스캐너가 다시 컴파일되는지 테스트"""
+        request = {"client_ip": "10.0.0.3", "path": "/", "body": "wget http://evil"}
+        await service.analyze_request(request)
+        compilations = service.pattern_scanner.stats["compilations"]
+
+        service.security_rules["wget"] = SecurityRule(
+            rule_id="wget",
+            name="Downloader",
+            description="Detects downloader commands",
+            threat_type=ThreatType.MALICIOUS_PAYLOAD,
+            severity=ThreatSeverity.HIGH,
+            enabled=True,
+            pattern=r"wget\s+http",
+            response_actions=[ResponseAction.BLOCK_REQUEST],
+            conditions={"min_confidence": 0.2},
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+        assert (await service.analyze_request(request))["threat_detected"]
+
+        service.security_rules["wget"].enabled = False
+        assert not (await service.analyze_request(request))["threat_detected"]
+        assert service.pattern_scanner.stats["compilations"] == compilations + 2
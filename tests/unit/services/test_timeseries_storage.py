@@ -0,0 +1,305 @@
+"""
+시계열 저장소 단위 테스트
+
+SQLite 저장 엔진의 원시 데이터 적재, time_bucket 방식 집계, 1m/5m/1h/1d 롤업의
+정확성과 증분 갱신(새로 들어온 구간만 재계산), 롤업 자동 선택 및
+TimescaleService 연동을 테스트합니다.
+"""
+
+import pytest
+import os
+import random
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+from backend.cache.unified_cache import UnifiedCacheManager
+from backend.services.timescale_service import TimescaleService
+from backend.services.timeseries_storage import (
+    SQLiteTimeSeriesStorage,
+    parse_interval,
+    to_epoch
+)
+
+
+BASE_TIME = datetime(2024, 1, 2, 9, 0)
+
+
+def make_ticks(symbol="AAPL", start=BASE_TIME, seconds=3 * 3600, step=10, seed=7):
+    """step초 간격의 가격 틱 생성"""
+    rng = random.Random(seed)
+    price = 100.0
+    ticks = []
+    for offset in range(0, seconds, step):
+        price += rng.uniform(-0.5, 0.5)
+        ticks.append({
+            "symbol": symbol,
+            "timestamp": start + timedelta(seconds=offset),
+            "price": round(price, 4),
+            "volume": rng.randint(1, 100)
+        })
+    return ticks
+
+
+def expected_bars(ticks, width):
+    """원시 틱으로부터 직접 계산한 OHLCV 봉"""
+    bars = {}
+    for tick in ticks:
+        ts = to_epoch(tick["timestamp"])
+        bucket = int(ts // width) * width
+        bar = bars.get(bucket)
+        if bar is None:
+            bars[bucket] = {"open": tick["price"], "high": tick["price"], "low": tick["price"],
+                            "close": tick["price"], "volume": tick["volume"]}
+        else:
+            bar["high"] = max(bar["high"], tick["price"])
+            bar["low"] = min(bar["low"], tick["price"])
+            bar["close"] = tick["price"]
+            bar["volume"] += tick["volume"]
+    return [bars[bucket] for bucket in sorted(bars)]
+
+
+def assert_bars_equal(data, expected):
+    assert len(data) == len(expected)
+    for row, bar in zip(data, expected):
+        for key in ("open", "high", "low", "close", "volume"):
+            assert row[key] == pytest.approx(bar[key])
+
+
+@pytest.fixture
+async def storage():
+    """메모리 SQLite 저장소"""
+    engine = SQLiteTimeSeriesStorage()
+    yield engine
+    await engine.close()
+
+
+class TestTimeSeriesStorage:
+    """SQLiteTimeSeriesStorage 테스트 클래스"""
+
+    def test_parse_interval(self):
+        """간격 문자열 파싱 테스트"""
+        assert parse_interval("5m") == 300
+        assert parse_interval("1 hour") == 3600
+        assert parse_interval("1d") == 86400
+        assert parse_interval(900) == 900
+        assert parse_interval(None) is None
+        with pytest.raises(ValueError):
+            parse_interval("avg")
+
+    def test_choose_rollup(self):
+        """요청 해상도를 나누는 가장 굵은 롤업 선택 테스트"""
+        assert SQLiteTimeSeriesStorage.choose_rollup(60) == ("1m", 60)
+        assert SQLiteTimeSeriesStorage.choose_rollup(900) == ("5m", 300)
+        assert SQLiteTimeSeriesStorage.choose_rollup(4 * 3600) == ("1h", 3600)
+        assert SQLiteTimeSeriesStorage.choose_rollup(7 * 86400) == ("1d", 86400)
+        assert SQLiteTimeSeriesStorage.choose_rollup(30) is None
+        assert SQLiteTimeSeriesStorage.choose_rollup(90) is None
+
+    @pytest.mark.asyncio
+    async def test_raw_query(self, storage):
+        """해상도 없는 짧은 구간은 원시 데이터 반환 테스트"""
+        ticks = make_ticks(seconds=600)
+        await storage.insert("stock_data", ticks)
+
+        result = await storage.query("stock_data", "AAPL", BASE_TIME, BASE_TIME + timedelta(minutes=5))
+
+        assert result["source"] == "stock_data"
+        assert len(result["data"]) == 30
+        assert result["data"][0]["timestamp"] == BASE_TIME
+        assert result["data"][0]["price"] == ticks[0]["price"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("resolution,source", [
+        (60, "ohlcv_1m"),
+        (300, "ohlcv_5m"),
+        (900, "ohlcv_5m"),
+        (3600, "ohlcv_1h"),
+        (30, "stock_data")
+    ])
+    async def test_rollups_match_raw_aggregation(self, storage, resolution, source):
+        """롤업 및 재버킷팅 결과가 원시 데이터 집계와 일치하는지 테스트"""
+        ticks = make_ticks()
+        await storage.insert("stock_data", ticks)
+
+        result = await storage.query(
+            "stock_data", "AAPL", BASE_TIME, BASE_TIME + timedelta(hours=3),
+            limit=10000, resolution=resolution
+        )
+
+        assert result["source"] == source
+        assert_bars_equal(result["data"], expected_bars(ticks, resolution))
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_touches_only_new_buckets(self, storage):
+        """증분 갱신이 새로 들어온 구간의 버킷만 재계산하는지 테스트"""
+        ticks = make_ticks(seconds=2 * 3600)
+        await storage.insert("stock_data", ticks[:360])  # 첫 1시간
+        await storage.refresh_rollups()
+
+        await storage.insert("stock_data", ticks[360:366])  # 다음 1분
+        refreshed = await storage.refresh_rollups()
+
+        assert refreshed["stock_data_1m"] == 1
+        assert refreshed["stock_data_5m"] == 1
+        assert refreshed["stock_data_1h"] == 1
+        assert refreshed["stock_data_1d"] == 1
+
+        # 변경이 없으면 갱신할 것도 없음
+        assert await storage.refresh_rollups() == {}
+
+        result = await storage.query(
+            "stock_data", "AAPL", BASE_TIME, BASE_TIME + timedelta(hours=2), limit=1000, resolution=60
+        )
+        assert_bars_equal(result["data"], expected_bars(ticks[:366], 60))
+
+    @pytest.mark.asyncio
+    async def test_late_data_updates_existing_buckets(self, storage):
+        """늦게 도착한 데이터가 기존 롤업 버킷에 반영되는지 테스트"""
+        ticks = make_ticks(seconds=3600)
+        on_time = [tick for i, tick in enumerate(ticks) if i % 7]
+        late = [tick for i, tick in enumerate(ticks) if not i % 7]
+
+        await storage.insert("stock_data", on_time)
+        await storage.refresh_rollups()
+        await storage.insert("stock_data", late)
+
+        # 조회 전 대기 중인 롤업이 자동으로 갱신됨
+        result = await storage.query(
+            "stock_data", "AAPL", BASE_TIME, BASE_TIME + timedelta(hours=1), limit=1000, resolution=300
+        )
+        assert_bars_equal(result["data"], expected_bars(ticks, 300))
+
+    @pytest.mark.asyncio
+    async def test_long_range_picks_coarse_rollup(self, storage):
+        """긴 구간 조회 시 limit에 맞는 롤업 자동 선택 테스트"""
+        ticks = make_ticks(seconds=2 * 86400, step=60)
+        await storage.insert("stock_data", ticks)
+
+        result = await storage.query(
+            "stock_data", "AAPL", BASE_TIME, BASE_TIME + timedelta(days=2), limit=100
+        )
+
+        assert result["source"] == "ohlcv_1h"
+        assert result["resolution"] == 3600
+        assert len(result["data"]) == 48
+        assert_bars_equal(result["data"], expected_bars(ticks, 3600))
+
+    @pytest.mark.asyncio
+    async def test_symbols_are_isolated(self, storage):
+        """심볼별 롤업 분리 테스트"""
+        await storage.insert("stock_data", make_ticks("AAPL", seconds=600, seed=1))
+        await storage.insert("stock_data", make_ticks("MSFT", seconds=600, seed=2))
+
+        aapl = await storage.query("stock_data", "AAPL", BASE_TIME, BASE_TIME + timedelta(minutes=10), resolution=300)
+        msft = await storage.query("stock_data", "MSFT", BASE_TIME, BASE_TIME + timedelta(minutes=10), resolution=300)
+
+        assert [row["symbol"] for row in aapl["data"]] == ["AAPL", "AAPL"]
+        assert_bars_equal(msft["data"], expected_bars(make_ticks("MSFT", seconds=600, seed=2), 300))
+
+    @pytest.mark.asyncio
+    async def test_sentiment_rollups(self, storage):
+        """감성 데이터 롤업 평균/최소/최대 테스트"""
+        rows = [
+            {"symbol": "AAPL", "timestamp": BASE_TIME + timedelta(minutes=minute), "compound_score": score,
+             "mention_count": 2}
+            for minute, score in [(0, 0.5), (3, -0.1), (7, 0.3), (20, 0.9)]
+        ]
+        await storage.insert("sentiment_data", rows)
+
+        result = await storage.query(
+            "sentiment_data", "AAPL", BASE_TIME, BASE_TIME + timedelta(hours=1), resolution=900
+        )
+
+        assert result["source"] == "sentiment_5m"
+        first, second = result["data"]
+        assert first["sentiment_score"] == pytest.approx(0.7 / 3)
+        assert first["min_score"] == -0.1
+        assert first["max_score"] == 0.5
+        assert first["mention_count"] == 6
+        assert second["timestamp"] == BASE_TIME + timedelta(minutes=15)
+
+    @pytest.mark.asyncio
+    async def test_generic_table_and_drop(self, storage):
+        """롤업 없는 테이블 저장/조회 및 삭제 테스트"""
+        await storage.insert("user_activity", [
+            {"user_id": 1, "timestamp": BASE_TIME, "action": "login"},
+            {"user_id": 2, "timestamp": BASE_TIME + timedelta(seconds=5), "action": "search"}
+        ])
+
+        result = await storage.query("user_activity", "2")
+        assert result["data"] == [{"user_id": 2, "action": "search", "timestamp": BASE_TIME + timedelta(seconds=5)}]
+
+        await storage.insert("stock_data", make_ticks(seconds=120))
+        await storage.refresh_rollups()
+        assert await storage.drop_table("stock_data") == 12
+        stats = await storage.get_table_stats("stock_data")
+        assert stats["row_count"] == 0
+        assert stats["rollups"] == {"1m": 0, "5m": 0, "1h": 0, "1d": 0}
+
+
+class TestTimescaleServiceStorage:
+    """TimescaleService 저장소 연동 테스트 클래스"""
+
+    @pytest.fixture
+    def timescale_service(self):
+        cache_manager = Mock(spec=UnifiedCacheManager)
+        cache_manager.set = AsyncMock()
+        return TimescaleService(cache_manager, storage=SQLiteTimeSeriesStorage())
+
+    @pytest.mark.asyncio
+    async def test_insert_and_query_with_resolution(self, timescale_service):
+        """서비스 삽입 후 해상도 지정 조회 테스트"""
+        ticks = make_ticks(seconds=3600)
+
+        inserted = await timescale_service.insert_time_series_data("stock_data", ticks, batch_size=100)
+        assert inserted["success"] is True
+        assert inserted["inserted_count"] == len(ticks)
+        assert "processing_time_ms" in inserted
+
+        result = await timescale_service.query_time_series_data(
+            "stock_data",
+            start_time=BASE_TIME,
+            end_time=BASE_TIME + timedelta(hours=1),
+            symbol="AAPL",
+            aggregation="15m"
+        )
+
+        assert result["success"] is True
+        assert result["count"] == 4
+        assert result["source"] == "ohlcv_5m"
+        assert result["resolution_seconds"] == 900
+        assert_bars_equal(result["data"], expected_bars(ticks, 900))
+
+    @pytest.mark.asyncio
+    async def test_initialize_keeps_configuration(self, timescale_service):
+        """initialize 후 설정이 딕셔너리로 유지되는지 테스트"""
+        await timescale_service.initialize()
+
+        assert isinstance(timescale_service.config, dict)
+        assert timescale_service.config["storage_backend"] == "sqlite"
+
+    @pytest.mark.asyncio
+    async def test_file_storage_persists_across_services(self, tmp_path):
+        """파일 저장소가 서비스 재생성 후에도 데이터를 유지하고 close가 백그라운드 작업을 정리하는지 테스트"""
+        cache_manager = Mock(spec=UnifiedCacheManager)
+        cache_manager.set = AsyncMock()
+        path = str(tmp_path / "data" / "timeseries.db")
+        ticks = make_ticks(seconds=600)
+
+        with patch.dict(os.environ, {"TIMESCALE_STORAGE_PATH": path}):
+            first = TimescaleService(cache_manager)
+        tasks = list(first._background_tasks)
+        assert len(tasks) == 4
+        await first.insert_time_series_data("stock_data", ticks)
+        await first.close()
+        assert all(task.done() for task in tasks)
+
+        with patch.dict(os.environ, {"TIMESCALE_STORAGE_PATH": path}):
+            second = TimescaleService(cache_manager)
+        try:
+            result = await second.query_time_series_data(
+                "stock_data", start_time=BASE_TIME, end_time=BASE_TIME + timedelta(hours=1), symbol="AAPL"
+            )
+            assert result["count"] == len(ticks)
+        finally:
+            await second.close()
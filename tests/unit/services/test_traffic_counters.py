@@ -0,0 +1,167 @@
+"""
+고정 메모리 트래픽 카운터 단위 테스트
+
+링 버킷 슬라이딩 윈도우 카운터, count-min 스케치, 헤비 히터 추적,
+추적 IP 수 제한 및 ThreatDetectionService 무차별 대입/DDoS/속도 제한 검사 연동을 테스트합니다.
+"""
+
+import pytest
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.services.threat_detection_service import ThreatDetectionService
+from backend.services.traffic_counters import (
+    CountMinSketch,
+    HeavyHitters,
+    RingBucketCounter,
+    SourceTrafficTracker
+)
+
+
+class TestRingBucketCounter:
+    """RingBucketCounter 테스트 클래스"""
+
+    def test_counts_events_within_window(self):
+        """윈도우 내 이벤트 수와 만료 테스트"""
+        counter = RingBucketCounter(window_seconds=10, buckets=10)
+        for second in range(20):
+            counter.add(1000.0 + second)
+
+        # 최근 10개 버킷(1초 단위)만 남음
+        assert counter.count(1019.5) == 10
+        assert counter.count(1025.0) == 4
+        assert counter.count(1100.0) == 0
+
+    def test_memory_is_fixed(self):
+        """이벤트 수와 관계없이 버킷 수가 고정되는지 테스트"""
+        counter = RingBucketCounter(window_seconds=60, buckets=12)
+        for i in range(100000):
+            counter.add(1000.0 + i * 0.0005)
+
+        assert len(counter.buckets) == 12
+        assert counter.count(1050.0) == 100000
+        assert counter.count(1200.0) == 0
+
+
+class TestCountMinSketch:
+    """CountMinSketch 및 HeavyHitters 테스트 클래스"""
+
+    def test_estimates_never_undercount(self):
+        """추정치가 실제 값 이상이고 오차가 작은지 테스트"""
+        sketch = CountMinSketch(width=1024, depth=4, seed=1)
+        rng = random.Random(1)
+        actual = {}
+        for _ in range(20000):
+            key = f"10.0.{rng.randint(0, 20)}.{rng.randint(0, 255)}"
+            actual[key] = actual.get(key, 0) + 1
+            sketch.add(key)
+
+        errors = [sketch.estimate(key) - count for key, count in actual.items()]
+        assert min(errors) >= 0
+        assert sum(errors) / len(errors) < 20
+
+    def test_heavy_hitters_found_among_many_sources(self):
+        """다수의 출발지 중 상위 출발지를 찾는지 테스트"""
+        hitters = HeavyHitters(window_seconds=60, capacity=20)
+        rng = random.Random(2)
+        now = 6000.0
+        heavy = [f"203.0.113.{i}" for i in range(5)]
+        for i in range(50000):
+            hitters.add(f"198.51.{rng.randint(0, 255)}.{rng.randint(0, 255)}", now)
+            if i % 10 == 0:
+                hitters.add(heavy[(i // 10) % 5], now)
+
+        top = [source for source, _ in hitters.top(5, now)]
+        assert set(top) == set(heavy)
+
+    def test_heavy_hitters_decay_after_window(self):
+        """윈도우가 지나면 이전 헤비 히터가 사라지는지 테스트"""
+        hitters = HeavyHitters(window_seconds=60, capacity=5)
+        for _ in range(100):
+            hitters.add("203.0.113.1", 6000.0)
+
+        assert hitters.estimate("203.0.113.1", 6090.0) == pytest.approx(50, abs=1)
+        assert hitters.top(5, 6200.0) == []
+
+
+class TestSourceTrafficTracker:
+    """SourceTrafficTracker 테스트 클래스"""
+
+    def test_tracked_sources_are_bounded(self):
+        """추적 출발지 수 제한 및 최근 사용 출발지 유지 테스트"""
+        tracker = SourceTrafficTracker(max_tracked_sources=100)
+        tracker.register_window("requests", 60)
+        for i in range(1000):
+            tracker.record("10.0.0.1", "requests", 1000.0)
+            tracker.record(f"10.1.{i // 256}.{i % 256}", "requests", 1000.0)
+
+        assert tracker.get_stats()["tracked_sources"] == 100
+        assert tracker.count("10.0.0.1", "requests", 60, 1000.0) == 1000
+        assert tracker.top_sources(1, 1000.0)[0]["source"] == "10.0.0.1"
+
+
+class TestThreatDetectionRateChecks:
+    """ThreatDetectionService 속도 기반 검사 테스트 클래스"""
+
+    @pytest.fixture
+    async def service(self):
+        cache_manager = MagicMock()
+        cache_manager.set = AsyncMock(return_value=True)
+        service = ThreatDetectionService(cache_manager)
+        service.config["anomaly_detection_enabled"] = False
+        service.auto_response_enabled = False
+        return service
+
+    @pytest.mark.asyncio
+    async def test_brute_force_counts_login_attempts(self, service):
+        """로그인 시도만 무차별 대입 검사에 반영되는지 테스트"""
+        rule = service.security_rules["brute_force_detection"]
+        login = {"client_ip": "10.0.0.1", "path": "/api/v1/auth/login"}
+
+        for _ in range(10):
+            await service.analyze_request({"client_ip": "10.0.0.1", "path": "/api/v1/stocks"})
+        assert not (await service._check_brute_force(rule, login))["detected"]
+
+        for _ in range(5):
+            await service.analyze_request(login)
+        result = await service._check_brute_force(rule, login)
+
+        assert result["detected"]
+        assert result["attempts"] == 5
+
+    @pytest.mark.asyncio
+    async def test_ddos_burst_detected(self, service):
+        """짧은 시간 대량 요청 시 DDoS 버스트 탐지 테스트"""
+        rule = service.security_rules["ddos_detection"]
+        rule.conditions = {"requests_per_minute": 1000, "burst_threshold": 50}
+        request = {"client_ip": "10.0.0.9", "path": "/api/v1/stocks"}
+
+        for _ in range(50):
+            service._update_request_history("10.0.0.9", request)
+        result = await service._check_ddos(rule, request)
+
+        assert result["detected"]
+        assert result["burst_requests"] == 50
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_window_expires(self, service):
+        """속도 제한 윈도우가 지나면 카운트가 초기화되는지 테스트"""
+        service.config["rate_limit_requests"] = 5
+        with patch("backend.services.threat_detection_service.time.time", return_value=10000.0):
+            for _ in range(5):
+                service._update_request_history("10.0.0.5", {})
+            assert (await service._check_rate_limit("10.0.0.5"))["violated"]
+
+        with patch("backend.services.threat_detection_service.time.time", return_value=10200.0):
+            assert not (await service._check_rate_limit("10.0.0.5"))["violated"]
+
+    @pytest.mark.asyncio
+    async def test_statistics_include_top_sources(self, service):
+        """통계에 상위 출발지가 포함되는지 테스트"""
+        for _ in range(3):
+            service._update_request_history("10.0.0.7", {})
+
+        stats = await service.get_threat_statistics()
+
+        assert stats["traffic"]["top_sources"][0]["source"] == "10.0.0.7"
+        assert stats["traffic"]["tracked_sources"] == 1
@@ -0,0 +1,114 @@
+"""
+대시보드 통합 조회 단위 테스트
+
+지연이 주입된 가짜 백엔드로 대시보드 섹션 동시 조회 시 전체 지연이 섹션 합이 아닌
+최댓값 수준으로 줄어드는지, 섹션별 오류/타임아웃 보고 및 배치 종목 조회를 테스트합니다.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from backend.models.unified_models import StockType, UnifiedStockData
+from backend.services.unified_service import UnifiedService
+
+
+SECTION_LATENCY = {
+    "get_market_indices": 0.15,
+    "get_market_sentiment": 0.10,
+    "get_trending_stocks": 0.12,
+    "get_market_statistics": 0.20,
+    "get_stock_data": 0.10
+}
+
+
+def make_stock(symbol):
+    return UnifiedStockData(symbol=symbol, company_name=f"{symbol} Inc.", stock_type=StockType.EQUITY,
+                            exchange="NASDAQ", current_price=100.0)
+
+
+def slow(delay, result):
+    """지정 지연 후 결과를 반환하는 비동기 함수"""
+    async def call(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return result(*args) if callable(result) else result
+    return call
+
+
+@pytest.fixture
+def unified_service():
+    """지연이 주입된 가짜 백엔드를 사용하는 UnifiedService"""
+    service = UnifiedService(Mock(), Mock(), Mock())
+    service.get_market_indices = slow(SECTION_LATENCY["get_market_indices"], [{"symbol": "^GSPC"}])
+    service.get_market_sentiment = slow(SECTION_LATENCY["get_market_sentiment"], {"overall_sentiment": 0.2})
+    service.get_trending_stocks = slow(SECTION_LATENCY["get_trending_stocks"], [make_stock("GME")])
+    service.get_market_statistics = slow(SECTION_LATENCY["get_market_statistics"], {"market_overview": {}})
+    service.get_stock_data = slow(SECTION_LATENCY["get_stock_data"], lambda symbol, *_: make_stock(symbol))
+    return service
+
+
+class TestUnifiedDashboard:
+    """UnifiedService 대시보드 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_dashboard_latency_is_max_not_sum(self, unified_service):
+        """섹션 동시 조회 시 지연이 합이 아닌 최댓값 수준인지 테스트"""
+        symbols = ["AAPL", "MSFT", "NVDA"]
+
+        # 기존 페이지 방식: 섹션과 종목을 순차 호출
+        start = time.perf_counter()
+        await unified_service.get_market_indices()
+        await unified_service.get_market_sentiment()
+        await unified_service.get_trending_stocks(10, "24h")
+        await unified_service.get_market_statistics()
+        for symbol in symbols:
+            await unified_service.get_stock_data(symbol)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dashboard = await unified_service.get_dashboard(symbols=symbols)
+        concurrent = time.perf_counter() - start
+
+        expected_sum = sum(SECTION_LATENCY.values()) + SECTION_LATENCY["get_stock_data"] * (len(symbols) - 1)
+        expected_max = max(SECTION_LATENCY.values())
+        print(f"\nDashboard load: sequential {sequential * 1000:.0f}ms, concurrent {concurrent * 1000:.0f}ms "
+              f"(sum {expected_sum * 1000:.0f}ms, max {expected_max * 1000:.0f}ms)")
+
+        assert sequential >= expected_sum
+        assert concurrent < expected_max + 0.1
+        assert dashboard["errors"] == {}
+        assert dashboard["sections"]["indices"] == [{"symbol": "^GSPC"}]
+        assert dashboard["sections"]["trending"][0]["symbol"] == "GME"
+        assert set(dashboard["sections"]["stocks"]) == set(symbols)
+        assert set(dashboard["timings_ms"]) == {"indices", "market_sentiment", "trending", "statistics", "stocks"}
+
+    @pytest.mark.asyncio
+    async def test_section_errors_are_isolated(self, unified_service):
+        """실패/지연 섹션이 다른 섹션에 영향을 주지 않는지 테스트"""
+        unified_service.get_market_statistics = AsyncMock(side_effect=RuntimeError("statistics backend down"))
+        unified_service.get_market_indices = slow(5.0, [])
+
+        dashboard = await unified_service.get_dashboard(section_timeout=0.3)
+
+        assert dashboard["errors"]["statistics"] == "statistics backend down"
+        assert dashboard["errors"]["indices"].startswith("Timed out")
+        assert dashboard["sections"]["statistics"] is None
+        assert dashboard["sections"]["market_sentiment"] == {"overall_sentiment": 0.2}
+        assert "stocks" not in dashboard["sections"]
+
+    @pytest.mark.asyncio
+    async def test_get_stocks_batch(self, unified_service):
+        """배치 종목 조회 중복 제거 및 실패 처리 테스트"""
+        async def get_stock_data(symbol, include_sentiment=True):
+            if symbol == "FAIL":
+                raise RuntimeError("boom")
+            return None if symbol == "NONE" else make_stock(symbol)
+        unified_service.get_stock_data = get_stock_data
+
+        stocks = await unified_service.get_stocks(["aapl", "AAPL", "NONE", "FAIL"])
+
+        assert list(stocks) == ["AAPL", "NONE", "FAIL"]
+        assert stocks["AAPL"].symbol == "AAPL"
+        assert stocks["NONE"] is None and stocks["FAIL"] is None